@@ -11,11 +11,13 @@ from jwkest.jwk import RSAKey  # type: ignore
 from oic import oic, rndstr, utils
 from oic.oauth2 import ErrorResponse
 from oic.oic import AuthorizationRequest, AuthorizationResponse, RegistrationResponse
+from oic.oic.message import ProviderConfigurationResponse
 from oic.oic.message import AccessTokenResponse
 from oic.utils.authn.client import CLIENT_AUTHN_METHOD
 from oic.utils import keyio
 
 from . import exceptions as o_e
+from .provider_cache import get_jwks_cache, get_provider_info_cache
 
 __author__ = "roland"
 
@@ -70,8 +72,13 @@ class Client(oic.Client):
             raise o_e.InternalError()
 
         try:
-            # discover and store the provider (OP) urls, etc
-            self.provider_config(provider["srv_discovery_url"])
+            # discover and store the provider (OP) urls, etc. from the cached discovery document
+            self.srv_discovery_url = provider["srv_discovery_url"]
+            self.provider_info_cache = get_provider_info_cache(self.srv_discovery_url, verify_ssl)
+            self.jwks_cache = None
+            self._loaded_provider_info = None
+            self._loaded_jwks = None
+            self.load_cached_provider_metadata()
             self.store_registration_info(RegistrationResponse(**provider["client_registration"]))
         except Exception as err:
             logger.error(err)
@@ -81,6 +88,24 @@ class Client(oic.Client):
             )
             raise o_e.InternalError()
 
+    def load_cached_provider_metadata(self):
+        """Applies the cached discovery document and provider keys, if they changed since last loaded.
+
+        Keys are loaded as a local key bundle rather than from jwks_uri, so verifying
+        tokens never triggers a fetch. The caches refresh themselves in the background.
+        """
+        provider_info = self.provider_info_cache.get()
+        if provider_info is not self._loaded_provider_info:
+            pcr = ProviderConfigurationResponse(**provider_info)
+            self.handle_provider_config(pcr, self.srv_discovery_url, keys=False, endpoints=True)
+            self.jwks_cache = get_jwks_cache(provider_info["jwks_uri"], self.settings.verify_ssl)
+            self._loaded_provider_info = provider_info
+
+        jwks = self.jwks_cache.get()
+        if jwks is not self._loaded_jwks:
+            self.keyjar.issuer_keys[self.issuer] = [keyio.KeyBundle(jwks["keys"], verify_ssl=self.settings.verify_ssl)]
+            self._loaded_jwks = jwks
+
     def create_authn_request(
         self,
         session,
@@ -152,6 +177,8 @@ class Client(oic.Client):
         """Step 3: Receive OP's response, request an access token, and user info."""
         logger.debug("Processing the OpenID Connect callback response...")
         state = session.get("state", "")
+        # make sure the ID token is verified against the current provider keys
+        self._refresh_provider_metadata(state)
         try:
             # parse the response from OP
             authn_response = self.parse_response(
@@ -205,6 +232,15 @@ class Client(oic.Client):
 
         return user_info
 
+    def _refresh_provider_metadata(self, state):
+        """Loads the latest cached provider metadata and keys before handling a callback."""
+        try:
+            self.load_cached_provider_metadata()
+        except Exception as err:
+            logger.error(err)
+            logger.error("Unable to load provider keys for %s" % state)
+            raise o_e.InternalError(locator=state)
+
     def _get_user_info(self, state, session):
         """Get information from OP about the user."""
         scopes = list(self.behaviour.get("user_info_request", []))
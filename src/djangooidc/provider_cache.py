@@ -0,0 +1,189 @@
+# coding: utf-8
+"""
+Cached copies of the OpenID Connect provider's discovery document and JWKS.
+
+Lookups check, in order: this process's memory, the shared Django cache, and a JSON
+file on disk. The network is only used when none of those has a copy yet, or when
+every copy is past its TTL. Copies that are close to expiry are refreshed in a
+background thread, so logins do not wait on the provider. If a refresh fails,
+the stale copy is served and the failure is logged, so that logins keep working
+through a provider or network outage.
+
+Settings (all optional):
+    OIDC_PROVIDER_INFO_TTL: seconds a discovery document is fresh (default 1 day)
+    OIDC_JWKS_TTL: seconds a JWKS is fresh (default 1 hour)
+    OIDC_PROVIDER_CACHE_DIR: where copies are written on disk (default: the temp dir)
+    OIDC_PROVIDER_FETCH_TIMEOUT: network timeout in seconds (default 5)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_PATH = "/.well-known/openid-configuration"
+
+# Fraction of the TTL after which a copy is refreshed in the background
+REFRESH_AHEAD_FRACTION = 0.8
+
+
+@dataclass
+class CachedDocument:
+    """A JSON document along with the time it was fetched from the provider"""
+
+    document: dict
+    fetched_at: float
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class ProviderDocumentCache:
+    """Read-through, refresh-ahead cache for one JSON document published by the provider."""
+
+    def __init__(self, name, url, ttl, verify_ssl=True):
+        self.name = name
+        self.url = url
+        self.ttl = ttl
+        self.verify_ssl = verify_ssl
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
+        self.cache_key = f"djangooidc:{name}:{url_hash}"
+        cache_dir = getattr(settings, "OIDC_PROVIDER_CACHE_DIR", None) or os.path.join(
+            tempfile.gettempdir(), "djangooidc"
+        )
+        self.path = os.path.join(cache_dir, f"{name}-{url_hash}.json")
+        self._entry = None
+        self._refresh_lock = threading.Lock()
+
+    def get(self) -> dict:
+        """Returns the document, fetching it only if no fresh copy is available anywhere.
+
+        Raises if there is no copy at all and the provider cannot be reached.
+        """
+        entry = self._entry
+        if entry is None or entry.age() >= self.ttl:
+            entry = self._newest(entry, self._read_shared_cache(), self._read_disk())
+            self._entry = entry
+
+        if entry is None or entry.age() >= self.ttl:
+            try:
+                entry = self.refresh()
+            except Exception as err:
+                if entry is None:
+                    raise
+                logger.warning(f"Serving a stale {self.name} for {self.url}. Refresh failed: {err}")
+                # Treat the stale copy as due for refresh rather than expired, so that the
+                # following requests retry in the background instead of each waiting on the provider
+                entry = CachedDocument(entry.document, time.time() - self.ttl * REFRESH_AHEAD_FRACTION)
+                self._entry = entry
+        elif entry.age() >= self.ttl * REFRESH_AHEAD_FRACTION:
+            self.refresh_in_background()
+        return entry.document
+
+    def refresh(self) -> CachedDocument:
+        """Fetches the document from the provider and stores it in every cache layer"""
+        response = requests.get(
+            self.url, timeout=getattr(settings, "OIDC_PROVIDER_FETCH_TIMEOUT", 5), verify=self.verify_ssl
+        )
+        response.raise_for_status()
+        entry = CachedDocument(document=response.json(), fetched_at=time.time())
+        self._entry = entry
+        self._write_shared_cache(entry)
+        self._write_disk(entry)
+        logger.info(f"Refreshed {self.name} from {self.url}")
+        return entry
+
+    def refresh_in_background(self):
+        """Refreshes the document in a daemon thread, unless a refresh is already running"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                # Another process may have refreshed the shared copy already
+                shared = self._read_shared_cache()
+                if shared is not None and shared.age() < self.ttl * REFRESH_AHEAD_FRACTION:
+                    self._entry = shared
+                else:
+                    self.refresh()
+            except Exception as err:
+                logger.warning(f"Background refresh of {self.name} from {self.url} failed: {err}")
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=run, name=f"oidc-{self.name}-refresh", daemon=True).start()
+
+    def _newest(self, *entries):
+        entries = [entry for entry in entries if entry is not None]
+        return max(entries, key=lambda entry: entry.fetched_at) if entries else None
+
+    def _read_shared_cache(self):
+        try:
+            value = cache.get(self.cache_key)
+        except Exception as err:
+            logger.warning(f"Could not read {self.name} from the shared cache: {err}")
+            return None
+        return CachedDocument(**value) if value else None
+
+    def _write_shared_cache(self, entry):
+        try:
+            cache.set(self.cache_key, {"document": entry.document, "fetched_at": entry.fetched_at}, timeout=None)
+        except Exception as err:
+            logger.warning(f"Could not write {self.name} to the shared cache: {err}")
+
+    def _read_disk(self):
+        try:
+            with open(self.path, "r") as file:
+                return CachedDocument(**json.load(file))
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logger.warning(f"Could not read {self.name} from {self.path}: {err}")
+            return None
+
+    def _write_disk(self, entry):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Write to a temp file and rename it, so readers never see a partial file
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+            with os.fdopen(fd, "w") as file:
+                json.dump({"document": entry.document, "fetched_at": entry.fetched_at}, file)
+            os.replace(temp_path, self.path)
+        except Exception as err:
+            logger.warning(f"Could not write {self.name} to {self.path}: {err}")
+
+
+_caches: dict = {}
+_caches_lock = threading.Lock()
+
+
+def _get_cache(name, url, ttl, verify_ssl):
+    """Returns the process-wide cache for (name, url), so every Client shares one copy"""
+    with _caches_lock:
+        key = (name, url)
+        if key not in _caches:
+            _caches[key] = ProviderDocumentCache(name, url, ttl, verify_ssl)
+        return _caches[key]
+
+
+def get_provider_info_cache(issuer, verify_ssl=True) -> ProviderDocumentCache:
+    """Returns the cache for the issuer's discovery document"""
+    url = issuer.rstrip("/") + DISCOVERY_PATH
+    ttl = getattr(settings, "OIDC_PROVIDER_INFO_TTL", 60 * 60 * 24)
+    return _get_cache("provider-info", url, ttl, verify_ssl)
+
+
+def get_jwks_cache(jwks_uri, verify_ssl=True) -> ProviderDocumentCache:
+    """Returns the cache for the provider's signing keys"""
+    ttl = getattr(settings, "OIDC_JWKS_TTL", 60 * 60)
+    return _get_cache("jwks", jwks_uri, ttl, verify_ssl)
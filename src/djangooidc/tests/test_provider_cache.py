@@ -0,0 +1,92 @@
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from djangooidc.provider_cache import REFRESH_AHEAD_FRACTION, CachedDocument, ProviderDocumentCache
+
+from .common import less_console_noise
+
+DISCOVERY_URL = "https://idp.example.gov/.well-known/openid-configuration"
+
+
+def fake_response(document):
+    """A requests response whose json() returns document"""
+    response = MagicMock()
+    response.json.return_value = document
+    return response
+
+
+class ProviderDocumentCacheTest(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(OIDC_PROVIDER_CACHE_DIR=self.cache_dir.name)
+        self.settings_override.enable()
+        cache.clear()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.cache_dir.cleanup()
+        cache.clear()
+
+    @patch("djangooidc.provider_cache.requests.get")
+    def test_document_is_fetched_once(self, mock_get):
+        """The provider is only contacted once while the copy is fresh"""
+        mock_get.return_value = fake_response({"jwks_uri": "https://idp.example.gov/jwks"})
+        provider_cache = ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=60)
+
+        self.assertEqual(provider_cache.get()["jwks_uri"], "https://idp.example.gov/jwks")
+        provider_cache.get()
+
+        mock_get.assert_called_once()
+
+    @patch("djangooidc.provider_cache.requests.get")
+    def test_other_processes_reuse_shared_and_disk_copies(self, mock_get):
+        """A new cache for the same url (as in another worker) does not fetch again"""
+        mock_get.return_value = fake_response({"issuer": "https://idp.example.gov"})
+        ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=60).get()
+
+        self.assertEqual(
+            ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=60).get()["issuer"], "https://idp.example.gov"
+        )
+
+        # With the shared cache gone, the copy on disk is used
+        cache.clear()
+        self.assertEqual(
+            ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=60).get()["issuer"], "https://idp.example.gov"
+        )
+        mock_get.assert_called_once()
+
+    @patch("djangooidc.provider_cache.requests.get")
+    def test_stale_copy_is_served_when_provider_is_down(self, mock_get):
+        """An expired copy is still served if the provider cannot be reached"""
+        mock_get.side_effect = ConnectionError("provider is down")
+        provider_cache = ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=60)
+        provider_cache._entry = CachedDocument({"issuer": "stale"}, fetched_at=time.time() - 120)
+
+        with less_console_noise():
+            self.assertEqual(provider_cache.get()["issuer"], "stale")
+
+        # Until the next background refresh, the stale copy is served without waiting on the provider
+        with patch.object(provider_cache, "refresh_in_background") as mock_refresh_in_background:
+            self.assertEqual(provider_cache.get()["issuer"], "stale")
+            mock_refresh_in_background.assert_called_once()
+        mock_get.assert_called_once()
+
+    @patch("djangooidc.provider_cache.requests.get")
+    def test_copy_near_expiry_is_refreshed_in_background(self, mock_get):
+        """A copy close to its TTL is served, and a refresh is started"""
+        mock_get.return_value = fake_response({"issuer": "fresh"})
+        provider_cache = ProviderDocumentCache("provider-info", DISCOVERY_URL, ttl=100)
+        provider_cache._entry = CachedDocument({"issuer": "old"}, fetched_at=time.time() - 100 * REFRESH_AHEAD_FRACTION)
+
+        # Run the refresh thread inline
+        with patch("djangooidc.provider_cache.threading.Thread") as mock_thread:
+            mock_thread.return_value.start.side_effect = lambda: mock_thread.call_args.kwargs["target"]()
+            with less_console_noise():
+                self.assertEqual(provider_cache.get()["issuer"], "old")
+
+        self.assertEqual(provider_cache.get()["issuer"], "fresh")
+        mock_get.assert_called_once()
@@ -37,15 +37,22 @@ def _client_is_none():
     return CLIENT is None
 
 
-# Initialize CLIENT
-try:
-    _initialize_client()
-except Exception as err:
-    # In the event of an exception, log the error and allow the app load to continue
-    # without the OIDC Client. Subsequent login attempts will attempt to initialize
-    # again if Client is None
-    logger.error(err)
-    logger.error("Unable to configure OpenID Connect provider. Users cannot log in.")
+def warm_up_client():
+    """Initialize CLIENT ahead of the first login, if not initialized already.
+
+    CLIENT is not initialized at import, because provider discovery is a network round trip
+    that would otherwise delay every worker's startup. Views initialize it on first use;
+    this lets a server do it in the background instead. Returns whether CLIENT is ready.
+    """
+    try:
+        if _client_is_none():
+            _initialize_client()
+    except Exception as err:
+        # In the event of an exception, log the error and carry on without the OIDC Client.
+        # Subsequent login attempts will attempt to initialize again if Client is None
+        logger.error(err)
+        logger.error("Unable to configure OpenID Connect provider. Users cannot log in.")
+    return not _client_is_none()
 
 
 def error_page(request, error):
@@ -165,6 +172,10 @@ def logout(request, next_page=None):
     """Redirect the user to the authentication provider (OP) logout page."""
     try:
         user = request.user
+        # If the CLIENT is none, attempt to reinitialize before handling the request
+        if _client_is_none():
+            logger.debug("OIDC client is None, attempting to initialize")
+            _initialize_client()
         request_args = {
             "client_id": CLIENT.client_id,
         }
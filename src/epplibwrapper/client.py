@@ -1,6 +1,8 @@
 """Provide a wrapper around epplib to handle authentication and errors."""
 
 import logging
+import threading
+import time
 from gevent.lock import BoundedSemaphore
 
 try:
@@ -15,20 +17,33 @@ from django.conf import settings
 
 from .cert import Cert, Key
 from .errors import ErrorCode, LoginError, RegistryError
+from .metrics import METRICS
 
 logger = logging.getLogger(__name__)
 
-try:
-    # Write cert and key to disk
-    CERT = Cert()
-    KEY = Key()
-except Exception:
-    CERT = None  # type: ignore
-    KEY = None  # type: ignore
-    logger.warning(
-        "Problem with client certificate. Registrar cannot contact registry.",
-        exc_info=True,
-    )
+# The client certificate and key are written to disk on first use, not at import,
+# so that processes which never contact the registry don't create the temp files.
+CERT = None
+KEY = None
+_cert_lock = threading.Lock()
+
+
+def get_cert_and_key():
+    """Returns the (Cert, Key) pair, writing them to disk the first time this is called."""
+    global CERT, KEY
+    with _cert_lock:
+        if CERT is None or KEY is None:
+            try:
+                # Write cert and key to disk
+                CERT = Cert()
+                KEY = Key()
+            except Exception:
+                logger.warning(
+                    "Problem with client certificate. Registrar cannot contact registry.",
+                    exc_info=True,
+                )
+                raise
+    return CERT, KEY
 
 
 class EPPLibWrapper:
@@ -38,8 +53,12 @@ class EPPLibWrapper:
     ATTN: This should not be used directly. Use `Domain` from domain.py.
     """
 
-    def __init__(self) -> None:
-        """Initialize settings which will be used for all connections."""
+    def __init__(self, connect=True) -> None:
+        """Initialize settings which will be used for all connections.
+
+        With connect=False, no connection is made here. The client connects
+        on the first send, or when warm_up is called.
+        """
         # set _client to None initially. In the event that the __init__ fails
         # before _client initializes, app should still start and be in a state
         # that it can attempt _client initialization on send attempts
@@ -56,29 +75,41 @@ class EPPLibWrapper:
         # We should only ever have one active connection at a time
         self.connection_lock = BoundedSemaphore(1)
 
+        if connect:
+            self.warm_up()
+
+    def warm_up(self) -> bool:
+        """Connect and log in ahead of the first command, if not connected already.
+        Failures are logged rather than raised, since send will retry the connection.
+        Returns whether the client is connected."""
         self.connection_lock.acquire()
         try:
-            self._initialize_client()
+            if self._client is None:
+                self._initialize_client()
         except Exception:
             logger.warning("Unable to configure the connection to the registry.")
         finally:
             self.connection_lock.release()
+        return self._client is not None
+
+    def close(self) -> None:
+        """Log out and close the connection, if there is one. The next send reconnects."""
+        self.connection_lock.acquire()
+        try:
+            if self._client is not None:
+                self._disconnect()
+                self._client = None
+        finally:
+            self.connection_lock.release()
 
     def _initialize_client(self) -> None:
         """Initialize a client, assuming _login defined. Sets _client to initialized
         client. Raises errors if initialization fails.
-        This method will be called at app initialization, and also during retries."""
+        This method will be called on first use (or warm up), and also during retries."""
         # establish a client object with a TCP socket transport
         # note that type: ignore added in several places because linter complains
         # about _client initially being set to None, and None type doesn't match code
-        self._client = Client(  # type: ignore
-            SocketTransport(
-                settings.SECRET_REGISTRY_HOSTNAME,
-                cert_file=CERT.filename,
-                key_file=KEY.filename,
-                password=settings.SECRET_REGISTRY_KEY_PASSPHRASE,
-            )
-        )
+        self._client = Client(self._get_transport())  # type: ignore
         try:
             # use the _client object to connect
             self._connect()
@@ -93,6 +124,22 @@ class EPPLibWrapper:
             logger.error(f"{message} Error: {err}")
             raise RegistryError(message) from err
 
+    def _get_transport(self):
+        """Returns the transport to the registry, or to the local registry simulator
+        when EPP_REGISTRY_SIMULATOR is set (see simulator.py)"""
+        if settings.EPP_REGISTRY_SIMULATOR:
+            from .simulator import SimulatorTransport
+
+            hostname, port = settings.EPP_REGISTRY_SIMULATOR.rsplit(":", 1)
+            return SimulatorTransport(hostname, int(port))
+        cert, key = get_cert_and_key()
+        return SocketTransport(
+            settings.SECRET_REGISTRY_HOSTNAME,
+            cert_file=cert.filename,
+            key_file=key.filename,
+            password=settings.SECRET_REGISTRY_KEY_PASSPHRASE,
+        )
+
     def _connect(self) -> None:
         """Connects to EPP. Sends a login command. If an invalid response is returned,
         the client will be closed and a LoginError raised."""
@@ -159,42 +206,73 @@ class EPPLibWrapper:
         """Retry sending a command through EPP by re-initializing the client
         and then sending the command."""
         # re-initialize by disconnecting and initial
-        self._disconnect()
-        self._initialize_client()
+        reconnect_start = time.perf_counter()
+        try:
+            self._disconnect()
+            self._initialize_client()
+        finally:
+            METRICS.record_reconnect((time.perf_counter() - reconnect_start) * 1000)
         return self._send(command)
 
     def send(self, command, *, cleaned=False):
         """Login, the send the command. Retry once if an error is found"""
         # try to prevent use of this method without appropriate safeguards
-        cmd_type = command.__class__.__name__
         if not cleaned:
             raise ValueError("Please sanitize user input before sending it.")
 
+        # The time counts against the request being handled, including waiting for the connection
+        with METRICS.time_send():
+            return self._send_with_retry(command)
+
+    def _send_with_retry(self, command):
+        """Helper function used by `send`. Sends the command, and retries once if it fails.
+        Records the time taken, and the time spent waiting for the connection, in METRICS."""
+        cmd_type = command.__class__.__name__
+        wait_start = time.perf_counter()
         self.connection_lock.acquire()
+        start = time.perf_counter()
+        retried = False
+        response = error = None
         try:
-            return self._send(command)
-        except RegistryError as err:
-            if err.response:
-                logger.info(f"cltrid is {err.response.cl_tr_id} svtrid is {err.response.sv_tr_id}")
-            if (
-                err.is_transport_error()
-                or err.is_connection_error()
-                or err.is_session_error()
-                or err.is_server_error()
-                or err.should_retry()
-            ):
-                message = f"{cmd_type} failed and will be retried"
-                logger.info(f"{message} Error: {err}")
-                return self._retry(command)
-            else:
-                raise err
+            try:
+                response = self._send(command)
+            except RegistryError as err:
+                if err.response:
+                    logger.info(f"cltrid is {err.response.cl_tr_id} svtrid is {err.response.sv_tr_id}")
+                if (
+                    err.is_transport_error()
+                    or err.is_connection_error()
+                    or err.is_session_error()
+                    or err.is_server_error()
+                    or err.should_retry()
+                ):
+                    message = f"{cmd_type} failed and will be retried"
+                    logger.info(f"{message} Error: {err}")
+                    retried = True
+                    response = self._retry(command)
+                else:
+                    raise err
+            return response
+        except Exception as err:
+            error = err
+            response = getattr(err, "response", None)
+            raise
         finally:
             self.connection_lock.release()
+            METRICS.record_command(
+                cmd_type,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                lock_wait_ms=(start - wait_start) * 1000,
+                retried=retried,
+                response=response,
+                error=error,
+            )
 
 
 try:
-    # Initialize epplib
-    CLIENT = EPPLibWrapper()
+    # Initialize epplib. The connection is deferred until the first command (or warm up),
+    # so importing this module does not block on the registry.
+    CLIENT = EPPLibWrapper(connect=False)
     logger.info("registry client initialized")
 except Exception:
     logger.warning("Unable to configure epplib. Registrar cannot contact registry.")
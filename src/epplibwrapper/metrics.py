@@ -0,0 +1,158 @@
+"""
+In-process metrics of the commands EPPLibWrapper sends to the registry.
+
+For each command type (InfoDomain, CheckDomain, UpdateDomain, ...) this keeps a latency
+histogram and counts of commands, retries and errors, along with histograms of the time
+spent waiting for the connection lock and reconnecting. Commands slower than
+EPP_SLOW_COMMAND_MS are logged with their transaction ids, and the most recent ones kept.
+With EPP_LOG_COMMANDS on, every command is also logged as one structured line.
+
+The metrics are per process, and start over when it restarts. The admin shows them at
+admin/api/get-epp-metrics-json/.
+"""
+
+from collections import Counter, deque
+from contextlib import nullcontext
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+DEFAULT_SLOW_COMMAND_MS = 2000
+# Number of slow commands kept
+SLOW_COMMANDS_KEPT = 50
+
+
+class Histogram:
+    """Counts of observations in BUCKETS_MS, with their sum and maximum"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms):
+        index = next((i for i, bound in enumerate(BUCKETS_MS) if value_ms <= bound), len(BUCKETS_MS))
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, fraction):
+        """Returns the upper bound of the bucket holding the given fraction of observations,
+        or the maximum for the last bucket"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS_MS, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return round(self.max_ms, 1)
+
+    def snapshot(self) -> dict:
+        buckets = {f"le_{bound}": count for bound, count in zip(BUCKETS_MS, self.bucket_counts)}
+        buckets["le_inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": buckets,
+        }
+
+
+class EppMetrics:
+    """Metrics of the commands sent by the EPPLibWrapper instances in this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Makes the context manager that each EPPLibWrapper.send runs in, see set_send_timer
+        self._send_timer = nullcontext
+        self.reset()
+
+    def set_send_timer(self, send_timer):
+        """Sets a function returning a context manager that each EPPLibWrapper.send runs in,
+        including the wait for the connection. The registrar app uses it to count the time
+        against the request being handled (see registrar/apps.py)."""
+        self._send_timer = send_timer
+
+    def time_send(self):
+        """Returns the context manager to send a command in"""
+        return self._send_timer()
+
+    def reset(self):
+        with self._lock:
+            self.latency: dict[str, Histogram] = {}
+            self.lock_wait = Histogram()
+            self.reconnects = Histogram()
+            self.commands: Counter = Counter()
+            self.retries: Counter = Counter()
+            self.errors: Counter = Counter()
+            self.slow_commands: deque = deque(maxlen=SLOW_COMMANDS_KEPT)
+
+    def record_command(self, command_type, duration_ms, lock_wait_ms, retried=False, response=None, error=None):
+        """Records a command sent through EPPLibWrapper.send.
+
+        duration_ms is the time from getting the connection to the result, including any retry.
+        response is the registry's response, or the response of the error, if it had one.
+        """
+        entry = {
+            "command": command_type,
+            "duration_ms": round(duration_ms, 1),
+            "lock_wait_ms": round(lock_wait_ms, 1),
+            "retried": retried,
+            "code": getattr(response, "code", None) or getattr(error, "code", None),
+            "cl_tr_id": getattr(response, "cl_tr_id", None),
+            "sv_tr_id": getattr(response, "sv_tr_id", None),
+        }
+        slow = duration_ms + lock_wait_ms >= getattr(settings, "EPP_SLOW_COMMAND_MS", DEFAULT_SLOW_COMMAND_MS)
+        with self._lock:
+            self.latency.setdefault(command_type, Histogram()).observe(duration_ms)
+            self.lock_wait.observe(lock_wait_ms)
+            self.commands[command_type] += 1
+            if retried:
+                self.retries[command_type] += 1
+            if error is not None:
+                self.errors[command_type] += 1
+            if slow:
+                self.slow_commands.append(entry)
+
+        message = ", ".join(f"{key}={value}" for key, value in entry.items())
+        if slow:
+            logger.warning(f"EPP_SLOW_COMMAND: {message}", extra={"epp_command": entry})
+        elif getattr(settings, "EPP_LOG_COMMANDS", False):
+            logger.info(f"EPP_COMMAND: {message}", extra={"epp_command": entry})
+
+    def record_reconnect(self, duration_ms):
+        """Records the time taken to drop the connection and log in again"""
+        with self._lock:
+            self.reconnects.observe(duration_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "commands": {
+                    command_type: {
+                        "latency": histogram.snapshot(),
+                        "retries": self.retries[command_type],
+                        "errors": self.errors[command_type],
+                        "retry_rate": round(self.retries[command_type] / self.commands[command_type], 4),
+                    }
+                    for command_type, histogram in sorted(self.latency.items())
+                },
+                "lock_wait": self.lock_wait.snapshot(),
+                "reconnects": self.reconnects.snapshot(),
+                "slow_commands": list(self.slow_commands),
+            }
+
+
+METRICS = EppMetrics()
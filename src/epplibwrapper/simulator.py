@@ -0,0 +1,784 @@
+"""
+A local stand-in for the registry, for load testing the registrar without it.
+
+RegistrySimulator is an EPP server (RFC 5730-5734) that answers the commands EPPLibWrapper
+sends: login and logout, and check, info, create, update, renew and delete of domains,
+contacts and hosts, with the secDNS extension. It keeps the registry's objects in memory,
+and can add latency and jitter to each command, fail a share of them, and close sessions
+that sit idle, as the registry does.
+
+Start it with ./manage.py run_registry_simulator and set EPP_REGISTRY_SIMULATOR to its
+address (e.g. localhost:7700). EPPLibWrapper then connects through SimulatorTransport,
+which frames messages as RFC 5734 does over plain TCP rather than TLS.
+"""
+
+import copy
+from dataclasses import dataclass, field
+import datetime
+import logging
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+from xml.etree import ElementTree
+
+from defusedxml.ElementTree import fromstring
+
+try:
+    from epplib.exceptions import TransportError
+except ImportError:
+    pass
+
+from . import NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+EPP = NAMESPACE.EPP
+DOMAIN = NAMESPACE.NIC_DOMAIN
+CONTACT = NAMESPACE.NIC_CONTACT
+HOST = NAMESPACE.NIC_HOST
+SEC_DNS = NAMESPACE.SEC_DNS
+
+for _prefix, _namespace in [
+    ("epp", EPP),
+    ("domain", DOMAIN),
+    ("contact", CONTACT),
+    ("host", HOST),
+    ("secDNS", SEC_DNS),
+]:
+    ElementTree.register_namespace(_prefix, _namespace)
+
+CL_ID = "simulator"
+
+MESSAGES = {
+    1000: "Command completed successfully",
+    1500: "Command completed successfully; ending session",
+    2001: "Command syntax error",
+    2002: "Command use error",
+    2004: "Parameter value range error",
+    2101: "Unimplemented command",
+    2302: "Object exists",
+    2303: "Object does not exist",
+    2305: "Object association prohibits operation",
+    2400: "Command failed",
+}
+
+# Each message is preceded by its length, including these 4 bytes (RFC 5734)
+HEADER = struct.Struct(">I")
+
+
+def read_frame(sock) -> bytes | None:
+    """Reads one EPP message from sock, or returns None if the connection was closed"""
+    header = _read_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    return _read_exactly(sock, length - HEADER.size)
+
+
+def _read_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def write_frame(sock, message: bytes):
+    sock.sendall(HEADER.pack(len(message) + HEADER.size) + message)
+
+
+class SimulatorTransport:
+    """Transport for epplib's Client that connects to a RegistrySimulator over plain TCP"""
+
+    def __init__(self, hostname, port, timeout=None):
+        self.hostname = hostname
+        self.port = port
+        self.timeout = timeout
+        self.socket = None
+
+    def connect(self):
+        try:
+            self.socket = socket.create_connection((self.hostname, self.port), timeout=self.timeout)
+        except OSError as err:
+            raise TransportError(f"Cannot connect to the registry simulator: {err}") from err
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def send(self, message: bytes):
+        if self.socket is None:
+            raise TransportError("Not connected to the registry simulator")
+        try:
+            write_frame(self.socket, message)
+        except OSError as err:
+            raise TransportError(f"Cannot send to the registry simulator: {err}") from err
+
+    def receive(self) -> bytes:
+        if self.socket is None:
+            raise TransportError("Not connected to the registry simulator")
+        try:
+            message = read_frame(self.socket)
+        except OSError as err:
+            raise TransportError(f"Cannot receive from the registry simulator: {err}") from err
+        if message is None:
+            raise TransportError("The registry simulator closed the connection")
+        return message
+
+
+class EppError(Exception):
+    """Ends a command with the given result code"""
+
+    def __init__(self, code, msg=None):
+        super().__init__(msg or MESSAGES[code])
+        self.code = code
+        self.msg = msg or MESSAGES[code]
+
+
+@dataclass
+class Session:
+    logged_in: bool = False
+    closed: bool = False
+
+
+@dataclass
+class SimulatedObject:
+    roid: str
+    created: datetime.datetime
+    updated: datetime.datetime | None = None
+    statuses: set = field(default_factory=set)
+
+
+@dataclass
+class SimulatedDomain(SimulatedObject):
+    expires: datetime.datetime | None = None
+    registrant: str | None = None
+    contacts: list = field(default_factory=list)  # (type, contact id)
+    hosts: list = field(default_factory=list)
+    auth_info: list = field(default_factory=list)
+    # secDNS:dsData and secDNS:keyData elements
+    dnssec: list = field(default_factory=list)
+
+
+@dataclass
+class SimulatedContact(SimulatedObject):
+    # postalInfo, voice, fax and email elements, in order
+    details: list = field(default_factory=list)
+    auth_info: list = field(default_factory=list)
+    disclose: list = field(default_factory=list)
+
+
+@dataclass
+class SimulatedHost(SimulatedObject):
+    # host:addr elements
+    addresses: list = field(default_factory=list)
+
+
+def _tag(namespace, name):
+    return f"{{{namespace}}}{name}"
+
+
+def _element(parent, namespace, name, text=None, **attrib):
+    element = ElementTree.SubElement(parent, _tag(namespace, name), attrib)
+    if text is not None:
+        element.text = str(text)
+    return element
+
+
+def _format_datetime(value):
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _add_years(value, years):
+    try:
+        return value.replace(year=value.year + years)
+    except ValueError:
+        # 29 February
+        return value.replace(year=value.year + years, day=28)
+
+
+def _canonical(element):
+    return (
+        element.tag,
+        sorted(element.attrib.items()),
+        (element.text or "").strip(),
+        [_canonical(child) for child in element],
+    )
+
+
+def _same_element(first, second):
+    """Whether the elements have the same tags, attributes and text, ignoring whitespace"""
+    return _canonical(first) == _canonical(second)
+
+
+class SimulatedRegistry:
+    """
+    The objects of the simulated registry, and the answers to commands on them.
+
+    With create_missing, domains, contacts and hosts the registry hasn't seen are created
+    when a command refers to them, so that a database loaded without the registry (such
+    as with generate_large_registry) can be used against it.
+    """
+
+    def __init__(self, create_missing=False):
+        self.create_missing = create_missing
+        self.domains: dict[str, SimulatedDomain] = {}
+        self.contacts: dict[str, SimulatedContact] = {}
+        self.hosts: dict[str, SimulatedHost] = {}
+        self.lock = threading.Lock()
+        self._next_id = 0
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def greeting(self) -> bytes:
+        root = ElementTree.Element(_tag(EPP, "epp"))
+        greeting = _element(root, EPP, "greeting")
+        _element(greeting, EPP, "svID", "Registry simulator")
+        _element(greeting, EPP, "svDate", _format_datetime(datetime.datetime.now(datetime.timezone.utc)))
+        menu = _element(greeting, EPP, "svcMenu")
+        _element(menu, EPP, "version", "1.0")
+        _element(menu, EPP, "lang", "en")
+        for namespace in [DOMAIN, CONTACT, HOST]:
+            _element(menu, EPP, "objURI", namespace)
+        _element(_element(menu, EPP, "svcExtension"), EPP, "extURI", SEC_DNS)
+        dcp = _element(greeting, EPP, "dcp")
+        _element(_element(dcp, EPP, "access"), EPP, "all")
+        statement = _element(dcp, EPP, "statement")
+        _element(_element(statement, EPP, "purpose"), EPP, "prov")
+        _element(_element(statement, EPP, "recipient"), EPP, "ours")
+        _element(_element(statement, EPP, "retention"), EPP, "stated")
+        return self._serialize(root)
+
+    def handle(self, message: bytes, session: Session, fail=False) -> bytes:
+        """Returns the response to a command. fail makes object commands fail with 2400."""
+        cl_tr_id = None
+        res_data = extension = None
+        code = 1000
+        try:
+            try:
+                root = fromstring(message)
+            except Exception:
+                raise EppError(2001)
+            command = root.find(_tag(EPP, "command"))
+            if command is None:
+                if root.find(_tag(EPP, "hello")) is not None:
+                    return self.greeting()
+                raise EppError(2001)
+            cl_tr_id = command.findtext(_tag(EPP, "clTRID"))
+            verbs = [child for child in command if child.tag not in (_tag(EPP, "clTRID"), _tag(EPP, "extension"))]
+            if len(verbs) != 1:
+                raise EppError(2001)
+            code, res_data, extension = self._dispatch(verbs[0], command.find(_tag(EPP, "extension")), session, fail)
+        except EppError as err:
+            return self._response(err.code, err.msg, cl_tr_id)
+        return self._response(code, MESSAGES[code], cl_tr_id, res_data, extension)
+
+    def _dispatch(self, verb, extension, session, fail):
+        verb_name = verb.tag.split("}")[-1]
+        if verb_name == "login":
+            if session.logged_in:
+                raise EppError(2002, "Already logged in.")
+            session.logged_in = True
+            return 1000, None, None
+        if verb_name == "logout":
+            session.closed = True
+            return 1500, None, None
+        if not session.logged_in:
+            raise EppError(2002, "Registrar is not logged in.")
+        if fail:
+            raise EppError(2400)
+        if len(verb) != 1:
+            raise EppError(2001)
+        command = verb[0]
+        object_type = {DOMAIN: "domain", CONTACT: "contact", HOST: "host"}.get(command.tag.split("}")[0][1:])
+        handler = getattr(self, f"_{object_type}_{verb_name}", None)
+        if object_type is None or handler is None:
+            raise EppError(2101)
+        with self.lock:
+            res_data, response_extension = handler(command, extension)
+        return 1000, res_data, response_extension
+
+    def _response(self, code, msg, cl_tr_id, res_data=None, extension=None) -> bytes:
+        root = ElementTree.Element(_tag(EPP, "epp"))
+        response = _element(root, EPP, "response")
+        result = _element(response, EPP, "result", code=str(code))
+        _element(result, EPP, "msg", msg)
+        if res_data is not None:
+            _element(response, EPP, "resData").append(res_data)
+        if extension is not None:
+            _element(response, EPP, "extension").append(extension)
+        tr_id = _element(response, EPP, "trID")
+        if cl_tr_id:
+            _element(tr_id, EPP, "clTRID", cl_tr_id)
+        with self.lock:
+            sv_tr_id = f"SIM-{self._new_id()}"
+        _element(tr_id, EPP, "svTRID", sv_tr_id)
+        return self._serialize(root)
+
+    def _serialize(self, root) -> bytes:
+        return ElementTree.tostring(root, encoding="UTF-8", xml_declaration=True)
+
+    def _now(self):
+        return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+
+    def _add_object_fields(self, data, namespace, simulated, statuses):
+        """Adds the roid and statuses after the name or id that starts an infData element"""
+        position = 1
+        data.insert(position, ElementTree.Element(_tag(namespace, "roid")))
+        data[position].text = simulated.roid
+        for status in sorted(statuses):
+            position += 1
+            data.insert(position, ElementTree.Element(_tag(namespace, "status"), {"s": status}))
+
+    def _add_sponsor_and_dates(self, data, namespace, simulated):
+        _element(data, namespace, "clID", CL_ID)
+        _element(data, namespace, "crID", CL_ID)
+        _element(data, namespace, "crDate", _format_datetime(simulated.created))
+        if simulated.updated:
+            _element(data, namespace, "upID", CL_ID)
+            _element(data, namespace, "upDate", _format_datetime(simulated.updated))
+
+    def _statuses(self, simulated, linked):
+        statuses = set(simulated.statuses)
+        if linked:
+            statuses.add("linked")
+        if not statuses - {"linked"}:
+            statuses.add("ok")
+        return statuses
+
+    def _update_statuses(self, simulated, statuses, add):
+        for status in statuses:
+            if add:
+                simulated.statuses.add(status.get("s"))
+            else:
+                simulated.statuses.discard(status.get("s"))
+
+    def _mark_updated(self, simulated):
+        simulated.updated = self._now()
+
+    # region: Domains
+
+    def _get_domain(self, name) -> SimulatedDomain:
+        name = (name or "").lower()
+        if name not in self.domains:
+            if not self.create_missing or not name:
+                raise EppError(2303, f"The domain {name} does not exist.")
+            now = self._now()
+            self.domains[name] = SimulatedDomain(roid=f"D{self._new_id()}-SIM", created=now, expires=_add_years(now, 1))
+        return self.domains[name]
+
+    def _domain_statuses(self, domain):
+        statuses = set(domain.statuses)
+        if not domain.hosts:
+            statuses.add("inactive")
+        return statuses or {"ok"}
+
+    def _domain_check(self, command, extension):
+        data = ElementTree.Element(_tag(DOMAIN, "chkData"))
+        for name in command.findall(_tag(DOMAIN, "name")):
+            available = (name.text or "").lower() not in self.domains
+            check = _element(data, DOMAIN, "cd")
+            _element(check, DOMAIN, "name", name.text, avail="1" if available else "0")
+            if not available:
+                _element(check, DOMAIN, "reason", "In use")
+        return data, None
+
+    def _domain_info(self, command, extension):
+        name = command.findtext(_tag(DOMAIN, "name")).lower()
+        domain = self._get_domain(name)
+        data = ElementTree.Element(_tag(DOMAIN, "infData"))
+        _element(data, DOMAIN, "name", name)
+        self._add_object_fields(data, DOMAIN, domain, self._domain_statuses(domain))
+        if domain.registrant:
+            _element(data, DOMAIN, "registrant", domain.registrant)
+        for contact_type, contact_id in domain.contacts:
+            _element(data, DOMAIN, "contact", contact_id, type=contact_type)
+        if domain.hosts:
+            nameservers = _element(data, DOMAIN, "ns")
+            for host in domain.hosts:
+                _element(nameservers, DOMAIN, "hostObj", host)
+        for host in sorted(self.hosts):
+            if host.endswith(f".{name}"):
+                _element(data, DOMAIN, "host", host)
+        self._add_sponsor_and_dates(data, DOMAIN, domain)
+        _element(data, DOMAIN, "exDate", _format_datetime(domain.expires))
+        if domain.auth_info:
+            _element(data, DOMAIN, "authInfo").extend(copy.deepcopy(domain.auth_info))
+
+        extension = None
+        if domain.dnssec:
+            extension = ElementTree.Element(_tag(SEC_DNS, "infData"))
+            extension.extend(copy.deepcopy(domain.dnssec))
+        return data, extension
+
+    def _domain_create(self, command, extension):
+        name = command.findtext(_tag(DOMAIN, "name")).lower()
+        if name in self.domains:
+            raise EppError(2302, f"The domain {name} already exists.")
+        now = self._now()
+        domain = SimulatedDomain(roid=f"D{self._new_id()}-SIM", created=now)
+        domain.expires = _add_years(now, self._period_in_years(command))
+        self._update_domain_hosts(domain, command.find(_tag(DOMAIN, "ns")), add=True)
+        domain.registrant = command.findtext(_tag(DOMAIN, "registrant"))
+        if domain.registrant:
+            self._get_contact(domain.registrant)
+        for contact in command.findall(_tag(DOMAIN, "contact")):
+            self._get_contact(contact.text)
+            domain.contacts.append((contact.get("type"), contact.text))
+        auth_info = command.find(_tag(DOMAIN, "authInfo"))
+        domain.auth_info = list(auth_info) if auth_info is not None else []
+        self.domains[name] = domain
+
+        data = ElementTree.Element(_tag(DOMAIN, "creData"))
+        _element(data, DOMAIN, "name", name)
+        _element(data, DOMAIN, "crDate", _format_datetime(domain.created))
+        _element(data, DOMAIN, "exDate", _format_datetime(domain.expires))
+        return data, None
+
+    def _domain_update(self, command, extension):
+        domain = self._get_domain(command.findtext(_tag(DOMAIN, "name")))
+        for change, add in [("rem", False), ("add", True)]:
+            element = command.find(_tag(DOMAIN, change))
+            if element is None:
+                continue
+            self._update_domain_hosts(domain, element.find(_tag(DOMAIN, "ns")), add)
+            for contact in element.findall(_tag(DOMAIN, "contact")):
+                entry = (contact.get("type"), contact.text)
+                if add and entry not in domain.contacts:
+                    self._get_contact(contact.text)
+                    domain.contacts.append(entry)
+                elif not add and entry in domain.contacts:
+                    domain.contacts.remove(entry)
+            self._update_statuses(domain, element.findall(_tag(DOMAIN, "status")), add)
+        changes = command.find(_tag(DOMAIN, "chg"))
+        if changes is not None:
+            registrant = changes.findtext(_tag(DOMAIN, "registrant"))
+            if registrant:
+                self._get_contact(registrant)
+                domain.registrant = registrant
+            auth_info = changes.find(_tag(DOMAIN, "authInfo"))
+            if auth_info is not None:
+                domain.auth_info = list(auth_info)
+        dnssec = extension.find(_tag(SEC_DNS, "update")) if extension is not None else None
+        if dnssec is not None:
+            self._update_dnssec(domain, dnssec)
+        self._mark_updated(domain)
+        return None, None
+
+    def _update_domain_hosts(self, domain, nameservers, add):
+        if nameservers is None:
+            return
+        for host in nameservers.findall(_tag(DOMAIN, "hostObj")):
+            name = host.text.lower()
+            if add and name not in domain.hosts:
+                self._get_host(name)
+                domain.hosts.append(name)
+            elif not add and name in domain.hosts:
+                domain.hosts.remove(name)
+
+    def _update_dnssec(self, domain, update):
+        removed = update.find(_tag(SEC_DNS, "rem"))
+        if removed is not None:
+            if (removed.findtext(_tag(SEC_DNS, "all")) or "").strip().lower() in ("true", "1"):
+                domain.dnssec = []
+            for record in removed:
+                domain.dnssec = [existing for existing in domain.dnssec if not _same_element(existing, record)]
+        added = update.find(_tag(SEC_DNS, "add"))
+        if added is not None:
+            for record in added:
+                if not any(_same_element(existing, record) for existing in domain.dnssec):
+                    domain.dnssec.append(record)
+
+    def _domain_renew(self, command, extension):
+        name = command.findtext(_tag(DOMAIN, "name")).lower()
+        domain = self._get_domain(name)
+        current = command.findtext(_tag(DOMAIN, "curExpDate"))
+        if current != domain.expires.date().isoformat():
+            raise EppError(2004, f"The current expiration date of {name} is {domain.expires.date()}.")
+        expires = _add_years(domain.expires, self._period_in_years(command))
+        if expires > _add_years(self._now(), 10):
+            raise EppError(2004, "A domain cannot be registered for more than 10 years.")
+        domain.expires = expires
+        self._mark_updated(domain)
+
+        data = ElementTree.Element(_tag(DOMAIN, "renData"))
+        _element(data, DOMAIN, "name", name)
+        _element(data, DOMAIN, "exDate", _format_datetime(domain.expires))
+        return data, None
+
+    def _domain_delete(self, command, extension):
+        name = command.findtext(_tag(DOMAIN, "name")).lower()
+        self._get_domain(name)
+        if any(host.endswith(f".{name}") for host in self.hosts):
+            raise EppError(2305, f"The domain {name} has hosts that must be deleted first.")
+        del self.domains[name]
+        return None, None
+
+    def _period_in_years(self, command):
+        period = command.find(_tag(DOMAIN, "period"))
+        if period is None:
+            return 1
+        length = int(period.text)
+        return max(1, length // 12) if period.get("unit") == "m" else length
+
+    # endregion
+    # region: Contacts
+
+    def _get_contact(self, contact_id) -> SimulatedContact:
+        if contact_id not in self.contacts:
+            if not self.create_missing or not contact_id:
+                raise EppError(2303, f"The contact {contact_id} does not exist.")
+            contact = SimulatedContact(roid=f"C{self._new_id()}-SIM", created=self._now())
+            postal_info = ElementTree.Element(_tag(CONTACT, "postalInfo"), {"type": "loc"})
+            _element(postal_info, CONTACT, "name", "Simulated contact")
+            address = _element(postal_info, CONTACT, "addr")
+            _element(address, CONTACT, "street", "4200 Wilson Blvd.")
+            _element(address, CONTACT, "city", "Arlington")
+            _element(address, CONTACT, "sp", "VA")
+            _element(address, CONTACT, "pc", "22201")
+            _element(address, CONTACT, "cc", "US")
+            voice = ElementTree.Element(_tag(CONTACT, "voice"))
+            voice.text = "+1.5555555555"
+            email = ElementTree.Element(_tag(CONTACT, "email"))
+            email.text = "simulated@example.gov"
+            contact.details = [postal_info, voice, email]
+            self.contacts[contact_id] = contact
+        return self.contacts[contact_id]
+
+    def _contact_is_linked(self, contact_id):
+        return any(
+            domain.registrant == contact_id or any(linked_id == contact_id for _, linked_id in domain.contacts)
+            for domain in self.domains.values()
+        )
+
+    def _contact_info(self, command, extension):
+        contact_id = command.findtext(_tag(CONTACT, "id"))
+        contact = self._get_contact(contact_id)
+        data = ElementTree.Element(_tag(CONTACT, "infData"))
+        _element(data, CONTACT, "id", contact_id)
+        self._add_object_fields(data, CONTACT, contact, self._statuses(contact, self._contact_is_linked(contact_id)))
+        data.extend(copy.deepcopy(contact.details))
+        self._add_sponsor_and_dates(data, CONTACT, contact)
+        if contact.auth_info:
+            _element(data, CONTACT, "authInfo").extend(copy.deepcopy(contact.auth_info))
+        data.extend(copy.deepcopy(contact.disclose))
+        return data, None
+
+    def _contact_create(self, command, extension):
+        contact_id = command.findtext(_tag(CONTACT, "id"))
+        if contact_id in self.contacts:
+            raise EppError(2302, f"The contact {contact_id} already exists.")
+        contact = SimulatedContact(roid=f"C{self._new_id()}-SIM", created=self._now())
+        self._set_contact_details(contact, command)
+        self.contacts[contact_id] = contact
+
+        data = ElementTree.Element(_tag(CONTACT, "creData"))
+        _element(data, CONTACT, "id", contact_id)
+        _element(data, CONTACT, "crDate", _format_datetime(contact.created))
+        return data, None
+
+    def _set_contact_details(self, contact, element):
+        """Replaces the details of the contact with those given in element (a create or chg)"""
+        details = {child.tag: child for child in contact.details}
+        for name in ["postalInfo", "voice", "fax", "email"]:
+            replacement = element.find(_tag(CONTACT, name))
+            if replacement is not None:
+                details[_tag(CONTACT, name)] = replacement
+        order = [_tag(CONTACT, name) for name in ["postalInfo", "voice", "fax", "email"]]
+        contact.details = [details[tag] for tag in order if tag in details]
+        auth_info = element.find(_tag(CONTACT, "authInfo"))
+        if auth_info is not None:
+            contact.auth_info = list(auth_info)
+        disclose = element.find(_tag(CONTACT, "disclose"))
+        if disclose is not None:
+            contact.disclose = [disclose]
+
+    def _contact_update(self, command, extension):
+        contact = self._get_contact(command.findtext(_tag(CONTACT, "id")))
+        for change, add in [("rem", False), ("add", True)]:
+            element = command.find(_tag(CONTACT, change))
+            if element is not None:
+                self._update_statuses(contact, element.findall(_tag(CONTACT, "status")), add)
+        changes = command.find(_tag(CONTACT, "chg"))
+        if changes is not None:
+            self._set_contact_details(contact, changes)
+        self._mark_updated(contact)
+        return None, None
+
+    def _contact_delete(self, command, extension):
+        contact_id = command.findtext(_tag(CONTACT, "id"))
+        self._get_contact(contact_id)
+        if self._contact_is_linked(contact_id):
+            raise EppError(2305, f"The contact {contact_id} is linked to a domain.")
+        del self.contacts[contact_id]
+        return None, None
+
+    # endregion
+    # region: Hosts
+
+    def _get_host(self, name) -> SimulatedHost:
+        name = (name or "").lower()
+        if name not in self.hosts:
+            if not self.create_missing or not name:
+                raise EppError(2303, f"The host {name} does not exist.")
+            self.hosts[name] = SimulatedHost(roid=f"H{self._new_id()}-SIM", created=self._now())
+        return self.hosts[name]
+
+    def _host_is_linked(self, name):
+        return any(name in domain.hosts for domain in self.domains.values())
+
+    def _host_info(self, command, extension):
+        name = command.findtext(_tag(HOST, "name")).lower()
+        host = self._get_host(name)
+        data = ElementTree.Element(_tag(HOST, "infData"))
+        _element(data, HOST, "name", name)
+        self._add_object_fields(data, HOST, host, self._statuses(host, self._host_is_linked(name)))
+        data.extend(copy.deepcopy(host.addresses))
+        self._add_sponsor_and_dates(data, HOST, host)
+        return data, None
+
+    def _host_create(self, command, extension):
+        name = command.findtext(_tag(HOST, "name")).lower()
+        if name in self.hosts:
+            raise EppError(2302, f"The host {name} already exists.")
+        host = SimulatedHost(roid=f"H{self._new_id()}-SIM", created=self._now())
+        host.addresses = command.findall(_tag(HOST, "addr"))
+        self.hosts[name] = host
+
+        data = ElementTree.Element(_tag(HOST, "creData"))
+        _element(data, HOST, "name", name)
+        _element(data, HOST, "crDate", _format_datetime(host.created))
+        return data, None
+
+    def _host_update(self, command, extension):
+        name = command.findtext(_tag(HOST, "name")).lower()
+        host = self._get_host(name)
+        for change, add in [("rem", False), ("add", True)]:
+            element = command.find(_tag(HOST, change))
+            if element is None:
+                continue
+            for address in element.findall(_tag(HOST, "addr")):
+                host.addresses = [existing for existing in host.addresses if not _same_element(existing, address)]
+                if add:
+                    host.addresses.append(address)
+            self._update_statuses(host, element.findall(_tag(HOST, "status")), add)
+        new_name = command.findtext(f"{_tag(HOST, 'chg')}/{_tag(HOST, 'name')}")
+        if new_name and new_name.lower() != name:
+            new_name = new_name.lower()
+            if new_name in self.hosts:
+                raise EppError(2302, f"The host {new_name} already exists.")
+            self.hosts[new_name] = self.hosts.pop(name)
+            for domain in self.domains.values():
+                domain.hosts = [new_name if existing == name else existing for existing in domain.hosts]
+        self._mark_updated(host)
+        return None, None
+
+    def _host_delete(self, command, extension):
+        name = command.findtext(_tag(HOST, "name")).lower()
+        self._get_host(name)
+        if self._host_is_linked(name):
+            raise EppError(2305, f"The host {name} is a nameserver of a domain.")
+        del self.hosts[name]
+        return None, None
+
+    # endregion
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _SessionHandler(socketserver.BaseRequestHandler):
+    """Serves one EPP session: sends the greeting, then answers commands until logout"""
+
+    def handle(self):
+        simulator = self.server.simulator
+        simulator.count_session()
+        self.request.settimeout(simulator.session_timeout)
+        session = Session()
+        try:
+            write_frame(self.request, simulator.registry.greeting())
+            while not session.closed:
+                message = read_frame(self.request)
+                if message is None:
+                    return
+                write_frame(self.request, simulator.respond(message, session))
+        except socket.timeout:
+            logger.info(f"Closed a session idle for {simulator.session_timeout} seconds")
+        except OSError:
+            pass
+
+
+class RegistrySimulator:
+    """
+    Serves a SimulatedRegistry over TCP, as the registry would.
+
+    Each command waits latency_ms, give or take up to jitter_ms, before it is answered,
+    and a share (error_rate) of object commands fail with 2400 "Command failed". Sessions
+    idle for session_timeout seconds are closed. Use port 0 to listen on a free port.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=7700,
+        latency_ms=0,
+        jitter_ms=0,
+        error_rate=0.0,
+        session_timeout=None,
+        create_missing=False,
+        seed=None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.session_timeout = session_timeout
+        self.registry = SimulatedRegistry(create_missing=create_missing)
+        self.sessions = 0
+        self._random = random.Random(seed)  # nosec
+        self._lock = threading.Lock()
+        self._thread = None
+        self.server = _Server((host, port), _SessionHandler)
+        self.server.simulator = self
+
+    @property
+    def address(self) -> str:
+        """The host:port to set EPP_REGISTRY_SIMULATOR to"""
+        host, port = self.server.server_address[:2]
+        return f"{host}:{port}"
+
+    def count_session(self):
+        with self._lock:
+            self.sessions += 1
+
+    def respond(self, message: bytes, session: Session) -> bytes:
+        with self._lock:
+            delay_ms = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            fail = self._random.random() < self.error_rate
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+        return self.registry.handle(message, session, fail=fail)
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def start(self):
+        """Serves in a background thread, and returns the address"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.address
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
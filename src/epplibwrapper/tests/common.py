@@ -1,8 +1,15 @@
 import os
 import logging
+import time
 
 from contextlib import contextmanager
 
+try:
+    from epplib import commands
+    from epplib.responses import Result
+except ImportError:
+    pass
+
 
 def get_handlers():
     """Obtain pointers to all StreamHandlers."""
@@ -49,3 +56,55 @@ def less_console_noise():
             handler.setStream(restore[handler.name])
         # close the file we opened
         devnull.close()
+
+
+class FakeEppServer:
+    """
+    Stands in for the registry behind epplib's Client, without a network.
+
+    Patch it in with patch("epplibwrapper.client.Client", server.client). Each command
+    is answered with the next of the scripted codes (1000 once they run out) after
+    latency_ms, and logins and logouts always succeed. Every response gets its own
+    cl_tr_id and sv_tr_id.
+    """
+
+    def __init__(self, codes=(), latency_ms=0):
+        self.codes = list(codes)
+        self.latency_ms = latency_ms
+        self.connections = 0
+        self.received = []
+
+    def client(self, transport=None):
+        return FakeEppClient(self)
+
+    def respond(self, command):
+        if isinstance(command, (commands.Login, commands.Logout)):
+            code = 1000
+        else:
+            self.received.append(command)
+            time.sleep(self.latency_ms / 1000)
+            code = self.codes.pop(0) if self.codes else 1000
+        transaction = len(self.received)
+        return Result(
+            code=code,
+            msg="Command completed successfully" if code < 2000 else "Command failed",
+            res_data=[],
+            cl_tr_id=f"fake-cl-{transaction}",
+            sv_tr_id=f"fake-sv-{transaction}",
+        )
+
+
+class FakeEppClient:
+    """A connection to a FakeEppServer, with the methods of epplib's Client that EPPLibWrapper uses"""
+
+    def __init__(self, server):
+        self.server = server
+
+    def connect(self):
+        self.server.connections += 1
+
+    def send(self, command):
+        return self.server.respond(command)
+
+    def close(self):
+        pass
@@ -2,11 +2,13 @@ import datetime
 from dateutil.tz import tzlocal  # type: ignore
 from unittest.mock import MagicMock, patch
 from pathlib import Path
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from api.tests.common import less_console_noise_decorator
 from gevent.exceptions import ConcurrentObjectUseError
 from epplibwrapper.client import EPPLibWrapper
 from epplibwrapper.errors import RegistryError, LoginError
+from epplibwrapper.metrics import METRICS, Histogram
+from epplibwrapper.tests.common import FakeEppServer
 import logging
 
 try:
@@ -54,6 +56,34 @@ class TestClient(TestCase):
         # Assert that _client is not None after initialization
         self.assertIsNotNone(wrapper._client)
 
+    @less_console_noise_decorator
+    @patch("epplibwrapper.client.Client")
+    def test_deferred_client_connects_on_first_send(self, mock_client):
+        """Test that a client created with connect=False only connects when first used"""
+        mock_client.return_value.send = MagicMock(return_value=self.fake_result(1000, "Success"))
+
+        wrapper = EPPLibWrapper(connect=False)
+
+        mock_client.assert_not_called()
+        self.assertIsNone(wrapper._client)
+
+        wrapper.send(commands.InfoDomain(name="test.gov"), cleaned=True)
+
+        mock_client.assert_called_once()
+        mock_client.return_value.connect.assert_called_once()
+
+    @less_console_noise_decorator
+    @patch("epplibwrapper.client.Client")
+    def test_warm_up_connects_once(self, mock_client):
+        """Test that warm_up connects a deferred client, and does nothing once connected"""
+        mock_client.return_value.send = MagicMock(return_value=self.fake_result(1000, "Success"))
+        wrapper = EPPLibWrapper(connect=False)
+
+        self.assertTrue(wrapper.warm_up())
+        self.assertTrue(wrapper.warm_up())
+
+        mock_client.return_value.connect.assert_called_once()
+
     @less_console_noise_decorator
     @patch("epplibwrapper.client.Client")
     def test_initialize_client_transport_error(self, mock_client):
@@ -432,3 +462,105 @@ class TestClient(TestCase):
             ):
                 result = wrapper.send(tested_command, cleaned=True)
                 self.assertEqual(expected_result, result.__dict__)
+
+
+class TestClientMetrics(TestCase):
+    """Test the latency, retries and slow commands EPPLibWrapper records"""
+
+    def setUp(self):
+        METRICS.reset()
+
+    def tearDown(self):
+        METRICS.reset()
+
+    def send(self, server, *tested_commands):
+        """Sends the commands through a new wrapper connected to the fake server"""
+        with patch("epplibwrapper.client.Client", server.client):
+            wrapper = EPPLibWrapper(connect=False)
+            for command in tested_commands:
+                wrapper.send(command, cleaned=True)
+
+    def test_histogram_buckets_and_percentiles(self):
+        """Test that observations land in the first bucket that holds them"""
+        histogram = Histogram()
+        for value in [1, 4, 30, 30, 20000]:
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot["count"], 5)
+        self.assertEqual(snapshot["buckets"]["le_5"], 2)
+        self.assertEqual(snapshot["buckets"]["le_50"], 2)
+        self.assertEqual(snapshot["buckets"]["le_inf"], 1)
+        self.assertEqual(snapshot["p50_ms"], 50)
+        self.assertEqual(snapshot["p95_ms"], 20000)
+        self.assertEqual(snapshot["max_ms"], 20000)
+
+    @less_console_noise_decorator
+    def test_send_records_latency_by_command_type(self):
+        """Test that each command is counted under its type, with the wait for the connection"""
+        server = FakeEppServer()
+
+        self.send(
+            server,
+            commands.InfoDomain(name="test.gov"),
+            commands.InfoDomain(name="test2.gov"),
+            commands.CheckDomain(names=["test3.gov"]),
+        )
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(list(snapshot["commands"]), ["CheckDomain", "InfoDomain"])
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["latency"]["count"], 2)
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["retry_rate"], 0)
+        self.assertEqual(snapshot["commands"]["CheckDomain"]["latency"]["count"], 1)
+        self.assertEqual(snapshot["lock_wait"]["count"], 3)
+        self.assertEqual(snapshot["reconnects"]["count"], 0)
+        self.assertEqual(server.connections, 1)
+
+    @less_console_noise_decorator
+    def test_retry_records_reconnect(self):
+        """Test that a command retried after a server error counts a retry and a reconnect"""
+        server = FakeEppServer(codes=[2400, 1000])
+
+        self.send(server, commands.InfoDomain(name="test.gov"))
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["retries"], 1)
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["retry_rate"], 1)
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["errors"], 0)
+        self.assertEqual(snapshot["reconnects"]["count"], 1)
+        self.assertEqual(server.connections, 2)
+
+    @less_console_noise_decorator
+    def test_failed_command_counts_error(self):
+        """Test that a command the registry rejects is counted as an error, with its code"""
+        server = FakeEppServer(codes=[2303])
+
+        with self.assertRaises(RegistryError):
+            self.send(server, commands.InfoDomain(name="test.gov"))
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["errors"], 1)
+        self.assertEqual(snapshot["commands"]["InfoDomain"]["retries"], 0)
+
+    @override_settings(EPP_SLOW_COMMAND_MS=10)
+    def test_slow_command_is_traced(self):
+        """Test that a slow command is logged and kept with its transaction ids"""
+        server = FakeEppServer(codes=[1000], latency_ms=20)
+
+        with self.assertLogs("epplibwrapper.metrics", level="WARNING") as logs:
+            self.send(server, commands.InfoDomain(name="test.gov"))
+
+        self.assertIn("EPP_SLOW_COMMAND: command=InfoDomain", logs.output[0])
+        self.assertIn("sv_tr_id=fake-sv-1", logs.output[0])
+        slow_command = METRICS.snapshot()["slow_commands"][0]
+        self.assertEqual(slow_command["cl_tr_id"], "fake-cl-1")
+        self.assertEqual(slow_command["code"], 1000)
+        self.assertGreaterEqual(slow_command["duration_ms"], 20)
+
+    @less_console_noise_decorator
+    def test_fast_command_is_not_traced(self):
+        """Test that commands under EPP_SLOW_COMMAND_MS aren't kept"""
+        self.send(FakeEppServer(), commands.InfoDomain(name="test.gov"))
+
+        self.assertEqual(METRICS.snapshot()["slow_commands"], [])
@@ -0,0 +1,141 @@
+import time
+
+from django.test import TestCase, override_settings
+
+from api.tests.common import less_console_noise_decorator
+from epplibwrapper.client import EPPLibWrapper
+from epplibwrapper.errors import ErrorCode, RegistryError
+from epplibwrapper.metrics import METRICS
+from epplibwrapper.simulator import RegistrySimulator
+
+try:
+    from epplib import commands
+    from epplib.models import common
+except ImportError:
+    pass
+
+
+class TestRegistrySimulator(TestCase):
+    """Test EPPLibWrapper against the registry simulator, over a socket"""
+
+    def start_simulator(self, **kwargs):
+        """Starts a simulator on a free port, and returns a wrapper connected to it"""
+        simulator = RegistrySimulator(port=0, seed=0, **kwargs)
+        address = simulator.start()
+        self.addCleanup(simulator.stop)
+        settings_override = override_settings(EPP_REGISTRY_SIMULATOR=address)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        return simulator, EPPLibWrapper(connect=False)
+
+    def send(self, wrapper, command):
+        return wrapper.send(command, cleaned=True)
+
+    def create_domain(self, wrapper, name="simulated.gov"):
+        self.send(
+            wrapper,
+            commands.CreateContact(
+                id="simcontact",
+                postal_info=common.PostalInfo(
+                    name="Sim Contact",
+                    addr=common.ContactAddr(street=["4200 Wilson Blvd."], city="Arlington", pc="22201", cc="US"),
+                    org="Simulated",
+                    type="loc",
+                ),
+                email="sim@example.gov",
+                voice="+1.5555555555",
+                auth_info=common.ContactAuthInfo(pw="2fooBAR123fooBaz"),
+            ),
+        )
+        self.send(
+            wrapper,
+            commands.CreateDomain(
+                name=name, registrant="simcontact", auth_info=common.DomainAuthInfo(pw="2fooBAR123fooBaz")
+            ),
+        )
+
+    @less_console_noise_decorator
+    def test_domain_lifecycle(self):
+        """Test that domains, hosts and DNSSEC records are kept between commands"""
+        simulator, wrapper = self.start_simulator()
+        self.create_domain(wrapper)
+        self.send(wrapper, commands.CreateHost(name="ns1.simulated.gov", addrs=[common.Ip(addr="1.2.3.4")]))
+        self.send(
+            wrapper,
+            commands.UpdateDomain(name="simulated.gov", add=[common.HostObjSet(hosts=["ns1.simulated.gov"])]),
+        )
+        update = commands.UpdateDomain(name="simulated.gov")
+        update.add_extension(
+            commands.UpdateDomainDNSSECExtension(
+                dsData=[common.DSData(keyTag=1, alg=13, digestType=2, digest="AB" * 32)]
+            )
+        )
+        self.send(wrapper, update)
+
+        response = self.send(wrapper, commands.InfoDomain(name="simulated.gov"))
+
+        info = response.res_data[0]
+        self.assertEqual(info.hosts, ["ns1.simulated.gov"])
+        self.assertEqual(info.registrant, "simcontact")
+        self.assertEqual([status.state for status in info.statuses], ["ok"])
+        self.assertEqual(response.extensions[0].dsData[0].keyTag, 1)
+        self.assertTrue(response.sv_tr_id.startswith("SIM-"))
+
+        renewed = self.send(
+            wrapper, commands.RenewDomain(name="simulated.gov", cur_exp_date=info.ex_date, period=common.Period(1))
+        )
+        self.assertEqual(renewed.res_data[0].ex_date.year, info.ex_date.year + 1)
+
+        with self.assertRaises(RegistryError) as err:
+            self.send(wrapper, commands.DeleteHost(name="ns1.simulated.gov"))
+        self.assertEqual(err.exception.code, ErrorCode.OBJECT_ASSOCIATION_PROHIBITS_OPERATION)
+        self.assertEqual(simulator.sessions, 1)
+
+    @less_console_noise_decorator
+    def test_unknown_domain(self):
+        """Test that unknown domains don't exist, unless created when missing"""
+        _, wrapper = self.start_simulator()
+        self.assertTrue(self.send(wrapper, commands.CheckDomain(["unknown.gov"])).res_data[0].avail)
+        with self.assertRaises(RegistryError) as err:
+            self.send(wrapper, commands.InfoDomain(name="unknown.gov"))
+        self.assertEqual(err.exception.code, ErrorCode.OBJECT_DOES_NOT_EXIST)
+
+        _, lenient_wrapper = self.start_simulator(create_missing=True)
+        response = self.send(lenient_wrapper, commands.InfoDomain(name="unknown.gov"))
+        self.assertEqual(response.res_data[0].name, "unknown.gov")
+
+    @less_console_noise_decorator
+    def test_injected_errors_are_retried(self):
+        """Test that commands failing with 2400 are retried, and fail if the retry does"""
+        _, wrapper = self.start_simulator(error_rate=1.0)
+
+        with self.assertRaises(RegistryError) as err:
+            self.send(wrapper, commands.CheckDomain(["simulated.gov"]))
+
+        self.assertEqual(err.exception.code, ErrorCode.COMMAND_FAILED)
+
+    @less_console_noise_decorator
+    def test_idle_session_is_reconnected(self):
+        """Test that a session closed by the simulator after a timeout is reconnected on the next command"""
+        METRICS.reset()
+        self.addCleanup(METRICS.reset)
+        simulator, wrapper = self.start_simulator(session_timeout=0.2)
+        self.send(wrapper, commands.CheckDomain(["simulated.gov"]))
+
+        time.sleep(0.4)
+        response = self.send(wrapper, commands.CheckDomain(["simulated.gov"]))
+
+        self.assertEqual(response.code, 1000)
+        self.assertEqual(simulator.sessions, 2)
+        self.assertEqual(METRICS.snapshot()["reconnects"]["count"], 1)
+
+    @less_console_noise_decorator
+    def test_latency(self):
+        """Test that each command takes the configured latency"""
+        _, wrapper = self.start_simulator(latency_ms=50)
+        self.send(wrapper, commands.CheckDomain(["simulated.gov"]))
+
+        start = time.perf_counter()
+        self.send(wrapper, commands.CheckDomain(["simulated.gov"]))
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
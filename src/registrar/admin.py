@@ -3,26 +3,31 @@ import logging
 import copy
 from typing import Optional
 from django import forms
-from django.db.models import (
-    Case,
-    CharField,
-    F,
-    Q,
-    Value,
-    When,
-)
+from django.db.models import Q
 
-from django.db.models.functions import Concat, Coalesce
 from django.core.exceptions import ValidationError
 from django.http import HttpResponseRedirect
 from registrar.models.federal_agency import FederalAgency
+from registrar.utility.federal_agency_index import get_federal_agency_index
+from registrar.utility.admin_pagination import LargeTableAdminMixin
+from registrar.utility.admin_filter_values import (
+    DOMAIN_FEDERAL_TYPES,
+    DOMAIN_INFORMATION_ORG_TYPES,
+    DOMAIN_ORG_TYPES,
+    DOMAIN_REQUEST_FEDERAL_TYPES,
+    DOMAIN_REQUEST_INVESTIGATORS,
+    DOMAIN_REQUEST_ORG_TYPES,
+)
 from registrar.models.portfolio_invitation import PortfolioInvitation
 from registrar.utility.admin_helpers import (
     AutocompleteSelectWithPlaceholder,
     get_action_needed_reason_default_email,
+    get_federal_executive_filter,
     get_rejection_reason_default_email,
     get_field_links_as_list,
 )
+from registrar.models.utility.converted_fields import converted_field_annotations
+from registrar.models.utility.search import get_admin_search_fields, get_search_filter
 from django.conf import settings
 from django.contrib.messages import get_messages
 from django.contrib.admin.helpers import AdminForm
@@ -680,7 +685,7 @@ class MultiFieldSortableChangeList(admin.views.main.ChangeList):
         return lookup_params
 
 
-class CustomLogEntryAdmin(LogEntryAdmin):
+class CustomLogEntryAdmin(LargeTableAdminMixin, LogEntryAdmin):
     """Overwrite the generated LogEntry admin class"""
 
     list_display = [
@@ -814,6 +819,10 @@ class AuditedAdmin(admin.ModelAdmin):
         # Get the filtered values
         return super().changelist_view(request, extra_context=extra_context)
 
+    def get_search_fields(self, request):
+        """Search text fields with ILIKE, which the trigram indexes serve (see models/utility/search.py)"""
+        return get_admin_search_fields(self.model, super().get_search_fields(request))
+
     def history_view(self, request, object_id, extra_context=None):
         """On clicking 'History', take admin to the auditlog view for an object."""
         return HttpResponseRedirect(
@@ -952,6 +961,10 @@ class MyUserAdmin(BaseUserAdmin, ImportExportRegistrarModelAdmin):
 
     _meta = Meta()
 
+    def get_search_fields(self, request):
+        """Search text fields with ILIKE, which the trigram indexes serve (see models/utility/search.py)"""
+        return get_admin_search_fields(self.model, super().get_search_fields(request))
+
     list_display = (
         "username",
         "overridden_email_field",
@@ -1238,7 +1251,7 @@ class HostResource(resources.ModelResource):
         model = models.Host
 
 
-class MyHostAdmin(AuditedAdmin, ImportExportRegistrarModelAdmin):
+class MyHostAdmin(LargeTableAdminMixin, AuditedAdmin, ImportExportRegistrarModelAdmin):
     """Custom host admin class to use our inlines."""
 
     resource_classes = [HostResource]
@@ -1758,40 +1771,13 @@ class DomainInvitationAdmin(BaseInvitationAdmin):
     # Override for the delete confirmation page on the domain table (bulk delete action)
     delete_selected_confirmation_template = "django/admin/domain_invitation_delete_selected_confirmation.html"
 
-    def get_annotated_queryset(self, queryset):
-        return queryset.annotate(
-            converted_generic_org_type=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    domain__domain_info__portfolio__isnull=False,
-                    then=F("domain__domain_info__portfolio__organization_type"),
-                ),
-                # Otherwise, return the natively assigned value
-                default=F("domain__domain_info__generic_org_type"),
-            ),
-            converted_federal_type=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(domain__domain_info__portfolio__isnull=False)
-                    & Q(domain__domain_info__portfolio__federal_agency__isnull=False),
-                    then=F("domain__domain_info__portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return the federal agency's federal_type
-                default=F("domain__domain_info__federal_agency__federal_type"),
-            ),
-        )
-
     def get_queryset(self, request):
         """Restrict queryset based on user permissions."""
         qs = super().get_queryset(request)
 
         # Check if user is in OMB analysts group
         if request.user.groups.filter(name="omb_analysts_group").exists():
-            annotated_qs = self.get_annotated_queryset(qs)
-            return annotated_qs.filter(
-                converted_generic_org_type=DomainRequest.OrganizationChoices.FEDERAL,
-                converted_federal_type=BranchChoices.EXECUTIVE,
-            )
+            return qs.filter(get_federal_executive_filter("domain__domain_info__"))
 
         return qs  # Return full queryset if the user doesn't have the restriction
 
@@ -2051,7 +2037,7 @@ class DomainInformationResource(resources.ModelResource):
         model = models.DomainInformation
 
 
-class DomainInformationAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
+class DomainInformationAdmin(LargeTableAdminMixin, ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     """Customize domain information admin class."""
 
     class GenericOrgFilter(admin.SimpleListFilter):
@@ -2063,29 +2049,13 @@ class DomainInformationAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         parameter_name = "converted_generic_orgs"
 
         def lookups(self, request, model_admin):
-            # Annotate the queryset to avoid Python-side iteration
-            queryset = (
-                DomainInformation.objects.annotate(
-                    converted_generic_org=Case(
-                        When(portfolio__organization_type__isnull=False, then="portfolio__organization_type"),
-                        When(portfolio__isnull=True, generic_org_type__isnull=False, then="generic_org_type"),
-                        default=Value(""),
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("converted_generic_org", flat=True)
-                .distinct()
-            )
-
-            # Filter out empty results and return sorted list of unique values
-            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in queryset if org])
+            # The distinct stored converted values, cached between loads (see admin_filter_values.py)
+            org_types = DOMAIN_INFORMATION_ORG_TYPES.get()
+            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in org_types])
 
         def queryset(self, request, queryset):
             if self.value():
-                return queryset.filter(
-                    Q(portfolio__organization_type=self.value())
-                    | Q(portfolio__isnull=True, generic_org_type=self.value())
-                )
+                return queryset.filter(effective_generic_org_type=self.value())
             return queryset
 
     resource_classes = [DomainInformationResource]
@@ -2095,7 +2065,9 @@ class DomainInformationAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Customize column header text
     @admin.display(description=_("Org Type"))
     def converted_generic_org_type(self, obj):
-        return obj.converted_generic_org_type_display
+        return obj.get_effective_generic_org_type_display()
+
+    converted_generic_org_type.admin_order_field = "effective_generic_org_type"  # type: ignore
 
     # Columns
     list_display = [
@@ -2417,36 +2389,13 @@ class DomainInformationAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         use_sort = db_field.name != "senior_official"
         return super().formfield_for_foreignkey(db_field, request, use_admin_sort_fields=use_sort, **kwargs)
 
-    def get_annotated_queryset(self, queryset):
-        return queryset.annotate(
-            conv_generic_org_type=Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                # Otherwise, return the natively assigned value
-                default=F("generic_org_type"),
-            ),
-            conv_federal_type=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return the federal_type from federal agency
-                default=F("federal_agency__federal_type"),
-            ),
-        )
-
     def get_queryset(self, request):
         """Custom get_queryset to filter by portfolio if portfolio is in the
         request params."""
         qs = super().get_queryset(request)
         # Check if user is in OMB analysts group
         if request.user.groups.filter(name="omb_analysts_group").exists():
-            annotated_qs = self.get_annotated_queryset(qs)
-            return annotated_qs.filter(
-                conv_generic_org_type=DomainRequest.OrganizationChoices.FEDERAL,
-                conv_federal_type=BranchChoices.EXECUTIVE,
-            )
+            return qs.filter(get_federal_executive_filter())
         return qs
 
 
@@ -2458,7 +2407,7 @@ class DomainRequestResource(FsmModelResource):
         model = models.DomainRequest
 
 
-class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
+class DomainRequestAdmin(LargeTableAdminMixin, ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     """Custom domain requests admin class."""
 
     resource_classes = [DomainRequestResource]
@@ -2488,29 +2437,13 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         parameter_name = "converted_generic_orgs"
 
         def lookups(self, request, model_admin):
-            # Annotate the queryset to avoid Python-side iteration
-            queryset = (
-                DomainRequest.objects.annotate(
-                    converted_generic_org=Case(
-                        When(portfolio__organization_type__isnull=False, then="portfolio__organization_type"),
-                        When(portfolio__isnull=True, generic_org_type__isnull=False, then="generic_org_type"),
-                        default=Value(""),
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("converted_generic_org", flat=True)
-                .distinct()
-            )
-
-            # Filter out empty results and return sorted list of unique values
-            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in queryset if org])
+            # The distinct stored converted values, cached between loads (see admin_filter_values.py)
+            org_types = DOMAIN_REQUEST_ORG_TYPES.get()
+            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in org_types])
 
         def queryset(self, request, queryset):
             if self.value():
-                return queryset.filter(
-                    Q(portfolio__organization_type=self.value())
-                    | Q(portfolio__isnull=True, generic_org_type=self.value())
-                )
+                return queryset.filter(effective_generic_org_type=self.value())
             return queryset
 
     class FederalTypeFilter(admin.SimpleListFilter):
@@ -2522,46 +2455,14 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         parameter_name = "converted_federal_types"
 
         def lookups(self, request, model_admin):
-            """
-            1. Search for existing federal type
-            2. Then search for federal type from associated portfolio
-            3. Then search for federal type from associated federal agency
-            """
-            queryset = (
-                DomainRequest.objects.annotate(
-                    converted_federal_type=Case(
-                        When(federal_type__isnull=False, then=F("federal_type")),
-                        When(
-                            portfolio__federal_agency__federal_type__isnull=False,
-                            then=F("portfolio__federal_agency__federal_type"),
-                        ),
-                        When(
-                            federal_agency__federal_type__isnull=False,
-                            then=F("federal_agency__federal_type"),
-                        ),
-                        default=Value(""),
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("converted_federal_type", flat=True)
-                .distinct()
-            )
-
-            return sorted(
-                [
-                    (federal_type, BranchChoices.get_branch_label(federal_type))
-                    for federal_type in queryset
-                    if federal_type
-                ]
-            )
+            """The federal types of the requests' federal agencies, using the
+            portfolio's agency where there is one (see converted_fields.py), cached between loads"""
+            federal_types = DOMAIN_REQUEST_FEDERAL_TYPES.get()
+            return sorted([(value, BranchChoices.get_branch_label(value)) for value in federal_types])
 
         def queryset(self, request, queryset):
             if self.value():
-                return queryset.filter(
-                    Q(federal_type=self.value())
-                    | Q(portfolio__federal_agency__federal_type=self.value())
-                    | Q(federal_agency__federal_type=self.value())
-                )
+                return queryset.filter(effective_federal_type=self.value())
             return queryset
 
     class InvestigatorFilter(admin.SimpleListFilter):
@@ -2573,31 +2474,9 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
 
         def lookups(self, request, model_admin):
             """Lookup reimplementation, gets users of is_staff.
-            Returns a list of tuples consisting of (user.id, user)
+            Returns a list of tuples consisting of (user.id, user), cached between loads
             """
-            # Select all investigators that are staff, then order by name and email
-            privileged_users = (
-                DomainRequest.objects.select_related("investigator")
-                .filter(investigator__is_staff=True)
-                .order_by("investigator__first_name", "investigator__last_name", "investigator__email")
-            )
-
-            # Annotate the full name and return a values list that lookups can use
-            privileged_users_annotated = (
-                privileged_users.annotate(
-                    full_name=Coalesce(
-                        Concat(
-                            "investigator__first_name", Value(" "), "investigator__last_name", output_field=CharField()
-                        ),
-                        "investigator__email",
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("investigator__id", "full_name")
-                .distinct()
-            )
-
-            return privileged_users_annotated
+            return DOMAIN_REQUEST_INVESTIGATORS.get()
 
         def queryset(self, request, queryset):
             """Custom queryset implementation, filters by investigator"""
@@ -2662,37 +2541,49 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     custom_requested_domain.admin_order_field = "requested_domain__name"  # type: ignore
 
     # ------ Converted fields ------
-    # These fields map to @Property methods and
-    # require these custom definitions to work properly
+    # These read the stored copies of the converted_* properties (see converted_fields.py),
+    # so the table can be sorted by them without extra queries per row
     @admin.display(description=_("Org Type"))
     def converted_generic_org_type(self, obj):
-        return obj.converted_generic_org_type_display
+        return obj.get_effective_generic_org_type_display()
+
+    converted_generic_org_type.admin_order_field = "effective_generic_org_type"  # type: ignore
 
     @admin.display(description=_("Organization Name"))
     def converted_organization_name(self, obj):
         # Example: Show different icons based on `status`
-        if obj.portfolio:
-            url = reverse("admin:registrar_portfolio_change", args=[obj.portfolio.id])
-            text = obj.converted_organization_name
+        if obj.portfolio_id:
+            url = reverse("admin:registrar_portfolio_change", args=[obj.portfolio_id])
+            text = obj.effective_organization_name
             return format_html('<a href="{}">{}</a>', url, text)
         else:
-            return obj.converted_organization_name
+            return obj.effective_organization_name
+
+    converted_organization_name.admin_order_field = "effective_organization_name"  # type: ignore
 
     @admin.display(description=_("Federal Agency"))
     def converted_federal_agency(self, obj):
-        return obj.converted_federal_agency
+        return obj.effective_federal_agency
+
+    converted_federal_agency.admin_order_field = "effective_federal_agency__agency"  # type: ignore
 
     @admin.display(description=_("Federal Type"))
     def converted_federal_type(self, obj):
-        return obj.converted_federal_type_display
+        return obj.get_effective_federal_type_display()
+
+    converted_federal_type.admin_order_field = "effective_federal_type"  # type: ignore
 
     @admin.display(description=_("City"))
     def converted_city(self, obj):
-        return obj.converted_city
+        return obj.effective_city
+
+    converted_city.admin_order_field = "effective_city"  # type: ignore
 
     @admin.display(description=_("State/Territory"))
     def converted_state_territory(self, obj):
-        return obj.converted_state_territory
+        return obj.effective_state_territory
+
+    converted_state_territory.admin_order_field = "effective_state_territory"  # type: ignore
 
     # ------ Portfolio fields ------
     # Define methods to display fields from the related portfolio
@@ -2793,6 +2684,9 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         "analyst_as_investigator",
     ]
 
+    # Related rows shown in the table, loaded with each page
+    list_select_related = ["requester", "requested_domain", "investigator", "portfolio", "effective_federal_agency"]
+
     orderable_fk_fields = [
         ("requester", ["first_name", "last_name"]),
     ]
@@ -3543,25 +3437,6 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         use_sort = db_field.name != "senior_official"
         return super().formfield_for_foreignkey(db_field, request, use_admin_sort_fields=use_sort, **kwargs)
 
-    def get_annotated_queryset(self, queryset):
-        return queryset.annotate(
-            conv_generic_org_type=Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                # Otherwise, return the natively assigned value
-                default=F("generic_org_type"),
-            ),
-            conv_federal_type=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return federal type from federal agency
-                default=F("federal_agency__federal_type"),
-            ),
-        )
-
     def get_queryset(self, request):
         """Custom get_queryset to filter by portfolio if portfolio is in the
         request params."""
@@ -3573,11 +3448,7 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
             qs = qs.filter(portfolio=portfolio_id)
         # Check if user is in OMB analysts group
         if request.user.groups.filter(name="omb_analysts_group").exists():
-            annotated_qs = self.get_annotated_queryset(qs)
-            return annotated_qs.filter(
-                conv_generic_org_type=DomainRequest.OrganizationChoices.FEDERAL,
-                conv_federal_type=BranchChoices.EXECUTIVE,
-            )
+            return qs.filter(get_federal_executive_filter())
         return qs
 
     def has_view_permission(self, request, obj=None):
@@ -3610,11 +3481,8 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
 
         # Add custom search logic for the annotated field
         if search_term:
-            annotated_queryset = queryset.filter(
-                # converted_organization_name
-                Q(portfolio__organization_name__icontains=search_term)
-                | Q(portfolio__isnull=True, organization_name__icontains=search_term)
-            )
+            # The stored converted_organization_name
+            annotated_queryset = queryset.filter(get_search_filter(search_term, ["effective_organization_name"]))
 
             # Combine the two querysets using union
             combined_queryset = base_queryset | annotated_queryset
@@ -3903,7 +3771,7 @@ class DomainResource(FsmModelResource):
         model = models.Domain
 
 
-class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
+class DomainAdmin(LargeTableAdminMixin, ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     """Custom domain admin class to add extra buttons."""
 
     resource_classes = [DomainResource]
@@ -3936,38 +3804,14 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         parameter_name = "converted_generic_orgs"
 
         def lookups(self, request, model_admin):
-            # Annotate the queryset to avoid Python-side iteration
-            queryset = (
-                Domain.objects.annotate(
-                    converted_generic_org=Case(
-                        When(
-                            domain_info__isnull=False,
-                            domain_info__portfolio__organization_type__isnull=False,
-                            then="domain_info__portfolio__organization_type",
-                        ),
-                        When(
-                            domain_info__isnull=False,
-                            domain_info__portfolio__isnull=True,
-                            domain_info__generic_org_type__isnull=False,
-                            then="domain_info__generic_org_type",
-                        ),
-                        default=Value(""),
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("converted_generic_org", flat=True)
-                .distinct()
-            )
-
-            # Filter out empty results and return sorted list of unique values
-            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in queryset if org])
+            # The distinct stored converted values of the domains' information, cached between loads
+            # (see admin_filter_values.py)
+            org_types = DOMAIN_ORG_TYPES.get()
+            return sorted([(org, DomainRequest.OrganizationChoices.get_org_label(org)) for org in org_types])
 
         def queryset(self, request, queryset):
             if self.value():
-                return queryset.filter(
-                    Q(domain_info__portfolio__organization_type=self.value())
-                    | Q(domain_info__portfolio__isnull=True, domain_info__generic_org_type=self.value())
-                )
+                return queryset.filter(domain_info__effective_generic_org_type=self.value())
             return queryset
 
     class FederalTypeFilter(admin.SimpleListFilter):
@@ -3979,112 +3823,19 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         parameter_name = "converted_federal_types"
 
         def lookups(self, request, model_admin):
-            """
-            1. Search for existing federal type
-            2. Then search for federal type from associated portfolio
-            3. Then search for federal type from associated federal agency, where:
-                A. Make sure there's domain_info, if none do nothing
-                B. Check for if no portfolio, if there is then use portfolio
-                C. Check if federal_type is missing - if has don't replace
-                D. Make sure agency has a federal_type as fallback
-                E. Otherwise assign federal_type from agency
-            """
-            queryset = (
-                Domain.objects.annotate(
-                    converted_federal_type=Case(
-                        When(
-                            domain_info__federal_type__isnull=False,
-                            then=F("domain_info__federal_type"),
-                        ),
-                        When(
-                            domain_info__isnull=False,
-                            domain_info__portfolio__isnull=False,
-                            then=F("domain_info__portfolio__federal_agency__federal_type"),
-                        ),
-                        When(
-                            domain_info__isnull=False,
-                            domain_info__portfolio__isnull=True,
-                            domain_info__federal_type__isnull=True,
-                            domain_info__federal_agency__federal_type__isnull=False,
-                            then=F("domain_info__federal_agency__federal_type"),
-                        ),
-                        default=Value(""),
-                        output_field=CharField(),
-                    )
-                )
-                .values_list("converted_federal_type", flat=True)
-                .distinct()
-            )
-
-            return sorted(
-                [
-                    (federal_type, BranchChoices.get_branch_label(federal_type))
-                    for federal_type in queryset
-                    if federal_type
-                ]
-            )
+            """The federal types of the domains' federal agencies, using the
+            portfolio's agency where there is one (see converted_fields.py), cached between loads"""
+            federal_types = DOMAIN_FEDERAL_TYPES.get()
+            return sorted([(value, BranchChoices.get_branch_label(value)) for value in federal_types])
 
         def queryset(self, request, queryset):
-            """
-            1. Does domain's direct federal_type match what was selected
-            2. If not, check domains federal agency if it has a federal_type that matches
-            3. If not, check domain’s portfolio's (if present) link to agency that has
-            federal_type
-            """
-            val = self.value()
-            if val:
-                return queryset.filter(
-                    Q(domain_info__federal_type__iexact=val)
-                    | Q(domain_info__federal_agency__federal_type__iexact=val)
-                    | Q(domain_info__portfolio__federal_agency__federal_type__iexact=val)
-                )
+            if self.value():
+                return queryset.filter(domain_info__effective_federal_type=self.value())
             return queryset
 
     def get_annotated_queryset(self, queryset):
-        return queryset.annotate(
-            converted_generic_org_type=Case(
-                # When portfolio is present, use its value instead
-                When(domain_info__portfolio__isnull=False, then=F("domain_info__portfolio__organization_type")),
-                # Otherwise, return the natively assigned value
-                default=F("domain_info__generic_org_type"),
-            ),
-            converted_federal_agency=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(domain_info__portfolio__isnull=False) & Q(domain_info__portfolio__federal_agency__isnull=False),
-                    then=F("domain_info__portfolio__federal_agency__agency"),
-                ),
-                # Otherwise, return the natively assigned value
-                default=F("domain_info__federal_agency__agency"),
-            ),
-            converted_federal_type=Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(domain_info__portfolio__isnull=False) & Q(domain_info__portfolio__federal_agency__isnull=False),
-                    then=F("domain_info__portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return federal type from federal agency
-                default=F("domain_info__federal_agency__federal_type"),
-            ),
-            converted_organization_name=Case(
-                # When portfolio is present, use its value instead
-                When(domain_info__portfolio__isnull=False, then=F("domain_info__portfolio__organization_name")),
-                # Otherwise, return the natively assigned value
-                default=F("domain_info__organization_name"),
-            ),
-            converted_city=Case(
-                # When portfolio is present, use its value instead
-                When(domain_info__portfolio__isnull=False, then=F("domain_info__portfolio__city")),
-                # Otherwise, return the natively assigned value
-                default=F("domain_info__city"),
-            ),
-            converted_state_territory=Case(
-                # When portfolio is present, use its value instead
-                When(domain_info__portfolio__isnull=False, then=F("domain_info__portfolio__state_territory")),
-                # Otherwise, return the natively assigned value
-                default=F("domain_info__state_territory"),
-            ),
-        )
+        # The converted values are stored on the domain information, see converted_fields.py
+        return queryset.annotate(**converted_field_annotations("domain_info__"))
 
     # Filters
     list_filter = [GenericOrgFilter, FederalTypeFilter, ElectionOfficeFilter, "state"]
@@ -4144,7 +3895,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Use converted value in the table
     @admin.display(description=_("Org Type"))
     def converted_generic_org_type(self, obj):
-        return obj.domain_info.converted_generic_org_type_display
+        return DomainRequest.OrganizationChoices.get_org_label(obj.converted_generic_org_type)
 
     converted_generic_org_type.admin_order_field = "converted_generic_org_type"  # type: ignore
 
@@ -4155,7 +3906,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # --- Federal Agency
     @admin.display(description=_("Federal Agency"))
     def converted_federal_agency(self, obj):
-        return obj.domain_info.converted_federal_agency
+        return obj.converted_federal_agency
 
     converted_federal_agency.admin_order_field = "converted_federal_agency"  # type: ignore
 
@@ -4170,7 +3921,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Use converted value in the table
     @admin.display(description=_("Federal Type"))
     def converted_federal_type(self, obj):
-        return obj.domain_info.converted_federal_type_display
+        return BranchChoices.get_branch_label(obj.converted_federal_type)
 
     converted_federal_type.admin_order_field = "converted_federal_type"  # type: ignore
 
@@ -4182,7 +3933,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Use converted value in the table
     @admin.display(description=_("Organization Name"))
     def converted_organization_name(self, obj):
-        return obj.domain_info.converted_organization_name
+        return obj.converted_organization_name
 
     converted_organization_name.admin_order_field = "converted_organization_name"  # type: ignore
 
@@ -4194,7 +3945,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Use converted value in the table
     @admin.display(description=_("City"))
     def converted_city(self, obj):
-        return obj.domain_info.converted_city
+        return obj.converted_city
 
     converted_city.admin_order_field = "converted_city"  # type: ignore
 
@@ -4206,7 +3957,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     # Use converted value in the table
     @admin.display(description=_("State / territory"))
     def converted_state_territory(self, obj):
-        return obj.domain_info.converted_state_territory
+        return obj.converted_state_territory
 
     converted_state_territory.admin_order_field = "converted_state_territory"  # type: ignore
 
@@ -4556,10 +4307,7 @@ class DomainAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
             qs = qs.filter(domain_info__portfolio=portfolio_id)
         # Check if user is in OMB analysts group
         if request.user.groups.filter(name="omb_analysts_group").exists():
-            return qs.filter(
-                converted_generic_org_type=DomainRequest.OrganizationChoices.FEDERAL,
-                converted_federal_type=BranchChoices.EXECUTIVE,
-            )
+            return qs.filter(get_federal_executive_filter("domain_info__"))
         return qs
 
     def has_view_permission(self, request, obj=None):
@@ -4706,7 +4454,7 @@ class PublicContactResource(resources.ModelResource):
         self.after_save_instance(instance, using_transactions, dry_run)
 
 
-class PublicContactAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
+class PublicContactAdmin(LargeTableAdminMixin, ListHeaderAdmin, ImportExportRegistrarModelAdmin):
     """Custom PublicContact admin class."""
 
     resource_classes = [PublicContactResource]
@@ -5124,6 +4872,19 @@ class FederalAgencyAdmin(ListHeaderAdmin, ImportExportRegistrarModelAdmin):
         "is_fceb",
     ]
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Autocomplete widgets (such as federal_agency on DomainRequest) also match
+        abbreviations and near misses, e.g. "Dept of Defense", through the shared agency index.
+        """
+        base_queryset, use_distinct = super().get_search_results(request, queryset, search_term)
+        is_autocomplete = request is not None and "field_name" in getattr(request, "GET", {})
+        if search_term and is_autocomplete:
+            agency_ids = get_federal_agency_index().find_agency_ids(search_term)
+            if agency_ids:
+                return base_queryset | queryset.filter(pk__in=agency_ids), use_distinct
+        return base_queryset, use_distinct
+
     def get_queryset(self, request):
         """Restrict queryset based on user permissions."""
         qs = super().get_queryset(request)
@@ -5311,6 +5072,21 @@ class AllowedEmailAdmin(ListHeaderAdmin):
     ordering = ["email"]
 
 
+class QueuedEmailAdmin(ListHeaderAdmin):
+    """Emails queued to be sent in the background. Those that failed to send
+    MAX_ATTEMPTS times are marked as failed; setting one back to pending retries it."""
+
+    class Meta:
+        model = models.QueuedEmail
+
+    list_display = ["subject", "to_addresses", "status", "attempts", "last_error", "updated_at"]
+    list_filter = ["status"]
+    search_fields = ["subject", "to_addresses"]
+    search_help_text = "Search by subject or recipient."
+    ordering = ["-updated_at"]
+    readonly_fields = ["subject", "body", "to_addresses", "cc_addresses", "attempts", "last_error"]
+
+
 admin.site.unregister(LogEntry)  # Unregister the default registration
 
 admin.site.register(LogEntry, CustomLogEntryAdmin)
@@ -5340,6 +5116,7 @@ admin.site.register(models.Suborganization, SuborganizationAdmin)
 admin.site.register(models.SeniorOfficial, SeniorOfficialAdmin)
 admin.site.register(models.UserPortfolioPermission, UserPortfolioPermissionAdmin)
 admin.site.register(models.AllowedEmail, AllowedEmailAdmin)
+admin.site.register(models.QueuedEmail, QueuedEmailAdmin)
 
 # Register our custom waffle implementations
 admin.site.register(models.WaffleFlag, WaffleFlagAdmin)
@@ -9,4 +9,11 @@ class RegistrarConfig(AppConfig):
     def ready(self):
         import registrar.signals  # noqa
 
+        from functools import partial
+        from epplibwrapper.metrics import METRICS
+        from registrar.utility.request_metrics import EPP, timed
+
+        # Count the time spent on registry commands against the request being handled
+        METRICS.set_send_timer(partial(timed, EPP))
+
         from . import checks  # noqa: F401  # imported to register system checks, flake8 can ignore 'unused import'
@@ -68,6 +68,13 @@ env_log_format = env.str("DJANGO_LOG_FORMAT", "console")
 env_base_url: str = env.str("DJANGO_BASE_URL")
 env_getgov_public_site_url = env.str("GETGOV_PUBLIC_SITE_URL", "")
 env_oidc_active_provider = env.str("OIDC_ACTIVE_PROVIDER", "identity sandbox")
+env_client_warm_up = env.bool("CLIENT_WARM_UP", default=True)
+env_request_metrics_sample_rate = env.float("REQUEST_METRICS_SAMPLE_RATE", default=0.05)
+env_request_metrics_slow_ms = env.int("REQUEST_METRICS_SLOW_MS", default=2000)
+env_request_metrics_server_timing = env.bool("REQUEST_METRICS_SERVER_TIMING", default=True)
+env_epp_slow_command_ms = env.int("EPP_SLOW_COMMAND_MS", default=2000)
+env_epp_log_commands = env.bool("EPP_LOG_COMMANDS", default=False)
+env_epp_registry_simulator = env.str("EPP_REGISTRY_SIMULATOR", "")
 
 secret_login_key = b64decode(secret("DJANGO_SECRET_LOGIN_KEY", ""))
 secret_key = secret("DJANGO_SECRET_KEY")
@@ -181,6 +188,8 @@ MIDDLEWARE = [
     "registrar.registrar_middleware.NoCacheMiddleware",
     # serve static assets in production
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # count and time the queries and external calls of each request
+    "registrar.registrar_middleware.RequestMetricsMiddleware",
     # provide security enhancements to the request/response cycle
     "django.middleware.security.SecurityMiddleware",
     # django-csp: enable use of Content-Security-Policy header
@@ -210,8 +219,6 @@ MIDDLEWARE = [
     "registrar.registrar_middleware.RestrictAccessMiddleware",
     # Add User Info to Console logs
     "registrar.registrar_middleware.RequestLoggingMiddleware",
-    # Add DB info to logs
-    "registrar.registrar_middleware.DatabaseConnectionMiddleware",
 ]
 
 # application object used by Django's built-in servers (e.g. `runserver`)
@@ -230,6 +237,19 @@ CACHES = {
     }
 }
 
+# seconds the admin changelist filters keep their cached options,
+# see registrar/utility/admin_filter_values.py
+ADMIN_FILTER_VALUES_TIMEOUT = 300
+
+# share of requests whose query counts and external call timings are logged,
+# and the duration past which a request is always logged,
+# see registrar/utility/request_metrics.py
+REQUEST_METRICS_SAMPLE_RATE = env_request_metrics_sample_rate
+REQUEST_METRICS_SLOW_MS = env_request_metrics_slow_ms
+# add those timings to responses, in a Server-Timing header. Never sent in production,
+# as it tells anyone how long the database and the registry take.
+REQUEST_METRICS_SERVER_TIMING = False if env_is_production else env_request_metrics_server_timing
+
 # Absolute path to the directory where `collectstatic`
 # will place static files for deployment.
 # Do not use this directory for permanent storage -
@@ -809,6 +829,23 @@ SECRET_REGISTRY_CERT = secret_registry_cert
 SECRET_REGISTRY_KEY = secret_registry_key
 SECRET_REGISTRY_KEY_PASSPHRASE = secret_registry_key_passphrase
 SECRET_REGISTRY_HOSTNAME = secret_registry_hostname
+
+# The registry (EPP) and OIDC clients connect on first use rather than at import.
+# When True, each WSGI worker connects them in a background thread once it has started,
+# so the first registry command or login doesn't pay for the connection.
+CLIENT_WARM_UP = env_client_warm_up
+
+# registry commands slower than this (including the wait for the connection) are logged
+# with their transaction ids. With EPP_LOG_COMMANDS, every command is logged.
+# see epplibwrapper/metrics.py
+EPP_SLOW_COMMAND_MS = env_epp_slow_command_ms
+EPP_LOG_COMMANDS = env_epp_log_commands
+
+# host:port of a local registry simulator (./manage.py run_registry_simulator) to send
+# registry commands to instead of the registry. Never used in production.
+# see epplibwrapper/simulator.py
+EPP_REGISTRY_SIMULATOR = "" if env_is_production else env_epp_registry_simulator
+
 SECRET_DNS_TENANT_KEY = secret_dns_tenant_key
 SECRET_DNS_TENANT_NAME = secret_dns_tenant_name
 SECRET_DNS_SERVICE_EMAIL = secret_registry_service_email
@@ -950,6 +987,10 @@ SESSION_ENGINE = "django.contrib.sessions.backends.db"
 
 SESSION_SERIALIZER = "django.contrib.sessions.serializers.PickleSerializer"
 
+# where the domain request wizard keeps its state between requests:
+# SessionWizardStateStore (the session) or CacheWizardStateStore (the cache)
+DOMAIN_REQUEST_WIZARD_STATE_STORE = "registrar.views.utility.wizard_storage.SessionWizardStateStore"
+
 # ~ Set by django.middleware.clickjacking.XFrameOptionsMiddleware
 # prevent clickjacking by instructing the browser not to load
 # our site within an iframe
@@ -33,6 +33,7 @@ from registrar.views.utility.api_views import (
     get_federal_and_portfolio_types_from_federal_agency_json,
     get_action_needed_email_for_user_json,
     get_rejection_email_for_user_json,
+    get_epp_metrics_json,
 )
 
 from registrar.views.domain_request import Step, PortfolioDomainRequestStep
@@ -249,6 +250,11 @@ urlpatterns = [
         get_rejection_email_for_user_json,
         name="get-rejection-email-for-user-json",
     ),
+    path(
+        "admin/api/get-epp-metrics-json/",
+        get_epp_metrics_json,
+        name="get-epp-metrics-json",
+    ),
     path("admin/", admin.site.urls),
     path(
         "reports/export_members_portfolio/",
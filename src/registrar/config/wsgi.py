@@ -7,6 +7,32 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.0/howto/deployment/wsgi/
 """
 
+import logging
+import threading
+
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
+logger = logging.getLogger(__name__)
+
 application = get_wsgi_application()
+
+
+def warm_up_clients():
+    """Connect the registry and OIDC clients ahead of the first request that needs them."""
+    try:
+        from djangooidc.views import warm_up_client
+        from epplibwrapper.client import CLIENT as registry
+
+        registry_ready = registry.warm_up()
+        oidc_ready = warm_up_client()
+        logger.info(f"Client warm up finished. Registry ready: {registry_ready}. OIDC ready: {oidc_ready}.")
+    except Exception:
+        # Both clients also connect on first use, so a failed warm up only costs latency.
+        logger.warning("Client warm up failed.", exc_info=True)
+
+
+if settings.CLIENT_WARM_UP:
+    # Gunicorn workers load this module after forking, so each worker warms up its own clients.
+    # Under the gevent worker class this thread is a greenlet, so it does not hold up /health.
+    threading.Thread(target=warm_up_clients, name="client-warm-up", daemon=True).start()
@@ -49,7 +49,17 @@ def org_user_status(request):
 
 
 def add_path_to_context(request):
-    return {"path": getattr(request, "path", None)}
+    """Add the path and url name of the current page to the template context.
+
+    The url name comes from the match Django already made when routing the request, so
+    templates and filters can use it without resolving the path again. It is None
+    when the request wasn't routed to a named url, for example on some error pages.
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    return {
+        "path": getattr(request, "path", None),
+        "current_url_name": resolver_match.url_name if resolver_match else None,
+    }
 
 
 def portfolio_permissions(request):
@@ -0,0 +1,300 @@
+from datetime import timedelta
+import logging
+import random
+
+from django.db import transaction
+from django.utils import timezone
+
+from registrar.models import (
+    Contact,
+    Domain,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    DraftDomain,
+    Portfolio,
+    PortfolioInvitation,
+    User,
+    UserDomainRole,
+    UserPortfolioPermission,
+)
+from registrar.models.utility.converted_fields import sync_converted_fields
+from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
+
+logger = logging.getLogger(__name__)
+
+
+class LargeRegistryFixture:
+    """
+    Creates a registry of a given size, for load testing and benchmarks.
+
+    Each portfolio has an admin, a handful of members, domains managed by the admin
+    and some of the members, open invitations, and a domain request per domain plus
+    some still in progress. Contacts are spread across the requests as other contacts.
+
+    Rows are derived from the seed and their number, so the same sizes and seed build
+    the same registry (dates are relative to the day it is built). Usernames, emails,
+    domain names and organization names start with PREFIX, so generated rows can be told
+    apart from the rest. Everything is written with bulk inserts, without saving models
+    one at a time, so model signals don't run.
+
+    Use `./manage.py generate_large_registry` to run this code.
+    """
+
+    PREFIX = "load"
+
+    DEFAULT_SIZES = {
+        "portfolios": 5000,
+        "users": 25000,
+        "domains": 50000,
+        "contacts": 200000,
+    }
+
+    # In progress domain requests, as a share of the domains
+    OPEN_REQUEST_RATIO = 0.2
+    # Share of domains with an invitation, and the invitations per portfolio
+    DOMAIN_INVITATION_RATIO = 0.1
+    PORTFOLIO_INVITATIONS = 2
+    # Most members that manage one domain, besides the portfolio admin
+    MAX_EXTRA_MANAGERS = 2
+
+    DOMAIN_STATES = [
+        (Domain.State.READY, 80),
+        (Domain.State.DNS_NEEDED, 10),
+        (Domain.State.UNKNOWN, 5),
+        (Domain.State.ON_HOLD, 3),
+        (Domain.State.DELETED, 2),
+    ]
+    OPEN_REQUEST_STATUSES = [
+        DomainRequest.DomainRequestStatus.STARTED,
+        DomainRequest.DomainRequestStatus.SUBMITTED,
+        DomainRequest.DomainRequestStatus.IN_REVIEW,
+        DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+        DomainRequest.DomainRequestStatus.REJECTED,
+        DomainRequest.DomainRequestStatus.WITHDRAWN,
+    ]
+
+    def __init__(self, portfolios, users, domains, contacts, seed=0, batch_size=5000):
+        if portfolios < 1 or users < portfolios:
+            raise ValueError("The registry needs at least one portfolio, and a user for each portfolio")
+        self.sizes = {"portfolios": portfolios, "users": users, "domains": domains, "contacts": contacts}
+        self.random = random.Random(seed)  # nosec
+        self.batch_size = batch_size
+        self.today = timezone.now().date()
+        # Rows created, by model
+        self.created: dict = {}
+
+    @classmethod
+    def exists(cls):
+        """Returns True if a generated registry is already loaded"""
+        return User.objects.filter(username__startswith=f"{cls.PREFIX}-").exists()
+
+    @classmethod
+    def analyst_username(cls):
+        """The generated superuser, which the benchmarks use for the admin"""
+        return f"{cls.PREFIX}-analyst"
+
+    def load(self):
+        """Creates the registry in one transaction, and returns the number of rows of each kind"""
+        with transaction.atomic():
+            users = self.create_users()
+            portfolios = self.create_portfolios(users)
+            members = self.create_permissions(users, portfolios)
+            domains = self.create_domains()
+            requests = self.create_domain_requests(portfolios, domains)
+            self.create_domain_information(requests, domains)
+            self.create_domain_roles(portfolios, members, domains)
+            self.create_invitations(portfolios, domains)
+            self.create_contacts(requests)
+        return {model.__name__: count for model, count in self.created.items()}
+
+    def bulk_create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.created[model] = self.created.get(model, 0) + len(created)
+        logger.info(f"Created {len(created)} {model._meta.verbose_name_plural}.")
+        return created
+
+    def create_users(self):
+        users = [
+            User(
+                username=f"{self.PREFIX}-user-{i}",
+                email=f"{self.PREFIX}-user-{i}@example.gov",
+                first_name=f"First{i}",
+                last_name=f"Last{i}",
+                title="Team member",
+                phone="2022222222",
+                password="!",  # nosec
+            )
+            for i in range(self.sizes["users"])
+        ]
+        users.append(
+            User(
+                username=self.analyst_username(),
+                email=f"{self.analyst_username()}@example.gov",
+                first_name="Load",
+                last_name="Analyst",
+                password="!",  # nosec
+                is_staff=True,
+                is_superuser=True,
+            )
+        )
+        return self.bulk_create(User, users)[:-1]
+
+    def create_portfolios(self, users):
+        """One portfolio per admin. The first users are the admins, in portfolio order."""
+        org_types = [choice for choice, _ in DomainRequest.OrganizationChoices.choices]
+        portfolios = [
+            Portfolio(
+                requester=users[i],
+                organization_name=f"{self.PREFIX} organization {i}",
+                organization_type=self.random.choice(org_types),
+                city="Washington",
+                state_territory="DC",
+            )
+            for i in range(self.sizes["portfolios"])
+        ]
+        return self.bulk_create(Portfolio, portfolios)
+
+    def create_permissions(self, users, portfolios):
+        """Makes each portfolio's requester its admin, and spreads the other users across the
+        portfolios as members. Returns the members of each portfolio."""
+        permissions = [
+            UserPortfolioPermission(
+                user=portfolio.requester, portfolio=portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN]
+            )
+            for portfolio in portfolios
+        ]
+        members: list[list] = [[] for _ in portfolios]
+        for i, user in enumerate(users[len(portfolios) :]):
+            index = i % len(portfolios)
+            members[index].append(user)
+            permissions.append(
+                UserPortfolioPermission(
+                    user=user, portfolio=portfolios[index], roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+                )
+            )
+        self.bulk_create(UserPortfolioPermission, permissions)
+        return members
+
+    def create_domains(self):
+        states, weights = zip(*self.DOMAIN_STATES)
+        domains = [
+            Domain(
+                name=f"{self.PREFIX}-{i}.gov",
+                state=self.random.choices(states, weights)[0],
+                expiration_date=self.today + timedelta(days=self.random.randint(-60, 365)),
+            )
+            for i in range(self.sizes["domains"])
+        ]
+        return self.bulk_create(Domain, domains)
+
+    def create_domain_requests(self, portfolios, domains):
+        """An approved request for each domain, in the domain's portfolio, then the in progress ones"""
+        open_requests = int(len(domains) * self.OPEN_REQUEST_RATIO)
+        draft_domains = self.bulk_create(
+            DraftDomain,
+            [DraftDomain(name=domain.name) for domain in domains]
+            + [DraftDomain(name=f"{self.PREFIX}-requested-{i}.gov") for i in range(open_requests)],
+        )
+        requests = []
+        for i, draft_domain in enumerate(draft_domains):
+            portfolio = portfolios[i % len(portfolios)]
+            approved = i < len(domains)
+            request = DomainRequest(
+                requester=portfolio.requester,
+                portfolio=portfolio,
+                requested_domain=draft_domain,
+                approved_domain=domains[i] if approved else None,
+                status=(
+                    DomainRequest.DomainRequestStatus.APPROVED
+                    if approved
+                    else self.random.choice(self.OPEN_REQUEST_STATUSES)
+                ),
+                generic_org_type=portfolio.organization_type,
+                organization_name=portfolio.organization_name,
+                purpose="Load testing",
+                last_submitted_date=self.today - timedelta(days=self.random.randint(0, 720)),
+            )
+            requests.append(sync_converted_fields(request))
+        return self.bulk_create(DomainRequest, requests)
+
+    def create_domain_information(self, requests, domains):
+        domain_information = [
+            sync_converted_fields(
+                DomainInformation(
+                    requester=request.requester,
+                    portfolio=request.portfolio,
+                    domain_request=request,
+                    domain=domain,
+                    generic_org_type=request.generic_org_type,
+                    organization_name=request.organization_name,
+                )
+            )
+            for request, domain in zip(requests, domains)
+        ]
+        self.bulk_create(DomainInformation, domain_information)
+
+    def create_domain_roles(self, portfolios, members, domains):
+        """The admin of a domain's portfolio manages it, with up to MAX_EXTRA_MANAGERS of its members"""
+        roles = []
+        for i, domain in enumerate(domains):
+            index = i % len(portfolios)
+            managers = [portfolios[index].requester]
+            extra = self.random.randint(0, min(self.MAX_EXTRA_MANAGERS, len(members[index])))
+            managers += self.random.sample(members[index], extra)
+            roles += [UserDomainRole(user=user, domain=domain, role=UserDomainRole.Roles.MANAGER) for user in managers]
+        self.bulk_create(UserDomainRole, roles)
+
+    def create_invitations(self, portfolios, domains):
+        invited = DomainInvitation.DomainInvitationStatus.INVITED
+        retrieved = DomainInvitation.DomainInvitationStatus.RETRIEVED
+        invited_domains = self.random.sample(domains, int(len(domains) * self.DOMAIN_INVITATION_RATIO))
+        self.bulk_create(
+            DomainInvitation,
+            [
+                DomainInvitation(
+                    email=f"{self.PREFIX}-invitee-{i}@example.gov",
+                    domain=domain,
+                    status=self.random.choices([invited, retrieved], [3, 1])[0],
+                )
+                for i, domain in enumerate(invited_domains)
+            ],
+        )
+        self.bulk_create(
+            PortfolioInvitation,
+            [
+                PortfolioInvitation(
+                    email=f"{self.PREFIX}-invitee-{i}-{n}@example.gov",
+                    portfolio=portfolio,
+                    roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER],
+                )
+                for i, portfolio in enumerate(portfolios)
+                for n in range(self.PORTFOLIO_INVITATIONS)
+            ],
+        )
+
+    def create_contacts(self, requests):
+        """Creates the contacts, and adds them to the requests in turn as other contacts"""
+        contacts = self.bulk_create(
+            Contact,
+            [
+                Contact(
+                    first_name=f"Contact{i}",
+                    last_name=f"Last{i}",
+                    title="Contact",
+                    email=f"{self.PREFIX}-contact-{i}@example.gov",
+                    phone="2022222222",
+                )
+                for i in range(self.sizes["contacts"])
+            ],
+        )
+        if not requests:
+            return
+        OtherContacts = DomainRequest.other_contacts.through
+        self.bulk_create(
+            OtherContacts,
+            [
+                OtherContacts(domainrequest_id=requests[i % len(requests)].id, contact_id=contact.id)
+                for i, contact in enumerate(contacts)
+            ],
+        )
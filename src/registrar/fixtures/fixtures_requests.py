@@ -11,6 +11,7 @@ from registrar.models import User, DomainRequest, DraftDomain, Contact, Website,
 from registrar.models.domain import Domain
 from registrar.models.portfolio import Portfolio
 from registrar.models.suborganization import Suborganization
+from registrar.models.utility.converted_fields import refresh_converted_fields
 
 
 fake = Faker()
@@ -367,7 +368,8 @@ class DomainRequestFixture:
         """Bulk create domain requests."""
         if len(domain_requests_to_create) > 0:
             try:
-                DomainRequest.objects.bulk_create(domain_requests_to_create)
+                created = DomainRequest.objects.bulk_create(domain_requests_to_create)
+                refresh_converted_fields(DomainRequest.objects.filter(id__in=[request.id for request in created]))
                 logger.info(f"Successfully created {len(domain_requests_to_create)} requests.")
             except Exception as e:
                 logger.error(f"Unexpected error during requests bulk creation: {e}")
@@ -0,0 +1,65 @@
+"""Times the busiest pages against a generated registry, and compares them with a baseline"""
+
+import json
+import logging
+import os
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from registrar.management.commands.utility.benchmarks import BenchmarkError, find_regressions, run_benchmarks
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the JSON tables, exports, analytics, admin changelists and domain request wizard "
+        "against a registry loaded with generate_large_registry. Writes the results to --output, "
+        "and fails if they regressed from the results in --baseline."
+    )
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument("--repeat", type=int, default=5, help="Times each page is loaded")
+        parser.add_argument("--scenario", action="append", help="Only run the named scenario (repeatable)")
+        parser.add_argument("--output", help="Path of a json file to write the results to")
+        parser.add_argument("--baseline", help="Path of the results of an earlier run to compare with")
+        parser.add_argument(
+            "--tolerance", type=float, default=0.25, help="Slowdown allowed before a page regresses, as a fraction"
+        )
+
+    def handle(self, **options):
+        if settings.IS_PRODUCTION:
+            raise CommandError("benchmark cannot be run in production")
+
+        # Lets the test client in, and sends any emails to the local outbox
+        setup_test_environment()
+        try:
+            results = run_benchmarks(repeat=options["repeat"], names=options["scenario"])
+        except BenchmarkError as err:
+            raise CommandError(str(err)) from err
+        finally:
+            teardown_test_environment()
+
+        for name, result in results.items():
+            if "error" in result:
+                logger.info(f"{name}: {result['error']}")
+            else:
+                logger.info(f"{name}: {result['median_ms']}ms median, {result['queries']} queries")
+
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                json.dump(results, output_file, indent=2, sort_keys=True)
+
+        baseline = {}
+        if options["baseline"] and os.path.exists(options["baseline"]):
+            with open(options["baseline"]) as baseline_file:
+                baseline = json.load(baseline_file)
+        elif options["baseline"]:
+            logger.warning(f"No baseline at {options['baseline']}, only checking for errors")
+
+        regressions = find_regressions(results, baseline, tolerance=options["tolerance"])
+        if regressions:
+            raise CommandError("Regressions:\n" + "\n".join(regressions))
@@ -11,9 +11,11 @@ from registrar.models.portfolio_invitation import PortfolioInvitation
 from registrar.models.user_domain_role import UserDomainRole
 from registrar.models.user_portfolio_permission import UserPortfolioPermission
 from registrar.models.utility.generic_helper import count_capitals, normalize_string
+from registrar.models.utility.converted_fields import refresh_converted_fields
 from django.db.models import F, Q
 
 from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices, UserPortfolioPermissionChoices
+from registrar.utility.federal_agency_index import get_federal_agency_index
 
 
 logger = logging.getLogger(__name__)
@@ -150,6 +152,7 @@ class Command(BaseCommand):
                     f"Cannot find the federal agency '{agency_name}' in our database. "
                     "The value you enter for `agency_name` must be "
                     "prepopulated in the FederalAgency table before proceeding."
+                    f"{self.get_agency_suggestions(agency_name)}"
                 )
             else:
                 raise CommandError(f"Cannot find '{branch}' federal agencies in our database.")
@@ -221,6 +224,9 @@ class Command(BaseCommand):
         # Update DomainInformation
         try:
             self.domain_info_changes.bulk_update(["portfolio", "sub_organization"])
+            refresh_converted_fields(
+                DomainInformation.objects.filter(id__in=[info.id for info in self.domain_info_changes.update])
+            )
         except Exception as err:
             logger.error(f"{TerminalColors.FAIL}Could not bulk update domain infos.{TerminalColors.ENDC}")
             logger.error(err, exc_info=True)
@@ -237,6 +243,9 @@ class Command(BaseCommand):
                     "federal_agency",
                 ]
             )
+            refresh_converted_fields(
+                DomainRequest.objects.filter(id__in=[request.id for request in self.domain_request_changes.update])
+            )
         except Exception as err:
             logger.error(f"{TerminalColors.FAIL}Could not bulk update domain requests.{TerminalColors.ENDC}")
             logger.error(err, exc_info=True)
@@ -255,6 +264,14 @@ class Command(BaseCommand):
         # == PRINT RUN SUMMARY == #
         self.print_final_run_summary(parse_domains, parse_requests, parse_managers, debug)
 
+    def get_agency_suggestions(self, agency_name, limit=3):
+        """Returns a ' Did you mean ...?' hint listing the closest FederalAgency names, if any."""
+        best_matches = get_federal_agency_index().find_matches(agency_name).get_best_matches()
+        suggestions = list(dict.fromkeys(match_string for match_string, _, _ in best_matches))[:limit]
+        if not suggestions:
+            return ""
+        return " Did you mean: " + ", ".join(f"'{suggestion}'" for suggestion in suggestions) + "?"
+
     def print_final_run_summary(self, parse_domains, parse_requests, parse_managers, debug):
         self.portfolio_changes.print_script_run_summary(
             no_changes_message="||============= No portfolios changed. =============||",
@@ -1,19 +1,50 @@
-from django.core.paginator import Paginator
+import csv
+import io
 import logging
 import os
+import shutil
+import time
+from itertools import islice
+
 import pyzipper
-import tablib
 from django.core.management import BaseCommand
 import registrar.admin
+from registrar.management.commands.utility.table_scheduler import DEFAULT_WORKERS, log_throughput, run_tables
 
 logger = logging.getLogger(__name__)
 
+# Number of rows written to each csv file in the zip archive
+ROWS_PER_FILE = 10000
+
+# Number of rows fetched from the database at a time
+QUERY_CHUNK_SIZE = 2000
+
+
+def export_table_to_part(table_name):
+    """Exports a table to a zip file of its own, to be merged into the export. Runs in a worker process."""
+    with pyzipper.AESZipFile(get_part_filename(table_name), "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
+        return Command().export_table(table_name, zipf)
+
+
+def get_part_filename(table_name):
+    """Returns the path of the zip file a worker exports table_name to"""
+    return f"tmp/{table_name}_part.zip"
+
 
 class Command(BaseCommand):
     help = "Exports tables in csv format to zip file in tmp directory."
 
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_WORKERS,
+            help="Number of tables to export at the same time, each in its own process and database connection",
+        )
+
     def handle(self, **options):
-        """Generates CSV files for specified tables and creates a zip archive"""
+        """Streams CSV files for specified tables into a zip archive"""
         table_names = [
             "User",
             "Contact",
@@ -32,62 +63,69 @@ class Command(BaseCommand):
         # Ensure the tmp directory exists
         os.makedirs("tmp", exist_ok=True)
 
-        for table_name in table_names:
-            self.export_table(table_name)
-
-        # Create a zip file containing all the CSV files
+        # Rows are written straight into the zip file, so no table is ever held
+        # in memory or written to disk uncompressed
+        workers = options.get("workers", DEFAULT_WORKERS)
         zip_filename = "tmp/exported_tables.zip"
+        start = time.perf_counter()
         with pyzipper.AESZipFile(zip_filename, "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
-            for table_name in table_names:
-
-                # Define the tmp directory and the file pattern
-                tmp_dir = "tmp"
-                pattern = f"{table_name}_"
-                zip_file_path = os.path.join(tmp_dir, "exported_files.zip")
-
-                # Find all files that match the pattern
-                matching_files = [file for file in os.listdir(tmp_dir) if file.startswith(pattern)]
-                for file_path in matching_files:
-                    # Add each file to the zip archive
-                    zipf.write(f"tmp/{file_path}", os.path.basename(file_path))
-                    logger.info(f"Added {file_path} to {zip_file_path}")
-
-                    # Remove the file after adding to zip
-                    os.remove(f"tmp/{file_path}")
-                    logger.info(f"Removed {file_path}")
-
-    def export_table(self, table_name):
-        """Export a given table to csv files in the tmp directory"""
+            if workers <= 1:
+                results = run_tables(self.export_table, table_names, zipf, workers=1)
+            else:
+                # Tables don't depend on each other when reading, so they are all exported at once,
+                # each to a zip file of its own that is then copied into the export
+                results = run_tables(export_table_to_part, table_names, workers=workers)
+                for table_name in table_names:
+                    self.add_part_to_zip(table_name, zipf)
+
+        log_throughput(results, "exported", time.perf_counter() - start)
+        logger.info(f"Exported {len(table_names)} tables to {zip_filename}")
+
+    def add_part_to_zip(self, table_name, zipf):
+        """Copies the files in a table's part zip file into zipf, then removes the part"""
+        part_filename = get_part_filename(table_name)
+        if not os.path.exists(part_filename):
+            return
+        with pyzipper.AESZipFile(part_filename, "r") as part:
+            for filename in part.namelist():
+                with part.open(filename) as source, zipf.open(filename, "w") as target:
+                    shutil.copyfileobj(source, target)
+        os.remove(part_filename)
+        logger.info(f"Added {part_filename} to {zipf.filename}")
+
+    def export_table(self, table_name, zipf):
+        """Export a given table to csv files, named {table_name}_{n}.csv, in the zip archive.
+        Returns the number of rows exported."""
         resourcename = f"{table_name}Resource"
+        num_rows = 0
         try:
             resourceclass = getattr(registrar.admin, resourcename)
-            dataset = resourceclass().export()
-            if not isinstance(dataset, tablib.Dataset):
-                raise ValueError(f"Exported data from {resourcename} is not a tablib.Dataset")
-
-            # Determine the number of rows per file
-            rows_per_file = 10000
-
-            # Use Paginator to handle splitting the dataset
-            paginator = Paginator(dataset.dict, rows_per_file)
-            num_files = paginator.num_pages
-
-            logger.info(f"splitting {table_name} into {num_files} files")
-
-            # Export each page to a separate file
-            for page_num in paginator.page_range:
-                page = paginator.page(page_num)
-
-                # Create a new dataset for the chunk
-                chunk = tablib.Dataset(headers=dataset.headers)
-                for row_dict in page.object_list:
-                    row = [row_dict[header] for header in dataset.headers]
-                    chunk.append(row)
-
-                # Export the chunk to a new file
-                filename = f"tmp/{table_name}_{page_num}.csv"
-                with open(filename, "w") as f:
-                    f.write(chunk.export("csv"))
+            resource = resourceclass()
+            headers = resource.get_export_headers()
+            rows = (
+                resource.export_resource(instance)
+                for instance in self.get_export_queryset(resource).iterator(chunk_size=QUERY_CHUNK_SIZE)
+            )
+
+            # Always write the first file, so that an empty table still exports its headers
+            num_files = 0
+            row = next(rows, None)
+            while num_files == 0 or row is not None:
+                num_files += 1
+                filename = f"{table_name}_{num_files}.csv"
+                with zipf.open(filename, "w") as raw_file, io.TextIOWrapper(
+                    raw_file, encoding="utf-8", newline=""
+                ) as csv_file:
+                    writer = csv.writer(csv_file)
+                    writer.writerow(headers)
+                    if row is not None:
+                        writer.writerow(row)
+                        num_rows += 1
+                        for row in islice(rows, ROWS_PER_FILE - 1):
+                            writer.writerow(row)
+                            num_rows += 1
+                logger.info(f"Added {filename} to {zipf.filename}")
+                row = next(rows, None)
 
             logger.info(f"Successfully exported {table_name} into {num_files} files.")
 
@@ -95,3 +133,12 @@ class Command(BaseCommand):
             logger.error(f"Resource class {resourcename} not found in registrar.admin")
         except Exception as e:
             logger.error(f"Failed to export {table_name}: {e}")
+        return num_rows
+
+    def get_export_queryset(self, resource):
+        """Returns the resource's queryset in primary key order, with the related objects that
+        each exported row references loaded up front instead of with one query per row"""
+        model = resource._meta.model
+        foreign_keys = [field.name for field in model._meta.concrete_fields if field.many_to_one or field.one_to_one]
+        many_to_many = [field.name for field in model._meta.many_to_many]
+        return resource.get_queryset().select_related(*foreign_keys).prefetch_related(*many_to_many).order_by("pk")
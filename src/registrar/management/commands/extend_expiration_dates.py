@@ -5,17 +5,11 @@ from datetime import date
 import logging
 
 from django.core.management import BaseCommand
-from epplibwrapper.errors import RegistryError
 from registrar.models import Domain
+from registrar.management.commands.utility.bulk_renewal import FAILED, SKIPPED, BulkRenewal
+from registrar.management.commands.utility.registry_workers import get_clients
 from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
 
-from registrar.models.transition_domain import TransitionDomain
-
-try:
-    from epplib.exceptions import TransportError
-except ImportError:
-    pass
-
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +43,16 @@ class Command(BaseCommand):
         parser.add_argument(
             "--disableIdempotentCheck", action=argparse.BooleanOptionalAction, help="Disable script idempotence"
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of domains renewed at once, each over its own registry session",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Path of a file listing the domains done, which a rerun after an interruption skips",
+        )
         parser.add_argument("--debug", action=argparse.BooleanOptionalAction, help="Increases log chattiness")
 
     def handle(self, **options):
@@ -59,17 +63,23 @@ class Command(BaseCommand):
         the number of domains to change is set to the parse limit.
 
         Includes an idempotence check.
+
+        Domains are renewed --concurrency at a time. With --checkpoint, the domains
+        that are done are recorded, and skipped when the command is run again.
         """
 
         # Retrieve command line options
         extension_amount = options.get("extensionAmount")
         limit_parse = options.get("limitParse")
         disable_idempotence = options.get("disableIdempotentCheck")
+        concurrency = options.get("concurrency")
         debug = options.get("debug")
 
         # Does a check to see if parse_limit is a positive int.
         # Raise an error if not.
         self.check_if_positive_int(limit_parse, "limitParse")
+        if concurrency < 1:
+            raise argparse.ArgumentTypeError(f"{concurrency} is an invalid value for concurrency. Must be at least 1.")
 
         valid_domains = Domain.objects.filter(
             expiration_date__gte=self.expiration_minimum_cutoff,
@@ -86,46 +96,41 @@ class Command(BaseCommand):
         # If the user prompts 'N', a sys.exit() will be called.
         self.prompt_user_to_proceed(extension_amount, domains_to_change_count)
 
-        for domain in valid_domains:
-            try:
-                is_idempotent = self.idempotence_check(domain, extension_amount)
-                if not disable_idempotence and not is_idempotent:
-                    self.update_skipped.append(domain.name)
-                    logger.info(f"{TerminalColors.YELLOW}" f"Skipping update for {domain}" f"{TerminalColors.ENDC}")
+        renewal = BulkRenewal(
+            extension_amount,
+            get_clients(concurrency),
+            check_idempotence=not disable_idempotence,
+            checkpoint_path=options.get("checkpoint"),
+        )
+        try:
+            for result in renewal.run(valid_domains):
+                if result.status == SKIPPED:
+                    self.update_skipped.append(result.name)
+                    logger.info(
+                        f"{TerminalColors.YELLOW}" f"Skipping update for {result.name}" f"{TerminalColors.ENDC}"
+                    )
+                elif result.status == FAILED:
+                    self.update_failed.append(result.name)
+                    logger.error(
+                        f"{TerminalColors.FAIL}"
+                        f"Failed to update expiration date for {result.name}"
+                        f"{TerminalColors.ENDC}"
+                    )
+                    logger.error(result.error)
                 else:
-                    domain.renew_domain(extension_amount)
-                    self.update_success.append(domain.name)
+                    self.update_success.append(result.name)
                     logger.info(
                         f"{TerminalColors.OKCYAN}"
-                        f"Successfully updated expiration date for {domain}"
+                        f"Successfully updated expiration date for {result.name}"
                         f"{TerminalColors.ENDC}"
                     )
-            # Catches registry errors. Failures indicate bad data, or a faulty connection.
-            except (RegistryError, KeyError, TransportError) as err:
-                self.update_failed.append(domain.name)
-                logger.error(
-                    f"{TerminalColors.FAIL}" f"Failed to update expiration date for {domain}" f"{TerminalColors.ENDC}"
-                )
-                logger.error(err)
-            except Exception as err:
-                self.log_script_run_summary(debug)
-                raise err
-        self.log_script_run_summary(debug)
+        finally:
+            self.log_script_run_summary(debug)
+            logger.info(
+                f"Processed {renewal.completed} domains in {renewal.elapsed:.1f}s ({renewal.rate():.1f} per second)"
+            )
 
     # == Helper functions == #
-    def idempotence_check(self, domain: Domain, extension_amount):
-        """Determines if the proposed operation violates idempotency"""
-        # Because our migration data had a hard stop date, we can determine if our change
-        # is valid simply checking the date is within a valid range and it was updated
-        # in epp or not.
-        # CAVEAT: This is a workaround. A more robust solution would be a db flag
-        current_expiration_date = domain.registry_expiration_date
-        transition_domains = TransitionDomain.objects.filter(
-            domain_name=domain.name, epp_expiration_date=current_expiration_date
-        )
-
-        return transition_domains.count() > 0
-
     def prompt_user_to_proceed(self, extension_amount, domains_to_change_count):
         """Asks if the user wants to proceed with this action"""
         TerminalHelper.prompt_for_execution(
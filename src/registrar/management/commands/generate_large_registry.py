@@ -0,0 +1,53 @@
+"""Generates a registry of production size, for load testing and benchmarks"""
+
+import logging
+
+from auditlog.context import disable_auditlog
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from registrar.fixtures.fixtures_large_registry import LargeRegistryFixture
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a registry of the given size with bulk inserts: portfolios with admins and members, "
+        "domains with managers, domain requests, invitations and contacts. The same sizes and seed "
+        "build the same registry."
+    )
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        for name, default in LargeRegistryFixture.DEFAULT_SIZES.items():
+            parser.add_argument(f"--{name}", type=int, default=default, help=f"Number of {name} to create")
+        parser.add_argument("--seed", type=int, default=0, help="Seed for the random choices")
+        parser.add_argument("--batchSize", type=int, default=5000, help="Rows written per insert")
+
+    def handle(self, **options):
+        if settings.IS_PRODUCTION:
+            raise CommandError("generate_large_registry cannot be run in production")
+        if LargeRegistryFixture.exists():
+            raise CommandError(
+                f"A generated registry is already loaded (users starting with '{LargeRegistryFixture.PREFIX}-'). "
+                "Clear the database before generating another."
+            )
+
+        try:
+            fixture = LargeRegistryFixture(
+                **{name: options[name] for name in LargeRegistryFixture.DEFAULT_SIZES},
+                seed=options["seed"],
+                batch_size=options["batchSize"],
+            )
+        except ValueError as err:
+            raise CommandError(str(err)) from err
+
+        # django-auditlog has some bugs with fixtures
+        # https://github.com/jazzband/django-auditlog/issues/17
+        with disable_auditlog():
+            created = fixture.load()
+
+        for model_name, count in created.items():
+            logger.info(f"{model_name}: {count}")
+        logger.info(f"Generated registry loaded. Its staff user is {LargeRegistryFixture.analyst_username()}.")
@@ -1,16 +1,134 @@
 import argparse
+import csv
 import logging
 import os
+import re
+import time
+from itertools import islice
+
 import pyzipper
 import tablib
 from django.apps import apps
 from django.conf import settings
-from django.db import transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.color import no_style
+from django.db import DatabaseError, connection, transaction
 from django.core.management import BaseCommand
 import registrar.admin
+from registrar.management.commands.utility.table_scheduler import (
+    DEFAULT_WORKERS,
+    get_dependency_levels,
+    log_throughput,
+    run_tables,
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of rows inserted per query
+BULK_BATCH_SIZE = 1000
+
+
+def import_table_in_worker(table_name, skip_epp_save):
+    """Imports a table in a worker process. Returns the number of rows imported."""
+    command = Command()
+    command.skip_epp_save = skip_epp_save
+    return command.import_table(table_name)
+
+
+class BulkRowLoader:
+    """Loads csv rows exported by a resource into its model with bulk inserts.
+
+    Values are parsed with the resource's widgets. Foreign keys and many to many fields are
+    set from the exported ids directly, instead of fetching each related object. Model
+    save() and its side effects, such as saving to the registry, are skipped.
+    """
+
+    def __init__(self, resource):
+        self.resource = resource
+        self.model = resource._meta.model
+        self.value_fields = []
+        self.foreign_keys = []
+        self.many_to_many = []
+        for field in resource.get_import_fields():
+            model_field = self._get_model_field(field.attribute)
+            if model_field is not None and model_field.many_to_many:
+                if model_field.remote_field.through._meta.auto_created:
+                    self.many_to_many.append((field, model_field))
+            elif model_field is not None and (model_field.many_to_one or model_field.one_to_one):
+                self.foreign_keys.append((field, model_field))
+            else:
+                self.value_fields.append(field)
+
+    def _get_model_field(self, name):
+        try:
+            return self.model._meta.get_field(name) if name else None
+        except FieldDoesNotExist:
+            return None
+
+    def build_instance(self, row):
+        """Returns a model instance, and the ids of its many to many relations, for a csv row"""
+        instance = self.resource.init_instance(row)
+        for field in self.value_fields:
+            self.resource.import_field(field, instance, row)
+        for field, model_field in self.foreign_keys:
+            if field.column_name in row:
+                value = row[field.column_name]
+                setattr(instance, model_field.attname, model_field.target_field.to_python(value) if value else None)
+
+        related_ids = {}
+        for field, model_field in self.many_to_many:
+            if field.column_name in row:
+                separator = getattr(field.widget, "separator", ",")
+                values = row[field.column_name].split(separator)
+                related_ids[model_field] = [value.strip() for value in values if value.strip()]
+        return instance, related_ids
+
+    def insert(self, rows):
+        """Inserts rows, updating any that already exist by primary key. Returns the number of rows"""
+        built = [self.build_instance(row) for row in rows]
+        if not built:
+            return 0
+        instances = [instance for instance, _ in built]
+        pk_name = self.model._meta.pk.name
+        columns = {field.column_name for field in self.resource.get_import_fields()}
+        update_fields = [
+            field.name for field in self.model._meta.concrete_fields if field.name in columns and not field.primary_key
+        ]
+        if update_fields:
+            self.model.objects.bulk_create(
+                instances,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=[pk_name],
+                update_fields=update_fields,
+            )
+        else:
+            self.model.objects.bulk_create(instances, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+        for field, model_field in self.many_to_many:
+            self.set_many_to_many(
+                model_field, [(instance.pk, related_ids.get(model_field)) for instance, related_ids in built]
+            )
+        return len(instances)
+
+    def set_many_to_many(self, model_field, pairs):
+        """Replaces the relations of each instance in pairs of (pk, related ids)"""
+        through = model_field.remote_field.through
+        source = through._meta.get_field(model_field.m2m_field_name()).attname
+        target = through._meta.get_field(model_field.m2m_reverse_field_name()).attname
+        pairs = [(pk, related_ids) for pk, related_ids in pairs if related_ids is not None]
+        through.objects.filter(**{f"{source}__in": [pk for pk, _ in pairs]}).delete()
+        through.objects.bulk_create(
+            [through(**{source: pk, target: related_id}) for pk, related_ids in pairs for related_id in related_ids],
+            batch_size=BULK_BATCH_SIZE,
+        )
+
+    def reset_sequences(self):
+        """Moves the primary key sequence past the imported ids, so new rows don't collide with them"""
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [self.model]):
+                cursor.execute(sql)
+
 
 class Command(BaseCommand):
     help = "Imports tables from a zip file, exported_tables.zip, containing CSV files in the tmp directory."
@@ -18,6 +136,12 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         """Add command line arguments."""
         parser.add_argument("--skipEppSave", default=True, action=argparse.BooleanOptionalAction)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_WORKERS,
+            help="Number of tables to import at the same time, each in its own process and database connection",
+        )
 
     def handle(self, **options):
         """Extracts CSV files from a zip archive and imports them into the respective tables"""
@@ -56,48 +180,111 @@ class Command(BaseCommand):
             zipf.extractall("tmp")
             logger.info(f"Extracted zip file {zip_filename} into tmp directory")
 
-        # Import each CSV file
-        for table_name in table_names:
-            self.import_table(table_name)
+        # Import each table after the tables it references. Tables in the same level
+        # don't reference each other, so they are imported at the same time.
+        workers = options.get("workers", DEFAULT_WORKERS)
+        start = time.perf_counter()
+        results = []
+        for level in get_dependency_levels(table_names):
+            if workers <= 1:
+                results += run_tables(self.import_table, level, workers=1)
+            else:
+                results += run_tables(import_table_in_worker, level, self.skip_epp_save, workers=workers)
+        log_throughput(results, "imported", time.perf_counter() - start)
 
-    def import_table(self, table_name):
-        """Import data from a CSV file into the given table"""
+    def get_table_files(self, table_name, tmp_dir="tmp"):
+        """Returns the csv files for table_name in the order they were exported, which is by primary key"""
+        pattern = re.compile(rf"^{re.escape(table_name)}_(\d+)\.csv$")
+        matches = [pattern.match(file) for file in os.listdir(tmp_dir)]
+        return [match.group(0) for match in sorted(filter(None, matches), key=lambda match: int(match.group(1)))]
 
-        resourcename = f"{table_name}Resource"
+    def import_table(self, table_name, tmp_dir="tmp"):
+        """Import data from the CSV files in tmp_dir for the given table.
+        Returns the number of rows imported."""
 
-        # Define the directory and the pattern for csv filenames
-        tmp_dir = "tmp"
-        pattern = f"{table_name}_"
+        resourcename = f"{table_name}Resource"
 
-        resourceclass = getattr(registrar.admin, resourcename)
+        try:
+            resourceclass = getattr(registrar.admin, resourcename)
+        except AttributeError:
+            logger.error(f"Resource class {resourcename} not found in registrar.admin")
+            return 0
         resource_instance = resourceclass()
 
-        # Find all files that match the pattern
-        matching_files = [file for file in os.listdir(tmp_dir) if file.startswith(pattern)]
-        for csv_filename in matching_files:
+        # Saving to the registry needs each row's model save(), so that goes through the resource
+        save_to_registry = not self.skip_epp_save and hasattr(resource_instance, "skip_epp_save")
+        loader = None if save_to_registry else BulkRowLoader(resource_instance)
+
+        num_rows = 0
+        for csv_filename in self.get_table_files(table_name, tmp_dir):
+            csv_path = os.path.join(tmp_dir, csv_filename)
             try:
-                with open(f"tmp/{csv_filename}", "r") as csvfile:
-                    dataset = tablib.Dataset().load(csvfile.read(), format="csv")
-                result = resource_instance.import_data(dataset, dry_run=False, skip_epp_save=self.skip_epp_save)
-                if result.has_errors():
-                    logger.error(f"Errors occurred while importing {csv_filename}:")
-                    for row_error in result.row_errors():
-                        row_index = row_error[0]
-                        errors = row_error[1]
-                        for error in errors:
-                            logger.error(f"Row {row_index} - {error.error} - {error.row}")
+                if loader is None:
+                    imported, failed = self.import_file_with_resource(resource_instance, csv_path)
                 else:
+                    imported, failed = self.bulk_import_file(loader, csv_path)
+                num_rows += imported
+                if not failed:
                     logger.info(f"Successfully imported {csv_filename} into {table_name}")
-
-            except AttributeError:
-                logger.error(f"Resource class {resourcename} not found in registrar.admin")
             except Exception as e:
                 logger.error(f"Failed to import {csv_filename}: {e}")
             finally:
-                if os.path.exists(csv_filename):
-                    os.remove(csv_filename)
+                if os.path.exists(csv_path):
+                    os.remove(csv_path)
                     logger.info(f"Removed temporary file {csv_filename}")
 
+        if loader is not None:
+            loader.reset_sequences()
+        return num_rows
+
+    def bulk_import_file(self, loader, csv_path):
+        """Imports a csv file in batches, all in one transaction.
+
+        If that fails, for instance on a row that references a missing object, the file is
+        imported again one row at a time, so that only the failing rows are skipped.
+        Returns the number of rows imported and the number that failed.
+        """
+        try:
+            imported = 0
+            with open(csv_path, "r", newline="", encoding="utf-8") as csvfile, transaction.atomic():
+                rows = csv.DictReader(csvfile)
+                while batch_size := loader.insert(islice(rows, BULK_BATCH_SIZE)):
+                    imported += batch_size
+            return imported, 0
+        except DatabaseError as e:
+            logger.warning(f"Bulk import of {csv_path} failed ({e}), retrying one row at a time")
+            return self.import_file_by_row(loader, csv_path)
+
+    def import_file_by_row(self, loader, csv_path):
+        """Imports a csv file one row at a time, logging and skipping rows that fail.
+        Returns the number of rows imported and the number that failed."""
+        imported = failed = 0
+        with open(csv_path, "r", newline="", encoding="utf-8") as csvfile:
+            for row_index, row in enumerate(csv.DictReader(csvfile), start=1):
+                try:
+                    with transaction.atomic():
+                        imported += loader.insert([row])
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Row {row_index} - {e} - {row}")
+        return imported, failed
+
+    def import_file_with_resource(self, resource_instance, csv_path):
+        """Imports a csv file row by row with the resource, saving each row through the model.
+        Returns the number of rows imported and the number that failed."""
+        with open(csv_path, "r") as csvfile:
+            dataset = tablib.Dataset().load(csvfile.read(), format="csv")
+        result = resource_instance.import_data(dataset, dry_run=False, skip_epp_save=self.skip_epp_save)
+        if result.has_errors():
+            logger.error(f"Errors occurred while importing {csv_path}:")
+            for row_error in result.row_errors():
+                row_index = row_error[0]
+                errors = row_error[1]
+                for error in errors:
+                    logger.error(f"Row {row_index} - {error.error} - {error.row}")
+        failed = len(result.row_errors())
+        return len(dataset) - failed, failed
+
     def clean_table(self, table_name):
         """Delete all rows in the given table"""
         try:
@@ -13,6 +13,7 @@ from registrar.models import TransitionDomain, DomainInformation
 from django.core.paginator import Paginator
 from typing import List
 from registrar.models.domain import Domain
+from registrar.models.utility.converted_fields import refresh_converted_fields
 
 from registrar.management.commands.utility.load_organization_error import (
     LoadOrganizationError,
@@ -54,6 +55,12 @@ class Command(BaseCommand):
 
         parser.add_argument("--directory", default="migrationdata", help="Desired directory")
 
+        parser.add_argument(
+            "--use_disk_index",
+            action=argparse.BooleanOptionalAction,
+            help="Stores parsed data files in a local SQLite index rather than in memory",
+        )
+
     def handle(self, migration_json_filename, **options):
         """Load organization address data into the TransitionDomain
         and DomainInformation tables by using the organization adhoc file and domain_additional file"""
@@ -205,6 +212,7 @@ class Command(BaseCommand):
         for page_num in paginator.page_range:
             page = paginator.page(page_num)
             DomainInformation.objects.bulk_update(page.object_list, self.changed_fields)
+            refresh_converted_fields(DomainInformation.objects.filter(id__in=[item.id for item in page.object_list]))
 
         if debug:
             logger.info(f"Updated these DomainInformations: {[item for item in self.domain_information_to_update]}")
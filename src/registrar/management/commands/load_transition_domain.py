@@ -6,6 +6,7 @@ import logging
 import argparse
 
 from collections import defaultdict
+from contextlib import ExitStack
 from django.conf import settings
 
 from django.core.management import BaseCommand
@@ -19,11 +20,17 @@ from registrar.management.commands.utility.terminal_helper import (
 )
 
 from .utility.transition_domain_arguments import TransitionDomainArguments
-from .utility.extra_transition_domain_helper import LoadExtraTransitionDomain
+from .utility.extra_transition_domain_helper import LoadExtraTransitionDomain, SQLiteRowIndex
 
 logger = logging.getLogger(__name__)
 
 
+def close_on_exit(stack, lookup_table):
+    """Closes the lookup table when the stack exits, if it is backed by a disk index"""
+    if isinstance(lookup_table, SQLiteRowIndex):
+        stack.enter_context(lookup_table)
+
+
 class Command(BaseCommand):
     help = """Loads data for domains that are in transition
     (populates transition_domain model objects)."""
@@ -70,6 +77,13 @@ class Command(BaseCommand):
                 "Recommended to be enabled only in a development or testing setting.",
             )
 
+        parser.add_argument(
+            "--use_disk_index",
+            action=argparse.BooleanOptionalAction,
+            help="Stores parsed lookup tables in a local SQLite index rather than in memory. "
+            "Recommended for full registry imports.",
+        )
+
         parser.add_argument("--directory", default="migrationdata", help="Desired directory")
         parser.add_argument(
             "--domain_contacts_filename",
@@ -136,9 +150,16 @@ class Command(BaseCommand):
                 """
             )
 
-    def get_domain_user_dict(self, domain_statuses_filename: str, sep: str) -> defaultdict[str, str]:
+    def _new_lookup_table(self, use_disk_index: bool):
+        """Returns an empty mapping for one of the lookup files,
+        which is backed by a local SQLite index if use_disk_index is set"""
+        if use_disk_index:
+            return SQLiteRowIndex(str)
+        return defaultdict(str)
+
+    def get_domain_user_dict(self, domain_statuses_filename: str, sep: str, use_disk_index=False):
         """Creates a mapping of domain name -> status"""
-        domain_status_dictionary = defaultdict(str)
+        domain_status_dictionary = self._new_lookup_table(use_disk_index)
         logger.info("Reading domain statuses data file %s", domain_statuses_filename)
         with open(domain_statuses_filename, "r") as domain_statuses_file:  # noqa
             for row in csv.reader(domain_statuses_file, delimiter=sep):
@@ -148,9 +169,9 @@ class Command(BaseCommand):
         logger.info("Loaded statuses for %d domains", len(domain_status_dictionary))
         return domain_status_dictionary
 
-    def get_user_emails_dict(self, contacts_filename: str, sep) -> defaultdict[str, str]:
+    def get_user_emails_dict(self, contacts_filename: str, sep, use_disk_index=False):
         """Creates mapping of userId -> emails"""
-        user_emails_dictionary = defaultdict(str)
+        user_emails_dictionary = self._new_lookup_table(use_disk_index)
         logger.info("Reading contacts data file %s", contacts_filename)
         with open(contacts_filename, "r") as contacts_file:
             for row in csv.reader(contacts_file, delimiter=sep):
@@ -407,193 +428,201 @@ class Command(BaseCommand):
             if not os.path.isfile(full_path):
                 raise FileNotFoundError(full_path)
 
-        # STEP 1:
-        # Create mapping of domain name -> status
-        domain_status_dictionary = self.get_domain_user_dict(domain_statuses_filename, sep)
+        # Lookup tables backed by a disk index are closed once the transition domains are created
+        with ExitStack() as lookup_tables:
+            # STEP 1:
+            # Create mapping of domain name -> status
+            domain_status_dictionary = self.get_domain_user_dict(domain_statuses_filename, sep, args.use_disk_index)
+            close_on_exit(lookup_tables, domain_status_dictionary)
 
-        # STEP 2:
-        # Create mapping of userId  -> email
-        user_emails_dictionary = self.get_user_emails_dict(contacts_filename, sep)
+            # STEP 2:
+            # Create mapping of userId  -> email
+            user_emails_dictionary = self.get_user_emails_dict(contacts_filename, sep, args.use_disk_index)
+            close_on_exit(lookup_tables, user_emails_dictionary)
 
-        # STEP 3:
-        # Parse the domain_contacts file and create TransitionDomain objects,
-        # using the dictionaries from steps 1 & 2 to lookup needed information.
-        to_create = []
+            # STEP 3:
+            # Parse the domain_contacts file and create TransitionDomain objects,
+            # using the dictionaries from steps 1 & 2 to lookup needed information.
+            to_create = []
 
-        # keep track of statuses that don't match our available
-        # status values
-        outlier_statuses = []
+            # keep track of statuses that don't match our available
+            # status values
+            outlier_statuses = []
 
-        # keep track of domains that have no known status
-        domains_without_status = []
+            # keep track of domains that have no known status
+            domains_without_status = []
 
-        # keep track of users that have no e-mails
-        users_without_email = []
+            # keep track of users that have no e-mails
+            users_without_email = []
 
-        # keep track of duplications..
-        duplicate_domains = []
-        duplicate_domain_user_combos = []
+            # keep track of duplications..
+            duplicate_domains = []
+            duplicate_domain_user_combos = []
 
-        # keep track of domains we ADD or UPDATE
-        total_updated_domain_entries = 0
-        total_new_entries = 0
+            # keep track of domains we ADD or UPDATE
+            total_updated_domain_entries = 0
+            total_new_entries = 0
 
-        # if we are limiting our parse (for testing purposes, keep
-        # track of total rows parsed)
-        total_rows_parsed = 0
+            # if we are limiting our parse (for testing purposes, keep
+            # track of total rows parsed)
+            total_rows_parsed = 0
 
-        # Start parsing the main file and create TransitionDomain objects
-        logger.info("Reading domain-contacts data file %s", domain_contacts_filename)
-        with open(domain_contacts_filename, "r") as domain_contacts_file:
-            for row in csv.reader(domain_contacts_file, delimiter=sep):
-                total_rows_parsed += 1
+            # Start parsing the main file and create TransitionDomain objects
+            logger.info("Reading domain-contacts data file %s", domain_contacts_filename)
+            with open(domain_contacts_filename, "r") as domain_contacts_file:
+                for row in csv.reader(domain_contacts_file, delimiter=sep):
+                    total_rows_parsed += 1
 
-                # fields are just domain, userid, role
-                # lowercase the domain names
-                new_entry_domain_name = row[0].lower()
-                user_id = row[1]
+                    # fields are just domain, userid, role
+                    # lowercase the domain names
+                    new_entry_domain_name = row[0].lower()
+                    user_id = row[1]
 
-                new_entry_status = TransitionDomain.StatusChoices.READY
-                new_entry_email = ""
-                new_entry_emailSent = False  # set to False by default
+                    new_entry_status = TransitionDomain.StatusChoices.READY
+                    new_entry_email = ""
+                    new_entry_emailSent = False  # set to False by default
 
-                TerminalHelper.print_conditional(
-                    True,
-                    f"Processing item {total_rows_parsed}: {new_entry_domain_name}",
-                )
+                    TerminalHelper.print_conditional(
+                        True,
+                        f"Processing item {total_rows_parsed}: {new_entry_domain_name}",
+                    )
 
-                # PART 1: Get the status
-                if new_entry_domain_name not in domain_status_dictionary:
-                    # This domain has no status...default to "Create"
-                    # (For data analysis purposes, add domain name
-                    # to list of all domains without status
-                    # (avoid duplicate entries))
-                    if new_entry_domain_name not in domains_without_status:
-                        domains_without_status.append(new_entry_domain_name)
-                else:
-                    # Map the status
-                    original_status = domain_status_dictionary[new_entry_domain_name]
-                    mapped_status = self.get_mapped_status(original_status)
-                    if mapped_status is None:
-                        # (For data analysis purposes, check for any statuses
-                        # that don't have a mapping and add to list
-                        # of "outlier statuses")
-                        logger.info("Unknown status: " + original_status)
-                        outlier_statuses.append(original_status)
+                    # PART 1: Get the status
+                    if new_entry_domain_name not in domain_status_dictionary:
+                        # This domain has no status...default to "Create"
+                        # (For data analysis purposes, add domain name
+                        # to list of all domains without status
+                        # (avoid duplicate entries))
+                        if new_entry_domain_name not in domains_without_status:
+                            domains_without_status.append(new_entry_domain_name)
                     else:
-                        new_entry_status = mapped_status
-
-                # PART 2: Get the e-mail
-                if user_id not in user_emails_dictionary:
-                    # this user has no e-mail...this should never happen
-                    if user_id not in users_without_email:
-                        users_without_email.append(user_id)
-                else:
-                    new_entry_email = user_emails_dictionary[user_id]
-
-                # PART 3: Create the transition domain object
-                # Check for duplicate data in the file we are
-                # parsing so we do not add duplicates
-                # NOTE: Currently, we allow duplicate domains,
-                # but not duplicate domain-user pairs.
-                # However, track duplicate domains for now,
-                # since we are still deciding on whether
-                # to make this field unique or not. ~10/25/2023
-                existing_domain = next(
-                    (x for x in to_create if x.domain_name == new_entry_domain_name),
-                    None,
-                )
-                existing_domain_user_pair = next(
-                    (x for x in to_create if x.username == new_entry_email and x.domain_name == new_entry_domain_name),
-                    None,
-                )
-                if existing_domain is not None:
-                    # DEBUG:
-                    TerminalHelper.print_conditional(
-                        debug_on,
-                        f"{TerminalColors.YELLOW} DUPLICATE file entries found for domain: {new_entry_domain_name} {TerminalColors.ENDC}",  # noqa
+                        # Map the status
+                        original_status = domain_status_dictionary[new_entry_domain_name]
+                        mapped_status = self.get_mapped_status(original_status)
+                        if mapped_status is None:
+                            # (For data analysis purposes, check for any statuses
+                            # that don't have a mapping and add to list
+                            # of "outlier statuses")
+                            logger.info("Unknown status: " + original_status)
+                            outlier_statuses.append(original_status)
+                        else:
+                            new_entry_status = mapped_status
+
+                    # PART 2: Get the e-mail
+                    if user_id not in user_emails_dictionary:
+                        # this user has no e-mail...this should never happen
+                        if user_id not in users_without_email:
+                            users_without_email.append(user_id)
+                    else:
+                        new_entry_email = user_emails_dictionary[user_id]
+
+                    # PART 3: Create the transition domain object
+                    # Check for duplicate data in the file we are
+                    # parsing so we do not add duplicates
+                    # NOTE: Currently, we allow duplicate domains,
+                    # but not duplicate domain-user pairs.
+                    # However, track duplicate domains for now,
+                    # since we are still deciding on whether
+                    # to make this field unique or not. ~10/25/2023
+                    existing_domain = next(
+                        (x for x in to_create if x.domain_name == new_entry_domain_name),
+                        None,
                     )
-                    if new_entry_domain_name not in duplicate_domains:
-                        duplicate_domains.append(new_entry_domain_name)
-                if existing_domain_user_pair is not None:
-                    # DEBUG:
-                    TerminalHelper.print_conditional(
-                        debug_on,
-                        f"""{TerminalColors.YELLOW} DUPLICATE file entries found for domain - user {TerminalColors.BackgroundLightYellow} PAIR {TerminalColors.ENDC}{TerminalColors.YELLOW}:  
-                        {new_entry_domain_name} - {new_entry_email} {TerminalColors.ENDC}""",  # noqa
+                    existing_domain_user_pair = next(
+                        (
+                            x
+                            for x in to_create
+                            if x.username == new_entry_email and x.domain_name == new_entry_domain_name
+                        ),
+                        None,
                     )
-                    if existing_domain_user_pair not in duplicate_domain_user_combos:
-                        duplicate_domain_user_combos.append(existing_domain_user_pair)
-                else:
-                    entry_exists = TransitionDomain.objects.filter(
-                        username=new_entry_email, domain_name=new_entry_domain_name
-                    ).exists()
-                    if entry_exists:
-                        try:
-                            existing_entry = TransitionDomain.objects.get(
-                                username=new_entry_email,
-                                domain_name=new_entry_domain_name,
-                            )
+                    if existing_domain is not None:
+                        # DEBUG:
+                        TerminalHelper.print_conditional(
+                            debug_on,
+                            f"{TerminalColors.YELLOW} DUPLICATE file entries found for domain: {new_entry_domain_name} {TerminalColors.ENDC}",  # noqa
+                        )
+                        if new_entry_domain_name not in duplicate_domains:
+                            duplicate_domains.append(new_entry_domain_name)
+                    if existing_domain_user_pair is not None:
+                        # DEBUG:
+                        TerminalHelper.print_conditional(
+                            debug_on,
+                            f"""{TerminalColors.YELLOW} DUPLICATE file entries found for domain - user {TerminalColors.BackgroundLightYellow} PAIR {TerminalColors.ENDC}{TerminalColors.YELLOW}:  
+                            {new_entry_domain_name} - {new_entry_email} {TerminalColors.ENDC}""",  # noqa
+                        )
+                        if existing_domain_user_pair not in duplicate_domain_user_combos:
+                            duplicate_domain_user_combos.append(existing_domain_user_pair)
+                    else:
+                        entry_exists = TransitionDomain.objects.filter(
+                            username=new_entry_email, domain_name=new_entry_domain_name
+                        ).exists()
+                        if entry_exists:
+                            try:
+                                existing_entry = TransitionDomain.objects.get(
+                                    username=new_entry_email,
+                                    domain_name=new_entry_domain_name,
+                                )
 
-                            if not existing_entry.processed:
-                                if existing_entry.status != new_entry_status:
+                                if not existing_entry.processed:
+                                    if existing_entry.status != new_entry_status:
+                                        TerminalHelper.print_conditional(
+                                            debug_on,
+                                            f"{TerminalColors.OKCYAN}"
+                                            f"Updating entry: {existing_entry}"
+                                            f"Status: {existing_entry.status} > {new_entry_status}"  # noqa
+                                            f"Email Sent: {existing_entry.email_sent} > {new_entry_emailSent}"  # noqa
+                                            f"{TerminalColors.ENDC}",
+                                        )
+                                        existing_entry.status = new_entry_status
+                                    existing_entry.email_sent = new_entry_emailSent
+                                    existing_entry.save()
+                                else:
                                     TerminalHelper.print_conditional(
                                         debug_on,
-                                        f"{TerminalColors.OKCYAN}"
-                                        f"Updating entry: {existing_entry}"
-                                        f"Status: {existing_entry.status} > {new_entry_status}"  # noqa
-                                        f"Email Sent: {existing_entry.email_sent} > {new_entry_emailSent}"  # noqa
+                                        f"{TerminalColors.YELLOW}"
+                                        f"Skipping update on processed domain: {existing_entry}"
                                         f"{TerminalColors.ENDC}",
                                     )
-                                    existing_entry.status = new_entry_status
-                                existing_entry.email_sent = new_entry_emailSent
-                                existing_entry.save()
-                            else:
-                                TerminalHelper.print_conditional(
-                                    debug_on,
-                                    f"{TerminalColors.YELLOW}"
-                                    f"Skipping update on processed domain: {existing_entry}"
-                                    f"{TerminalColors.ENDC}",
+
+                            except TransitionDomain.MultipleObjectsReturned:
+                                logger.info(
+                                    f"{TerminalColors.FAIL}"
+                                    f"!!! ERROR: duplicate entries exist in the"
+                                    f"transtion_domain table for domain:"
+                                    f"{new_entry_domain_name}"
+                                    f"----------TERMINATING----------"
                                 )
+                                sys.exit()
 
-                        except TransitionDomain.MultipleObjectsReturned:
-                            logger.info(
-                                f"{TerminalColors.FAIL}"
-                                f"!!! ERROR: duplicate entries exist in the"
-                                f"transtion_domain table for domain:"
-                                f"{new_entry_domain_name}"
-                                f"----------TERMINATING----------"
+                        else:
+                            # no matching entry, make one
+                            new_entry = TransitionDomain(
+                                username=new_entry_email,
+                                domain_name=new_entry_domain_name,
+                                status=new_entry_status,
+                                email_sent=new_entry_emailSent,
+                                processed=False,
                             )
-                            sys.exit()
+                            to_create.append(new_entry)
+                            total_new_entries += 1
 
-                    else:
-                        # no matching entry, make one
-                        new_entry = TransitionDomain(
-                            username=new_entry_email,
-                            domain_name=new_entry_domain_name,
-                            status=new_entry_status,
-                            email_sent=new_entry_emailSent,
-                            processed=False,
-                        )
-                        to_create.append(new_entry)
-                        total_new_entries += 1
+                            # DEBUG:
+                            TerminalHelper.print_conditional(
+                                debug_on,
+                                f"{TerminalColors.OKCYAN} Adding entry {total_new_entries}: {new_entry} {TerminalColors.ENDC}",  # noqa
+                            )
 
-                        # DEBUG:
-                        TerminalHelper.print_conditional(
-                            debug_on,
-                            f"{TerminalColors.OKCYAN} Adding entry {total_new_entries}: {new_entry} {TerminalColors.ENDC}",  # noqa
+                    # Check Parse limit and exit loop if needed
+                    if total_rows_parsed >= debug_max_entries_to_parse and debug_max_entries_to_parse != 0:
+                        logger.info(
+                            f"{TerminalColors.YELLOW}"
+                            f"----PARSE LIMIT REACHED.  HALTING PARSER.----"
+                            f"{TerminalColors.ENDC}"
                         )
+                        break
 
-                # Check Parse limit and exit loop if needed
-                if total_rows_parsed >= debug_max_entries_to_parse and debug_max_entries_to_parse != 0:
-                    logger.info(
-                        f"{TerminalColors.YELLOW}"
-                        f"----PARSE LIMIT REACHED.  HALTING PARSER.----"
-                        f"{TerminalColors.ENDC}"
-                    )
-                    break
-
-        TransitionDomain.objects.bulk_create(to_create)
+            TransitionDomain.objects.bulk_create(to_create)
         # Print a summary of findings (duplicate entries,
         # missing data..etc.)
         self.print_summary_duplications(duplicate_domain_user_combos, duplicate_domains, users_without_email)
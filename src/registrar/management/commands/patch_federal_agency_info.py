@@ -4,14 +4,16 @@ import argparse
 import csv
 import logging
 import os
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from django.core.management import BaseCommand
 from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
 from registrar.models.domain_information import DomainInformation
+from registrar.models.utility.converted_fields import refresh_converted_fields
 from django.db.models import Q
 
 from registrar.models.transition_domain import TransitionDomain
+from registrar.utility.federal_agency_index import get_federal_agency_index
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,10 @@ class Command(BaseCommand):
         self.di_to_update: List[DomainInformation] = []
         self.di_failed_to_update: List[DomainInformation] = []
         self.di_skipped: List[DomainInformation] = []
+        # Records whose agency name only fuzzily matches a FederalAgency, for a person to review.
+        # Maps each record to its agency name and the closest FederalAgency name.
+        self.di_fuzzy_matches: Dict[DomainInformation, Tuple[str, str]] = {}
+        self.agency_index = None
 
     def add_arguments(self, parser):
         """Adds command line arguments"""
@@ -43,6 +49,11 @@ class Command(BaseCommand):
         if not os.path.isfile(current_full_filepath):
             raise argparse.ArgumentTypeError(f"Invalid file path '{current_full_filepath}'")
 
+        # Agency names in TransitionDomain and current-full.csv are free text.
+        # Resolve them to FederalAgency records through the shared matcher index.
+        # Only exact and variant matches are written; fuzzy matches are logged for review.
+        self.agency_index = get_federal_agency_index()
+
         # === Update the "federal_agency" field === #
         was_success = self.patch_agency_info(debug)
 
@@ -68,18 +79,21 @@ class Command(BaseCommand):
                 f"{TerminalColors.ENDC}"
             )
 
+        self.log_fuzzy_matches()
+
     def patch_agency_info(self, debug):
         """
         Updates the federal_agency field of each valid DomainInformation object based on the corresponding
         TransitionDomain object. Skips the update if the TransitionDomain object does not exist or its
-        federal_agency field is None. Logs the update, skip, and failure actions if debug mode is on.
+        federal_agency field is None or matches no FederalAgency exactly or by a variant. Logs the update,
+        skip, and failure actions if debug mode is on.
         After all updates, logs a summary of the results.
         """
 
         # Grab all DomainInformation objects (and their associated TransitionDomains)
         # that need to be updated
         empty_agency_query = Q(federal_agency=None) | Q(federal_agency="")
-        domain_info_to_fix = DomainInformation.objects.filter(empty_agency_query)
+        domain_info_to_fix = DomainInformation.objects.filter(federal_agency__isnull=True)
 
         domain_names = domain_info_to_fix.values_list("domain__name", flat=True)
         transition_domains = TransitionDomain.objects.filter(domain_name__in=domain_names).exclude(empty_agency_query)
@@ -105,12 +119,12 @@ class Command(BaseCommand):
 
         for di in domain_info_to_fix:
             domain_name = di.domain.name
-            federal_agency = td_dict.get(domain_name)
+            federal_agency_id = self.get_agency_id(di, td_dict.get(domain_name))
             log_message = None
 
             # If agency exists on a TransitionDomain, update the related DomainInformation object
-            if domain_name in td_dict:
-                di.federal_agency = federal_agency
+            if federal_agency_id is not None:
+                di.federal_agency_id = federal_agency_id
                 self.di_to_update.append(di)
                 log_message = f"{TerminalColors.OKCYAN}Updated {di}{TerminalColors.ENDC}"
             else:
@@ -123,6 +137,7 @@ class Command(BaseCommand):
 
         # Bulk update the federal agency field in DomainInformation objects
         DomainInformation.objects.bulk_update(self.di_to_update, ["federal_agency"])
+        refresh_converted_fields(DomainInformation.objects.filter(id__in=[di.id for di in self.di_to_update]))
 
         # Get a list of each domain we changed
         corrected_domains = DomainInformation.objects.filter(domain__name__in=domain_names)
@@ -140,6 +155,18 @@ class Command(BaseCommand):
         was_success = len(self.di_failed_to_update) == 0
         return was_success
 
+    def get_agency_id(self, di, agency_name) -> Optional[int]:
+        """Returns the id of the FederalAgency that agency_name names exactly or by a variant.
+        A fuzzy match may be a different agency, so it isn't returned but kept for review."""
+        federal_agency_id = self.agency_index.get_agency_id(agency_name, fuzzy=False)
+        if federal_agency_id is None and agency_name:
+            fuzzy_match = self.agency_index.find_best_match(agency_name)
+            if fuzzy_match:
+                self.di_fuzzy_matches[di] = (agency_name, fuzzy_match)
+        elif federal_agency_id is not None:
+            self.di_fuzzy_matches.pop(di, None)
+        return federal_agency_id
+
     def process_skipped_records(self, file_path, separator, debug):
         """If we encounter any DomainInformation records that do not have data in the associated
         TransitionDomain record, then check the associated current-full.csv file for this
@@ -164,14 +191,14 @@ class Command(BaseCommand):
         for di in self.di_skipped:
             domain_name = di.domain.name
             row = file_data.get(domain_name)
-            fed_agency = None
+            federal_agency_id = None
             if row is not None and "agency" in row:
-                fed_agency = row.get("agency")
+                federal_agency_id = self.get_agency_id(di, row.get("agency"))
 
             # Determine if we should update this record or not.
             # If we don't get any data back, something went wrong.
-            if fed_agency is not None:
-                di.federal_agency = fed_agency
+            if federal_agency_id is not None:
+                di.federal_agency_id = federal_agency_id
                 self.di_to_update.append(di)
                 if debug:
                     logger.info(f"{TerminalColors.OKCYAN}" f"Updating {di}" f"{TerminalColors.ENDC}")
@@ -183,6 +210,7 @@ class Command(BaseCommand):
 
         # Bulk update the federal agency field in DomainInformation objects
         DomainInformation.objects.bulk_update(self.di_to_update, ["federal_agency"])
+        refresh_converted_fields(DomainInformation.objects.filter(id__in=[di.id for di in self.di_to_update]))
 
     def read_current_full(self, file_path, separator):
         """Reads the current-full.csv file and stores it in a dictionary"""
@@ -207,6 +235,22 @@ class Command(BaseCommand):
         for row in reader:
             yield {k.lower(): v for k, v in row.items()}
 
+    def log_fuzzy_matches(self):
+        """Lists the records that were left alone because their agency name only fuzzily
+        matches a FederalAgency, so that a person can review them and set the agency by hand."""
+        if not self.di_fuzzy_matches:
+            return
+        fuzzy_matches = "\n".join(
+            f"{di}: '{agency_name}' is closest to '{fuzzy_match}'"
+            for di, (agency_name, fuzzy_match) in self.di_fuzzy_matches.items()
+        )
+        logger.warning(
+            f"{TerminalColors.YELLOW}"
+            f"{len(self.di_fuzzy_matches)} DomainInformation entries were not updated, as their agency "
+            f"only loosely matches a FederalAgency. Please review:\n{fuzzy_matches}"
+            f"{TerminalColors.ENDC}"
+        )
+
     def log_script_run_summary(self, debug):
         """Prints success, failed, and skipped counts, as well as
         all affected objects."""
@@ -1,16 +1,15 @@
 import argparse
 import logging
 import os
-from typing import List
 from django.core.management import BaseCommand
-from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper, ScriptDataHelper
+from registrar.management.commands.utility.terminal_helper import PopulateScriptTemplate, TerminalColors
 from registrar.models import DomainInformation, DomainRequest
 from registrar.models.utility.generic_helper import CreateOrUpdateOrganizationTypeHelper
 
 logger = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(BaseCommand, PopulateScriptTemplate):
     help = (
         "Loops through each valid DomainInformation and DomainRequest object and updates its organization_type value. "
         "A valid DomainInformation/DomainRequest in this sense is one that has the value None for organization_type. "
@@ -19,16 +18,6 @@ class Command(BaseCommand):
 
     def __init__(self):
         super().__init__()
-        # Get lists for DomainRequest
-        self.request_to_update: List[DomainRequest] = []
-        self.request_failed_to_update: List[DomainRequest] = []
-        self.request_skipped: List[DomainRequest] = []
-
-        # Get lists for DomainInformation
-        self.di_to_update: List[DomainInformation] = []
-        self.di_failed_to_update: List[DomainInformation] = []
-        self.di_skipped: List[DomainInformation] = []
-
         # Define a global variable for all domains with election offices
         self.domains_with_election_boards_set = set()
 
@@ -38,6 +27,9 @@ class Command(BaseCommand):
             "domain_election_board_filename",
             help=("A file that contains" " all the domains that are election offices."),
         )
+        # Updated records drop out of the organization_type__isnull filter,
+        # so rerunning an interrupted run picks up where the last committed chunk left off.
+        self.add_chunk_arguments(parser, resumable=False)
 
     def handle(self, domain_election_board_filename, **kwargs):
         """Loops through each valid Domain object and updates its first_created value"""
@@ -49,40 +41,24 @@ class Command(BaseCommand):
         # Read the election office csv
         self.read_election_board_file(domain_election_board_filename)
 
-        domain_requests = DomainRequest.objects.filter(organization_type__isnull=True)
-
-        # Code execution will stop here if the user prompts "N"
-        TerminalHelper.prompt_for_execution(
-            system_exit_on_terminate=True,
-            prompt_message=f"""
-            ==Proposed Changes==
-            Number of DomainRequest objects to change: {len(domain_requests)}
+        chunk_size = kwargs.get("chunk_size")
+        fields_to_update = ["organization_type", "is_election_board", "generic_org_type"]
 
-            Organization_type data will be added for all of these fields.
-            """,
-            prompt_title="Do you wish to process DomainRequest?",
-        )
+        self.prompt_title = "Do you wish to process DomainRequest?"
+        self.run_summary_header = "============= FINISHED UPDATE FOR DOMAINREQUEST ==============="
         logger.info("Updating DomainRequest(s)...")
-
-        self.update_domain_requests(domain_requests)
+        self.mass_update_records(
+            DomainRequest, {"organization_type__isnull": True}, fields_to_update, chunk_size=chunk_size
+        )
 
         # We should actually be targeting all fields with no value for organization type,
         # but do have a value for generic_org_type. This is because there is data that we can infer.
-        domain_infos = DomainInformation.objects.filter(organization_type__isnull=True)
-        # Code execution will stop here if the user prompts "N"
-        TerminalHelper.prompt_for_execution(
-            system_exit_on_terminate=True,
-            prompt_message=f"""
-            ==Proposed Changes==
-            Number of DomainInformation objects to change: {len(domain_infos)}
-
-            Organization_type data will be added for all of these fields.
-            """,
-            prompt_title="Do you wish to process DomainInformation?",
-        )
+        self.prompt_title = "Do you wish to process DomainInformation?"
+        self.run_summary_header = "============= FINISHED UPDATE FOR DOMAININFORMATION ==============="
         logger.info("Updating DomainInformation(s)...")
-
-        self.update_domain_informations(domain_infos)
+        self.mass_update_records(
+            DomainInformation, {"organization_type__isnull": True}, fields_to_update, chunk_size=chunk_size
+        )
 
     def read_election_board_file(self, domain_election_board_filename):
         """
@@ -104,113 +80,43 @@ class Command(BaseCommand):
                 if domain not in self.domains_with_election_boards_set:
                     self.domains_with_election_boards_set.add(domain)
 
-    def update_domain_requests(self, domain_requests):
-        """
-        Updates the organization_type for a list of DomainRequest objects using the `sync_organization_type` function.
-        Results are then logged.
+    def custom_filter(self, records):
+        """Fetches the related domain names used by update_record alongside each record"""
+        if records.model == DomainRequest:
+            return records.select_related("requested_domain")
+        return records.select_related("domain")
 
-        This function updates the following variables:
-        - self.request_to_update list is appended to if the field was updated successfully.
-        - self.request_skipped list is appended to if the field has `None` for `request.generic_org_type`.
-        - self.request_failed_to_update list is appended to if an exception is caught during update.
-        """
-        for request in domain_requests:
-            try:
-                if request.generic_org_type is not None:
-                    domain_name = None
-                    if request.requested_domain is not None and request.requested_domain.name is not None:
-                        domain_name = request.requested_domain.name
-
-                    request_is_approved = request.status == DomainRequest.DomainRequestStatus.APPROVED
-                    if request_is_approved and domain_name is not None and not request.is_election_board:
-                        request.is_election_board = domain_name in self.domains_with_election_boards_set
-
-                    self.sync_organization_type(DomainRequest, request)
-                    self.request_to_update.append(request)
-                    logger.info(f"Updating {request} => {request.organization_type}")
-                else:
-                    self.request_skipped.append(request)
-                    logger.warning(f"Skipped updating {request}. No generic_org_type was found.")
-            except Exception as err:
-                self.request_failed_to_update.append(request)
-                logger.error(err)
-                logger.error(f"{TerminalColors.FAIL}" f"Failed to update {request}" f"{TerminalColors.ENDC}")
-
-        # Do a bulk update on the organization_type field
-        ScriptDataHelper.bulk_update_fields(
-            DomainRequest, self.request_to_update, ["organization_type", "is_election_board", "generic_org_type"]
-        )
-
-        # Log what happened
-        log_header = "============= FINISHED UPDATE FOR DOMAINREQUEST ==============="
-        TerminalHelper.log_script_run_summary(
-            self.request_to_update,
-            self.request_failed_to_update,
-            self.request_skipped,
-            [],
-            debug=True,
-            log_header=log_header,
-        )
-
-        update_skipped_count = len(self.request_to_update)
-        if update_skipped_count > 0:
+    def should_skip_record(self, record) -> bool:
+        """Records without a generic_org_type have nothing to infer organization_type from"""
+        if record.generic_org_type is None:
             logger.warning(
-                f"""{TerminalColors.MAGENTA}
-                Note: Entries are skipped when generic_org_type is None
-                {TerminalColors.ENDC}
-                """
+                f"{TerminalColors.YELLOW}Skipped updating {record}. No generic_org_type was found.{TerminalColors.ENDC}"
             )
+            return True
+        return False
 
-    def update_domain_informations(self, domain_informations):
+    def update_record(self, record):
         """
-        Updates the organization_type for a list of DomainInformation objects
-        and updates is_election_board if the domain is in the provided csv.
-        Results are then logged.
-
-        This function updates the following variables:
-        - self.di_to_update list is appended to if the field was updated successfully.
-        - self.di_skipped list is appended to if the field has `None` for `request.generic_org_type`.
-        - self.di_failed_to_update list is appended to if an exception is caught during update.
+        Updates organization_type on a DomainRequest or DomainInformation, and sets is_election_board
+        if the domain is in the provided csv. Domain requests are only flagged once approved.
         """
-        for info in domain_informations:
-            try:
-                if info.generic_org_type is not None:
-                    domain_name = info.domain.name
-
-                    if not info.is_election_board:
-                        info.is_election_board = domain_name in self.domains_with_election_boards_set
-
-                    self.sync_organization_type(DomainInformation, info)
-
-                    self.di_to_update.append(info)
-                    logger.info(f"Updating {info} => {info.organization_type}")
-                else:
-                    self.di_skipped.append(info)
-                    logger.warning(f"Skipped updating {info}. No generic_org_type was found.")
-            except Exception as err:
-                self.di_failed_to_update.append(info)
-                logger.error(err)
-                logger.error(f"{TerminalColors.FAIL}" f"Failed to update {info}" f"{TerminalColors.ENDC}")
-
-        # Do a bulk update on the organization_type field
-        ScriptDataHelper.bulk_update_fields(
-            DomainInformation, self.di_to_update, ["organization_type", "is_election_board", "generic_org_type"]
-        )
+        if isinstance(record, DomainRequest):
+            domain_name = None
+            if record.requested_domain is not None and record.requested_domain.name is not None:
+                domain_name = record.requested_domain.name
 
-        # Log what happened
-        log_header = "============= FINISHED UPDATE FOR DOMAININFORMATION ==============="
-        TerminalHelper.log_script_run_summary(
-            self.di_to_update, self.di_failed_to_update, self.di_skipped, [], debug=True, log_header=log_header
-        )
+            request_is_approved = record.status == DomainRequest.DomainRequestStatus.APPROVED
+            if request_is_approved and domain_name is not None and not record.is_election_board:
+                record.is_election_board = domain_name in self.domains_with_election_boards_set
 
-        update_skipped_count = len(self.di_skipped)
-        if update_skipped_count > 0:
-            logger.warning(
-                f"""{TerminalColors.MAGENTA}
-                Note: Entries are skipped when generic_org_type is None
-                {TerminalColors.ENDC}
-                """
-            )
+            self.sync_organization_type(DomainRequest, record)
+        else:
+            if not record.is_election_board:
+                record.is_election_board = record.domain.name in self.domains_with_election_boards_set
+
+            self.sync_organization_type(DomainInformation, record)
+
+        logger.info(f"Updating {record} => {record.organization_type}")
 
     def sync_organization_type(self, sender, instance):
         """
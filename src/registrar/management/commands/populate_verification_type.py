@@ -9,10 +9,20 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand, PopulateScriptTemplate):
     help = "Loops through each valid User object and updates its verification_type value"
 
+    def add_arguments(self, parser):
+        """Adds command line arguments"""
+        self.add_chunk_arguments(parser)
+
     def handle(self, **kwargs):
         """Loops through each valid User object and updates its verification_type value"""
         filter_condition = {"verification_type__isnull": True}
-        self.mass_update_records(User, filter_condition, ["verification_type"])
+        self.mass_update_records(
+            User,
+            filter_condition,
+            ["verification_type"],
+            chunk_size=kwargs.get("chunk_size"),
+            start_after_pk=kwargs.get("start_after_pk"),
+        )
 
     def update_record(self, record: User):
         """Defines how we update the verification_type field"""
@@ -0,0 +1,85 @@
+"""Corrects the registry-derived fields of domains that have drifted from the registry"""
+
+import argparse
+import csv
+import logging
+
+from django.core.management import BaseCommand
+
+from registrar.management.commands.utility.registry_reconciliation import RegistryReconciliation
+from registrar.management.commands.utility.registry_workers import get_clients
+from registrar.management.commands.utility.terminal_helper import TerminalColors
+from registrar.models import Domain
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the expiration dates, creation dates, security contacts and nameservers of domains "
+        "in the registry with the database, and corrects the database. Meant to be run on a schedule."
+    )
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of domains read from the registry at once, each over its own registry session",
+        )
+        parser.add_argument("--batchSize", type=int, default=500, help="Number of domains compared at a time")
+        parser.add_argument("--limitParse", type=int, default=0, help="Sets a cap on the number of domains to check")
+        parser.add_argument("--report", help="Path of a CSV file to write the drift to")
+        parser.add_argument(
+            "--dryRun", action=argparse.BooleanOptionalAction, help="Report the drift without correcting it"
+        )
+
+    def handle(self, **options):
+        concurrency = options["concurrency"]
+        batch_size = options["batchSize"]
+        limit_parse = options["limitParse"]
+        if concurrency < 1 or batch_size < 1 or limit_parse < 0:
+            raise argparse.ArgumentTypeError("--concurrency and --batchSize must be at least 1, --limitParse positive")
+
+        # Domains in other states aren't in the registry
+        domains = Domain.objects.filter(
+            state__in=[Domain.State.DNS_NEEDED, Domain.State.READY, Domain.State.ON_HOLD]
+        ).order_by("name")
+        if limit_parse:
+            domains = domains[:limit_parse]
+
+        reconciliation = RegistryReconciliation(
+            get_clients(concurrency), dry_run=options["dryRun"], batch_size=batch_size
+        )
+        try:
+            reconciliation.run(domains)
+        finally:
+            if options["report"]:
+                self.write_report(options["report"], reconciliation)
+            self.log_summary(reconciliation, options["dryRun"])
+
+    def write_report(self, path, reconciliation):
+        with open(path, "w", newline="") as report_file:
+            writer = csv.writer(report_file)
+            writer.writerow(["Domain", "Field", "Database", "Registry"])
+            for drift in reconciliation.drift + reconciliation.failed:
+                writer.writerow([drift.domain, drift.field, drift.database, drift.registry])
+        logger.info(f"Wrote the drift to {path}")
+
+    def log_summary(self, reconciliation, dry_run):
+        counts = ", ".join(f"{field}: {count}" for field, count in sorted(reconciliation.drift_counts().items()))
+        color = TerminalColors.YELLOW if reconciliation.drift or reconciliation.failed else TerminalColors.OKGREEN
+        logger.info(
+            f"""{color}
+            ============= FINISHED ===============
+            Checked {reconciliation.completed} domains in {reconciliation.elapsed:.1f}s
+            ({reconciliation.rate():.1f} per second)
+            {len(reconciliation.drifted_domains)} domains drifted from the registry ({counts or "none"})
+            {"Dry run: nothing was corrected" if dry_run else f"Corrected {reconciliation.corrected} domains"}
+            Failed to read {len(reconciliation.failed)} domains from the registry
+            {TerminalColors.ENDC}
+            """
+        )
+        for drift in reconciliation.failed:
+            logger.error(f"Failed to read {drift.domain} from the registry: {drift.registry}")
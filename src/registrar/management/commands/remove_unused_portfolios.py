@@ -17,6 +17,7 @@ from registrar.models import (
     Suborganization,
     UserPortfolioPermission,
 )
+from registrar.models.utility.converted_fields import refresh_converted_fields
 
 logger = logging.getLogger(__name__)
 
@@ -173,14 +174,18 @@ class Command(BaseCommand):
                             portfolio_summary.append(
                                 f"{len(domain_informations)} Orphaned DomainInformations:\n{formatted_domain_infos}"
                             )
+                            orphaned_ids = list(domain_informations.values_list("id", flat=True))
                             domain_informations.update(portfolio=None)
+                            refresh_converted_fields(DomainInformation.objects.filter(id__in=orphaned_ids))
 
                         if domain_requests.exists():
                             formatted_domain_reqs = "\n".join([str(req) for req in domain_requests])
                             portfolio_summary.append(
                                 f"{len(domain_requests)} Orphaned DomainRequests:\n{formatted_domain_reqs}"
                             )
+                            orphaned_ids = list(domain_requests.values_list("id", flat=True))
                             domain_requests.update(portfolio=None)
+                            refresh_converted_fields(DomainRequest.objects.filter(id__in=orphaned_ids))
 
                         if portfolio_invitations.exists():
                             formatted_portfolio_invitations = "\n".join([str(inv) for inv in portfolio_invitations])
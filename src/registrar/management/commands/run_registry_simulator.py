@@ -0,0 +1,61 @@
+"""Serves a local stand-in for the registry, for load testing without it"""
+
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from epplibwrapper.simulator import RegistrySimulator
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Serves an EPP registry simulator that keeps domains, contacts and hosts in memory. "
+        "Set EPP_REGISTRY_SIMULATOR to its address (e.g. localhost:7700) to send registry commands to it."
+    )
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument("--host", default="localhost", help="Address to listen on")
+        parser.add_argument("--port", type=int, default=7700, help="Port to listen on")
+        parser.add_argument("--latencyMs", type=float, default=0, help="Time taken to answer each command")
+        parser.add_argument("--jitterMs", type=float, default=0, help="Most the latency varies by, either way")
+        parser.add_argument(
+            "--errorRate", type=float, default=0.0, help="Share of commands that fail with 2400, from 0 to 1"
+        )
+        parser.add_argument(
+            "--sessionTimeout", type=float, default=None, help="Seconds after which idle sessions are closed"
+        )
+        parser.add_argument(
+            "--createMissing",
+            action="store_true",
+            help="Create the domains, contacts and hosts commands refer to if they don't exist, "
+            "to use a database loaded without the registry",
+        )
+        parser.add_argument("--seed", type=int, default=None, help="Seed for the latency and errors")
+
+    def handle(self, **options):
+        if settings.IS_PRODUCTION:
+            raise CommandError("run_registry_simulator cannot be run in production")
+        if not 0 <= options["errorRate"] <= 1:
+            raise CommandError("--errorRate must be between 0 and 1")
+
+        simulator = RegistrySimulator(
+            host=options["host"],
+            port=options["port"],
+            latency_ms=options["latencyMs"],
+            jitter_ms=options["jitterMs"],
+            error_rate=options["errorRate"],
+            session_timeout=options["sessionTimeout"],
+            create_missing=options["createMissing"],
+            seed=options["seed"],
+        )
+        logger.info(f"Registry simulator listening on {simulator.address}. Set EPP_REGISTRY_SIMULATOR to it.")
+        try:
+            simulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            simulator.server.server_close()
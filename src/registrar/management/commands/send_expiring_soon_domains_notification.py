@@ -2,17 +2,31 @@ import logging
 
 from datetime import timedelta
 
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.core.management import BaseCommand
+from django.db.models import Exists, F, OuterRef, Q, Value
 
 from django.utils import timezone
 
-from registrar.models import Domain, UserDomainRole, UserPortfolioPermission
+from registrar.models import Domain, DomainExpirationNotification, UserPortfolioPermission
 from registrar.models.user import UserPortfolioRoleChoices
-from registrar.utility.email import send_templated_email, EmailSendingError
+from registrar.utility.email import EmailSendingError, TemplatedEmail, send_templated_emails
 from django.template.loader import render_to_string
 
 logger = logging.getLogger(__name__)
 
+TEMPLATES = {
+    Domain.State.READY: ("emails/ready_and_expiring_soon.txt", "emails/ready_and_expiring_soon_subject.txt"),
+    Domain.State.DNS_NEEDED: (
+        "emails/dns_needed_or_unknown_expiring_soon.txt",
+        "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
+    ),
+    Domain.State.UNKNOWN: (
+        "emails/dns_needed_or_unknown_expiring_soon.txt",
+        "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
+    ),
+}
+
 
 class Command(BaseCommand):
     help = (
@@ -20,6 +34,10 @@ class Command(BaseCommand):
         "and portfolio managers at 30, 7, and 1 day(s) before expiration."
     )
 
+    days_to_check = [30, 7, 1]
+    # Number of emails sent before the notifications are recorded
+    batch_size = 100
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--dry-run",
@@ -31,91 +49,129 @@ class Command(BaseCommand):
         """
         How to run it in dry run mode:
         ./manage.py send_expiring_soon_domains_notification --dry-run
+
+        Notifications that were sent are recorded, so running it again on the same
+        day only sends those that failed.
         """
         dryrun = options.get("dry_run", False)
-
-        all_emails_sent = True
         today = timezone.now().date()
 
-        days_to_check = [30, 7, 1]
-        expiring_domains = Domain.objects.filter(expiration_date__in=[today + timedelta(days=d) for d in days_to_check])
-        logger.info(f"Found {expiring_domains.count()} domains expiring in 30, 7, or 1 days")
-
-        for days_remaining in days_to_check:
-
-            expiration_day = today + timedelta(days=days_remaining)
-            domains = Domain.objects.filter(expiration_date=expiration_day)
-
-            logger.info(f"Found {domains.count()} domains expiring in {days_remaining} days")
-
-            for domain in domains:
-                if domain.state == Domain.State.READY:
-                    template = "emails/ready_and_expiring_soon.txt"
-                    subject_template = "emails/ready_and_expiring_soon_subject.txt"
-                elif domain.state in [Domain.State.DNS_NEEDED, Domain.State.UNKNOWN]:
-                    template = "emails/dns_needed_or_unknown_expiring_soon.txt"
-                    subject_template = "emails/dns_needed_or_unknown_expiring_soon_subject.txt"
-                else:
-                    continue
-
-                context = {
+        domains = self.get_expiring_domains(today)
+        logger.info(f"Found {len(domains)} domains expiring in 30, 7, or 1 days that haven't been notified")
+        portfolio_admin_emails = self.get_portfolio_admin_emails({domain.info_portfolio_id for domain in domains})
+
+        notifications = []
+        for domain in domains:
+            template, subject_template = TEMPLATES[domain.state]
+            days_remaining = (domain.expiration_date - today).days
+            email = TemplatedEmail(
+                template,
+                subject_template,
+                to_addresses=domain.manager_emails,
+                cc_addresses=portfolio_admin_emails.get(domain.info_portfolio_id, []),
+                context={
                     "domain": domain,
                     "days_remaining": days_remaining,
                     "expiration_date": domain.expiration_date,
-                }
-
-                # -- GRAB DOMAIN MANAGER EMAILS --
-                domain_manager_emails = list(
-                    UserDomainRole.objects.filter(domain=domain).values_list("user__email", flat=True).distinct()
-                )
+                },
+            )
+            notifications.append((domain, days_remaining, email))
 
-                # -- GRAB PORTFOLIO ADMIN EMAILS --
-                portfolio_id = domain.domain_info.portfolio_id
-                portfolio_admin_emails = list(
-                    UserPortfolioPermission.objects.filter(
-                        portfolio_id=portfolio_id,
-                        roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
-                    )
-                    .values_list("user__email", flat=True)
-                    .distinct()
-                )
+        if dryrun:
+            for domain, _, email in notifications:
+                self.log_dry_run(domain, email)
+            return
 
-                try:
-                    if dryrun:
-                        rendered_subject = render_to_string(subject_template, context).strip()
-                        rendered_body = render_to_string(template, context)
-
-                        logger.info(
-                            f"[DRYRUN]\n"
-                            f"Would send email for domain {domain.name}\n"
-                            f"TO: {domain_manager_emails}\n"
-                            f"CC: {portfolio_admin_emails}\n"
-                            f"Subject: {rendered_subject}\n"
-                            f"Body:\n{rendered_body}"
-                        )
-                    else:
-                        send_templated_email(
-                            template,
-                            subject_template,
-                            to_addresses=domain_manager_emails,
-                            cc_addresses=portfolio_admin_emails,
-                            context=context,
-                        )
-                        logger.info(f"Sent email for domain {domain.name} to managers and CC’d org admins")
-                except EmailSendingError as err:
-                    if not dryrun:
-                        logger.error(
-                            "Failed to send expiring soon email(s):\n"
-                            f"  Subject template: {subject_template}\n"
-                            f"  To: {', '.join(domain_manager_emails)}\n"
-                            f"  CC: {', '.join(portfolio_admin_emails)}\n"
-                            f"  Domain: {domain.name}\n"
-                            f"  Error: {err}",
-                            exc_info=True,
-                        )
-                        all_emails_sent = False
+        all_emails_sent = True
+        for start in range(0, len(notifications), self.batch_size):
+            batch = notifications[start : start + self.batch_size]
+            if not self.send_batch(batch):
+                all_emails_sent = False
 
         if all_emails_sent:
             self.stdout.write(self.style.SUCCESS("All domain expiration emails sent successfully."))
         else:
             self.stderr.write(self.style.ERROR("Some domain expiration emails failed to send."))
+
+    def get_expiring_domains(self, today) -> list[Domain]:
+        """Returns the domains expiring in one of days_to_check days that haven't been notified for it,
+        with the emails of their managers and the portfolio of their domain information"""
+        sent = DomainExpirationNotification.objects.filter(
+            domain=OuterRef("pk"), expiration_date=OuterRef("expiration_date")
+        )
+        expiring_soon = Q()
+        for days_remaining in self.days_to_check:
+            expiring_soon |= Q(expiration_date=today + timedelta(days=days_remaining)) & ~Exists(
+                sent.filter(days_remaining=days_remaining)
+            )
+        return list(
+            Domain.objects.filter(expiring_soon, state__in=list(TEMPLATES))
+            .annotate(
+                info_portfolio_id=F("domain_info__portfolio_id"),
+                manager_emails=ArrayAgg(
+                    "permissions__user__email",
+                    distinct=True,
+                    filter=Q(permissions__user__email__isnull=False),
+                    default=Value([]),
+                ),
+            )
+            .order_by("expiration_date", "name")
+        )
+
+    def get_portfolio_admin_emails(self, portfolio_ids) -> dict[int, list[str]]:
+        """Returns the emails of the admins of each portfolio, in one query"""
+        admin_emails: dict[int, list[str]] = {}
+        rows = (
+            UserPortfolioPermission.objects.filter(
+                portfolio_id__in=[portfolio_id for portfolio_id in portfolio_ids if portfolio_id],
+                roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+                user__email__isnull=False,
+            )
+            .values_list("portfolio_id", "user__email")
+            .distinct()
+        )
+        for portfolio_id, email in rows:
+            admin_emails.setdefault(portfolio_id, []).append(email)
+        return admin_emails
+
+    def send_batch(self, batch) -> bool:
+        """Sends a batch of notifications and records those that were sent. Returns whether all were."""
+        try:
+            failures = send_templated_emails([email for _, _, email in batch])
+        except EmailSendingError as err:
+            failures = [(email, err) for _, _, email in batch]
+        failed = {id(email) for email, _ in failures}
+        for email, err in failures:
+            logger.error(
+                "Failed to send expiring soon email(s):\n"
+                f"  Subject template: {email.subject_template_name}\n"
+                f"  To: {', '.join(email.to_addresses)}\n"
+                f"  CC: {', '.join(email.cc_addresses)}\n"
+                f"  Domain: {email.context['domain'].name}\n"
+                f"  Error: {err}",
+                exc_info=err,
+            )
+        DomainExpirationNotification.objects.bulk_create(
+            [
+                DomainExpirationNotification(
+                    domain=domain, expiration_date=domain.expiration_date, days_remaining=days_remaining
+                )
+                for domain, days_remaining, email in batch
+                if id(email) not in failed
+            ],
+            ignore_conflicts=True,
+        )
+        logger.info(f"Sent {len(batch) - len(failures)} emails to managers and CC’d org admins")
+        return not failures
+
+    def log_dry_run(self, domain, email):
+        rendered_subject = render_to_string(email.subject_template_name, email.context).strip()
+        rendered_body = render_to_string(email.template_name, email.context)
+        logger.info(
+            f"[DRYRUN]\n"
+            f"Would send email for domain {domain.name}\n"
+            f"TO: {email.to_addresses}\n"
+            f"CC: {email.cc_addresses}\n"
+            f"Subject: {rendered_subject}\n"
+            f"Body:\n{rendered_body}"
+        )
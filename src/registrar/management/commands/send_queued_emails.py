@@ -0,0 +1,27 @@
+"""Sends the emails left queued by send_templated_emails_later"""
+
+import logging
+
+from django.core.management import BaseCommand
+
+from registrar.models import QueuedEmail
+from registrar.utility.email import send_queued_emails
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends the queued emails that weren't sent in the background, such as when sending failed or "
+        "the process sending them stopped. Meant to be run on a schedule."
+    )
+
+    def handle(self, **options):
+        sent, failed = send_queued_emails()
+        logger.info(f"Sent {sent} queued emails, {failed} failed")
+        given_up = QueuedEmail.objects.filter(status=QueuedEmail.Status.FAILED).count()
+        if given_up:
+            logger.error(
+                f"{given_up} queued emails failed {QueuedEmail.MAX_ATTEMPTS} times and won't be retried. "
+                "They are listed under Queued emails in the admin."
+            )
@@ -5,18 +5,22 @@ import sys
 from django_fsm import TransitionNotAllowed  # type: ignore
 
 from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Q
 
 from registrar.models import TransitionDomain
 from registrar.models import Domain
 from registrar.models import DomainInvitation
 
 from registrar.management.commands.utility.terminal_helper import (
+    ScriptDataHelper,
     TerminalColors,
     TerminalHelper,
 )
 from registrar.models.contact import Contact
 from registrar.models.domain_request import DomainRequest
 from registrar.models.domain_information import DomainInformation
+from registrar.models.utility.converted_fields import refresh_converted_fields
 from registrar.models.user import User
 from registrar.models.federal_agency import FederalAgency
 from registrar.utility.constants import BranchChoices
@@ -24,11 +28,31 @@ from registrar.utility.constants import BranchChoices
 logger = logging.getLogger(__name__)
 
 
+class TransferSummary:
+    """Running totals for a transfer run. Only domain names are kept
+    (not model instances) so that memory stays flat across chunks."""
+
+    def __init__(self):
+        self.created_domains: list[str] = []
+        self.updated_domains: list[str] = []
+        self.skipped_domains: list[str] = []
+        self.created_domain_invitations: list[str] = []
+        self.skipped_domain_invitations: list[str] = []
+        self.created_domain_information: list[str] = []
+        self.updated_domain_information: list[str] = []
+
+
 class Command(BaseCommand):
     help = """Load data from transition domain tables
     into main domain tables.  Also create domain invitation
     entries for every domain we ADD (but not for domains
-    we UPDATE)"""
+    we UPDATE).
+
+    Transition domains are transferred in chunks of domain names.
+    Each chunk is committed in its own transaction together with
+    the 'processed' flag of its transition domains, so an interrupted
+    run can simply be restarted and will resume after the last
+    committed chunk."""
 
     # ======================================================
     # ===================== ARGUMENTS  =====================
@@ -42,6 +66,13 @@ class Command(BaseCommand):
             help="Sets max number of entries to load, set to 0 to load all entries",
         )
 
+        parser.add_argument(
+            "--batchSize",
+            default=1000,
+            type=int,
+            help="Number of domain names to transfer (and commit) per chunk",
+        )
+
     # ======================================================
     # ===================== PRINTING  ======================
     # ======================================================
@@ -67,72 +98,38 @@ class Command(BaseCommand):
             """,
         )
 
-    def parse_limit_reached(self, debug_max_entries_to_parse: bool, total_rows_parsed: int) -> bool:
-        if debug_max_entries_to_parse > 0 and total_rows_parsed >= debug_max_entries_to_parse:
-            logger.info(
-                f"""{TerminalColors.YELLOW}
-                ----PARSE LIMIT REACHED.  HALTING PARSER.----
-                {TerminalColors.ENDC}
-                """
-            )
-            return True
-        return False
-
-    def print_summary_of_findings(
-        self,
-        domains_to_create,
-        updated_domain_entries,
-        domain_invitations_to_create,
-        skipped_domain_entries,
-        domain_information_to_create,
-        updated_domain_information,
-        debug_on,
-    ):
+    def print_summary_of_findings(self, summary: TransferSummary, debug_on):
         """Prints to terminal a summary of findings from
         transferring transition domains to domains"""
 
-        total_new_entries = len(domains_to_create)
-        total_updated_domain_entries = len(updated_domain_entries)
-        total_domain_invitation_entries = len(domain_invitations_to_create)
-
-        total_new_domain_information_entries = len(domain_information_to_create)
-        total_updated_domain_information_entries = len(updated_domain_information)
-
         logger.info(
             f"""{TerminalColors.OKGREEN}
             ============= FINISHED ===============
-            Created {total_new_entries} domain entries,
-            Updated {total_updated_domain_entries} domain entries
+            Created {len(summary.created_domains)} domain entries,
+            Updated {len(summary.updated_domains)} domain entries
 
-            Created {total_new_domain_information_entries} domain information entries,
-            Updated {total_updated_domain_information_entries} domain information entries,
+            Created {len(summary.created_domain_information)} domain information entries,
+            Updated {len(summary.updated_domain_information)} domain information entries,
 
-            Created {total_domain_invitation_entries} domain invitation entries
+            Created {len(summary.created_domain_invitations)} domain invitation entries
             (NOTE: no invitations are SENT in this script)
             {TerminalColors.ENDC}
             """  # noqa
         )
-        if len(skipped_domain_entries) > 0:
+        if len(summary.skipped_domains) > 0:
             logger.info(
                 f"""{TerminalColors.FAIL}
                 ============= SKIPPED DOMAINS (ERRORS) ===============
-                {skipped_domain_entries}
+                {summary.skipped_domains}
                 {TerminalColors.ENDC}
                 """
             )
 
-        # determine domainInvitations we SKIPPED
-        skipped_domain_invitations = []
-        for domain in domains_to_create:
-            skipped_domain_invitations.append(domain)
-        for domain_invite in domain_invitations_to_create:
-            if domain_invite.domain in skipped_domain_invitations:
-                skipped_domain_invitations.remove(domain_invite.domain)
-        if len(skipped_domain_invitations) > 0:
+        if len(summary.skipped_domain_invitations) > 0:
             logger.info(
                 f"""{TerminalColors.FAIL}
                 ============= SKIPPED DOMAIN INVITATIONS (ERRORS) ===============
-                {skipped_domain_invitations}
+                {summary.skipped_domain_invitations}
                 {TerminalColors.ENDC}
                 """
             )
@@ -143,68 +140,40 @@ class Command(BaseCommand):
             f"""{TerminalColors.YELLOW}
             ======= DEBUG OUTPUT =======
             Created Domains:
-            {domains_to_create}
+            {summary.created_domains}
 
             Updated Domains:
-            {updated_domain_entries}
+            {summary.updated_domains}
 
             {TerminalColors.ENDC}
             """,
         )
 
     # ======================================================
-    # ===================    DOMAIN    =====================
+    # ===================== LOADING  =======================
     # ======================================================
-    def update_or_create_domain(self, transition_domain: TransitionDomain, debug_on: bool):
-        """Given a transition domain, either finds & updates an existing
-        corresponding domain, or creates a new corresponding domain in
-        the Domain table.
-
-        Returns the corresponding Domain object and a boolean
-        that is TRUE if that Domain was newly created.
-        """
-
-        # Create some local variables to make data tracing easier
-        transition_domain_name = transition_domain.domain_name
-        transition_domain_status = transition_domain.status
-        transition_domain_creation_date = transition_domain.epp_creation_date
-        transition_domain_expiration_date = transition_domain.epp_expiration_date
-
-        domain_exists = Domain.objects.filter(name=transition_domain_name).exists()
-        if domain_exists:
-            try:
-                # ----------------------- UPDATE DOMAIN -----------------------
-                # ---- GET THE DOMAIN
-                target_domain = Domain.objects.get(name=transition_domain_name)
-                # DEBUG:
-                TerminalHelper.print_conditional(
-                    debug_on,
-                    f"""{TerminalColors.YELLOW}
-                    > Found existing entry in Domain table for: {transition_domain_name}, {target_domain.state}
-                    {TerminalColors.ENDC}""",  # noqa
-                )
-
-                # ---- UPDATE THE DOMAIN
-                # update the status
-                self.update_domain_status(transition_domain, target_domain, debug_on)
-                # TODO: not all domains need to be updated
-                # (the information is the same).
-                # Need to bubble this up to the final report.
-
-                # update dates (creation and expiration)
-                if transition_domain_creation_date is not None:
-                    # TODO: added this because I ran into a situation where
-                    # the created_at date was null (violated a key constraint).
-                    # How do we want to handle this case?
-                    target_domain.created_at = transition_domain_creation_date
-
-                if transition_domain_expiration_date is not None:
-                    target_domain.expiration_date = transition_domain_expiration_date
-                target_domain.save()
-
-                return (target_domain, False)
-
-            except Domain.MultipleObjectsReturned:
+    def load_transition_domains(self, debug_max_entries_to_parse: int) -> dict[str, list[TransitionDomain]]:
+        """Loads every unprocessed transition domain in a single query and
+        groups them by domain name (in the order they were loaded).
+
+        Grouping by name guarantees that all rows for the same domain land
+        in the same chunk, which is what makes the 'processed' flag safe
+        to use as a resume checkpoint."""
+        transition_domains = TransitionDomain.objects.filter(processed=False).order_by("id")
+        if debug_max_entries_to_parse > 0:
+            transition_domains = transition_domains[:debug_max_entries_to_parse]
+
+        grouped: dict[str, list[TransitionDomain]] = {}
+        for transition_domain in transition_domains.iterator(chunk_size=2000):
+            grouped.setdefault(transition_domain.domain_name, []).append(transition_domain)
+        return grouped
+
+    def resolve_existing_domains(self, domain_names) -> dict[str, Domain]:
+        """Resolves domain names to existing Domain objects with one query.
+        Exits if the Domain table holds duplicate entries for any name."""
+        existing_domains: dict[str, Domain] = {}
+        for domain in Domain.objects.filter(name__in=domain_names):
+            if domain.name in existing_domains:
                 # This exception was thrown once before during testing.
                 # While the circumstances that led to corrupt data in
                 # the domain table was a freak accident, and the possibility of it
@@ -216,7 +185,7 @@ class Command(BaseCommand):
                     {TerminalColors.FAIL}
                     !!! ERROR: duplicate entries already exist in the
                     Domain table for the following domain:
-                    {transition_domain_name}
+                    {domain.name}
 
                     RECOMMENDATION:
                     This means the Domain table is corrupt.  Please
@@ -226,33 +195,53 @@ class Command(BaseCommand):
                     ----------TERMINATING----------"""
                 )
                 sys.exit()
-            except TransitionNotAllowed as err:
-                logger.warning(
-                    f"""{TerminalColors.FAIL}
-                    Unable to change state for {transition_domain_name}
+            existing_domains[domain.name] = domain
+        return existing_domains
 
-                    RECOMMENDATION:
-                    This indicates there might have been changes to the
-                    Domain model which were not accounted for in this
-                    migration script.  Please check state change rules
-                    in the Domain model and ensure we are following the
-                    correct state transition pathways.
-
-                    INTERNAL ERROR MESSAGE:
-                    'TRANSITION NOT ALLOWED' exception
-                    {err}
-                    ----------SKIPPING----------"""
-                )
-                return (None, False)
-        else:
-            # ----------------------- CREATE DOMAIN -----------------------
-            # no matching entry, make one
-            target_domain = Domain(
-                name=str(transition_domain_name),
-                state=transition_domain_status,
-                expiration_date=transition_domain_expiration_date,
+    # ======================================================
+    # ===================    DOMAIN    =====================
+    # ======================================================
+    def update_domain(self, transition_domain: TransitionDomain, target_domain: Domain, debug_on: bool) -> bool:
+        """Given a transition domain that matches an existing domain, updates
+        the status and dates of the existing domain in memory. Status changes
+        go through the FSM transitions; the state and dates are written later in bulk.
+
+        Returns FALSE if the state transition is not allowed."""
+        # DEBUG:
+        TerminalHelper.print_conditional(
+            debug_on,
+            f"""{TerminalColors.YELLOW}
+            > Found existing entry in Domain table for: {target_domain.name}, {target_domain.state}
+            {TerminalColors.ENDC}""",  # noqa
+        )
+        try:
+            self.update_domain_status(transition_domain, target_domain, debug_on)
+        except TransitionNotAllowed as err:
+            logger.warning(
+                f"""{TerminalColors.FAIL}
+                Unable to change state for {target_domain.name}
+
+                RECOMMENDATION:
+                This indicates there might have been changes to the
+                Domain model which were not accounted for in this
+                migration script.  Please check state change rules
+                in the Domain model and ensure we are following the
+                correct state transition pathways.
+
+                INTERNAL ERROR MESSAGE:
+                'TRANSITION NOT ALLOWED' exception
+                {err}
+                ----------SKIPPING----------"""
             )
-            return (target_domain, True)
+            return False
+
+        # update dates (creation and expiration)
+        if transition_domain.epp_creation_date is not None:
+            target_domain.created_at = transition_domain.epp_creation_date
+
+        if transition_domain.epp_expiration_date is not None:
+            target_domain.expiration_date = transition_domain.epp_expiration_date
+        return True
 
     def update_domain_status(self, transition_domain: TransitionDomain, target_domain: Domain, debug_on: bool) -> bool:
         """Given a transition domain that matches an existing domain,
@@ -268,7 +257,6 @@ class Command(BaseCommand):
                 target_domain.place_client_hold(ignoreEPP=True)
             else:
                 target_domain.revert_client_hold(ignoreEPP=True)
-            target_domain.save()
 
             # DEBUG:
             TerminalHelper.print_conditional(
@@ -282,125 +270,176 @@ class Command(BaseCommand):
             return True
         return False
 
+    def transfer_domains(self, chunk: dict[str, list[TransitionDomain]], summary: TransferSummary, debug_on: bool):
+        """Creates or updates the Domain rows for a chunk of transition domains.
+
+        Returns a dictionary of domain name to (saved) Domain for every
+        domain that was created or updated. Skipped names are left out."""
+        existing_domains = self.resolve_existing_domains(chunk.keys())
+
+        domains_to_create = []
+        domains_to_update = []
+        transferred_domains: dict[str, Domain] = {}
+        for domain_name, transition_domains in chunk.items():
+            if domain_name is None:
+                summary.skipped_domains.append(domain_name)
+                continue
+
+            target_domain = existing_domains.get(domain_name)
+            if target_domain is None:
+                # ----------------------- CREATE DOMAIN -----------------------
+                # The unique key constraint does not allow duplicate domain entries
+                # even if there are different users, so the first row wins.
+                transition_domain = transition_domains[0]
+                target_domain = Domain(
+                    name=str(domain_name),
+                    state=transition_domain.status,
+                    expiration_date=transition_domain.epp_expiration_date,
+                )
+                domains_to_create.append(target_domain)
+                summary.created_domains.append(domain_name)
+                debug_string = f"created domain: {target_domain}"
+            else:
+                # ----------------------- UPDATE DOMAIN -----------------------
+                if not all(self.update_domain(td, target_domain, debug_on) for td in transition_domains):
+                    summary.skipped_domains.append(domain_name)
+                    continue
+                domains_to_update.append(target_domain)
+                summary.updated_domains.append(domain_name)
+                debug_string = f"updated domain: {target_domain}"
+
+            transferred_domains[domain_name] = target_domain
+            # DEBUG:
+            TerminalHelper.print_conditional(
+                debug_on,
+                (f"{TerminalColors.OKCYAN} {debug_string} {TerminalColors.ENDC}"),
+            )
+
+        # bulk_create sets the primary keys on postgres, so these
+        # objects can be referenced directly by invitations and infos
+        ScriptDataHelper.bulk_create_fields(Domain, domains_to_create, quiet=True)
+        ScriptDataHelper.bulk_update_fields(
+            Domain, domains_to_update, ["created_at", "expiration_date", "state"], quiet=True
+        )
+        return transferred_domains
+
     # ======================================================
     # ================ DOMAIN INVITATION  ==================
     # ======================================================
-    def try_add_domain_invitation(self, domain_email: str, associated_domain: Domain) -> DomainInvitation | None:
-        """If no domain invitation exists for the given domain and
-        e-mail, create and return a new domain invitation object.
-        If one already exists, or if the email is invalid, return NONE"""
+    def transfer_domain_invitations(
+        self,
+        chunk: dict[str, list[TransitionDomain]],
+        transferred_domains: dict[str, Domain],
+        summary: TransferSummary,
+        debug_on: bool,
+    ):
+        """Creates one domain invitation per (username, domain) pair
+        in the chunk that does not already have one."""
+        existing_invitations = {
+            (email.lower(), domain_name)
+            for email, domain_name in DomainInvitation.objects.filter(
+                domain__in=transferred_domains.values()
+            ).values_list("email", "domain__name")
+        }
 
-        # this should never happen, but adding it just in case
-        if associated_domain is None:
-            logger.warning(
-                f"""
-                        {TerminalColors.FAIL}
-                        !!! ERROR: Domain cannot be null for a
-                        Domain Invitation object!
-
-                        RECOMMENDATION:
-                        Somehow, an empty domain object is
-                        being passed to the subroutine in charge
-                        of making domain invitations. Walk through
-                        the code to see what is amiss.
-
-                        ----------TERMINATING----------"""
-            )
-            sys.exit()
-
-        # check that the given e-mail is valid
-        if domain_email is not None and domain_email != "":
-            # check that a domain invitation doesn't already
-            # exist for this e-mail / Domain pair
-            domain_email_already_in_domain_invites = DomainInvitation.objects.filter(
-                email=domain_email.lower(), domain=associated_domain
-            ).exists()
-            if not domain_email_already_in_domain_invites:
-                # Create new domain invitation
-                new_domain_invitation = DomainInvitation(email=domain_email.lower(), domain=associated_domain)
-                return new_domain_invitation
-        return None
+        invitations_to_create = []
+        for domain_name, domain in transferred_domains.items():
+            added_invitation = False
+            for transition_domain in chunk[domain_name]:
+                domain_email = transition_domain.username
+                # check that the given e-mail is valid
+                if not domain_email:
+                    continue
+
+                invitation_key = (domain_email.lower(), domain_name)
+                if invitation_key in existing_invitations:
+                    continue
+
+                existing_invitations.add(invitation_key)
+                new_domain_invitation = DomainInvitation(email=domain_email.lower(), domain=domain)
+                # DEBUG:
+                TerminalHelper.print_conditional(
+                    debug_on,
+                    f"{TerminalColors.OKCYAN} Adding domain invitation: {new_domain_invitation} {TerminalColors.ENDC}",  # noqa
+                )
+                invitations_to_create.append(new_domain_invitation)
+                summary.created_domain_invitations.append(domain_name)
+                added_invitation = True
+
+            if not added_invitation and domain_name in summary.created_domains:
+                logger.info(
+                    f"{TerminalColors.YELLOW} ! No new e-mail detected for {domain_name} !"  # noqa
+                    f"(SKIPPED ADDING DOMAIN INVITATION){TerminalColors.ENDC}"
+                )
+                summary.skipped_domain_invitations.append(domain_name)
+
+        ScriptDataHelper.bulk_create_fields(DomainInvitation, invitations_to_create, quiet=True)
 
     # ======================================================
     # ================ DOMAIN INFORMATION  =================
     # ======================================================
-    def update_domain_information(self, current: DomainInformation, target: DomainInformation, debug_on: bool) -> bool:
-        # DEBUG:
-        TerminalHelper.print_conditional(
-            debug_on,
-            (f"{TerminalColors.OKCYAN}" f"Updating: {current}" f"{TerminalColors.ENDC}"),  # noqa
+    def upsert_senior_official_contacts(self, chunk: dict[str, list[TransitionDomain]]) -> dict[str | None, Contact]:
+        """Creates or updates the senior official contacts for every row in the chunk
+        (keyed by email) using one lookup query, one bulk insert and one bulk update.
+
+        As with row-by-row processing, the last row for a given email wins and every
+        existing duplicate contact for that email is updated."""
+        contact_data = {}
+        for transition_domains in chunk.values():
+            for transition_domain in transition_domains:
+                contact_data[transition_domain.email] = {
+                    "first_name": transition_domain.first_name,
+                    "middle_name": transition_domain.middle_name,
+                    "last_name": transition_domain.last_name,
+                    "email": transition_domain.email,
+                    "phone": transition_domain.phone,
+                }
+
+        emails = [email for email in contact_data if email is not None]
+        contact_filter = Q(email__in=emails)
+        if None in contact_data:
+            contact_filter |= Q(email__isnull=True)
+
+        existing_contacts: dict[str | None, list[Contact]] = {}
+        for contact in Contact.objects.filter(contact_filter).order_by("pk"):
+            existing_contacts.setdefault(contact.email, []).append(contact)
+
+        contacts: dict[str | None, Contact] = {}
+        contacts_to_create = []
+        contacts_to_update = []
+        for email, data in contact_data.items():
+            matching_contacts = existing_contacts.get(email)
+            if not matching_contacts:
+                contact = Contact(**data)
+                contacts_to_create.append(contact)
+                contacts[email] = contact
+                continue
+
+            if len(matching_contacts) > 1:
+                logger.warning(f"Duplicate contact found {email}. Updating all relevant entries.")
+            for contact in matching_contacts:
+                for field, value in data.items():
+                    setattr(contact, field, value)
+                contacts_to_update.append(contact)
+            contacts[email] = matching_contacts[0]
+
+        ScriptDataHelper.bulk_create_fields(Contact, contacts_to_create, quiet=True)
+        ScriptDataHelper.bulk_update_fields(
+            Contact, contacts_to_update, ["first_name", "middle_name", "last_name", "email", "phone"], quiet=True
         )
-
-        updated = False
-
-        fields_to_update = [
-            "generic_org_type",
-            "federal_type",
-            "federal_agency",
-            "organization_name",
-        ]
-        defaults = {field: getattr(target, field) for field in fields_to_update}
-        if current != target:
-            current = target
-            DomainInformation.objects.filter(domain=current.domain).update(**defaults)
-            updated = True
-
-        return updated
-
-    def update_contact_info(self, first_name, middle_name, last_name, email, phone):
-        contact = None
-        contacts = Contact.objects.filter(email=email)
-        contact_count = contacts.count()
-        # Create a new one
-        if contact_count == 0:
-            contact = Contact(
-                first_name=first_name, middle_name=middle_name, last_name=last_name, email=email, phone=phone
-            )
-            contact.save()
-        elif contact_count == 1:
-            contact = contacts.get()
-            contact.first_name = first_name
-            contact.middle_name = middle_name
-            contact.last_name = last_name
-            contact.email = email
-            contact.phone = phone
-            contact.save()
-        else:
-            logger.warning(f"Duplicate contact found {contact}. Updating all relevant entries.")
-            for c in contacts:
-                c.first_name = first_name
-                c.middle_name = middle_name
-                c.last_name = last_name
-                c.email = email
-                c.phone = phone
-                c.save()
-            contact = contacts.first()
-        return contact
+        return contacts
 
     def create_new_domain_info(
         self,
         transition_domain: TransitionDomain,
         domain: Domain,
-        agency_choices,
-        fed_choices,
-        org_choices,
+        contact: Contact,
+        lookups: dict,
         debug_on,
     ) -> DomainInformation:
         org_type = ("", "")
         fed_type = transition_domain.federal_type
-        fed_agency = transition_domain.federal_agency
-
-        # = SO Information = #
-        first_name = transition_domain.first_name
-        middle_name = transition_domain.middle_name
-        last_name = transition_domain.last_name
-        email = transition_domain.email
-        phone = transition_domain.phone
-
-        contact = self.update_contact_info(first_name, middle_name, last_name, email, phone)
-
-        if debug_on:
-            logger.info(f"Contact created: {contact}")
+        fed_agency = lookups["agencies"].get(transition_domain.federal_agency)
 
         org_type_current = transition_domain.generic_org_type
         match org_type_current:
@@ -419,16 +458,13 @@ class Command(BaseCommand):
             case "Independent Intrastate":
                 org_type = ("special_district", "Special district")
 
-        valid_org_type = org_type in org_choices
-        valid_fed_type = fed_type in fed_choices
-        valid_fed_agency = fed_agency in agency_choices
-
-        default_requester = User.get_default_user()
+        valid_org_type = org_type in lookups["org_choices"]
+        valid_fed_type = fed_type in lookups["fed_choices"]
 
         new_domain_info_data = {
             "domain": domain,
             "organization_name": transition_domain.organization_name,
-            "requester": default_requester,
+            "requester": lookups["default_requester"],
             "senior_official": contact,
         }
 
@@ -442,301 +478,87 @@ class Command(BaseCommand):
         elif debug_on:
             logger.debug(f"No federal type found on {domain.name}")
 
-        if valid_fed_agency:
+        if fed_agency is not None:
             new_domain_info_data["federal_agency"] = fed_agency
         elif debug_on:
             logger.debug(f"No federal agency found on {domain.name}")
 
-        new_domain_info = DomainInformation(**new_domain_info_data)
+        return DomainInformation(**new_domain_info_data)
 
-        # DEBUG:
-        TerminalHelper.print_conditional(
-            True,
-            (
-                f"{TerminalColors.MAGENTA}"
-                f"Created Domain Information template for: {new_domain_info}"
-                f"{TerminalColors.ENDC}"
-            ),  # noqa
-        )
-        return new_domain_info
-
-    def update_or_create_domain_information(
+    def transfer_domain_information(
         self,
-        transition_domain: TransitionDomain,
-        agency_choices,
-        fed_choices,
-        org_choices,
+        chunk: dict[str, list[TransitionDomain]],
+        transferred_domains: dict[str, Domain],
+        lookups: dict,
+        summary: TransferSummary,
         debug_on: bool,
     ):
-        transition_domain_name = transition_domain.domain_name
-
-        # Get associated domain
-        domain_data = Domain.objects.filter(name=transition_domain.domain_name)
-        if not domain_data.exists():
-            logger.warn(
-                f"{TerminalColors.FAIL}"
-                f"WARNING: No Domain exists for:"
-                f"{transition_domain_name}"
-                f"{TerminalColors.ENDC}\n"
-            )
-            return (None, None, False)
-        domain = domain_data.get()
-        template_domain_information = self.create_new_domain_info(
-            transition_domain,
-            domain,
-            agency_choices,
-            fed_choices,
-            org_choices,
-            debug_on,
-        )
-        target_domain_information = None
-        domain_information_exists = DomainInformation.objects.filter(domain__name=transition_domain_name).exists()
-        if domain_information_exists:
-            try:
-                # get the existing domain information object
-                target_domain_information = DomainInformation.objects.get(domain__name=transition_domain_name)
-                # DEBUG:
-                TerminalHelper.print_conditional(
-                    debug_on,
-                    (
-                        f"{TerminalColors.FAIL}"
-                        f"Found existing entry in Domain Information table for:"
-                        f"{transition_domain_name}"
-                        f"{TerminalColors.ENDC}"
-                    ),  # noqa
-                )
-
-                # for existing entry, update the status to
-                # the transition domain status
-                self.update_domain_information(target_domain_information, template_domain_information, debug_on)
-                # TODO: not all domains need to be updated
-                # (the information is the same).
-                # Need to bubble this up to the final report.
-
-                return (target_domain_information, domain, False)
-            except DomainInformation.MultipleObjectsReturned:
-                # This should never happen (just like with the Domain Table).
-                # However, because such an error did occur in the past,
-                # we will watch for it in this script
-                logger.warning(
-                    f"""
-                    {TerminalColors.FAIL}
-                    !!! ERROR: duplicate entries already exist in the
-                    Domain Information table for the following domain:
-                    {transition_domain_name}
-
-                    RECOMMENDATION:
-                    This means the Domain Information table is corrupt.  Please
-                    check the Domain Information table data as there should be a key
-                    constraint which prevents duplicate entries.
-
-                    ----------TERMINATING----------"""
-                )
-                sys.exit()
-        else:
-            # no matching entry, make one
-            target_domain_information = template_domain_information
-            # DEBUG:
-            TerminalHelper.print_conditional(
-                debug_on,
-                (
-                    f"{TerminalColors.OKCYAN}"
-                    f"Adding domain information for: "
-                    f"{transition_domain_name}"
-                    f"{TerminalColors.ENDC}"
-                ),
-            )
-            return (target_domain_information, domain, True)
-
-    # C901 'Command.handle' is too complex
-    def process_domain_information(
-        self,
-        valid_agency_choices,
-        valid_fed_choices,
-        valid_org_choices,
-        debug_on,
-        skipped_domain_information_entries,
-        domain_information_to_create,
-        updated_domain_information,
-        debug_max_entries_to_parse,
-        total_rows_parsed,
-    ):
-        changed_transition_domains = TransitionDomain.objects.filter(processed=False)
-        for transition_domain in changed_transition_domains:
-            (
-                target_domain_information,
-                associated_domain,
-                was_created,
-            ) = self.update_or_create_domain_information(
-                transition_domain,
-                valid_agency_choices,
-                valid_fed_choices,
-                valid_org_choices,
-                debug_on,
-            )
+        """Creates (or updates) the DomainInformation for every transferred domain.
+        New infos come from the first row for a domain, since the unique key
+        does not allow more than one; updates are applied in row order."""
+        contacts = self.upsert_senior_official_contacts(chunk)
+        existing_domain_information = {
+            domain_info.domain_id: domain_info
+            for domain_info in DomainInformation.objects.filter(domain__in=transferred_domains.values())
+        }
 
-            debug_string = ""
-            if target_domain_information is None:
-                # ---------------- SKIPPED ----------------
-                skipped_domain_information_entries.append(target_domain_information)
-                debug_string = f"skipped domain information: {target_domain_information}"
-            elif was_created:
-                # DEBUG:
-                TerminalHelper.print_conditional(
-                    debug_on,
-                    (
-                        f"{TerminalColors.OKCYAN}"
-                        f"Checking duplicates for: {target_domain_information}"
-                        f"{TerminalColors.ENDC}"
-                    ),  # noqa
-                )
-                # ---------------- DUPLICATE ----------------
-                # The unique key constraint does not allow multiple domain
-                # information objects to share the same domain
-                existing_domain_information_in_to_create = next(
-                    (x for x in domain_information_to_create if x.domain.name == target_domain_information.domain.name),
-                    None,
+        fields_to_update = [
+            "generic_org_type",
+            "federal_type",
+            "federal_agency",
+            "organization_name",
+        ]
+        domain_information_to_create = []
+        domain_information_to_update = []
+        for domain_name, domain in transferred_domains.items():
+            transition_domains = chunk[domain_name]
+            current = existing_domain_information.get(domain.id)
+            if current is None:
+                # ---------------- CREATED ----------------
+                transition_domain = transition_domains[0]
+                template = self.create_new_domain_info(
+                    transition_domain, domain, contacts[transition_domain.email], lookups, debug_on
                 )
-                # TODO: this is redundant.
-                # Currently debugging....
-                # running into unique key constraint error....
-                existing_domain_info = DomainInformation.objects.filter(
-                    domain__name=target_domain_information.domain.name
-                ).exists()
-                if existing_domain_information_in_to_create is not None or existing_domain_info:
-                    debug_string = f"""{TerminalColors.YELLOW}
-                        Duplicate Detected: {existing_domain_information_in_to_create}.
-                        Cannot add duplicate Domain Information object
-                        {TerminalColors.ENDC}"""
-                else:
-                    # ---------------- CREATED ----------------
-                    domain_information_to_create.append(target_domain_information)
-                    debug_string = f"created domain information: {target_domain_information}"
-            elif not was_created:
-                # ---------------- UPDATED ----------------
-                updated_domain_information.append(target_domain_information)
-                debug_string = f"updated domain information: {target_domain_information}"
+                domain_information_to_create.append(template)
+                summary.created_domain_information.append(domain_name)
+                debug_string = f"created domain information: {template}"
             else:
-                debug_string = "domain information already exists and "
-                f"matches incoming data (NO CHANGES MADE): {target_domain_information}"
-
-            # DEBUG:
-            TerminalHelper.print_conditional(
-                debug_on,
-                (f"{TerminalColors.OKCYAN}{debug_string}{TerminalColors.ENDC}"),
-            )
-
-            # ------------------ Parse limit reached? ------------------
-            # Check parse limit and exit loop if parse limit has been reached
-            if self.parse_limit_reached(debug_max_entries_to_parse, total_rows_parsed):
-                break
-        return (
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-        )
-
-    # C901 'Command.handle' is too complex
-    def process_domain_and_invitations(
-        self,
-        debug_on,
-        skipped_domain_entries,
-        domains_to_create,
-        updated_domain_entries,
-        domain_invitations_to_create,
-        debug_max_entries_to_parse,
-        total_rows_parsed,
-    ):
-        changed_transition_domains = TransitionDomain.objects.filter(processed=False)
-        for transition_domain in changed_transition_domains:
-            # Create some local variables to make data tracing easier
-            transition_domain_name = transition_domain.domain_name
-            transition_domain_status = transition_domain.status
-            transition_domain_email = transition_domain.username
-            transition_domain_creation_date = transition_domain.epp_creation_date
-            transition_domain_expiration_date = transition_domain.epp_expiration_date
-
-            # DEBUG:
-            TerminalHelper.print_conditional(
-                debug_on,
-                f"{TerminalColors.OKCYAN}"
-                "Processing Transition Domain: "
-                f"{transition_domain_name},"
-                f" {transition_domain_status},"
-                f" {transition_domain_email}"
-                f", {transition_domain_creation_date}, "
-                f"{transition_domain_expiration_date}"
-                f"{TerminalColors.ENDC}",  # noqa
-            )
-
-            # ======================================================
-            # ====================== DOMAIN  =======================
-            target_domain, was_created = self.update_or_create_domain(transition_domain, debug_on)
-
-            debug_string = ""
-            if target_domain is None:
-                # ---------------- SKIPPED ----------------
-                skipped_domain_entries.append(transition_domain_name)
-                debug_string = f"skipped domain: {target_domain}"
-            elif was_created:
-                # ---------------- DUPLICATE ----------------
-                # The unique key constraint does not allow duplicate domain entries
-                # even if there are different users.
-                existing_domain_in_to_create = next(
-                    (x for x in domains_to_create if x.name == transition_domain_name),
-                    None,
-                )
-                if existing_domain_in_to_create is not None:
-                    debug_string = f"""{TerminalColors.YELLOW}
-                        Duplicate Detected: {transition_domain_name}.
-                        Cannot add duplicate entry for another username.
-                        Violates Unique Key constraint.
-                        {TerminalColors.ENDC}"""
-                else:
-                    # ---------------- CREATED ----------------
-                    domains_to_create.append(target_domain)
-                    debug_string = f"created domain: {target_domain}"
-            elif not was_created:
                 # ---------------- UPDATED ----------------
-                updated_domain_entries.append(transition_domain.domain_name)
-                debug_string = f"updated domain: {target_domain}"
+                for transition_domain in transition_domains:
+                    template = self.create_new_domain_info(
+                        transition_domain, domain, contacts[transition_domain.email], lookups, debug_on
+                    )
+                    for field in fields_to_update:
+                        setattr(current, field, getattr(template, field))
+                domain_information_to_update.append(current)
+                summary.updated_domain_information.append(domain_name)
+                debug_string = f"updated domain information: {current}"
 
             # DEBUG:
             TerminalHelper.print_conditional(
                 debug_on,
-                (f"{TerminalColors.OKCYAN} {debug_string} {TerminalColors.ENDC}"),
+                (f"{TerminalColors.OKCYAN}{debug_string}{TerminalColors.ENDC}"),
             )
 
-            # ======================================================
-            # ================ DOMAIN INVITATIONS ==================
-            new_domain_invitation = self.try_add_domain_invitation(transition_domain_email, target_domain)
-            if new_domain_invitation is None:
-                logger.info(
-                    f"{TerminalColors.YELLOW} ! No new e-mail detected !"  # noqa
-                    f"(SKIPPED ADDING DOMAIN INVITATION){TerminalColors.ENDC}"
-                )
-            else:
-                # DEBUG:
-                TerminalHelper.print_conditional(
-                    debug_on,
-                    f"{TerminalColors.OKCYAN} Adding domain invitation: {new_domain_invitation} {TerminalColors.ENDC}",  # noqa
-                )
-                domain_invitations_to_create.append(new_domain_invitation)
-
-            # ------------------ Parse limit reached? ------------------
-            # Check parse limit and exit loop if parse limit has been reached
-            if self.parse_limit_reached(debug_max_entries_to_parse, total_rows_parsed):
-                break
-        return (
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
+        ScriptDataHelper.bulk_create_fields(DomainInformation, domain_information_to_create, quiet=True)
+        ScriptDataHelper.bulk_update_fields(
+            DomainInformation, domain_information_to_update, fields_to_update, quiet=True
         )
+        refresh_converted_fields(DomainInformation.objects.filter(domain__in=transferred_domains.values()))
 
     # ======================================================
     # ===================== HANDLE  ========================
     # ======================================================
+    def transfer_chunk(self, chunk: dict[str, list[TransitionDomain]], lookups: dict, summary, debug_on):
+        """Transfers one chunk of transition domains in a single transaction,
+        then marks the transferred rows as processed (the resume checkpoint)."""
+        with transaction.atomic():
+            transferred_domains = self.transfer_domains(chunk, summary, debug_on)
+            self.transfer_domain_invitations(chunk, transferred_domains, summary, debug_on)
+            self.transfer_domain_information(chunk, transferred_domains, lookups, summary, debug_on)
+            processed_ids = [td.id for name in transferred_domains for td in chunk[name]]
+            TransitionDomain.objects.filter(id__in=processed_ids).update(processed=True)
+
     def handle(
         self,
         **options,
@@ -748,28 +570,10 @@ class Command(BaseCommand):
         # grab command line arguments and store locally...
         debug_on = options.get("debug")
         debug_max_entries_to_parse = int(options.get("limitParse"))  # set to 0 to parse all entries
+        batch_size = max(int(options.get("batchSize") or 1000), 1)
 
         self.print_debug_mode_statements(debug_on, debug_max_entries_to_parse)
 
-        # domains to ADD
-        domains_to_create = []
-        domain_information_to_create = []
-
-        # domains we UPDATED
-        updated_domain_entries = []
-        updated_domain_information = []
-
-        # domains we SKIPPED
-        skipped_domain_entries = []
-        skipped_domain_information_entries = []
-
-        # domain invitations to ADD
-        domain_invitations_to_create = []
-
-        # if we are limiting our parse (for testing purposes, keep
-        # track of total rows parsed)
-        total_rows_parsed = 0
-
         logger.info(
             f"""{TerminalColors.OKCYAN}
             ==========================
@@ -778,95 +582,25 @@ class Command(BaseCommand):
             {TerminalColors.ENDC}"""
         )
 
-        logger.info(
-            f"""{TerminalColors.OKCYAN}
-            ========= Adding Domains and Domain Invitations =========
-            {TerminalColors.ENDC}"""
-        )
-        (
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-        ) = self.process_domain_and_invitations(
-            debug_on,
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-            debug_max_entries_to_parse,
-            total_rows_parsed,
-        )
-
-        # First, save all Domain objects to the database
-        Domain.objects.bulk_create(domains_to_create)
-
-        # DomainInvitation.objects.bulk_create(domain_invitations_to_create)
-
-        # TODO: this is to resolve an error where bulk_create
-        # doesn't save to database in a way that invitation objects can
-        # utilize.
-        # Then, create DomainInvitation objects
-        for invitation in domain_invitations_to_create:
-            if debug_on:
-                logger.info(f"Pairing invite to its domain...{invitation}")
-            existing_domain = Domain.objects.filter(name=invitation.domain.name)
-            # Make sure the related Domain object is saved
-            if existing_domain.exists():
-                invitation.domain = existing_domain.get()
-            else:
-                # Raise an err for now
-                raise Exception(f"Domain {existing_domain} wants to be added" "but doesn't exist in the DB")
-            invitation.save()
-
-        valid_org_choices = [(name, value) for name, value in DomainRequest.OrganizationChoices.choices]
-        valid_fed_choices = [value for name, value in BranchChoices.choices]
-        valid_agency_choices = FederalAgency.objects.all()
-        # ======================================================
-        # ================= DOMAIN INFORMATION =================
-        logger.info(
-            f"""{TerminalColors.OKCYAN}
-            ========= Adding Domains Information Objects =========
-            {TerminalColors.ENDC}"""
-        )
+        transition_domains_by_name = self.load_transition_domains(debug_max_entries_to_parse)
+        lookups = {
+            "org_choices": [(name, value) for name, value in DomainRequest.OrganizationChoices.choices],
+            "fed_choices": [value for name, value in BranchChoices.choices],
+            "agencies": {agency.agency: agency for agency in FederalAgency.objects.all()},
+            "default_requester": User.get_default_user(),
+        }
 
-        (
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-        ) = self.process_domain_information(
-            valid_agency_choices,
-            valid_fed_choices,
-            valid_org_choices,
-            debug_on,
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-            debug_max_entries_to_parse,
-            total_rows_parsed,
-        )
+        summary = TransferSummary()
+        domain_names = list(transition_domains_by_name.keys())
+        total_domain_names = len(domain_names)
+        for start in range(0, total_domain_names, batch_size):
+            chunk_names = domain_names[start : start + batch_size]
+            chunk = {name: transition_domains_by_name[name] for name in chunk_names}
+            self.transfer_chunk(chunk, lookups, summary, debug_on)
+            logger.info(
+                f"{TerminalColors.OKCYAN}"
+                f"Committed {start + len(chunk_names)}/{total_domain_names} domain names"
+                f"{TerminalColors.ENDC}"
+            )
 
-        TerminalHelper.print_conditional(
-            debug_on,
-            (f"{TerminalColors.YELLOW}" f"Trying to add: {domain_information_to_create}" f"{TerminalColors.ENDC}"),
-        )
-        DomainInformation.objects.bulk_create(domain_information_to_create)
-
-        # Loop through the list of everything created, and mark it as processed
-        for domain in domains_to_create:
-            name = domain.name
-            TransitionDomain.objects.filter(domain_name=name).update(processed=True)
-
-        # Loop through the list of everything updated, and mark it as processed
-        for name in updated_domain_entries:
-            TransitionDomain.objects.filter(domain_name=name).update(processed=True)
-
-        self.print_summary_of_findings(
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-            skipped_domain_entries,
-            domain_information_to_create,
-            updated_domain_information,
-            debug_on,
-        )
+        self.print_summary_of_findings(summary, debug_on)
@@ -1,5 +1,8 @@
 import logging
+from datetime import timezone
 from django.core.management import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import TruncDate
 from registrar.management.commands.utility.terminal_helper import PopulateScriptTemplate, TerminalColors
 from registrar.models import Domain, TransitionDomain
 
@@ -10,10 +13,21 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand, PopulateScriptTemplate):
     help = "Loops through each domain object and populates the last_status_update and first_submitted_date"
 
+    def add_arguments(self, parser):
+        """Adds command line arguments"""
+        self.add_chunk_arguments(parser)
+
     def handle(self, **kwargs):
         """Loops through each valid Domain object and updates it's first_ready value if it is out of sync"""
         filter_conditions = {"state__in": [Domain.State.READY, Domain.State.ON_HOLD, Domain.State.DELETED]}
-        self.mass_update_records(Domain, filter_conditions, ["first_ready"], verbose=True)
+        self.mass_update_records(
+            Domain,
+            filter_conditions,
+            ["first_ready"],
+            verbose=True,
+            chunk_size=kwargs.get("chunk_size"),
+            start_after_pk=kwargs.get("start_after_pk"),
+        )
 
     def update_record(self, record: Domain):
         """Defines how we update the first_ready field"""
@@ -27,12 +41,5 @@ class Command(BaseCommand, PopulateScriptTemplate):
     # check if a transition domain object for this domain name exists,
     # or if so whether its first_ready value matches its created_at date
     def custom_filter(self, records):
-        to_include_pks = []
-        for record in records:
-            if (
-                TransitionDomain.objects.filter(domain_name=record.name).exists()
-                and record.first_ready != record.created_at.date()
-            ):  # noqa
-                to_include_pks.append(record.pk)
-
-        return records.filter(pk__in=to_include_pks)
+        has_transition_domain = Exists(TransitionDomain.objects.filter(domain_name=OuterRef("name")))
+        return records.filter(has_transition_domain).exclude(first_ready=TruncDate("created_at", tzinfo=timezone.utc))
@@ -0,0 +1,200 @@
+"""
+Page timings against a generated registry (see fixtures_large_registry.py).
+
+Each Scenario loads one page with django's test client, as a portfolio admin from the
+generated registry or as its staff user, and records the median time and the number of
+queries. Results are compared with a baseline from an earlier run: a scenario regresses
+when it runs more queries, or is slower by more than the tolerance.
+"""
+
+from dataclasses import dataclass
+import statistics
+import time
+from typing import Callable
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from registrar.fixtures.fixtures_large_registry import LargeRegistryFixture
+from registrar.models import DomainRequest, Portfolio, User, UserPortfolioPermission
+from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
+from registrar.utility.enums import Step
+
+
+class BenchmarkError(Exception):
+    """The generated registry isn't loaded, or a page failed to load"""
+
+
+@dataclass
+class BenchmarkContext:
+    """The users and records from the generated registry that the scenarios load pages for"""
+
+    member_admin: User
+    analyst: User
+    portfolio: Portfolio
+    member: User
+    started_request: DomainRequest | None
+
+    @classmethod
+    def load(cls):
+        prefix = LargeRegistryFixture.PREFIX
+        analyst = User.objects.filter(username=LargeRegistryFixture.analyst_username()).first()
+        portfolio = Portfolio.objects.filter(organization_name=f"{prefix} organization 0").first()
+        if analyst is None or portfolio is None:
+            raise BenchmarkError("Load a registry with generate_large_registry first")
+        member_permission = (
+            UserPortfolioPermission.objects.filter(
+                portfolio=portfolio, roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+            )
+            .select_related("user")
+            .order_by("pk")
+            .first()
+        )
+        return cls(
+            member_admin=portfolio.requester,
+            analyst=analyst,
+            portfolio=portfolio,
+            member=member_permission.user if member_permission else portfolio.requester,
+            started_request=DomainRequest.objects.filter(
+                requester=portfolio.requester, status=DomainRequest.DomainRequestStatus.STARTED
+            )
+            .order_by("pk")
+            .first(),
+        )
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Returns the url to load, or None if the registry has nothing to load it for
+    get_url: Callable[[BenchmarkContext], str | None]
+    # Loads the page as the registry's staff user rather than the portfolio admin
+    as_analyst: bool = False
+
+
+def portfolio_url(name, **params):
+    """Returns a Scenario url for the named page, with the portfolio and params in the query string"""
+
+    def get_url(context):
+        query = "&".join(f"{key}={value(context) if callable(value) else value}" for key, value in params.items())
+        separator = "&" if query else ""
+        return f"{reverse(name)}?portfolio={context.portfolio.id}{separator}{query}"
+
+    return get_url
+
+
+def wizard_url(step):
+    def get_url(context):
+        if context.started_request is None:
+            return None
+        return reverse(f"domain-request:{step}", kwargs={"domain_request_pk": context.started_request.id})
+
+    return get_url
+
+
+SCENARIOS = [
+    # The tables on the home page
+    Scenario("home", lambda context: reverse("home")),
+    Scenario("domains_json", portfolio_url("get_domains_json")),
+    Scenario("domains_json_search", portfolio_url("get_domains_json", search_term="load-1")),
+    Scenario("domain_requests_json", portfolio_url("get_domain_requests_json")),
+    Scenario("portfolio_members_json", portfolio_url("get_portfolio_members_json")),
+    Scenario(
+        "member_domains_json",
+        portfolio_url("get_member_domains_json", member_id=lambda context: context.member.id, member_only="false"),
+    ),
+    # Exports
+    Scenario("export_data_type_user", lambda context: reverse("export_data_type_user")),
+    Scenario("export_members_portfolio", lambda context: reverse("export_members_portfolio")),
+    Scenario("export_data_type", lambda context: reverse("export_data_type"), as_analyst=True),
+    # Analytics
+    Scenario("analytics", lambda context: reverse("analytics"), as_analyst=True),
+    # Admin changelists
+    Scenario("admin_domains", lambda context: reverse("admin:registrar_domain_changelist"), as_analyst=True),
+    Scenario(
+        "admin_domain_requests", lambda context: reverse("admin:registrar_domainrequest_changelist"), as_analyst=True
+    ),
+    Scenario(
+        "admin_domain_information",
+        lambda context: reverse("admin:registrar_domaininformation_changelist"),
+        as_analyst=True,
+    ),
+    Scenario("admin_users", lambda context: reverse("admin:registrar_user_changelist"), as_analyst=True),
+    Scenario(
+        "admin_domain_search",
+        lambda context: f"{reverse('admin:registrar_domain_changelist')}?q=load-1",
+        as_analyst=True,
+    ),
+    # Domain request wizard
+    Scenario("wizard_org_type", wizard_url(Step.ORGANIZATION_TYPE)),
+    Scenario("wizard_other_contacts", wizard_url(Step.OTHER_CONTACTS)),
+]
+
+
+def run_scenario(client, url, repeat):
+    """Loads url once to warm up, then repeat times. Returns the timings in milliseconds and the query count."""
+    client.get(url)
+    timings = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            raise BenchmarkError(f"{url} returned {response.status_code}")
+    return timings, len(context.captured_queries)
+
+
+def run_benchmarks(repeat=5, names=None) -> dict:
+    """Runs the scenarios (or those in names), and returns their results by name.
+    A scenario whose page fails to load has an error instead of timings."""
+    context = BenchmarkContext.load()
+    clients = {}
+    for as_analyst, user in [(False, context.member_admin), (True, context.analyst)]:
+        clients[as_analyst] = Client(HTTP_HOST="localhost:8080")
+        clients[as_analyst].force_login(user)
+
+    results = {}
+    for scenario in SCENARIOS:
+        if names and scenario.name not in names:
+            continue
+        url = scenario.get_url(context)
+        if url is None:
+            continue
+        try:
+            timings, queries = run_scenario(clients[scenario.as_analyst], url, repeat)
+        except BenchmarkError as err:
+            results[scenario.name] = {"url": url, "error": str(err)}
+            continue
+        results[scenario.name] = {
+            "url": url,
+            "median_ms": round(statistics.median(timings), 1),
+            "max_ms": round(max(timings), 1),
+            "queries": queries,
+        }
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.25, min_slowdown_ms=20) -> list[str]:
+    """Returns a description of each scenario in results that regressed from baseline.
+
+    A scenario regresses if its page fails to load, runs more queries, or its median is
+    both tolerance (a fraction) and min_slowdown_ms slower. Scenarios missing from the
+    baseline, or that failed in it, are only checked for errors.
+    """
+    regressions = []
+    for name, result in results.items():
+        if "error" in result:
+            regressions.append(f"{name}: {result['error']}")
+            continue
+        before = baseline.get(name)
+        if before is None or "error" in before:
+            continue
+        if result["queries"] > before["queries"]:
+            regressions.append(f"{name}: {before['queries']} -> {result['queries']} queries")
+        slowdown = result["median_ms"] - before["median_ms"]
+        if slowdown > min_slowdown_ms and slowdown > before["median_ms"] * tolerance:
+            regressions.append(f"{name}: {before['median_ms']}ms -> {result['median_ms']}ms")
+    return regressions
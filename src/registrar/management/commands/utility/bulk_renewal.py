@@ -0,0 +1,134 @@
+"""
+Renews domains in the registry in bulk, for extend_expiration_dates.
+
+The registry commands for each domain (an InfoDomain for its current expiration date, then
+a RenewDomain) are sent from a pool of worker threads, each with its own registry session,
+so that several domains are renewed at once. Only the registry is contacted from the
+workers: the transition domains used for the idempotence check are read up front in one
+query, and the renewed domains are saved as their results come in. The names of the
+domains that are done are appended to a checkpoint file, which a rerun skips.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+import logging
+import os
+import time
+
+from epplibwrapper import commands, common as epp
+from epplibwrapper.errors import RegistryError
+from registrar.management.commands.utility.registry_workers import close_clients, run_with_clients
+from registrar.models.transition_domain import TransitionDomain
+
+try:
+    from epplib.exceptions import TransportError
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+RENEWED = "renewed"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+@dataclass
+class RenewalResult:
+    name: str
+    status: str
+    # The expiration date after renewal, or the current one if the domain was skipped
+    expiration_date: date | None = None
+    error: Exception | None = None
+
+
+def read_checkpoint(path) -> set[str]:
+    """Returns the names of the domains done in an earlier run"""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path) as checkpoint_file:
+        return {line.strip() for line in checkpoint_file if line.strip()}
+
+
+def get_transition_dates(names) -> dict[str, set[date]]:
+    """Returns the epp_expiration_dates of the transition domains of each name, in one query"""
+    transition_dates: dict[str, set[date]] = {}
+    rows = TransitionDomain.objects.filter(domain_name__in=names).values_list("domain_name", "epp_expiration_date")
+    for name, expiration_date in rows:
+        transition_dates.setdefault(name, set()).add(expiration_date)
+    return transition_dates
+
+
+class BulkRenewal:
+    """Renews the given domains by extension_amount years with one worker per client"""
+
+    def __init__(self, extension_amount, clients, check_idempotence=True, checkpoint_path=None, progress_every=100):
+        self.extension_amount = extension_amount
+        self.clients = clients
+        self.check_idempotence = check_idempotence
+        self.checkpoint_path = checkpoint_path
+        self.progress_every = progress_every
+        self.elapsed = 0.0
+        self.completed = 0
+
+    def renew(self, client, name, transition_dates) -> RenewalResult:
+        """Sends the registry commands for one domain. Runs on a worker thread."""
+        try:
+            info = client.send(commands.InfoDomain(name=name), cleaned=True)
+            current_expiration_date = info.res_data[0].ex_date
+            # Because our migration data had a hard stop date, we can determine if our change
+            # is valid simply checking the date is within a valid range and it was updated
+            # in epp or not.
+            # CAVEAT: This is a workaround. A more robust solution would be a db flag
+            if self.check_idempotence and current_expiration_date not in transition_dates:
+                return RenewalResult(name, SKIPPED, current_expiration_date)
+            if current_expiration_date is None:
+                # Like Domain.renew_domain, renew from today if the registry has no expiration date
+                logger.warning(f"{name} has no expiration date in the registry, renewing from today")
+                current_expiration_date = date.today()
+            request = commands.RenewDomain(
+                name=name,
+                cur_exp_date=current_expiration_date,
+                period=epp.Period(self.extension_amount, epp.Unit.YEAR),
+            )
+            response = client.send(request, cleaned=True)
+            return RenewalResult(name, RENEWED, response.res_data[0].ex_date)
+        # Catches registry errors. Failures indicate bad data, or a faulty connection.
+        except (RegistryError, KeyError, TransportError) as err:
+            return RenewalResult(name, FAILED, error=err)
+
+    def run(self, domains):
+        """Renews the domains, skipping those in the checkpoint, and yields a RenewalResult
+        for each as it completes. Renewed domains are saved before they are yielded."""
+        done = read_checkpoint(self.checkpoint_path)
+        domains_by_name = {domain.name: domain for domain in domains if domain.name not in done}
+        if done:
+            logger.info(f"Resuming: {len(done)} domains were done in an earlier run")
+        transition_dates = get_transition_dates(list(domains_by_name)) if self.check_idempotence else {}
+
+        def renew(client, name):
+            return self.renew(client, name, transition_dates.get(name, set()))
+
+        start = time.perf_counter()
+        checkpoint_file = open(self.checkpoint_path, "a") if self.checkpoint_path else None
+        try:
+            for result in run_with_clients(self.clients, renew, domains_by_name):
+                if result.status == RENEWED:
+                    domain = domains_by_name[result.name]
+                    domain.expiration_date = result.expiration_date
+                    domain.save()
+                if result.status != FAILED and checkpoint_file:
+                    checkpoint_file.write(f"{result.name}\n")
+                    checkpoint_file.flush()
+                self.completed += 1
+                self.elapsed = time.perf_counter() - start
+                if self.completed % self.progress_every == 0:
+                    logger.info(f"{self.completed}/{len(domains_by_name)} domains done, {self.rate():.1f} per second")
+                yield result
+        finally:
+            close_clients(self.clients)
+            if checkpoint_file:
+                checkpoint_file.close()
+
+    def rate(self):
+        """Domains done per second"""
+        return self.completed / self.elapsed if self.elapsed else 0.0
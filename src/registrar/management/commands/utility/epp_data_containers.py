@@ -4,6 +4,8 @@ A list of helper classes to facilitate handling data from verisign data exports.
 Regarding our dataclasses:
 Not intended to be used as models but rather as an alternative to storing as a dictionary.
 By keeping it as a dataclass instead of a dictionary, we can maintain data consistency.
+They are declared with slots=True as we hold one record per row of each (large) data file,
+and slotted records are much smaller than ones backed by a __dict__.
 """  # noqa
 
 from dataclasses import dataclass, field
@@ -12,7 +14,7 @@ from enum import Enum
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AgencyAdhoc:
     """Defines the structure given in the AGENCY_ADHOC file"""
 
@@ -22,7 +24,7 @@ class AgencyAdhoc:
     isfederal: Optional[str] = field(default=None, repr=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainAdditionalData:
     """Defines the structure given in the DOMAIN_ADDITIONAL file"""
 
@@ -35,7 +37,7 @@ class DomainAdditionalData:
     domainpurpose: Optional[str] = field(default=None, repr=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainTypeAdhoc:
     """Defines the structure given in the DOMAIN_ADHOC file"""
 
@@ -45,7 +47,7 @@ class DomainTypeAdhoc:
     active: Optional[str] = field(default=None, repr=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizationAdhoc:
     """Defines the structure given in the ORGANIZATION_ADHOC file"""
 
@@ -58,7 +60,7 @@ class OrganizationAdhoc:
     orgcountrycode: Optional[str] = field(default=None, repr=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthorityAdhoc:
     """Defines the structure given in the AUTHORITY_ADHOC file"""
 
@@ -72,7 +74,7 @@ class AuthorityAdhoc:
     addlinfo: Optional[List[str]] = field(default=None, repr=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainEscrow:
     """Defines the structure given in the DOMAIN_ESCROW file"""
 
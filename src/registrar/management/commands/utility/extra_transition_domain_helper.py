@@ -1,14 +1,15 @@
 """"""
 
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-import io
 import glob
+import json
 import re
 import logging
 
 import os
+import sqlite3
 import sys
 from typing import Dict, List
 from django.core.paginator import Paginator
@@ -980,6 +981,8 @@ class ExtraTransitionDomain:
             options.directory += "/"
         self.directory = options.directory
         self.seperator = options.sep
+        # Spill parsed rows to a local SQLite index instead of holding them in memory
+        self.use_disk_index = bool(getattr(options, "use_disk_index", False))
 
         self.all_files = glob.glob(f"{self.directory}*")
 
@@ -1139,8 +1142,17 @@ class ExtraTransitionDomain:
     def clear_file_data(self):
         for item in self.file_data.values():
             file_type: FileDataHolder = item
+            if isinstance(file_type.data, SQLiteRowIndex):
+                file_type.data.close()
             file_type.data = {}
 
+    def _new_row_store(self, dataclass_type):
+        """Returns an empty container for parsed rows. This is a dict, unless
+        use_disk_index is set, in which case rows are spilled to a local SQLite index."""
+        if self.use_disk_index:
+            return SQLiteRowIndex(dataclass_type)
+        return {}
+
     def parse_csv_file(self, file, seperator, dataclass_type, id_field, is_domain_escrow=False):
         # Domain escrow is an edge case
         if is_domain_escrow:
@@ -1152,7 +1164,7 @@ class ExtraTransitionDomain:
 
     # Domain escrow is an edgecase given that its structured differently data-wise.
     def _read_domain_escrow(self, file, seperator):
-        dict_data = {}
+        dict_data = self._new_row_store(DomainEscrow)
         with open(file, "r", encoding="utf-8-sig") as requested_file:
             reader = csv.reader(requested_file, delimiter=seperator)
             for row in reader:
@@ -1181,64 +1193,126 @@ class ExtraTransitionDomain:
             return row_id
 
     def _read_csv_file(self, file, seperator, dataclass_type, id_field):
-        dict_data = {}
-        # Used when we encounter bad data
-        updated_file_content = None
+        """Parses a data file in a single streaming pass.
+
+        Bad seperators (a seperator surrounded by spaces inside of a value) are
+        repaired line by line as the file is read, and only the columns defined
+        on dataclass_type are kept for each row."""
+        dict_data = self._new_row_store(dataclass_type)
+        wanted_columns = [data_field.name for data_field in fields(dataclass_type)]
+        special_character = ";badseperator;"
         with open(file, "r", encoding="utf-8-sig") as requested_file:
-            reader = csv.DictReader(requested_file, delimiter=seperator)
-            for row in reader:
-                # Checks if we encounter any bad data.
-                # If we do, we (non-destructively) clean the file
-                if None in row:
-                    logger.warning(
-                        f"{TerminalColors.YELLOW}"
-                        f"Found bad data in {file}. Attempting to clean."
-                        f"{TerminalColors.ENDC}"
-                    )
-                    updated_file_content = self.replace_bad_seperators(file, f"{seperator}", ";badseperator;")
-                    dict_data = {}
-                    break
-
-                row_id = self._grab_row_id(row, id_field, file, dataclass_type)
-
-                # To maintain pairity with the load_transition_domain
-                # script, we store this data in lowercase.
-                if id_field == "domainname" and row_id is not None:
-                    row_id = row_id.lower()
-                dict_data[row_id] = dataclass_type(**row)
-
-        # After we clean the data, try to parse it again
-        if updated_file_content:
-            logger.info(f"{TerminalColors.MAGENTA}" f"Retrying load for {file}" f"{TerminalColors.ENDC}")
-            # Store the file locally rather than writing to the file.
-            # This is to avoid potential data corruption.
-            updated_file = io.StringIO(updated_file_content)
-            reader = csv.DictReader(updated_file, delimiter=seperator)
+            repaired_lines = self.replace_bad_seperators(requested_file, f"{seperator}", special_character)
+            reader = csv.DictReader(repaired_lines, delimiter=seperator)
             for row in reader:
-                row_id = row[id_field]
                 # If the key is still none, something
                 # is wrong with the file.
                 if None in row:
                     logger.error(
-                        f"{TerminalColors.FAIL}" f"Corrupt data found for {row_id}. Skipping." f"{TerminalColors.ENDC}"
+                        f"{TerminalColors.FAIL}"
+                        f"Corrupt data found for {row.get(id_field)} in {file}. Skipping."
+                        f"{TerminalColors.ENDC}"
                     )
                     continue
 
-                for key, value in row.items():
+                row_id = self._grab_row_id(row, id_field, file, dataclass_type)
+                record_data = {}
+                for column in wanted_columns:
+                    value = row.get(column)
                     if value is not None and isinstance(value, str):
-                        value = value.replace(";badseperator;", f" {seperator} ")
-                    row[key] = value
+                        value = value.replace(special_character, f" {seperator} ")
+                    record_data[column] = value
 
                 # To maintain pairity with the load_transition_domain
                 # script, we store this data in lowercase.
                 if id_field == "domainname" and row_id is not None:
                     row_id = row_id.lower()
-                dict_data[row_id] = dataclass_type(**row)
+                dict_data[row_id] = dataclass_type(**record_data)
         return dict_data
 
-    def replace_bad_seperators(self, filename, delimiter, special_character):
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            contents = file.read()
+    def replace_bad_seperators(self, lines, delimiter, special_character):
+        """Lazily replaces any delimiter surrounded by spaces with special_character,
+        one line at a time, so that the file never has to be held in memory."""
+        bad_seperator = re.compile(rf" \{delimiter} ")
+        found_bad_data = False
+        for line in lines:
+            if bad_seperator.search(line):
+                if not found_bad_data:
+                    logger.warning(
+                        f"{TerminalColors.YELLOW}" "Found bad data. Attempting to clean." f"{TerminalColors.ENDC}"
+                    )
+                    found_bad_data = True
+                line = bad_seperator.sub(special_character, line)
+            yield line
+
+
+class SQLiteRowIndex:
+    """Dict-like store of parsed rows (row id -> record) that lives in a temporary
+    SQLite database on disk rather than in memory. Used when parsing very large data files.
+
+    Records are stored as JSON lists of their field values and rebuilt into
+    record_type on read (plain values, such as strings, are stored as-is).
+    Like a dict, assigning an existing id replaces the row.
+    """
+
+    def __init__(self, record_type):
+        self.record_type = record_type
+        # An empty filename gives a private, temporary on-disk database
+        # which SQLite deletes as soon as the connection is closed.
+        self.connection = sqlite3.connect("")
+        self.connection.execute("CREATE TABLE rows (id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, datetime):
+            return {"__datetime__": value.isoformat()}
+        raise TypeError(f"Cannot store value of type {type(value).__name__}")
+
+    @staticmethod
+    def _decode(value):
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        return value
+
+    def __setitem__(self, row_id, record):
+        if is_dataclass(record):
+            values = [getattr(record, data_field.name) for data_field in fields(record)]
+        else:
+            values = [record]
+        self.connection.execute(
+            "INSERT OR REPLACE INTO rows (id, data) VALUES (?, ?)",
+            (row_id, json.dumps(values, default=self._encode)),
+        )
 
-        new_content = re.sub(rf" \{delimiter} ", special_character, contents)
-        return new_content
+    def get(self, row_id, default=None):
+        if row_id is None:
+            return default
+        result = self.connection.execute("SELECT data FROM rows WHERE id = ?", (row_id,)).fetchone()
+        if result is None:
+            return default
+        values = json.loads(result[0], object_hook=self._decode)
+        if is_dataclass(self.record_type):
+            return self.record_type(*values)
+        return values[0]
+
+    def __getitem__(self, row_id):
+        record = self.get(row_id)
+        if record is None:
+            raise KeyError(row_id)
+        return record
+
+    def __contains__(self, row_id):
+        return self.get(row_id) is not None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def close(self):
+        """Closes the connection (which deletes the backing file)"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
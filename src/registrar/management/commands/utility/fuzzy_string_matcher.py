@@ -16,9 +16,11 @@ This utility is designed to be flexible and extensible for various fuzzy matchin
 """
 
 import logging
-from typing import Set, List, Dict, Optional, Callable, Tuple
+from collections import defaultdict
+from typing import Set, List, Dict, Iterator, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
 from rapidfuzz import fuzz, process
 from registrar.models.utility.generic_helper import normalize_string
 
@@ -182,6 +184,14 @@ class GenericFuzzyMatcher:
         self.variant_generator = variant_generator
         self.global_threshold = global_threshold
 
+    # Max number of target variants scored against the candidates in a single cdist call.
+    # This bounds the size of the score matrix when matching thousands of names.
+    BATCH_CHUNK_SIZE = 256
+
+    # Max number of candidates kept per variant and strategy, taken from the best scores
+    # in each row of the score matrix
+    MAX_MATCHES_PER_VARIANT = 10
+
     def find_matches(
         self,
         target_string: str,
@@ -204,26 +214,10 @@ class GenericFuzzyMatcher:
         if not target_string or not candidate_strings:
             return MatchResult(matched_strings=set())
 
-        target_variants, variants_used = self._prepare_target_variants(target_string, include_variants)
-
-        matched_strings: Set[str] = set()
-        all_match_details: List[Tuple[str, float, str]] = []
-
-        # Exact string matching
-        self._perform_exact_matching(
-            target_variants, candidate_strings, matched_strings, all_match_details, report_details
-        )
-
-        # Fuzzy matching
-        self._perform_fuzzy_matching(
-            target_variants, candidate_strings, matched_strings, all_match_details, report_details
-        )
-
-        return MatchResult(
-            matched_strings=matched_strings,
-            match_details=all_match_details if report_details else [],
-            variants_used=variants_used,
-        )
+        result = self.batch_find_matches([target_string], candidate_strings, include_variants, workers=1)[target_string]
+        if not report_details:
+            result.match_details = []
+        return result
 
     def _prepare_target_variants(self, target_string: str, include_variants: bool) -> Tuple[Set[str], Set[str]]:
         """Prepare target string variants for matching."""
@@ -238,83 +232,48 @@ class GenericFuzzyMatcher:
 
         return target_variants, variants_used
 
-    def _perform_exact_matching(
-        self,
-        target_variants: Set[str],
-        candidate_strings: List[str],
-        matched_strings: Set[str],
-        all_match_details: List[Tuple[str, float, str]],
-        report_details: bool,
-    ) -> None:
-        """Perform exact string matching against target variants."""
-        normalized_candidates = [normalize_string(candidate) for candidate in candidate_strings]
-
-        for i, normalized_candidate in enumerate(normalized_candidates):
-            if normalized_candidate in target_variants:
-                matched_strings.add(candidate_strings[i])
-                if report_details:
-                    all_match_details.append((candidate_strings[i], 100.0, "exact_string_match"))
-
-    def _perform_fuzzy_matching(
-        self,
-        target_variants: Set[str],
-        candidate_strings: List[str],
-        matched_strings: Set[str],
-        all_match_details: List[Tuple[str, float, str]],
-        report_details: bool,
-    ) -> None:
-        """Perform fuzzy matching using configured strategies."""
-        for target_variant in target_variants:
-            for strategy in self.strategies:
-                self._apply_matching_strategy(
-                    target_variant, candidate_strings, strategy, matched_strings, all_match_details, report_details
-                )
-
-    def _apply_matching_strategy(
-        self,
-        target_variant: str,
-        candidate_strings: List[str],
-        strategy: MatchingStrategy,
-        matched_strings: Set[str],
-        all_match_details: List[Tuple[str, float, str]],
-        report_details: bool,
-    ) -> None:
-        """Apply a single matching strategy to find matches."""
-        try:
+    def _score_variants(
+        self, variants: List[str], candidate_strings: List[str], workers: int
+    ) -> Dict[str, Dict[Tuple[str, str], float]]:
+        """Scores every variant against every candidate with each strategy.
+
+        Returns:
+            Dictionary mapping each variant to {(candidate, strategy_name): score}
+            for every pair that meets the strategy threshold
+        """
+        variant_scores: Dict[str, Dict[Tuple[str, str], float]] = defaultdict(dict)
+        for strategy in self.strategies:
             threshold = getattr(strategy, "threshold", self.global_threshold)
-            matches = process.extract(
-                target_variant,
-                candidate_strings,
-                scorer=strategy.scorer,
-                score_cutoff=threshold,
-                limit=None,
+            try:
+                for variant_index, candidate_index, score in self._score_matrix(
+                    variants, candidate_strings, strategy.scorer, threshold, workers
+                ):
+                    scores = variant_scores[variants[variant_index]]
+                    match_key = (candidate_strings[candidate_index], strategy.name)
+                    if score > scores.get(match_key, -1):
+                        scores[match_key] = score
+            except Exception as e:
+                logger.warning(f"Error in fuzzy matching with strategy {strategy.name}: {e}")
+        return variant_scores
+
+    def _score_matrix(
+        self, queries: List[str], choices: List[str], scorer: Callable, threshold: int, workers: int
+    ) -> Iterator[Tuple[int, int, float]]:
+        """Yields (query_index, choice_index, score) for the best scoring choices of each query,
+        up to MAX_MATCHES_PER_VARIANT of them, that score at least threshold."""
+        top_k = min(self.MAX_MATCHES_PER_VARIANT, len(choices))
+        for chunk_start in range(0, len(queries), self.BATCH_CHUNK_SIZE):
+            chunk = queries[chunk_start : chunk_start + self.BATCH_CHUNK_SIZE]
+            # Scores below score_cutoff are returned as 0
+            matrix = process.cdist(
+                chunk, choices, scorer=scorer, score_cutoff=threshold, dtype=np.float64, workers=workers
             )
-
-            for match_string, score, _ in matches:
-                # Only add if not already found by exact matching
-                if match_string not in matched_strings:
-                    matched_strings.add(match_string)
-
-                if report_details:
-                    self._add_match_detail(all_match_details, match_string, score, strategy.name)
-
-        except Exception as e:
-            logger.warning(f"Error in fuzzy matching with strategy {strategy.name}: {e}")
-
-    def _add_match_detail(
-        self,
-        all_match_details: List[Tuple[str, float, str]],
-        match_string: str,
-        score: float,
-        strategy_name: str,
-    ) -> None:
-        """Add match detail if it doesn't already exist."""
-        existing_detail = next(
-            (detail for detail in all_match_details if detail[0] == match_string and detail[2] == strategy_name),
-            None,
-        )
-        if not existing_detail:
-            all_match_details.append((match_string, score, strategy_name))
+            top_choices = np.argpartition(matrix, -top_k, axis=1)[:, -top_k:]
+            for row, choice_indexes in enumerate(top_choices):
+                for choice_index in choice_indexes:
+                    score = float(matrix[row, choice_index])
+                    if score >= threshold:
+                        yield chunk_start + row, int(choice_index), score
 
     def find_best_match(
         self, target_string: str, candidate_strings: List[str], include_variants: bool = True
@@ -334,17 +293,60 @@ class GenericFuzzyMatcher:
         return (best_match[0], best_match[1])
 
     def batch_find_matches(
-        self, target_strings: List[str], candidate_strings: List[str], include_variants: bool = True
+        self,
+        target_strings: List[str],
+        candidate_strings: List[str],
+        include_variants: bool = True,
+        workers: int = -1,
     ) -> Dict[str, MatchResult]:
         """
         Find matches for multiple target strings efficiently.
 
+        Candidates are normalized once, and the variants of every target are
+        de-duplicated and scored against all candidates together, one score matrix
+        per strategy (process.cdist, spread over `workers` threads; -1 uses all cores).
+
         Returns:
             Dictionary mapping each target string to its MatchResult
         """
-        results = {}
-        for target in target_strings:
-            results[target] = self.find_matches(target, candidate_strings, include_variants, report_details=True)
+        targets = [target for target in target_strings if target]
+        results = {target: MatchResult(matched_strings=set()) for target in target_strings}
+        if not targets or not candidate_strings:
+            return results
+
+        candidates_by_normalized_name = defaultdict(list)
+        for candidate in candidate_strings:
+            candidates_by_normalized_name[normalize_string(candidate)].append(candidate)
+
+        variants_by_target = {}
+        for target in targets:
+            variants_by_target[target], _ = self._prepare_target_variants(target, include_variants)
+        unique_variants = sorted(set().union(*variants_by_target.values()))
+        variant_scores = self._score_variants(unique_variants, candidate_strings, workers)
+
+        for target, target_variants in variants_by_target.items():
+            # Keyed on (candidate, strategy_name), keeping the best score across variants
+            match_details: Dict[Tuple[str, str], float] = {}
+
+            # Exact string matching
+            for target_variant in target_variants:
+                for candidate in candidates_by_normalized_name.get(target_variant, []):
+                    match_details[(candidate, "exact_string_match")] = 100.0
+
+            # Fuzzy matching
+            for target_variant in target_variants:
+                for match_key, score in variant_scores.get(target_variant, {}).items():
+                    if score > match_details.get(match_key, -1):
+                        match_details[match_key] = score
+
+            results[target] = MatchResult(
+                matched_strings={match_string for match_string, _ in match_details},
+                match_details=[
+                    (match_string, score, strategy_name)
+                    for (match_string, strategy_name), score in match_details.items()
+                ],
+                variants_used=target_variants.copy(),
+            )
         return results
 
 
@@ -373,8 +375,9 @@ class FuzzyMatchingTestRunner:
         report_lines.append("               FUZZY MATCHING TEST REPORT")
         report_lines.append("=" * 70)
 
+        results = self.matcher.batch_find_matches(target_strings, candidate_strings, include_variants=True)
         for target in target_strings:
-            result = self.matcher.find_matches(target, candidate_strings, include_variants=True, report_details=True)
+            result = results[target]
 
             report_lines.append(f"\nTarget: '{target}'")
             report_lines.append("-" * 50)
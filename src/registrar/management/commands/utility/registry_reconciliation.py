@@ -0,0 +1,218 @@
+"""
+Reconciles the registry-derived fields of domains with the registry, for reconcile_registry.
+
+The expiration date, creation date, security contact and Host/HostIP rows of a domain are
+otherwise only refreshed when its registry data is loaded, in Domain._fetch_cache. Here the
+registry data of many domains (an InfoDomain, then an InfoHost for each nameserver that is a
+subdomain, as only those keep their IPs in the database) is fetched from a pool of workers,
+a batch of domains at a time. Each batch is then compared with the database in a few queries,
+and the differences are recorded as drift and corrected with bulk writes.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import logging
+import time
+
+from django.db import transaction
+from django.db.models import Q
+
+from epplibwrapper import commands
+from epplibwrapper.errors import RegistryError
+from registrar.management.commands.utility.registry_workers import close_clients, run_with_clients
+from registrar.models import Domain, Host, HostIP, PublicContact
+
+try:
+    from epplib.exceptions import TransportError
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+EXPIRATION_DATE = "expiration_date"
+CREATED_AT = "created_at"
+SECURITY_CONTACT = "security_contact_registry_id"
+HOSTS = "hosts"
+HOST_IPS = "host_ips"
+ERROR = "error"
+
+
+@dataclass
+class RegistryRecord:
+    """The registry's copy of the fields of a domain that are kept in the database"""
+
+    name: str
+    expiration_date: date | None = None
+    created_at: datetime | None = None
+    security_contact_registry_id: str = ""
+    # The IPs of each nameserver, which are only kept for nameservers that are subdomains
+    hosts: dict[str, set[str]] = field(default_factory=dict)
+    error: Exception | None = None
+
+
+@dataclass
+class Drift:
+    """A field of a domain whose value in the database differs from the registry"""
+
+    domain: str
+    field: str
+    database: str
+    registry: str
+
+
+def fetch_registry_record(client, name) -> RegistryRecord:
+    """Sends the registry commands for one domain. Runs on a worker thread."""
+    try:
+        info = client.send(commands.InfoDomain(name=name), cleaned=True).res_data[0]
+        hosts = {}
+        for host in getattr(info, "hosts", None) or []:
+            addrs: set[str] = set()
+            if Domain.isSubdomain(name, host):
+                host_info = client.send(commands.InfoHost(name=host), cleaned=True).res_data[0]
+                addrs = {item.addr for item in getattr(host_info, "addrs", None) or []}
+            hosts[host] = addrs
+        security_contacts = [
+            contact.contact
+            for contact in getattr(info, "contacts", None) or []
+            if contact.type == PublicContact.ContactTypeChoices.SECURITY
+        ]
+        return RegistryRecord(
+            name,
+            expiration_date=info.ex_date,
+            created_at=info.cr_date,
+            security_contact_registry_id=security_contacts[0] if security_contacts else "",
+            hosts=hosts,
+        )
+    # Catches registry errors, including domains missing from the registry, and faulty connections.
+    except (RegistryError, KeyError, TransportError) as err:
+        return RegistryRecord(name, error=err)
+
+
+def join(values) -> str:
+    return ", ".join(sorted(values))
+
+
+@dataclass
+class Corrections:
+    """The bulk writes that bring a batch of domains in line with the registry"""
+
+    domains: dict[str, Domain] = field(default_factory=dict)
+    domain_fields: set[str] = field(default_factory=set)
+    hosts_to_delete: list[int] = field(default_factory=list)
+    # New hosts, with the IPs to create for each once it is saved
+    hosts_to_create: list[tuple[Host, set[str]]] = field(default_factory=list)
+    ips_to_delete: list[int] = field(default_factory=list)
+    ips_to_create: list[HostIP] = field(default_factory=list)
+
+    @transaction.atomic
+    def apply(self):
+        if self.domains:
+            Domain.objects.bulk_update(list(self.domains.values()), sorted(self.domain_fields))
+        HostIP.objects.filter(Q(host_id__in=self.hosts_to_delete) | Q(id__in=self.ips_to_delete)).delete()
+        Host.objects.filter(id__in=self.hosts_to_delete).delete()
+        Host.objects.bulk_create([host for host, _ in self.hosts_to_create])
+        new_host_ips = [HostIP(host=host, address=address) for host, addrs in self.hosts_to_create for address in addrs]
+        HostIP.objects.bulk_create(self.ips_to_create + new_host_ips)
+
+
+class RegistryReconciliation:
+    """Compares the given domains with the registry, with one worker per client, and corrects
+    the database unless dry_run is set"""
+
+    def __init__(self, clients, dry_run=False, batch_size=500):
+        self.clients = clients
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.drift: list[Drift] = []
+        # Domains the registry couldn't be read for, such as those missing from it
+        self.failed: list[Drift] = []
+        self.drifted_domains: set[str] = set()
+        # Domains whose drift was corrected
+        self.corrected = 0
+        self.completed = 0
+        self.elapsed = 0.0
+
+    def run(self, domains):
+        """Reconciles the domains, a batch at a time. The clients are kept open across batches,
+        and closed after the last one."""
+        start = time.perf_counter()
+        names = list(domains.values_list("name", flat=True))
+        try:
+            for offset in range(0, len(names), self.batch_size):
+                batch = names[offset : offset + self.batch_size]
+                records = list(run_with_clients(self.clients, fetch_registry_record, batch))
+                self.reconcile(records)
+                self.completed += len(batch)
+                self.elapsed = time.perf_counter() - start
+                logger.info(f"{self.completed}/{len(names)} domains reconciled, {self.rate():.1f} per second")
+        finally:
+            close_clients(self.clients)
+
+    def reconcile(self, records):
+        """Records the drift between a batch of domains and the registry, then corrects it"""
+        domains = Domain.objects.in_bulk([record.name for record in records], field_name="name")
+        hosts_by_domain: dict[int, dict[str, Host]] = {}
+        for host in Host.objects.filter(domain__in=domains.values()).prefetch_related("ip"):
+            hosts_by_domain.setdefault(host.domain_id, {})[host.name] = host
+
+        corrections = Corrections()
+        drifted_before = len(self.drifted_domains)
+        for record in records:
+            if record.error:
+                self.failed.append(Drift(record.name, ERROR, "", str(record.error)))
+                continue
+            domain = domains.get(record.name)
+            if domain is None:
+                # The domain was deleted while its registry record was being read
+                logger.warning(f"Skipping {record.name}, which is no longer in the database")
+                continue
+            self.diff_fields(domain, record, corrections)
+            self.diff_hosts(domain, record, hosts_by_domain.get(domain.id, {}), corrections)
+
+        if not self.dry_run:
+            corrections.apply()
+            self.corrected += len(self.drifted_domains) - drifted_before
+
+    def record_drift(self, domain, field_name, database, registry):
+        self.drift.append(Drift(domain.name, field_name, database, registry))
+        self.drifted_domains.add(domain.name)
+
+    def diff_fields(self, domain, record, corrections):
+        """Sets the fields of the domain that differ from the registry"""
+        for field_name in (EXPIRATION_DATE, CREATED_AT, SECURITY_CONTACT):
+            database_value = getattr(domain, field_name)
+            registry_value = getattr(record, field_name)
+            if database_value != registry_value:
+                self.record_drift(domain, field_name, str(database_value), str(registry_value))
+                setattr(domain, field_name, registry_value)
+                corrections.domain_fields.add(field_name)
+                corrections.domains[domain.name] = domain
+
+    def diff_hosts(self, domain, record, hosts_in_db, corrections):
+        """Plans the Host and HostIP rows to delete and create for the domain"""
+        if set(hosts_in_db) != set(record.hosts):
+            self.record_drift(domain, HOSTS, join(hosts_in_db), join(record.hosts))
+        for name, host in hosts_in_db.items():
+            if name not in record.hosts:
+                corrections.hosts_to_delete.append(host.id)
+                continue
+            ips_in_db = {ip.address: ip for ip in host.ip.all()}
+            addrs = record.hosts[name]
+            if set(ips_in_db) != addrs:
+                self.record_drift(domain, HOST_IPS, f"{name}: {join(ips_in_db)}", f"{name}: {join(addrs)}")
+            corrections.ips_to_delete.extend(ip.id for address, ip in ips_in_db.items() if address not in addrs)
+            corrections.ips_to_create.extend(HostIP(host=host, address=address) for address in addrs - set(ips_in_db))
+        for name, addrs in record.hosts.items():
+            if name not in hosts_in_db:
+                corrections.hosts_to_create.append((Host(domain=domain, name=name), addrs))
+
+    def drift_counts(self) -> dict[str, int]:
+        """Number of drifted fields by field name"""
+        counts: dict[str, int] = {}
+        for drift in self.drift:
+            counts[drift.field] = counts.get(drift.field, 0) + 1
+        return counts
+
+    def rate(self):
+        """Domains reconciled per second"""
+        return self.completed / self.elapsed if self.elapsed else 0.0
@@ -0,0 +1,58 @@
+"""
+Sends registry commands for many domains at once, for management commands that sweep the registry.
+
+Each worker thread has its own registry client, so the number of workers bounds the number of
+registry sessions in use. Only the registry should be contacted from the workers: callers read
+and write the database on the main thread, as the results come in.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+import queue
+
+from epplibwrapper import CLIENT
+from epplibwrapper.client import EPPLibWrapper
+
+
+def get_clients(concurrency) -> list:
+    """Returns a registry client for each worker. A single worker uses the app's client, so
+    that no other session is opened; otherwise each worker opens its own session."""
+    if concurrency == 1:
+        return [CLIENT]
+    return [EPPLibWrapper(connect=False) for _ in range(concurrency)]
+
+
+def run_with_clients(clients, func, items):
+    """Calls func(client, item) for each item, with one worker per client, and yields the
+    results in the order they complete. A client is only used by one worker at a time.
+
+    Only one item per worker is in flight at a time, and the next is only submitted once the
+    caller has handled a result, so that when the caller stops early (an error, or Ctrl-C) no commands
+    are left queued to be sent. The clients are left open, so that they can be used for more items;
+    callers close them with close_clients when they are done."""
+    idle_clients: queue.Queue = queue.Queue()
+    for client in clients:
+        idle_clients.put(client)
+
+    def call_with_idle_client(item):
+        client = idle_clients.get()
+        try:
+            return func(client, item)
+        finally:
+            idle_clients.put(client)
+
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        items = iter(items)
+        pending = {executor.submit(call_with_idle_client, item) for item in islice(items, len(clients))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                pending.update(executor.submit(call_with_idle_client, item) for item in islice(items, 1))
+
+
+def close_clients(clients):
+    """Closes the sessions of the clients other than the app's client"""
+    for client in clients:
+        if client is not CLIENT:
+            client.close()
@@ -0,0 +1,115 @@
+"""Runs per-table work for export_tables and import_tables, in parallel where the tables allow it"""
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Default number of worker processes. Each one holds its own database connection.
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class TableResult:
+    """The number of rows a table's work handled, and how long it took"""
+
+    table_name: str
+    rows: int
+    seconds: float
+    error: str | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def get_loaded_relations(model):
+    """Returns the models that the rows of model reference when imported"""
+    for field in model._meta.get_fields():
+        # Skip reverse relations, and many to many relations stored in a table of their own
+        if not field.is_relation or field.auto_created:
+            continue
+        if field.many_to_many and not field.remote_field.through._meta.auto_created:
+            continue
+        yield field.related_model
+
+
+def get_dependency_levels(table_names):
+    """Groups table_names into levels, where every table only references tables in earlier levels.
+
+    Tables in the same level don't reference each other, so they can be processed at the same
+    time. Tables keep their given order within a level. If the references form a cycle, the
+    remaining tables are put in one last level in their given order.
+    """
+    models_by_table = {table_name: apps.get_model("registrar", table_name) for table_name in table_names}
+    tables_by_model = {model: table_name for table_name, model in models_by_table.items()}
+    dependencies = {
+        table_name: {tables_by_model[related] for related in get_loaded_relations(model) if related in tables_by_model}
+        - {table_name}
+        for table_name, model in models_by_table.items()
+    }
+
+    levels = []
+    done = set()
+    remaining = list(table_names)
+    while remaining:
+        ready = [table_name for table_name in remaining if dependencies[table_name].issubset(done)]
+        if not ready:
+            logger.warning(f"Tables {remaining} reference each other, keeping them in the given order")
+            ready = remaining
+        levels.append(ready)
+        done.update(ready)
+        remaining = [table_name for table_name in remaining if table_name not in done]
+    return levels
+
+
+def _timed_call(function, table_name, *args):
+    """Runs function for one table and returns a TableResult. function returns the number of rows."""
+    start = time.perf_counter()
+    try:
+        rows = function(table_name, *args)
+        return TableResult(table_name, rows or 0, time.perf_counter() - start)
+    except Exception as err:
+        logger.error(f"Failed to process {table_name}: {err}")
+        return TableResult(table_name, 0, time.perf_counter() - start, error=str(err))
+
+
+def run_tables(function, table_names, *args, workers=DEFAULT_WORKERS):
+    """Runs function(table_name, *args) for each table, in up to workers processes at a time.
+
+    function must be defined at the top level of a module, and returns the number of rows it
+    handled. Returns a TableResult for each table, in the order of table_names.
+    """
+    if workers <= 1 or len(table_names) <= 1:
+        return [_timed_call(function, table_name, *args) for table_name in table_names]
+
+    # Workers are forked, so they inherit the configured django app. Connections are closed
+    # first so that no worker shares this process's connection; each opens its own.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=min(workers, len(table_names)), mp_context=context) as executor:
+        futures = [executor.submit(_timed_call, function, table_name, *args) for table_name in table_names]
+        return [future.result() for future in futures]
+
+
+def log_throughput(results, action, seconds):
+    """Logs the rows per second of each table, and of all tables together over seconds"""
+    for result in results:
+        if result.error:
+            logger.info(f"{result.table_name}: failed after {result.seconds:.1f}s ({result.error})")
+        else:
+            logger.info(
+                f"{result.table_name}: {action} {result.rows} rows in {result.seconds:.1f}s "
+                f"({result.rows_per_second:.0f} rows/s)"
+            )
+    rows = sum(result.rows for result in results)
+    rows_per_second = rows / seconds if seconds > 0 else 0.0
+    logger.info(
+        f"{action.capitalize()} {rows} rows from {len(results)} tables in {seconds:.1f}s ({rows_per_second:.0f} rows/s)"
+    )
@@ -2,6 +2,7 @@ import logging
 import sys
 from abc import ABC, abstractmethod
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import Model
 from django.db.models.manager import BaseManager
 from typing import List
@@ -124,8 +125,19 @@ class PopulateScriptTemplate(ABC):
         """
         raise NotImplementedError
 
+    # Default number of records per chunk for scripts that expose --chunk_size
+    default_chunk_size: int = 1000
+
     def mass_update_records(
-        self, object_class, filter_conditions, fields_to_update, debug=True, verbose=False, show_record_count=False
+        self,
+        object_class,
+        filter_conditions,
+        fields_to_update,
+        debug=True,
+        verbose=False,
+        show_record_count=False,
+        chunk_size=None,
+        start_after_pk=None,
     ):
         """Loops through each valid "object_class" object - specified by filter_conditions - and
         updates fields defined by fields_to_update using update_record.
@@ -149,6 +161,15 @@ class PopulateScriptTemplate(ABC):
             show_record_count: Whether to show a 'Record 1/10' dialog when running update.
                 Default: False.
 
+            chunk_size: When set, records are streamed in primary key order with .iterator()
+                and bulk updated every chunk_size records, and only primary keys are kept for
+                the run summary. Memory use stays flat regardless of table size.
+                Default: None (load and update every record at once).
+
+            start_after_pk: Chunked mode only. Skips records with a primary key at or below this
+                value, e.g. the last committed primary key logged by an interrupted run.
+                Default: None.
+
         Raises:
             NotImplementedError: If you do not define update_record before using this function.
             TypeError: If custom_filter is not Callable.
@@ -158,6 +179,12 @@ class PopulateScriptTemplate(ABC):
 
         # apply custom filter
         records = self.custom_filter(records)
+        if chunk_size:
+            self.mass_update_records_in_chunks(
+                object_class, records, fields_to_update, chunk_size, start_after_pk, debug, verbose, show_record_count
+            )
+            return
+
         records_length = len(records)
 
         readable_class_name = self.get_class_name(object_class)
@@ -212,9 +239,121 @@ class PopulateScriptTemplate(ABC):
             display_as_str=True,
         )
 
-    def bulk_update_fields(self, object_class, to_update, fields_to_update):
+    def mass_update_records_in_chunks(
+        self, object_class, records, fields_to_update, chunk_size, start_after_pk, debug, verbose, show_record_count
+    ):
+        """Chunked mode of mass_update_records. See mass_update_records for the parameters.
+
+        Every chunk is bulk updated in its own transaction. After each commit, the primary key of
+        the last record in the chunk is logged and stored on self.last_committed_pk.
+        If the run is interrupted, pass that value as start_after_pk to resume.
+        """
+        if start_after_pk is not None:
+            records = records.filter(pk__gt=start_after_pk)
+        records = records.order_by("pk")
+        records_length = records.count()
+
+        # Code execution will stop here if the user prompts "N"
+        TerminalHelper.prompt_for_execution(
+            system_exit_on_terminate=True,
+            prompt_message=self.get_chunked_proposed_changes(
+                object_class, records, records_length, fields_to_update, chunk_size, start_after_pk, verbose
+            ),
+            prompt_title=self.prompt_title,
+        )
+        logger.info("Updating...")
+
+        self.last_committed_pk = start_after_pk
+        updated_pks: List[int] = []
+        skipped_pks: List[int] = []
+        failed_pks: List[int] = []
+        chunk: List[object_class] = []
+        processed = 0
+        for record in records.iterator(chunk_size=chunk_size):
+            processed += 1
+            if show_record_count:
+                logger.info(f"{TerminalColors.BOLD}Record {processed}/{records_length}{TerminalColors.ENDC}")
+            try:
+                if not self.should_skip_record(record):
+                    self.update_record(record)
+                    chunk.append(record)
+                else:
+                    skipped_pks.append(record.pk)
+            except Exception as err:
+                failed_pks.append(record.pk)
+                logger.error(err)
+                logger.error(self.get_failure_message(record))
+
+            if processed % chunk_size == 0:
+                self.commit_chunk(object_class, chunk, fields_to_update, record.pk, processed, records_length)
+                updated_pks.extend(updated.pk for updated in chunk)
+                chunk = []
+
+        if processed % chunk_size:
+            self.commit_chunk(object_class, chunk, fields_to_update, record.pk, processed, records_length)
+            updated_pks.extend(updated.pk for updated in chunk)
+
+        # Log what happened
+        TerminalHelper.log_script_run_summary(
+            updated_pks,
+            failed_pks,
+            skipped_pks,
+            [],
+            debug=debug,
+            log_header=self.run_summary_header,
+            display_as_str=True,
+        )
+
+    def get_chunked_proposed_changes(
+        self, object_class, records, records_length, fields_to_update, chunk_size, start_after_pk, verbose
+    ):
+        """Returns the execution prompt for chunked mode. With verbose, lists a sample of records
+        rather than rendering the entire queryset."""
+        readable_class_name = self.get_class_name(object_class)
+        proposed_changes = (
+            "==Proposed Changes==\n"
+            f"Number of {readable_class_name} objects to change: {records_length}\n"
+            f"These fields will be updated on each record: {fields_to_update}\n"
+            f"Records will be updated in chunks of {chunk_size}"
+        )
+        if start_after_pk is not None:
+            proposed_changes = f"{proposed_changes}, starting after primary key {start_after_pk}"
+
+        if verbose:
+            sample = list(records[:10])
+            remaining = f" (and {records_length - len(sample)} more)" if records_length > len(sample) else ""
+            proposed_changes = f"{proposed_changes}\nThese records will be updated: {sample}{remaining}"
+        return proposed_changes
+
+    def commit_chunk(self, object_class, chunk, fields_to_update, last_pk, processed, total):
+        """Bulk updates one chunk in a transaction and records it as the resume checkpoint"""
+        with transaction.atomic():
+            self.bulk_update_fields(object_class, chunk, fields_to_update, quiet=True)
+        self.last_committed_pk = last_pk
+        logger.info(
+            f"{TerminalColors.OKBLUE}Committed {processed}/{total} records. "
+            f"Last committed primary key: {last_pk}{TerminalColors.ENDC}"
+        )
+
+    def add_chunk_arguments(self, parser, resumable=True):
+        """Adds the --chunk_size (and optionally --start_after_pk) arguments used by chunked mode"""
+        parser.add_argument(
+            "--chunk_size",
+            type=int,
+            default=self.default_chunk_size,
+            help="Number of records to stream and bulk update at a time. Use 0 to load every record at once.",
+        )
+        if resumable:
+            parser.add_argument(
+                "--start_after_pk",
+                type=int,
+                default=None,
+                help="Resume an interrupted run after this primary key (the last committed primary key it logged).",
+            )
+
+    def bulk_update_fields(self, object_class, to_update, fields_to_update, quiet=False):
         """Bulk updates the given fields"""
-        ScriptDataHelper.bulk_update_fields(object_class, to_update, fields_to_update)
+        ScriptDataHelper.bulk_update_fields(object_class, to_update, fields_to_update, quiet=quiet)
 
     def get_class_name(self, sender) -> str:
         """Returns the class name that we want to display for the terminal prompt.
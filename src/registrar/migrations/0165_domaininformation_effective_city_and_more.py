@@ -0,0 +1,336 @@
+# Generated by Django 4.2.20 on 2026-10-18 22:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+BATCH_SIZE = 1000
+
+FIELD_NAMES = [
+    "effective_generic_org_type",
+    "effective_federal_agency",
+    "effective_federal_type",
+    "effective_organization_name",
+    "effective_city",
+    "effective_state_territory",
+]
+
+
+def populate_effective_fields(apps, schema_editor):
+    """Fills in the stored converted values of existing domain requests and domain information.
+    Mirrors registrar.models.utility.converted_fields.get_converted_values."""
+    for model_name in ["DomainRequest", "DomainInformation"]:
+        model = apps.get_model("registrar", model_name)
+        records = model.objects.select_related("portfolio__federal_agency", "federal_agency").order_by("pk")
+        batch = []
+        for record in records.iterator(chunk_size=BATCH_SIZE):
+            portfolio = record.portfolio
+            source = portfolio or record
+            federal_agency = source.federal_agency
+            record.effective_generic_org_type = portfolio.organization_type if portfolio else record.generic_org_type
+            record.effective_federal_agency = federal_agency
+            record.effective_federal_type = federal_agency.federal_type if federal_agency else None
+            record.effective_organization_name = source.organization_name
+            record.effective_city = source.city
+            record.effective_state_territory = source.state_territory
+            batch.append(record)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, FIELD_NAMES)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, FIELD_NAMES)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0164_alter_domain_request_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_city",
+            field=models.CharField(
+                blank=True, editable=False, help_text="City, from the portfolio if there is one", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_federal_agency",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Federal agency, from the portfolio if it has one",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="registrar.federalagency",
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_federal_type",
+            field=models.CharField(
+                blank=True,
+                choices=[("executive", "Executive"), ("judicial", "Judicial"), ("legislative", "Legislative")],
+                editable=False,
+                help_text="Federal type of the effective federal agency",
+                max_length=50,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_generic_org_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("federal", "Federal"),
+                    ("interstate", "Interstate"),
+                    ("state_or_territory", "State or territory"),
+                    ("tribal", "Tribal"),
+                    ("county", "County"),
+                    ("city", "City"),
+                    ("special_district", "Special district"),
+                    ("school_district", "School district"),
+                ],
+                editable=False,
+                help_text="Type of organization, from the portfolio if there is one",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_organization_name",
+            field=models.CharField(
+                blank=True, editable=False, help_text="Organization name, from the portfolio if there is one", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaininformation",
+            name="effective_state_territory",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("AL", "Alabama (AL)"),
+                    ("AK", "Alaska (AK)"),
+                    ("AS", "American Samoa (AS)"),
+                    ("AZ", "Arizona (AZ)"),
+                    ("AR", "Arkansas (AR)"),
+                    ("CA", "California (CA)"),
+                    ("CO", "Colorado (CO)"),
+                    ("CT", "Connecticut (CT)"),
+                    ("DE", "Delaware (DE)"),
+                    ("DC", "District of Columbia (DC)"),
+                    ("FL", "Florida (FL)"),
+                    ("GA", "Georgia (GA)"),
+                    ("GU", "Guam (GU)"),
+                    ("HI", "Hawaii (HI)"),
+                    ("ID", "Idaho (ID)"),
+                    ("IL", "Illinois (IL)"),
+                    ("IN", "Indiana (IN)"),
+                    ("IA", "Iowa (IA)"),
+                    ("KS", "Kansas (KS)"),
+                    ("KY", "Kentucky (KY)"),
+                    ("LA", "Louisiana (LA)"),
+                    ("ME", "Maine (ME)"),
+                    ("MD", "Maryland (MD)"),
+                    ("MA", "Massachusetts (MA)"),
+                    ("MI", "Michigan (MI)"),
+                    ("MN", "Minnesota (MN)"),
+                    ("MS", "Mississippi (MS)"),
+                    ("MO", "Missouri (MO)"),
+                    ("MT", "Montana (MT)"),
+                    ("NE", "Nebraska (NE)"),
+                    ("NV", "Nevada (NV)"),
+                    ("NH", "New Hampshire (NH)"),
+                    ("NJ", "New Jersey (NJ)"),
+                    ("NM", "New Mexico (NM)"),
+                    ("NY", "New York (NY)"),
+                    ("NC", "North Carolina (NC)"),
+                    ("ND", "North Dakota (ND)"),
+                    ("MP", "Northern Mariana Islands (MP)"),
+                    ("OH", "Ohio (OH)"),
+                    ("OK", "Oklahoma (OK)"),
+                    ("OR", "Oregon (OR)"),
+                    ("PA", "Pennsylvania (PA)"),
+                    ("PR", "Puerto Rico (PR)"),
+                    ("RI", "Rhode Island (RI)"),
+                    ("SC", "South Carolina (SC)"),
+                    ("SD", "South Dakota (SD)"),
+                    ("TN", "Tennessee (TN)"),
+                    ("TX", "Texas (TX)"),
+                    ("UM", "United States Minor Outlying Islands (UM)"),
+                    ("UT", "Utah (UT)"),
+                    ("VT", "Vermont (VT)"),
+                    ("VI", "Virgin Islands (VI)"),
+                    ("VA", "Virginia (VA)"),
+                    ("WA", "Washington (WA)"),
+                    ("WV", "West Virginia (WV)"),
+                    ("WI", "Wisconsin (WI)"),
+                    ("WY", "Wyoming (WY)"),
+                    ("AA", "Armed Forces Americas (AA)"),
+                    ("AE", "Armed Forces Africa, Canada, Europe, Middle East (AE)"),
+                    ("AP", "Armed Forces Pacific (AP)"),
+                ],
+                editable=False,
+                help_text="State, territory, or military post, from the portfolio if there is one",
+                max_length=2,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_city",
+            field=models.CharField(
+                blank=True, editable=False, help_text="City, from the portfolio if there is one", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_federal_agency",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Federal agency, from the portfolio if it has one",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="registrar.federalagency",
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_federal_type",
+            field=models.CharField(
+                blank=True,
+                choices=[("executive", "Executive"), ("judicial", "Judicial"), ("legislative", "Legislative")],
+                editable=False,
+                help_text="Federal type of the effective federal agency",
+                max_length=50,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_generic_org_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("federal", "Federal"),
+                    ("interstate", "Interstate"),
+                    ("state_or_territory", "State or territory"),
+                    ("tribal", "Tribal"),
+                    ("county", "County"),
+                    ("city", "City"),
+                    ("special_district", "Special district"),
+                    ("school_district", "School district"),
+                ],
+                editable=False,
+                help_text="Type of organization, from the portfolio if there is one",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_organization_name",
+            field=models.CharField(
+                blank=True, editable=False, help_text="Organization name, from the portfolio if there is one", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="domainrequest",
+            name="effective_state_territory",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("AL", "Alabama (AL)"),
+                    ("AK", "Alaska (AK)"),
+                    ("AS", "American Samoa (AS)"),
+                    ("AZ", "Arizona (AZ)"),
+                    ("AR", "Arkansas (AR)"),
+                    ("CA", "California (CA)"),
+                    ("CO", "Colorado (CO)"),
+                    ("CT", "Connecticut (CT)"),
+                    ("DE", "Delaware (DE)"),
+                    ("DC", "District of Columbia (DC)"),
+                    ("FL", "Florida (FL)"),
+                    ("GA", "Georgia (GA)"),
+                    ("GU", "Guam (GU)"),
+                    ("HI", "Hawaii (HI)"),
+                    ("ID", "Idaho (ID)"),
+                    ("IL", "Illinois (IL)"),
+                    ("IN", "Indiana (IN)"),
+                    ("IA", "Iowa (IA)"),
+                    ("KS", "Kansas (KS)"),
+                    ("KY", "Kentucky (KY)"),
+                    ("LA", "Louisiana (LA)"),
+                    ("ME", "Maine (ME)"),
+                    ("MD", "Maryland (MD)"),
+                    ("MA", "Massachusetts (MA)"),
+                    ("MI", "Michigan (MI)"),
+                    ("MN", "Minnesota (MN)"),
+                    ("MS", "Mississippi (MS)"),
+                    ("MO", "Missouri (MO)"),
+                    ("MT", "Montana (MT)"),
+                    ("NE", "Nebraska (NE)"),
+                    ("NV", "Nevada (NV)"),
+                    ("NH", "New Hampshire (NH)"),
+                    ("NJ", "New Jersey (NJ)"),
+                    ("NM", "New Mexico (NM)"),
+                    ("NY", "New York (NY)"),
+                    ("NC", "North Carolina (NC)"),
+                    ("ND", "North Dakota (ND)"),
+                    ("MP", "Northern Mariana Islands (MP)"),
+                    ("OH", "Ohio (OH)"),
+                    ("OK", "Oklahoma (OK)"),
+                    ("OR", "Oregon (OR)"),
+                    ("PA", "Pennsylvania (PA)"),
+                    ("PR", "Puerto Rico (PR)"),
+                    ("RI", "Rhode Island (RI)"),
+                    ("SC", "South Carolina (SC)"),
+                    ("SD", "South Dakota (SD)"),
+                    ("TN", "Tennessee (TN)"),
+                    ("TX", "Texas (TX)"),
+                    ("UM", "United States Minor Outlying Islands (UM)"),
+                    ("UT", "Utah (UT)"),
+                    ("VT", "Vermont (VT)"),
+                    ("VI", "Virgin Islands (VI)"),
+                    ("VA", "Virginia (VA)"),
+                    ("WA", "Washington (WA)"),
+                    ("WV", "West Virginia (WV)"),
+                    ("WI", "Wisconsin (WI)"),
+                    ("WY", "Wyoming (WY)"),
+                    ("AA", "Armed Forces Americas (AA)"),
+                    ("AE", "Armed Forces Africa, Canada, Europe, Middle East (AE)"),
+                    ("AP", "Armed Forces Pacific (AP)"),
+                ],
+                editable=False,
+                help_text="State, territory, or military post, from the portfolio if there is one",
+                max_length=2,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            populate_effective_fields,
+            reverse_code=migrations.RunPython.noop,
+            atomic=True,
+        ),
+        migrations.AddIndex(
+            model_name="domaininformation",
+            index=models.Index(
+                fields=["effective_generic_org_type", "effective_federal_type"],
+                include=("domain",),
+                name="di_effective_org_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="domainrequest",
+            index=models.Index(
+                fields=["effective_generic_org_type", "effective_federal_type"], name="dr_effective_org_type_idx"
+            ),
+        ),
+    ]
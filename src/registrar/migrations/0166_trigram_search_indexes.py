@@ -0,0 +1,78 @@
+# Generated by Django 4.2.20 on 2026-10-19 01:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The indexes are built without locking the tables against writes, which can't be done in a transaction
+    atomic = False
+
+    dependencies = [
+        ("registrar", "0165_domaininformation_effective_city_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="domain",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="domain_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="draftdomain",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="draftdomain_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"], name="user_email_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["first_name"], name="user_first_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["last_name"], name="user_last_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="contact",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"], name="contact_email_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="domaininvitation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"], name="domaininv_email_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="portfolioinvitation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"], name="portfolioinv_email_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="portfolio",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organization_name"], name="portfolio_org_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="domainrequest",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["effective_organization_name"], name="dr_org_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.20 on 2026-10-19 03:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The indexes are built without locking the tables against writes, which can't be done in a transaction
+    atomic = False
+
+    dependencies = [
+        ("registrar", "0166_trigram_search_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="domain",
+            index=models.Index(
+                condition=models.Q(("expiration_date__isnull", False)),
+                fields=["expiration_date", "state"],
+                name="domain_expiration_state_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="domaininformation",
+            index=models.Index(fields=["portfolio", "domain"], name="di_portfolio_domain_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="domaininvitation",
+            index=models.Index(fields=["email", "status"], name="domaininv_email_status_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="domaininvitation",
+            index=models.Index(
+                condition=models.Q(("status", "invited")),
+                fields=["domain", "email"],
+                name="domaininv_invited_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="domainrequest",
+            index=models.Index(fields=["requester", "status"], name="dr_requester_status_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="portfolioinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "invited")),
+                fields=["portfolio", "email"],
+                name="portfolioinv_invited_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.20 on 2026-10-19 05:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0167_hot_path_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DomainExpirationNotification",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "expiration_date",
+                    models.DateField(help_text="Expiration date of the domain when the notification was sent"),
+                ),
+                (
+                    "days_remaining",
+                    models.PositiveIntegerField(help_text="Days until expiration when the notification was sent"),
+                ),
+                (
+                    "domain",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="expiration_notifications",
+                        to="registrar.domain",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="domainexpirationnotification",
+            constraint=models.UniqueConstraint(
+                fields=("domain", "expiration_date", "days_remaining"), name="unique_domain_expiration_notification"
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.20 on 2026-10-19 09:40
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0168_domainexpirationnotification"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedEmail",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("subject", models.TextField()),
+                ("body", models.TextField()),
+                (
+                    "to_addresses",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.EmailField(max_length=320),
+                        help_text="Addresses the email is sent to",
+                        size=None,
+                    ),
+                ),
+                (
+                    "cc_addresses",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.EmailField(max_length=320),
+                        blank=True,
+                        default=list,
+                        help_text="Addresses the email is copied to",
+                        size=None,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("failed", "Failed")],
+                        db_index=True,
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, help_text="Number of times sending the email failed"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, default="", help_text="Why the email last failed to send"),
+                ),
+            ],
+        ),
+    ]
@@ -3,6 +3,7 @@ from .contact import Contact
 from .domain_request import DomainRequest
 from .domain_information import DomainInformation
 from .domain import Domain
+from .domain_expiration_notification import DomainExpirationNotification
 from .draft_domain import DraftDomain
 from .federal_agency import FederalAgency
 from .host_ip import HostIP
@@ -37,6 +38,7 @@ from .domain_group import DomainGroup
 from .suborganization import Suborganization
 from .senior_official import SeniorOfficial
 from .allowed_email import AllowedEmail
+from .queued_email import QueuedEmail
 
 
 __all__ = [
@@ -44,6 +46,7 @@ __all__ = [
     "DomainRequest",
     "DomainInformation",
     "Domain",
+    "DomainExpirationNotification",
     "DraftDomain",
     "DomainInvitation",
     "FederalAgency",
@@ -64,6 +67,7 @@ __all__ = [
     "SeniorOfficial",
     "UserPortfolioPermission",
     "AllowedEmail",
+    "QueuedEmail",
     "DnsVendor",
     "DnsAccount",
     "VendorDnsAccount",
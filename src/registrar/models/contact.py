@@ -1,5 +1,6 @@
 from django.db import models
 
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 from phonenumber_field.modelfields import PhoneNumberField  # type: ignore
@@ -15,6 +16,7 @@ class Contact(TimeStampedModel):
 
         indexes = [
             models.Index(fields=["email"]),
+            trigram_index("email", name="contact_email_trgm_idx"),
         ]
 
     first_name = models.CharField(
@@ -39,6 +39,7 @@ from django.db.models import DateField, TextField
 
 from .utility.domain_field import DomainField
 from .utility.domain_helper import DomainHelper
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 from .public_contact import PublicContact
@@ -76,6 +77,13 @@ class Domain(TimeStampedModel, DomainHelper):
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["state"]),
+            trigram_index("name", name="domain_name_trgm_idx"),
+            # Domains expiring in a date range, in the given states
+            models.Index(
+                fields=["expiration_date", "state"],
+                condition=models.Q(expiration_date__isnull=False),
+                name="domain_expiration_state_idx",
+            ),
         ]
 
         # Domain name must be unique across all non-deletd domains
@@ -0,0 +1,38 @@
+from django.db import models
+
+from .utility.time_stamped_model import TimeStampedModel
+
+
+class DomainExpirationNotification(TimeStampedModel):
+    """
+    A record of an expiring soon email sent for a domain, so that
+    send_expiring_soon_domains_notification doesn't send it twice.
+
+    Notifications are keyed on the expiration date as well as the days remaining,
+    so that a renewed domain is notified again before its new expiration date.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["domain", "expiration_date", "days_remaining"],
+                name="unique_domain_expiration_notification",
+            ),
+        ]
+
+    domain = models.ForeignKey(
+        "registrar.Domain",
+        on_delete=models.CASCADE,
+        related_name="expiration_notifications",
+    )
+
+    expiration_date = models.DateField(
+        help_text="Expiration date of the domain when the notification was sent",
+    )
+
+    days_remaining = models.PositiveIntegerField(
+        help_text="Days until expiration when the notification was sent",
+    )
+
+    def __str__(self):
+        return f"{self.domain} expiring on {self.expiration_date} ({self.days_remaining} days)"
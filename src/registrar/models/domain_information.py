@@ -3,6 +3,7 @@ from django.db import transaction
 
 from registrar.models.utility.domain_helper import DomainHelper
 from registrar.models.utility.generic_helper import CreateOrUpdateOrganizationTypeHelper
+from registrar.models.utility.converted_fields import sync_converted_fields
 from registrar.utility.constants import BranchChoices
 
 from .domain_request import DomainRequest
@@ -30,6 +31,14 @@ class DomainInformation(TimeStampedModel):
         indexes = [
             models.Index(fields=["domain"]),
             models.Index(fields=["domain_request"]),
+            # Covers the domain changelist's filters, which only need the domain from each row
+            models.Index(
+                fields=["effective_generic_org_type", "effective_federal_type"],
+                include=["domain"],
+                name="di_effective_org_type_idx",
+            ),
+            # The domains of a portfolio, read from the index alone
+            models.Index(fields=["portfolio", "domain"], name="di_portfolio_domain_idx"),
         ]
 
         verbose_name_plural = "Domain information"
@@ -270,6 +279,59 @@ class DomainInformation(TimeStampedModel):
         blank=True,
     )
 
+    # ##### stored converted values, see registrar/models/utility/converted_fields.py #####
+    # These copy the converted_* properties, so that they can be filtered and sorted on.
+    effective_generic_org_type = models.CharField(
+        max_length=255,
+        choices=OrganizationChoices.choices,  # type: ignore[misc]
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Type of organization, from the portfolio if there is one",
+    )
+
+    effective_federal_agency = models.ForeignKey(
+        "registrar.FederalAgency",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text="Federal agency, from the portfolio if it has one",
+    )
+
+    effective_federal_type = models.CharField(
+        max_length=50,
+        choices=BranchChoices.choices,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Federal type of the effective federal agency",
+    )
+
+    effective_organization_name = models.CharField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Organization name, from the portfolio if there is one",
+    )
+
+    effective_city = models.CharField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="City, from the portfolio if there is one",
+    )
+
+    effective_state_territory = models.CharField(
+        max_length=2,
+        choices=StateTerritoryChoices.choices,  # type: ignore[misc]
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="State, territory, or military post, from the portfolio if there is one",
+    )
+
     def __str__(self):
         try:
             if self.domain and self.domain.name:
@@ -345,6 +407,7 @@ class DomainInformation(TimeStampedModel):
         """Save override for custom properties"""
         self.sync_yes_no_form_fields()
         self.sync_organization_type()
+        sync_converted_fields(self)
         super().save(*args, **kwargs)
 
     @classmethod
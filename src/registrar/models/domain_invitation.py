@@ -7,6 +7,7 @@ from django.db import models
 
 from django_fsm import FSMField, transition  # type: ignore
 
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 from .user_domain_role import UserDomainRole
 
@@ -20,6 +21,15 @@ class DomainInvitation(TimeStampedModel):
 
         indexes = [
             models.Index(fields=["status"]),
+            trigram_index("email", name="domaininv_email_trgm_idx"),
+            # A user's invitations in a given status, such as when they log in
+            models.Index(fields=["email", "status"], name="domaininv_email_status_idx"),
+            # Open invitations by domain, for the member tables and exports
+            models.Index(
+                fields=["domain", "email"],
+                condition=models.Q(status="invited"),
+                name="domaininv_invited_idx",
+            ),
         ]
 
     # Constants for status field
@@ -9,7 +9,9 @@ from django.utils import timezone
 from registrar.models.domain import Domain
 from registrar.models.federal_agency import FederalAgency
 from registrar.models.utility.generic_helper import CreateOrUpdateOrganizationTypeHelper
+from registrar.models.utility.converted_fields import sync_converted_fields
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices
+from registrar.models.utility.search import trigram_index
 from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
 from registrar.utility.constants import BranchChoices
 from auditlog.models import LogEntry
@@ -32,6 +34,13 @@ class DomainRequest(TimeStampedModel):
             models.Index(fields=["requested_domain"]),
             models.Index(fields=["approved_domain"]),
             models.Index(fields=["status"]),
+            models.Index(
+                fields=["effective_generic_org_type", "effective_federal_type"],
+                name="dr_effective_org_type_idx",
+            ),
+            trigram_index("effective_organization_name", name="dr_org_name_trgm_idx"),
+            # A user's requests in a given status, for the requests table and home page counts
+            models.Index(fields=["requester", "status"], name="dr_requester_status_idx"),
         ]
 
     # https://django-auditlog.readthedocs.io/en/latest/usage.html#object-history
@@ -665,6 +674,59 @@ class DomainRequest(TimeStampedModel):
         blank=True,
     )
 
+    # ##### stored converted values, see registrar/models/utility/converted_fields.py #####
+    # These copy the converted_* properties, so that they can be filtered and sorted on.
+    effective_generic_org_type = models.CharField(
+        max_length=255,
+        choices=OrganizationChoices.choices,  # type: ignore[misc]
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Type of organization, from the portfolio if there is one",
+    )
+
+    effective_federal_agency = models.ForeignKey(
+        "registrar.FederalAgency",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text="Federal agency, from the portfolio if it has one",
+    )
+
+    effective_federal_type = models.CharField(
+        max_length=50,
+        choices=BranchChoices.choices,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Federal type of the effective federal agency",
+    )
+
+    effective_organization_name = models.CharField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Organization name, from the portfolio if there is one",
+    )
+
+    effective_city = models.CharField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="City, from the portfolio if there is one",
+    )
+
+    effective_state_territory = models.CharField(
+        max_length=2,
+        choices=StateTerritoryChoices.choices,  # type: ignore[misc]
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="State, territory, or military post, from the portfolio if there is one",
+    )
+
     def is_awaiting_review(self) -> bool:
         """Checks if the current status is in submitted or in_review"""
         return self.status in [self.DomainRequestStatus.SUBMITTED, self.DomainRequestStatus.IN_REVIEW]
@@ -799,6 +861,7 @@ class DomainRequest(TimeStampedModel):
 
         self.sync_organization_type()
         self.sync_yes_no_form_fields()
+        sync_converted_fields(self)
 
         if self._cached_status != self.status:
             self.last_status_update = timezone.now().date()
@@ -1444,13 +1507,12 @@ class DomainRequest(TimeStampedModel):
 
     def unlock_other_contacts(self) -> bool:
         """Unlocks the other contacts step"""
-        other_contacts_filled_out = self.other_contacts.filter(
-            first_name__isnull=False,
-            last_name__isnull=False,
-            title__isnull=False,
-            email__isnull=False,
-            phone__isnull=False,
-        ).exists()
+        # Checked in python rather than with a filter, so that prefetched contacts are used
+        required_fields = ["first_name", "last_name", "title", "email", "phone"]
+        other_contacts_filled_out = any(
+            all(getattr(contact, field) is not None for field in required_fields)
+            for contact in self.other_contacts.all()
+        )
         return (self.has_other_contacts() and other_contacts_filled_out) or self.no_other_contacts_rationale is not None
 
     # ## Form policies ## #
@@ -6,6 +6,7 @@ from registrar.models.user import User
 from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
 from django.db.models import Q
 
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 from django.core.exceptions import ValidationError
 
@@ -19,6 +20,9 @@ class Portfolio(TimeStampedModel):
     # Addresses the UnorderedObjectListWarning
     class Meta:
         ordering = ["organization_name"]
+        indexes = [
+            trigram_index("organization_name", name="portfolio_org_name_trgm_idx"),
+        ]
 
     # use the short names in Django admin
     OrganizationChoices = DomainRequest.OrganizationChoices
@@ -19,6 +19,7 @@ from .utility.portfolio_helper import (
     get_role_display,
     validate_portfolio_invitation,
 )  # type: ignore
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 from django.contrib.postgres.fields import ArrayField
 
@@ -31,6 +32,13 @@ class PortfolioInvitation(TimeStampedModel):
 
         indexes = [
             models.Index(fields=["status"]),
+            trigram_index("email", name="portfolioinv_email_trgm_idx"),
+            # The open invitations of a portfolio, for the members table
+            models.Index(
+                fields=["portfolio", "email"],
+                condition=models.Q(status="invited"),
+                name="portfolioinv_invited_idx",
+            ),
         ]
 
     # Constants for status field
@@ -0,0 +1,67 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from .utility.time_stamped_model import TimeStampedModel
+
+
+class QueuedEmail(TimeStampedModel):
+    """
+    An email queued by send_templated_emails_later, rendered and waiting to be sent.
+
+    Queued emails are saved in the same transaction as the change they are about, and
+    deleted once sent, so that an email isn't lost if the process sending it stops.
+    The send_queued_emails command retries those left pending. Emails that still fail
+    after MAX_ATTEMPTS tries are marked as failed, for staff to look into.
+    """
+
+    # Number of times an email is tried before it is marked as failed
+    MAX_ATTEMPTS = 5
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        FAILED = "failed", "Failed"
+
+    subject = models.TextField()
+
+    body = models.TextField()
+
+    to_addresses = ArrayField(
+        models.EmailField(max_length=320),
+        help_text="Addresses the email is sent to",
+    )
+
+    cc_addresses = ArrayField(
+        models.EmailField(max_length=320),
+        blank=True,
+        default=list,
+        help_text="Addresses the email is copied to",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        db_index=True,
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of times sending the email failed",
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        help_text="Why the email last failed to send",
+    )
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.to_addresses)}"
+
+    def record_failure(self, error):
+        """Records a failed attempt to send the email, marking it as failed after MAX_ATTEMPTS"""
+        self.attempts += 1
+        self.last_error = str(error.__cause__ or error)
+        if self.attempts >= self.MAX_ATTEMPTS:
+            self.status = self.Status.FAILED
+        self.save(update_fields=["attempts", "last_error", "status", "updated_at"])
@@ -6,6 +6,7 @@ from django.db.models import Q
 
 from registrar.models import DomainInformation, UserDomainRole, PortfolioInvitation, UserPortfolioPermission
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
+from registrar.models.utility.search import trigram_index
 
 from .domain_invitation import DomainInvitation
 from .transition_domain import TransitionDomain
@@ -36,6 +37,9 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=["username"]),
             models.Index(fields=["email"]),
+            trigram_index("email", name="user_email_trgm_idx"),
+            trigram_index("first_name", name="user_first_name_trgm_idx"),
+            trigram_index("last_name", name="user_last_name_trgm_idx"),
         ]
 
         permissions = [
@@ -0,0 +1,101 @@
+"""
+Stored copies of the "converted" organization values of domain requests and domain information.
+
+The converted_* properties on DomainRequest and DomainInformation read from the record's
+portfolio when it has one, and from the record itself otherwise. The admin changelists, their
+filters and the csv exports filter, sort and group records by these values. Rather than rebuild
+them with Case/When annotations across several joins on every query, each record stores them in
+effective_* columns, which are kept up to date:
+
+- when the record is saved (see sync_converted_fields)
+- when its portfolio is saved (see refresh_converted_fields and registrar/signals.py)
+- when the federal type of its federal agency changes (see registrar/signals.py)
+
+Code that changes a record's portfolio, federal agency or organization fields with
+queryset.update() or bulk_update() should call refresh_converted_fields on those records.
+"""
+
+from django.db.models import F
+
+# Number of records saved per query when refreshing
+REFRESH_BATCH_SIZE = 1000
+
+# The stored columns, named after the converted_* property each one copies
+CONVERTED_FIELDS = {
+    "converted_generic_org_type": "effective_generic_org_type",
+    "converted_federal_agency": "effective_federal_agency",
+    "converted_federal_type": "effective_federal_type",
+    "converted_organization_name": "effective_organization_name",
+    "converted_city": "effective_city",
+    "converted_state_territory": "effective_state_territory",
+}
+
+
+def get_converted_values(record) -> dict:
+    """Returns the converted values of a domain request or domain information, keyed by stored column"""
+    portfolio = record.portfolio if record.portfolio_id else None
+    source = portfolio or record
+
+    # Like the converted_federal_agency property, a portfolio without a federal agency
+    # doesn't fall back to the record's own agency
+    federal_agency = source.federal_agency if source.federal_agency_id else None
+
+    return {
+        "effective_generic_org_type": portfolio.organization_type if portfolio else record.generic_org_type,
+        "effective_federal_agency": federal_agency,
+        "effective_federal_type": federal_agency.federal_type if federal_agency else None,
+        "effective_organization_name": source.organization_name,
+        "effective_city": source.city,
+        "effective_state_territory": source.state_territory,
+    }
+
+
+def sync_converted_fields(record):
+    """Updates the stored converted values of record (without saving)"""
+    for field_name, value in get_converted_values(record).items():
+        setattr(record, field_name, value)
+    return record
+
+
+def has_stale_converted_fields(record) -> bool:
+    """Returns True if any stored converted value of record is out of date"""
+    for field_name, value in get_converted_values(record).items():
+        if field_name == "effective_federal_agency":
+            if record.effective_federal_agency_id != (value.pk if value else None):
+                return True
+        elif getattr(record, field_name) != value:
+            return True
+    return False
+
+
+def refresh_converted_fields(queryset) -> int:
+    """Works out the stored converted values of each record in queryset again,
+    and saves the ones that changed. Returns the number of records saved."""
+    records = queryset.select_related("portfolio__federal_agency", "federal_agency").order_by("pk")
+    field_names = list(CONVERTED_FIELDS.values())
+    stale = []
+    saved = 0
+    for record in records.iterator(chunk_size=REFRESH_BATCH_SIZE):
+        if has_stale_converted_fields(record):
+            stale.append(sync_converted_fields(record))
+        if len(stale) >= REFRESH_BATCH_SIZE:
+            queryset.model.objects.bulk_update(stale, field_names)
+            saved += len(stale)
+            stale = []
+    if stale:
+        queryset.model.objects.bulk_update(stale, field_names)
+        saved += len(stale)
+    return saved
+
+
+def converted_field_annotations(prefix=""):
+    """Returns annotations that read the stored values under their converted_* names.
+
+    prefix is the path from the queried model to the domain request or domain information,
+    such as "domain_info__" for domains. The federal agency is annotated with its name.
+    Don't use these directly on DomainRequest or DomainInformation querysets that load model
+    instances, as the names clash with the models' converted_* properties.
+    """
+    annotations = {name: F(f"{prefix}{field_name}") for name, field_name in CONVERTED_FIELDS.items()}
+    annotations["converted_federal_agency"] = F(f"{prefix}effective_federal_agency__agency")
+    return annotations
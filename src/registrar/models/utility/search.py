@@ -0,0 +1,70 @@
+"""
+Substring search that Postgres can answer from trigram indexes.
+
+Django's icontains compares UPPER(column) LIKE UPPER(term), which no index on the column
+can serve, so every search read the whole table. The trigram_contains lookup here matches
+the same rows with column ILIKE '%term%', which a pg_trgm GIN index on the column serves
+(see trigram_index). The JSON tables and the admin build their searches with
+get_search_filter and get_admin_search_fields, so they search the same way.
+"""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import CharField, Lookup, Q, TextField
+from django.db.models.constants import LOOKUP_SEP
+
+SEARCH_LOOKUP = "trigram_contains"
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramContains(Lookup):
+    """Case insensitive substring match, column ILIKE '%term%'"""
+
+    lookup_name = SEARCH_LOOKUP
+
+    def get_db_prep_lookup(self, value, connection):
+        return "%s", [f"%{connection.ops.prep_for_like_query(value)}%"]
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+def trigram_index(field_name, name):
+    """Returns a pg_trgm GIN index on field_name, which serves trigram_contains searches"""
+    return GinIndex(fields=[field_name], opclasses=["gin_trgm_ops"], name=name)
+
+
+def get_search_filter(search_term, field_names) -> Q:
+    """Returns a Q matching the rows where any of field_names contains search_term"""
+    search_filter = Q()
+    for field_name in field_names:
+        search_filter |= Q(**{f"{field_name}{LOOKUP_SEP}{SEARCH_LOOKUP}": search_term})
+    return search_filter
+
+
+def get_admin_search_fields(model, search_fields):
+    """Returns a ModelAdmin's search_fields, with the text fields among them searched with trigram_contains.
+    Fields with a prefix (^, =, @) or a lookup of their own are left as they are."""
+    return [
+        f"{field_name}{LOOKUP_SEP}{SEARCH_LOOKUP}" if is_text_field_path(model, field_name) else field_name
+        for field_name in search_fields
+    ]
+
+
+def is_text_field_path(model, path):
+    """Returns True if path, such as "domain__name", leads from model to a CharField or TextField"""
+    opts = model._meta
+    field = None
+    for part in path.split(LOOKUP_SEP):
+        if field is not None:
+            if not field.is_relation:
+                return False
+            opts = field.related_model._meta
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return False
+    return isinstance(field, (CharField, TextField))
@@ -3,7 +3,6 @@ Contains middleware used in settings.py
 """
 
 import logging
-import time
 import re
 from urllib.parse import parse_qs
 from django.conf import settings
@@ -11,11 +10,11 @@ from django.core.exceptions import PermissionDenied
 from django.urls import reverse
 from django.http import HttpResponseRedirect
 from django.urls import resolve
-from django.db import connections
 from registrar.models import User
 from waffle.decorators import flag_is_active
 
 from registrar.models.utility.generic_helper import replace_url_queryparams
+from registrar.utility.request_metrics import collect_request_metrics, log_request_metrics
 from .logging_context import set_user_log_context
 
 logger = logging.getLogger(__name__)
@@ -287,36 +286,20 @@ class RequestLoggingMiddleware:
         return self.get_response(request)
 
 
-class DatabaseConnectionMiddleware:
+class RequestMetricsMiddleware:
     """
-    Middleware to track database connection metrics and query performance.
-    Uses the same callable pattern as RequestLoggingMiddleware.
+    Middleware to count and time the database queries, registry commands and email and S3
+    calls of each request, in every environment. Adds a Server-Timing header to the response,
+    and logs a sample of the requests (see registrar/utility/request_metrics.py).
     """
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        request._db_start_time = time.time()
-        request._db_queries_start = len(connections["default"].queries)
-
-        # Log connection state
-        connection = connections["default"]
-        logger.info(f"DB_CONN_START: queries_executed={len(connection.queries)}")
-        response = self.get_response(request)
-        if hasattr(request, "_db_start_time"):
-            connection = connections["default"]
-            query_count = len(connection.queries) - request._db_queries_start
-            duration = time.time() - request._db_start_time
-
-            # Get request ID for correlation
-            request_id = request.META.get("HTTP_X_REQUEST_ID", "unknown")
-            logger.info(
-                f"DB_CONN_END: req_id={request_id}, "
-                f"queries={query_count}, "
-                f"duration={duration:.3f}s, "
-                f"total_queries={len(connection.queries)}, "
-                f"status={response.status_code}, "
-                f"path={request.path}"
-            )
+        with collect_request_metrics() as metrics:
+            response = self.get_response(request)
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing()
+        log_request_metrics(request, response, metrics)
         return response
@@ -1,7 +1,18 @@
 # registrar/signals.py
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import UserDomainRole, DomainInvitation, User
+from .models import (
+    UserDomainRole,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    FederalAgency,
+    Portfolio,
+    User,
+)
+from .models.utility.converted_fields import refresh_converted_fields
+from .utility.admin_filter_values import invalidate_filter_values
+from .utility.federal_agency_index import invalidate_federal_agency_index
 
 
 @receiver(post_delete, sender=UserDomainRole)
@@ -22,3 +33,41 @@ def cleanup_retrieved_domain_invitations(sender, instance, **kwargs):
         domain_id=instance.domain_id,
         status=DomainInvitation.DomainInvitationStatus.RETRIEVED,
     ).delete()
+
+
+@receiver(post_save, sender=FederalAgency)
+@receiver(post_delete, sender=FederalAgency)
+def refresh_federal_agency_index(sender, instance, **kwargs):
+    """Rebuild the federal agency matcher index after any FederalAgency is added, changed or removed."""
+    invalidate_federal_agency_index()
+
+
+@receiver(post_save, sender=FederalAgency)
+def refresh_federal_agency_converted_fields(sender, instance, **kwargs):
+    """Update the stored federal type of the records whose effective federal agency this is."""
+    for model in [DomainRequest, DomainInformation]:
+        model.objects.filter(effective_federal_agency=instance).exclude(
+            effective_federal_type=instance.federal_type
+        ).update(effective_federal_type=instance.federal_type)
+
+
+@receiver(post_save, sender=Portfolio)
+def refresh_portfolio_converted_fields(sender, instance, **kwargs):
+    """Update the stored converted values of the portfolio's domain requests and domain information,
+    which are read from the portfolio."""
+    refresh_converted_fields(DomainRequest.objects.filter(portfolio=instance))
+    refresh_converted_fields(DomainInformation.objects.filter(portfolio=instance))
+
+
+@receiver(post_save, sender=DomainRequest)
+@receiver(post_save, sender=DomainInformation)
+@receiver(post_save, sender=FederalAgency)
+@receiver(post_save, sender=Portfolio)
+@receiver(post_save, sender=User)
+def refresh_admin_filter_values(sender, instance, update_fields=None, **kwargs):
+    """Drop the cached admin list filter options that read from the changed model.
+    Deletes are left to expire, as a stale option then only matches no rows."""
+    # Logging in only updates last_login, which no filter shows
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_filter_values(sender)
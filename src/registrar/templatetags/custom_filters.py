@@ -183,12 +183,9 @@ def model_name_lowercase(instance):
     return instance.__class__.__name__.lower()
 
 
-@register.filter(name="is_domain_subpage")
-def is_domain_subpage(path):
-    """Checks if the given page is a subpage of domains.
-    Takes a path name, like '/domains/'."""
-    # Since our pages aren't unified under a common path, we need this approach for now.
-    url_names = [
+# Since our pages aren't unified under a common path, the nav filters below match on url names.
+DOMAIN_SUBPAGE_URL_NAMES = frozenset(
+    {
         "domains",
         "no-portfolio-domains",
         "domain",
@@ -209,16 +206,11 @@ def is_domain_subpage(path):
         "invitation-cancel",
         "domain-delete",
         "domain-lifecycle",
-    ]
-    return get_url_name(path) in url_names
+    }
+)
 
-
-@register.filter(name="is_domain_request_subpage")
-def is_domain_request_subpage(path):
-    """Checks if the given page is a subpage of domain requests.
-    Takes a path name, like '/requests/'."""
-    # Since our pages aren't unified under a common path, we need this approach for now.
-    url_names = [
+DOMAIN_REQUEST_SUBPAGE_URL_NAMES = frozenset(
+    {
         "domain-requests",
         "no-portfolio-requests",
         "domain-request-status",
@@ -232,45 +224,72 @@ def is_domain_request_subpage(path):
         "portfolio_additional_details",
         "requirements",
         "review",
-    ]
-
-    # The domain request wizard pages don't have a defined path,
-    # so we need to check directly on it.
-    wizard_paths = [
-        DomainRequestWizard.EDIT_URL_NAME,
-        DomainRequestWizard.URL_NAMESPACE,
-        DomainRequestWizard.NEW_URL_NAME,
-    ]
-    return get_url_name(path) in url_names or any(wizard in path for wizard in wizard_paths)
-
-
-@register.filter(name="is_portfolio_subpage")
-def is_portfolio_subpage(path):
-    """Checks if the given page is a subpage of portfolio.
-    Takes a path name, like '/organization/'."""
-    # Since our pages aren't unified under a common path, we need this approach for now.
-    url_names = [
+    }
+)
+
+# The domain request wizard pages don't have a defined path,
+# so we need to check directly on it.
+DOMAIN_REQUEST_WIZARD_PATHS = (
+    DomainRequestWizard.EDIT_URL_NAME,
+    DomainRequestWizard.URL_NAMESPACE,
+    DomainRequestWizard.NEW_URL_NAME,
+)
+
+PORTFOLIO_SUBPAGE_URL_NAMES = frozenset(
+    {
         "organization",
         "organization-info",
         "organization-senior-official",
-    ]
-    return get_url_name(path) in url_names
+    }
+)
 
-
-@register.filter(name="is_members_subpage")
-def is_members_subpage(path):
-    """Checks if the given page is a subpage of members.
-    Takes a path name, like '/organization/'."""
-    # Since our pages aren't unified under a common path, we need this approach for now.
-    url_names = [
+MEMBERS_SUBPAGE_URL_NAMES = frozenset(
+    {
         "members",
         "member",
         "member-permissions",
         "invitedmember",
         "invitedmember-permissions",
         "member-domains",
-    ]
-    return get_url_name(path) in url_names
+    }
+)
+
+
+def _url_name_of(path, url_name):
+    """Returns url_name, the current page's url name from the template context, if it is set.
+    Otherwise the path is resolved to find it."""
+    return url_name or get_url_name(path)
+
+
+@register.filter(name="is_domain_subpage")
+def is_domain_subpage(path, url_name=None):
+    """Checks if the given page is a subpage of domains.
+    Takes a path name, like '/domains/', and optionally the page's url name.
+    Usage: {{ path|is_domain_subpage:current_url_name }}"""
+    return _url_name_of(path, url_name) in DOMAIN_SUBPAGE_URL_NAMES
+
+
+@register.filter(name="is_domain_request_subpage")
+def is_domain_request_subpage(path, url_name=None):
+    """Checks if the given page is a subpage of domain requests.
+    Takes a path name, like '/requests/', and optionally the page's url name."""
+    if any(wizard in path for wizard in DOMAIN_REQUEST_WIZARD_PATHS):
+        return True
+    return _url_name_of(path, url_name) in DOMAIN_REQUEST_SUBPAGE_URL_NAMES
+
+
+@register.filter(name="is_portfolio_subpage")
+def is_portfolio_subpage(path, url_name=None):
+    """Checks if the given page is a subpage of portfolio.
+    Takes a path name, like '/organization/', and optionally the page's url name."""
+    return _url_name_of(path, url_name) in PORTFOLIO_SUBPAGE_URL_NAMES
+
+
+@register.filter(name="is_members_subpage")
+def is_members_subpage(path, url_name=None):
+    """Checks if the given page is a subpage of members.
+    Takes a path name, like '/members/', and optionally the page's url name."""
+    return _url_name_of(path, url_name) in MEMBERS_SUBPAGE_URL_NAMES
 
 
 @register.filter(name="display_requesting_entity")
@@ -1944,6 +1944,56 @@ class TestHostAdmin(TestCase):
         ]
         self.test_helper.assert_response_contains_distinct_values(response, expected_values)
 
+    def walk_changelist_pages(self, url):
+        """Follows the next page links from url, returning the host names on each page"""
+        pages = []
+        query_string = ""
+        while query_string is not None:
+            response = self.client.get(url + query_string)
+            self.assertEqual(response.status_code, 200)
+            changelist = response.context["cl"]
+            pages.append([host.name for host in changelist.result_list])
+            query_string = changelist.get_next_page_url() if changelist.next_cursor is not None else None
+        return pages, changelist
+
+    @less_console_noise_decorator
+    def test_changelist_pages_with_cursors(self):
+        """Following the next page links shows every host once, in order, and the links go back too"""
+        domain, _ = Domain.objects.get_or_create(name="fake.gov", state=Domain.State.READY)
+        names = ["ns1.fake.gov", "ns1.fake.gov", "ns2.fake.gov", "ns3.fake.gov", "ns3.fake.gov", "ns4.fake.gov"]
+        for name in names:
+            Host.objects.create(name=name, domain=domain)
+        self.client.force_login(self.superuser)
+
+        url = reverse("admin:registrar_host_changelist")
+        with patch.object(MyHostAdmin, "list_per_page", 4), patch.object(MyHostAdmin, "ordering", ["name"]):
+            pages, last_page = self.walk_changelist_pages(url)
+            self.assertEqual(pages, [names[:4], names[4:]])
+
+            # The previous page link from the last page shows the first page again
+            response = self.client.get(url + last_page.get_previous_page_url())
+            self.assertEqual([host.name for host in response.context["cl"].result_list], names[:4])
+            self.assertIsNone(response.context["cl"].previous_cursor)
+
+            # Numbered pages still work
+            response = self.client.get(f"{url}?p=2")
+            self.assertEqual([host.name for host in response.context["cl"].result_list], names[4:])
+
+    @less_console_noise_decorator
+    def test_changelist_uses_estimated_count_for_large_tables(self):
+        """An unfiltered list of a large table shows the table's estimated size instead of counting it"""
+        self.client.force_login(self.superuser)
+        with patch("registrar.utility.admin_pagination.estimate_table_rows", return_value=250000) as mock_estimate:
+            response = self.client.get(reverse("admin:registrar_host_changelist"))
+            mock_estimate.assert_called_once()
+        self.assertEqual(response.context["cl"].result_count, 250000)
+        self.assertContains(response, "About")
+
+        # Searching filters the list, so it is counted
+        response = self.client.get(reverse("admin:registrar_host_changelist") + "?q=nothing")
+        self.assertEqual(response.context["cl"].result_count, 0)
+        self.assertFalse(response.context["cl"].result_count_is_estimate)
+
 
 class TestDomainInformationAdmin(TestCase):
     """Tests for the DomainInformationAdmin class as super or staff user
@@ -1998,6 +2048,16 @@ class TestDomainInformationAdmin(TestCase):
         User.objects.all().delete()
         SeniorOfficial.objects.all().delete()
 
+    @less_console_noise_decorator
+    def test_search_uses_trigram_lookup(self):
+        """Search fields on text columns use the trigram lookup, and still find rows regardless of case"""
+        request = self.factory.get("/admin/registrar/domaininformation/", {"q": "FEDDOMAIN"})
+        request.user = self.superuser
+        self.assertEqual(self.admin.get_search_fields(request), ["domain__name__trigram_contains"])
+
+        queryset, _ = self.admin.get_search_results(request, DomainInformation.objects.all(), "FEDDOMAIN")
+        self.assertEqual(list(queryset), [self.domain_info])
+
     @less_console_noise_decorator
     def test_analyst_view(self):
         """Ensure regular analysts cannot view domain information list."""
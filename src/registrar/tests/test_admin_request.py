@@ -5,6 +5,8 @@ from registrar.models.federal_agency import FederalAgency
 from registrar.utility.constants import BranchChoices
 import re
 from django.test import RequestFactory, Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.admin.sites import AdminSite
 from contextlib import ExitStack
 from api.tests.common import less_console_noise_decorator
@@ -2690,6 +2692,33 @@ class TestDomainRequestAdmin(MockEppLib):
 
             self.assertEqual(expected_list, actual_list)
 
+    @less_console_noise_decorator
+    def test_filter_lookups_are_cached(self):
+        """Filter options are read from the cache on later changelist loads,
+        and a saved domain request adds its values to them"""
+        completed_domain_request(name="city.gov", generic_org_type=DomainRequest.OrganizationChoices.CITY)
+        request = self.factory.get("/")
+        request.user = self.superuser
+
+        def org_type_lookups():
+            return [org for org, _ in self.admin.GenericOrgFilter.lookups(self, request, self.admin)]
+
+        self.assertEqual(org_type_lookups(), [DomainRequest.OrganizationChoices.CITY])
+        with CaptureQueriesContext(connection) as captured:
+            org_type_lookups()
+            self.admin.FederalTypeFilter.lookups(self, request, self.admin)
+            self.admin.InvestigatorFilter.lookups(self, request, self.admin)
+            self.admin.FederalTypeFilter.lookups(self, request, self.admin)
+            self.admin.InvestigatorFilter.lookups(self, request, self.admin)
+        # Only the first load of each of the other two filters reads the domain request table
+        table = DomainRequest._meta.db_table
+        self.assertEqual(len([query for query in captured.captured_queries if table in query["sql"]]), 2)
+
+        completed_domain_request(name="county.gov", generic_org_type=DomainRequest.OrganizationChoices.COUNTY)
+        self.assertEqual(
+            org_type_lookups(), [DomainRequest.OrganizationChoices.CITY, DomainRequest.OrganizationChoices.COUNTY]
+        )
+
     @less_console_noise_decorator
     def test_staff_can_see_cisa_region_federal(self):
         """Tests if staff can see CISA Region: N/A"""
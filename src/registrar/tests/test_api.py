@@ -318,3 +318,32 @@ class GetRejectionEmailForUserJsonTest(TestCase):
             },
         )
         self.assertEqual(response.status_code, 302)
+
+
+class GetEppMetricsJsonTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.superuser = create_superuser()
+        self.analyst_user = create_user()
+        self.api_url = reverse("get-epp-metrics-json")
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    @less_console_noise_decorator
+    def test_get_epp_metrics_json_superuser(self):
+        """Test that a superuser can fetch the registry client metrics."""
+        self.client.force_login(self.superuser)
+        response = self.client.get(self.api_url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn("commands", data)
+        self.assertIn("lock_wait", data)
+        self.assertIn("slow_commands", data)
+
+    @less_console_noise_decorator
+    def test_get_epp_metrics_json_analyst(self):
+        """Test that an analyst without full access receives a 403."""
+        self.client.force_login(self.analyst_user)
+        response = self.client.get(self.api_url)
+        self.assertEqual(response.status_code, 403)
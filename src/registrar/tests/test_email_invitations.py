@@ -24,10 +24,13 @@ from registrar.utility.email_invitations import (
     send_portfolio_update_emails_to_portfolio_admins,
     send_domain_manager_on_hold_email_to_domain_managers,
     send_domain_renewal_notification_emails,
+    queue_domain_invitation_update_emails_to_domain_managers,
+    queue_domain_manager_removal_emails_to_domain_managers,
 )
 
 from api.tests.common import less_console_noise_decorator
 from registrar.utility.errors import MissingEmailError
+from django.template.loader import render_to_string
 from django.test import TestCase
 from registrar.models import DomainInvitation
 
@@ -1395,6 +1398,68 @@ class TestDomainInvitationCleanupSignal(TestCase):
         self.assertTrue(UserDomainRole.objects.filter(user=self.user, domain=self.domain).exists())
 
 
+class TestQueueDomainManagerEmails(TestCase):
+    """Tests for the domain manager emails queued for many domains at once"""
+
+    def setUp(self):
+        self.requestor = User.objects.create(email="requestor@example.com", username="requestor")
+        self.member = User.objects.create(email="member@example.com", username="member")
+        self.manager_of_both = User.objects.create(email="both@example.com", username="both")
+        self.manager_of_one = User.objects.create(email="one@example.com", username="one")
+        self.domain1 = Domain.objects.create(name="queued1.gov")
+        self.domain2 = Domain.objects.create(name="queued2.gov")
+        for user, domain in [
+            (self.member, self.domain1),
+            (self.member, self.domain2),
+            (self.manager_of_both, self.domain1),
+            (self.manager_of_both, self.domain2),
+            (self.manager_of_one, self.domain2),
+        ]:
+            UserDomainRole.objects.create(user=user, domain=domain, role=UserDomainRole.Roles.MANAGER)
+
+    def tearDown(self):
+        UserDomainRole.objects.all().delete()
+        Domain.objects.all().delete()
+        User.objects.all().delete()
+
+    @patch("registrar.utility.email_invitations.send_templated_emails_later")
+    def test_removal_emails_are_one_per_manager(self, mock_send_later):
+        """Test that each remaining manager gets one email for all their domains, and the removed member none"""
+        with self.assertNumQueries(1):
+            queue_domain_manager_removal_emails_to_domain_managers(
+                removed_by_user=self.requestor,
+                manager_removed=self.member,
+                manager_removed_email=self.member.email,
+                domains=[self.domain1, self.domain2],
+            )
+
+        emails = {email.to_addresses[0]: email for email in mock_send_later.call_args.args[0]}
+        self.assertEqual(set(emails), {"both@example.com", "one@example.com"})
+        self.assertEqual(emails["both@example.com"].context["domains"], [self.domain1, self.domain2])
+        self.assertEqual(emails["one@example.com"].context["domain"], self.domain2)
+        self.assertEqual(
+            render_to_string(emails["both@example.com"].subject_template_name, emails["both@example.com"].context),
+            "A domain manager was removed from 2 of your domains",
+        )
+        body = render_to_string(emails["both@example.com"].template_name, emails["both@example.com"].context)
+        self.assertIn("queued1.gov\nqueued2.gov\n", body)
+
+    @patch("registrar.utility.email_invitations.send_templated_emails_later")
+    def test_invitation_emails_skip_the_invited_user(self, mock_send_later):
+        """Test that the user invited isn't told about their own invitation"""
+        queue_domain_invitation_update_emails_to_domain_managers(
+            email=self.member.email,
+            requestor=self.requestor,
+            domains=[self.domain1],
+            requested_user=self.member,
+        )
+
+        emails = mock_send_later.call_args.args[0]
+        self.assertEqual([email.to_addresses for email in emails], [["both@example.com"]])
+        self.assertEqual(emails[0].context["invited_email_address"], "member@example.com")
+        self.assertEqual(emails[0].context["requestor_email"], "requestor@example.com")
+
+
 class TestSendDomainManagerOnHoldEmail(unittest.TestCase):
     """Unit tests for send_domain_manager_on_hold_email_to_domain_managers function."""
 
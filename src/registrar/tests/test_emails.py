@@ -8,16 +8,23 @@ from django.utils import timezone
 
 from waffle.testutils import override_flag
 from registrar.utility import email
-from registrar.utility.email import send_templated_email
+from registrar.utility.email import EmailSendingError, TemplatedEmail, send_templated_email
 
 from .common import completed_domain_request
-from registrar.models import AllowedEmail, Domain, User, DomainInformation
+from registrar.models import (
+    AllowedEmail,
+    Domain,
+    DomainExpirationNotification,
+    User,
+    DomainInformation,
+    QueuedEmail,
+)
 from registrar.models.portfolio import Portfolio
 from registrar.models.user_domain_role import UserDomainRole
 from registrar.models.user_portfolio_permission import UserPortfolioPermission
 from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
 
-from api.tests.common import less_console_noise_decorator
+from api.tests.common import less_console_noise, less_console_noise_decorator
 from datetime import datetime, date, timedelta
 
 import boto3_mocking  # type: ignore
@@ -93,6 +100,84 @@ class TestEmails(TestCase):
 
         self.assertEqual(["testy2@town.com", "mayor@igorville.gov"], kwargs["Destination"]["CcAddresses"])
 
+    @boto3_mocking.patching
+    @less_console_noise_decorator
+    def test_send_templated_emails(self):
+        """Test that emails sent together share an SES client, and that one failing doesn't stop the others"""
+        context = {"domain": "test", "user": "test", "date": 1, "changes": "test"}
+        emails = [
+            TemplatedEmail(
+                "emails/update_to_approved_domain.txt",
+                "emails/update_to_approved_domain_subject.txt",
+                to_addresses=[address],
+                context=dict(context),
+            )
+            for address in ["testy@town.com", "notallowed@town.com", "testy2@town.com"]
+        ]
+        with boto3_mocking.clients.handler_for("sesv2", self.mock_client_class):
+            failures = email.send_templated_emails(emails)
+
+        self.assertEqual(self.mock_client_class.call_count, 1)
+        self.assertEqual(self.mock_client.send_email.call_count, 2)
+        self.assertEqual([failed for failed, _ in failures], [emails[1]])
+        self.assertIsInstance(failures[0][1], email.EmailSendingError)
+
+    def approved_domain_emails(self, addresses):
+        context = {"domain": "test", "user": "test", "date": 1, "changes": "test"}
+        return [
+            TemplatedEmail(
+                "emails/update_to_approved_domain.txt",
+                "emails/update_to_approved_domain_subject.txt",
+                to_addresses=[address],
+                context=dict(context),
+            )
+            for address in addresses
+        ]
+
+    @patch("registrar.utility.email.connections")
+    @patch("registrar.utility.email.send_queued_emails")
+    @patch("registrar.utility.email.threading.Thread")
+    def test_send_templated_emails_later(self, mock_thread, mock_send_queued_emails, _):
+        """Test that emails sent later are queued, then sent on a thread started once the transaction commits"""
+        emails = self.approved_domain_emails(["testy@town.com"])
+        with self.captureOnCommitCallbacks() as callbacks:
+            email.send_templated_emails_later(emails)
+        mock_thread.assert_not_called()
+        queued_email = QueuedEmail.objects.get()
+        self.assertEqual(queued_email.to_addresses, ["testy@town.com"])
+        self.assertIn("test", queued_email.subject)
+
+        for callback in callbacks:
+            callback()
+        mock_thread.return_value.start.assert_called_once()
+        # The thread isn't a daemon, so the process waits for it to finish before exiting
+        self.assertNotIn("daemon", mock_thread.call_args.kwargs)
+        mock_send_queued_emails.assert_not_called()
+        mock_thread.call_args.kwargs["target"](*mock_thread.call_args.kwargs["args"])
+        mock_send_queued_emails.assert_called_once_with([queued_email.id])
+
+    @boto3_mocking.patching
+    @less_console_noise_decorator
+    def test_send_queued_emails(self):
+        """Test that sent emails are deleted, and those that fail are retried until MAX_ATTEMPTS"""
+        email.queue_templated_emails(self.approved_domain_emails(["testy@town.com", "notallowed@town.com"]))
+
+        with boto3_mocking.clients.handler_for("sesv2", self.mock_client_class):
+            self.assertEqual(email.send_queued_emails(), (1, 1))
+        self.assertEqual(self.mock_client.send_email.call_count, 1)
+        failed_email = QueuedEmail.objects.get()
+        self.assertEqual(failed_email.to_addresses, ["notallowed@town.com"])
+        self.assertEqual(failed_email.attempts, 1)
+        self.assertEqual(failed_email.status, QueuedEmail.Status.PENDING)
+        self.assertIn("allowlist", failed_email.last_error)
+
+        with boto3_mocking.clients.handler_for("sesv2", self.mock_client_class):
+            for _ in range(QueuedEmail.MAX_ATTEMPTS):
+                call_command("send_queued_emails")
+        failed_email.refresh_from_db()
+        self.assertEqual(failed_email.attempts, QueuedEmail.MAX_ATTEMPTS)
+        self.assertEqual(failed_email.status, QueuedEmail.Status.FAILED)
+
     @boto3_mocking.patching
     @override_settings(IS_PRODUCTION=True)
     def test_email_with_cc_in_prod(self):
@@ -479,7 +564,9 @@ class SendExpirationEmailsTests(TestCase):
         self.manager = User.objects.create(email="manager@example.com", username="manageruser")
         self.admin = User.objects.create(email="admin@example.com", username="adminuser")
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_emails_sent_for_ready_domain_expiring_soon(self, mock_now, mock_send_email):
         """
@@ -519,15 +606,21 @@ class SendExpirationEmailsTests(TestCase):
             "expiration_date": self.fixed_today + timedelta(days=30),
         }
 
-        mock_send_email.assert_any_call(
-            "emails/ready_and_expiring_soon.txt",
-            "emails/ready_and_expiring_soon_subject.txt",
-            to_addresses=["manager@example.com"],
-            cc_addresses=["admin@example.com"],
-            context=expected_context,
+        mock_send_email.assert_called_once_with(
+            [
+                TemplatedEmail(
+                    "emails/ready_and_expiring_soon.txt",
+                    "emails/ready_and_expiring_soon_subject.txt",
+                    to_addresses=["manager@example.com"],
+                    cc_addresses=["admin@example.com"],
+                    context=expected_context,
+                )
+            ]
         )
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_emails_sent_for_dns_domain_expiring_soon(self, mock_now, mock_send_email):
         """
@@ -566,15 +659,21 @@ class SendExpirationEmailsTests(TestCase):
             "expiration_date": self.fixed_today + timedelta(days=7),
         }
 
-        mock_send_email.assert_any_call(
-            "emails/dns_needed_or_unknown_expiring_soon.txt",
-            "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
-            to_addresses=["manager@example.com"],
-            cc_addresses=["admin@example.com"],
-            context=expected_context,
+        mock_send_email.assert_called_once_with(
+            [
+                TemplatedEmail(
+                    "emails/dns_needed_or_unknown_expiring_soon.txt",
+                    "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
+                    to_addresses=["manager@example.com"],
+                    cc_addresses=["admin@example.com"],
+                    context=expected_context,
+                )
+            ]
         )
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_emails_sent_for_unknown_domain_expiring_soon(self, mock_now, mock_send_email):
         """
@@ -613,15 +712,21 @@ class SendExpirationEmailsTests(TestCase):
             "expiration_date": self.fixed_today + timedelta(days=7),
         }
 
-        mock_send_email.assert_any_call(
-            "emails/dns_needed_or_unknown_expiring_soon.txt",
-            "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
-            to_addresses=["manager@example.com"],
-            cc_addresses=["admin@example.com"],
-            context=expected_context,
+        mock_send_email.assert_called_once_with(
+            [
+                TemplatedEmail(
+                    "emails/dns_needed_or_unknown_expiring_soon.txt",
+                    "emails/dns_needed_or_unknown_expiring_soon_subject.txt",
+                    to_addresses=["manager@example.com"],
+                    cc_addresses=["admin@example.com"],
+                    context=expected_context,
+                )
+            ]
         )
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_no_emails_for_unrelated_domain_states(self, mock_now, mock_send_email):
         """
@@ -640,7 +745,9 @@ class SendExpirationEmailsTests(TestCase):
 
         mock_send_email.assert_not_called()
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_domains_expiring_later_do_not_trigger_email(self, mock_now, mock_send_email):
         """
@@ -660,7 +767,9 @@ class SendExpirationEmailsTests(TestCase):
 
         mock_send_email.assert_not_called()
 
-    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_email")
+    @patch(
+        "registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails", return_value=[]
+    )
     @patch("django.utils.timezone.now")
     def test_expired_domains_do_not_trigger_email(self, mock_now, mock_send_email):
         """
@@ -699,3 +808,45 @@ class SendExpirationEmailsTests(TestCase):
         call_command("send_expiring_soon_domains_notification")
 
         mock_send_email.assert_not_called()
+
+    @patch("registrar.management.commands.send_expiring_soon_domains_notification.send_templated_emails")
+    @patch("django.utils.timezone.now")
+    def test_rerun_only_sends_failed_emails(self, mock_now, mock_send_emails):
+        """
+        1. Sent notifications are recorded, and not sent again on a rerun
+        2. Notifications that failed to send are sent on a rerun
+        """
+        mock_now.return_value = timezone.make_aware(datetime.combine(self.fixed_today, datetime.min.time()))
+        domains = [
+            Domain.objects.create(
+                name=f"rerun{index}.gov",
+                state=Domain.State.READY,
+                expiration_date=self.fixed_today + timedelta(days=1),
+            )
+            for index in range(3)
+        ]
+        for domain in domains:
+            UserDomainRole.objects.create(user=self.manager, domain=domain, role="manager")
+
+        def fail_for_last_domain(emails):
+            return [(email, EmailSendingError("failed")) for email in emails if email.context["domain"] == domains[2]]
+
+        mock_send_emails.side_effect = fail_for_last_domain
+        with less_console_noise():
+            call_command("send_expiring_soon_domains_notification")
+        self.assertEqual(
+            set(DomainExpirationNotification.objects.values_list("domain__name", "days_remaining")),
+            {("rerun0.gov", 1), ("rerun1.gov", 1)},
+        )
+
+        mock_send_emails.side_effect = None
+        mock_send_emails.return_value = []
+        with self.assertNumQueries(2):
+            # The domains with their managers, and recording the notification.
+            # None of the domains are in a portfolio, so no portfolio admins are looked up.
+            call_command("send_expiring_soon_domains_notification")
+
+        emails = mock_send_emails.call_args.args[0]
+        self.assertEqual([email.context["domain"] for email in emails], [domains[2]])
+        self.assertEqual(emails[0].to_addresses, ["manager@example.com"])
+        self.assertEqual(DomainExpirationNotification.objects.count(), 3)
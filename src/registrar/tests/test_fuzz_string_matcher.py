@@ -8,7 +8,9 @@ from registrar.management.commands.utility.fuzzy_string_matcher import (
     GenericFuzzyMatcher,
     MatchingStrategy,
 )
-from rapidfuzz import fuzz
+from registrar.models.utility.generic_helper import normalize_string
+from registrar.utility.federal_agency_index import get_federal_agency_index, invalidate_federal_agency_index
+from rapidfuzz import fuzz, process
 
 
 class TestFuzzyStringMatcher(TestCase):
@@ -231,3 +233,107 @@ class TestFuzzyStringMatcher(TestCase):
         # Should handle punctuation variants
         result = matcher.find_matches("US Department of Defense", candidates)
         self.assertGreater(len(result.matched_strings), 0)
+
+    def test_batch_matching_agrees_with_process_extract(self):
+        """Test that the batch engine finds the same matches and scores as process.extract"""
+        strategies = [
+            MatchingStrategy(fuzz.ratio, 80, "ratio"),
+            MatchingStrategy(fuzz.token_set_ratio, 85, "token_set"),
+        ]
+        matcher = GenericFuzzyMatcher(strategies=strategies)
+
+        targets = ["Department of Defense", "US Department of Defense", "Health and Human Services", "", "FBI"]
+        candidates = [
+            "Department of Defense",
+            "Dept of Defense",
+            "U.S. Department of Defense",
+            "Health & Human Services",
+            "Federal Bureau of Investigation",
+        ]
+
+        results = matcher.batch_find_matches(targets, candidates)
+
+        self.assertEqual(set(results.keys()), set(targets))
+        self.assertEqual(results[""].matched_strings, set())
+        for target in filter(None, targets):
+            normalized_target = normalize_string(target)
+            expected_details = [
+                (candidate, score, strategy.name)
+                for strategy in strategies
+                for candidate, score, _ in process.extract(
+                    normalized_target, candidates, scorer=strategy.scorer, score_cutoff=strategy.threshold, limit=None
+                )
+            ]
+            expected_details += [
+                (candidate, 100.0, "exact_string_match")
+                for candidate in candidates
+                if normalize_string(candidate) == normalized_target
+            ]
+            self.assertCountEqual(results[target].match_details, expected_details)
+            self.assertEqual(results[target].matched_strings, {candidate for candidate, _, _ in expected_details})
+
+        # Known matches, to guard against the reference above changing with it
+        self.assertEqual(
+            results["US Department of Defense"].matched_strings, {"Department of Defense", "U.S. Department of Defense"}
+        )
+        self.assertEqual(results["FBI"].matched_strings, set())
+
+    def test_batch_matching_keeps_the_best_matches_per_variant(self):
+        """Test that only the best scoring candidates of each variant are kept"""
+        matcher = GenericFuzzyMatcher(strategies=[MatchingStrategy(fuzz.ratio, 50, "ratio")])
+        matcher.MAX_MATCHES_PER_VARIANT = 2
+        candidates = ["Office of Testing", "Office of Testin", "Office of Tstn", "Office of Nothing"]
+
+        result = matcher.batch_find_matches(["Office of Testing"], candidates)["Office of Testing"]
+
+        self.assertEqual(result.matched_strings, {"Office of Testing", "Office of Testin"})
+
+    def test_match_details_are_unique_per_strategy(self):
+        """Test that each (match, strategy) pair is only reported once, with its best score"""
+        matcher = create_federal_agency_matcher(threshold=80)
+
+        result = matcher.find_matches("Department of Defense", ["Department of Defense"], report_details=True)
+
+        detail_keys = [(match_string, strategy) for match_string, _, strategy in result.match_details]
+        self.assertEqual(len(detail_keys), len(set(detail_keys)))
+        self.assertIn(("Department of Defense", 100.0, "exact_string_match"), result.match_details)
+
+
+class TestFederalAgencyIndex(TestCase):
+
+    def setUp(self):
+        invalidate_federal_agency_index()
+        self.agency = FederalAgency.objects.create(agency="Department of Testing Affairs")
+
+    def tearDown(self):
+        FederalAgency.objects.filter(pk=self.agency.pk).delete()
+        invalidate_federal_agency_index()
+
+    def test_index_is_reused_until_an_agency_changes(self):
+        """Test that the index is built once and rebuilt after FederalAgency saves and deletes"""
+        index = get_federal_agency_index()
+        self.assertIs(get_federal_agency_index(), index)
+        self.assertIn("Department of Testing Affairs", index.candidates)
+
+        new_agency = FederalAgency.objects.create(agency="Commission on Index Rebuilds")
+        rebuilt_index = get_federal_agency_index()
+        self.assertIsNot(rebuilt_index, index)
+        self.assertEqual(rebuilt_index.get_agency_id("Commission on Index Rebuilds"), new_agency.pk)
+
+        new_agency.delete()
+        self.assertNotIn("Commission on Index Rebuilds", get_federal_agency_index().candidates)
+
+    def test_index_lookups(self):
+        """Test variant probes, fuzzy fallback and memoized results"""
+        index = get_federal_agency_index()
+
+        self.assertEqual(index.find_exact_matches("Dept of Testing Affairs"), {"Department of Testing Affairs"})
+        self.assertEqual(index.get_agency_id("dept. of testing affairs"), self.agency.pk)
+        self.assertEqual(index.get_agency_id("Department of Testing Afairs"), self.agency.pk)
+        self.assertEqual(index.get_agency_id("dept. of testing affairs", fuzzy=False), self.agency.pk)
+        self.assertIsNone(index.get_agency_id("Department of Testing Afairs", fuzzy=False))
+        self.assertIn(self.agency.pk, index.find_agency_ids("Dept of Testing Affairs"))
+        self.assertIsNone(index.get_agency_id(""))
+
+        result = index.find_matches("Department of Testing Afairs")
+        self.assertIs(index.find_matches("Department of Testing Afairs"), result)
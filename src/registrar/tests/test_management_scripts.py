@@ -1,8 +1,13 @@
 import copy
+import csv
+import io
+import os
+import tempfile
 import boto3_mocking  # type: ignore
 from datetime import date, datetime, time
+from django.contrib.auth.models import Group
 from django.core.management import call_command
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from registrar.models.domain_group import DomainGroup
 from registrar.models.portfolio_invitation import PortfolioInvitation
 from registrar.models.senior_official import SeniorOfficial
@@ -16,6 +21,11 @@ import pyzipper
 from django.core.management.base import CommandError
 from registrar.management.commands.clean_tables import Command as CleanTablesCommand
 from registrar.management.commands.export_tables import Command as ExportTablesCommand
+from registrar.management.commands.import_tables import Command as ImportTablesCommand
+from registrar.management.commands.utility.benchmarks import find_regressions
+from registrar.management.commands.utility.bulk_renewal import RENEWED, BulkRenewal
+from registrar.management.commands.utility.registry_reconciliation import RegistryReconciliation, RegistryRecord
+from registrar.management.commands.utility.table_scheduler import get_dependency_levels, log_throughput, run_tables
 from registrar.models import (
     User,
     Domain,
@@ -31,11 +41,14 @@ from registrar.models import (
     FederalAgency,
     Portfolio,
     Suborganization,
+    Host,
+    HostIP,
 )
 from registrar.utility.enums import DefaultEmail
 import tablib
-from unittest.mock import patch, call, MagicMock, mock_open
+from unittest.mock import patch, call, MagicMock
 from epplibwrapper import commands, common
+from epplibwrapper.errors import ErrorCode, RegistryError
 
 from .common import (
     MockEppLib,
@@ -146,6 +159,24 @@ class TestPopulateVerificationType(MockEppLib):
         self.assertEqual(self.untouched_user.verification_type, User.VerificationTypeChoices.GRANDFATHERED)
         self.assertEqual(self.fixture_user.verification_type, User.VerificationTypeChoices.FIXTURE_USER)
 
+    @less_console_noise_decorator
+    def test_verification_type_script_resumes_after_last_committed_chunk(self):
+        """Ensures that a chunked run started with start_after_pk only updates later records"""
+        with patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+            return_value=True,
+        ):
+            call_command("populate_verification_type", chunk_size=1, start_after_pk=self.grandfathered_user.pk)
+
+        self.regular_user.refresh_from_db()
+        self.grandfathered_user.refresh_from_db()
+        self.invited_user.refresh_from_db()
+
+        # Records at or before the checkpoint are left for the earlier run
+        self.assertIsNone(self.regular_user.verification_type)
+        self.assertIsNone(self.grandfathered_user.verification_type)
+        self.assertEqual(self.invited_user.verification_type, User.VerificationTypeChoices.INVITED)
+
 
 class TestPopulateOrganizationType(MockEppLib):
     """Tests for the populate_organization_type script"""
@@ -583,6 +614,24 @@ class TestPatchAgencyInfo(TestCase):
         """Calls the patch_federal_agency_info command and mimics a keypress"""
         call_command("patch_federal_agency_info", "registrar/tests/data/fake_current_full.csv", debug=True)
 
+    def test_patch_agency_info_resolves_agency_names(self):
+        """Tests that the agency name on a TransitionDomain is resolved to its FederalAgency"""
+        self.call_patch_federal_agency_info()
+
+        self.domain_info.refresh_from_db()
+        self.assertEqual(self.domain_info.federal_agency, self.federal_agency)
+
+    def test_patch_agency_info_leaves_fuzzy_matches_for_review(self):
+        """Tests that an agency name that only fuzzily matches a FederalAgency is logged, not written"""
+        self.transition_domain.federal_agency = "test agncy"
+        self.transition_domain.save()
+        with self.assertLogs("registrar.management.commands.patch_federal_agency_info", level="WARNING") as logs:
+            self.call_patch_federal_agency_info()
+
+        self.domain_info.refresh_from_db()
+        self.assertIsNone(self.domain_info.federal_agency)
+        self.assertTrue(any("'test agncy' is closest to 'test agency'" in line for line in logs.output))
+
 
 class TestExtendExpirationDates(MockEppLib):
     @less_console_noise_decorator
@@ -744,6 +793,260 @@ class TestExtendExpirationDates(MockEppLib):
         # Explicitly test the expiration date - should be the same
         self.assertEqual(desired_domain.expiration_date, date(2024, 11, 15))
 
+    def fake_renewal_client(self):
+        """A registry client that reports every domain as expiring 2023-11-15, and renews it by a year"""
+
+        def send(command, cleaned=False):
+            if isinstance(command, commands.RenewDomain):
+                return MagicMock(res_data=[MagicMock(ex_date=date(2024, 11, 15))])
+            return MagicMock(res_data=[MagicMock(ex_date=date(2023, 11, 15))])
+
+        return MagicMock(send=MagicMock(side_effect=send))
+
+    @less_console_noise_decorator
+    def test_renews_from_today_without_a_registry_expiration_date(self):
+        """
+        Tests that a domain with no expiration date in the registry is renewed from today
+        """
+        domain = Domain.objects.create(name="noexpiration.gov", state=Domain.State.READY)
+        client = self.fake_renewal_client()
+        renew = client.send.side_effect
+
+        def send(command, cleaned=False):
+            if isinstance(command, commands.InfoDomain):
+                return MagicMock(res_data=[MagicMock(ex_date=None)])
+            return renew(command, cleaned)
+
+        client.send.side_effect = send
+
+        results = list(BulkRenewal(1, [client], check_idempotence=False).run([domain]))
+
+        self.assertEqual([(result.name, result.status) for result in results], [("noexpiration.gov", RENEWED)])
+        renewal = client.send.call_args_list[-1].args[0]
+        self.assertEqual(renewal.cur_exp_date, date.today())
+        domain.refresh_from_db()
+        self.assertEqual(domain.expiration_date, date(2024, 11, 15))
+
+    @less_console_noise_decorator
+    def test_extends_expiration_dates_concurrently(self):
+        """
+        Tests that with --concurrency, domains are renewed over several registry clients
+        """
+        names = [f"concurrent{index}.gov" for index in range(6)]
+        for name in names:
+            Domain.objects.create(name=name, state=Domain.State.READY, expiration_date=date(2023, 11, 15))
+            TransitionDomain.objects.create(
+                username="concurrent@mail.com", domain_name=name, epp_expiration_date=date(2023, 11, 15)
+            )
+        clients = [self.fake_renewal_client() for _ in range(3)]
+
+        with patch(
+            "registrar.management.commands.extend_expiration_dates.get_clients", return_value=clients
+        ) as mock_get_clients, patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+            return_value=True,
+        ):
+            call_command("extend_expiration_dates", concurrency=3)
+
+        mock_get_clients.assert_called_once_with(3)
+        for name in names + ["waterbutpurple.gov"]:
+            self.assertEqual(Domain.objects.get(name=name).expiration_date, date(2024, 11, 15))
+        # Each domain was looked up and renewed once, across the clients
+        self.assertEqual(sum(client.send.call_count for client in clients), 2 * (len(names) + 1))
+        for client in clients:
+            client.close.assert_called_once()
+
+    @less_console_noise_decorator
+    def test_extends_expiration_dates_interrupted(self):
+        """
+        Tests that a run stopped partway doesn't go on to renew the remaining domains,
+        and that the domains renewed before it stopped are saved and checkpointed
+        """
+        names = [f"interrupted{index}.gov" for index in range(6)]
+        for name in names:
+            Domain.objects.create(name=name, state=Domain.State.READY, expiration_date=date(2023, 11, 15))
+            TransitionDomain.objects.create(
+                username="interrupted@mail.com", domain_name=name, epp_expiration_date=date(2023, 11, 15)
+            )
+        clients = [self.fake_renewal_client() for _ in range(2)]
+        saved = []
+        original_save = Domain.save
+
+        def save_once(domain, *args, **kwargs):
+            if saved:
+                raise RuntimeError("Interrupted")
+            saved.append(domain.name)
+            return original_save(domain, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, "checkpoint.txt")
+            with patch(
+                "registrar.management.commands.extend_expiration_dates.get_clients", return_value=clients
+            ), patch.object(Domain, "save", autospec=True, side_effect=save_once), patch(
+                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+                return_value=True,
+            ):
+                with self.assertRaises(RuntimeError):
+                    call_command("extend_expiration_dates", concurrency=2, checkpoint=checkpoint_path)
+
+            with open(checkpoint_path) as checkpoint_file:
+                self.assertEqual(checkpoint_file.read().split(), saved)
+
+        renewals = [
+            args[0]
+            for client in clients
+            for args, _ in client.send.call_args_list
+            if isinstance(args[0], commands.RenewDomain)
+        ]
+        # Only the domains in flight when the run stopped were renewed, not the rest of the queue
+        self.assertLessEqual(len(renewals), len(clients) + 1)
+        renewed = Domain.objects.filter(expiration_date=date(2024, 11, 15)).values_list("name", flat=True)
+        self.assertEqual(list(renewed), saved)
+        for client in clients:
+            client.close.assert_called_once()
+
+    @less_console_noise_decorator
+    def test_extends_expiration_date_resumes_from_checkpoint(self):
+        """
+        Tests that domains listed in the checkpoint are skipped, and that domains done are added to it
+        """
+        Domain.objects.create(name="resumed.gov", state=Domain.State.READY, expiration_date=date(2023, 11, 15))
+        TransitionDomain.objects.create(
+            username="resumed@mail.com", domain_name="resumed.gov", epp_expiration_date=date(2023, 11, 15)
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, "checkpoint.txt")
+            with open(checkpoint_path, "w") as checkpoint_file:
+                checkpoint_file.write("waterbutpurple.gov\n")
+
+            with patch(
+                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+                return_value=True,
+            ):
+                call_command("extend_expiration_dates", checkpoint=checkpoint_path)
+
+            with open(checkpoint_path) as checkpoint_file:
+                self.assertEqual(checkpoint_file.read().split(), ["waterbutpurple.gov", "resumed.gov"])
+
+        # waterbutpurple.gov was done in the earlier run, so the registry isn't asked about it again
+        sent_names = [getattr(args[0], "name", None) for args, _ in self.mockedSendFunction.call_args_list]
+        self.assertNotIn("waterbutpurple.gov", sent_names)
+        self.assertIn("resumed.gov", sent_names)
+        self.assertEqual(Domain.objects.get(name="waterbutpurple.gov").expiration_date, date(2023, 11, 15))
+
+
+class TestReconcileRegistry(TestCase):
+    """Tests for the reconcile_registry script"""
+
+    registry_created_at = timezone.make_aware(datetime(2020, 1, 1, 12))
+
+    def setUp(self):
+        self.domain = Domain.objects.create(
+            name="drifted.gov",
+            state=Domain.State.READY,
+            expiration_date=date(2024, 1, 1),
+            security_contact_registry_id="oldsecurity",
+        )
+        stale_host = Host.objects.create(domain=self.domain, name="ns1.stale.com")
+        HostIP.objects.create(host=stale_host, address="9.9.9.9")
+        kept_host = Host.objects.create(domain=self.domain, name="ns1.drifted.gov")
+        HostIP.objects.create(host=kept_host, address="1.1.1.1")
+        Domain.objects.create(name="missing.gov", state=Domain.State.READY)
+        Domain.objects.create(name="unknown.gov", state=Domain.State.UNKNOWN)
+
+    def tearDown(self):
+        HostIP.objects.all().delete()
+        Host.objects.all().delete()
+        Domain.objects.all().delete()
+
+    def fake_registry_client(self):
+        """A registry client with one domain, drifted.gov, and a nameserver on it with two IPs"""
+
+        def send(command, cleaned=False):
+            if isinstance(command, commands.InfoHost):
+                return MagicMock(res_data=[MagicMock(addrs=[common.Ip(addr="1.1.1.1"), common.Ip(addr="2.2.2.2")])])
+            if command.name != "drifted.gov":
+                raise RegistryError(code=ErrorCode.OBJECT_DOES_NOT_EXIST)
+            info = MagicMock(
+                ex_date=date(2025, 1, 1),
+                cr_date=self.registry_created_at,
+                hosts=["ns1.drifted.gov", "ns2.example.com"],
+                contacts=[common.DomainContact(contact="newsecurity", type=PublicContact.ContactTypeChoices.SECURITY)],
+            )
+            return MagicMock(res_data=[info])
+
+        return MagicMock(send=MagicMock(side_effect=send))
+
+    def run_reconcile_registry(self, clients=None, **options):
+        with patch(
+            "registrar.management.commands.reconcile_registry.get_clients",
+            return_value=clients or [self.fake_registry_client()],
+        ):
+            call_command("reconcile_registry", **options)
+
+    @less_console_noise_decorator
+    def test_corrects_drift(self):
+        """Test that the dates, security contact, hosts and IPs of domains are corrected from the registry"""
+        self.run_reconcile_registry()
+
+        self.domain.refresh_from_db()
+        self.assertEqual(self.domain.expiration_date, date(2025, 1, 1))
+        self.assertEqual(self.domain.created_at, self.registry_created_at)
+        self.assertEqual(self.domain.security_contact_registry_id, "newsecurity")
+        hosts = {host.name: sorted(host.ip.values_list("address", flat=True)) for host in self.domain.host.all()}
+        # IPs are only kept for nameservers that are subdomains of the domain
+        self.assertEqual(hosts, {"ns1.drifted.gov": ["1.1.1.1", "2.2.2.2"], "ns2.example.com": []})
+        self.assertFalse(HostIP.objects.filter(address="9.9.9.9").exists())
+
+    @less_console_noise_decorator
+    def test_keeps_clients_open_across_batches(self):
+        """Test that the registry clients are closed once, after the last batch"""
+        clients = [self.fake_registry_client() for _ in range(2)]
+        self.run_reconcile_registry(clients=clients, concurrency=2, batchSize=1)
+
+        self.domain.refresh_from_db()
+        self.assertEqual(self.domain.expiration_date, date(2025, 1, 1))
+        for client in clients:
+            client.close.assert_called_once()
+
+    @less_console_noise_decorator
+    def test_reports_drift_without_correcting_on_dry_run(self):
+        """Test that the drift report lists each drifted field and unreadable domain, and a dry run changes nothing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "drift.csv")
+            self.run_reconcile_registry(dryRun=True, report=report_path)
+            with open(report_path) as report_file:
+                rows = list(csv.reader(report_file))
+
+        self.assertEqual(rows[0], ["Domain", "Field", "Database", "Registry"])
+        fields = sorted(row[1] for row in rows[1:])
+        self.assertEqual(
+            fields, ["created_at", "error", "expiration_date", "host_ips", "hosts", "security_contact_registry_id"]
+        )
+        # Domains that aren't in the registry, like unknown.gov, aren't checked
+        self.assertEqual({row[0] for row in rows[1:]}, {"drifted.gov", "missing.gov"})
+        self.domain.refresh_from_db()
+        self.assertEqual(self.domain.expiration_date, date(2024, 1, 1))
+        self.assertEqual(Host.objects.count(), 2)
+
+    @less_console_noise_decorator
+    def test_skips_domains_deleted_during_the_run(self):
+        """Test that a domain deleted after its registry record was read is skipped, and the rest reconciled"""
+        reconciliation = RegistryReconciliation(clients=[])
+        reconciliation.reconcile(
+            [
+                RegistryRecord("deleted.gov", expiration_date=date(2025, 1, 1)),
+                RegistryRecord(
+                    "drifted.gov", expiration_date=date(2025, 1, 1), security_contact_registry_id="oldsecurity"
+                ),
+            ]
+        )
+
+        self.assertNotIn("deleted.gov", reconciliation.drifted_domains)
+        self.assertEqual(reconciliation.failed, [])
+        self.domain.refresh_from_db()
+        self.assertEqual(self.domain.expiration_date, date(2025, 1, 1))
+
 
 class TestDiscloseEmails(MockEppLib):
     def setUp(self):
@@ -959,26 +1262,14 @@ class TestExportTables(MockEppLib):
 
     def tearDown(self):
         self.logger_patcher.stop()
+        Website.objects.all().delete()
 
     @less_console_noise_decorator
     @patch("os.makedirs")
-    @patch("os.path.exists")
-    @patch("os.remove")
     @patch("pyzipper.AESZipFile")
-    @patch("registrar.management.commands.export_tables.getattr")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.listdir")
-    def test_handle(
-        self, mock_listdir, mock_open, mock_getattr, mock_zipfile, mock_remove, mock_path_exists, mock_makedirs
-    ):
-        """test that the handle method properly exports tables"""
-        # Mock os.makedirs to do nothing
-        mock_makedirs.return_value = None
-
-        # Mock os.path.exists to always return True
-        mock_path_exists.return_value = True
-
-        # Check that the export_table function was called for each table
+    @patch.object(ExportTablesCommand, "export_table")
+    def test_handle(self, mock_export_table, mock_zipfile, mock_makedirs):
+        """test that the handle method exports each table into the zip file"""
         table_names = [
             "User",
             "Contact",
@@ -994,41 +1285,49 @@ class TestExportTables(MockEppLib):
             "PublicContact",
         ]
 
-        # Mock directory listing
-        mock_listdir.side_effect = lambda path: [f"{table}_1.csv" for table in table_names]
-
-        # Mock the resource class and its export method
-        mock_dataset = tablib.Dataset()
-        mock_dataset.headers = ["header1", "header2"]
-        mock_dataset.append(["row1_col1", "row1_col2"])
-        mock_resource_class = MagicMock()
-        mock_resource_class().export.return_value = mock_dataset
-        mock_getattr.return_value = mock_resource_class
-
         command_instance = ExportTablesCommand()
-        command_instance.handle()
+        command_instance.handle(workers=1)
 
         # Check that os.makedirs was called once to create the tmp directory
         mock_makedirs.assert_called_once_with("tmp", exist_ok=True)
 
-        # Check that the CSV file was written
-        for table_name in table_names:
-            # Check that os.remove was called
-            mock_remove.assert_any_call(f"tmp/{table_name}_1.csv")
-
-        # Check that the zipfile was created and files were added
+        # Check that the zipfile was created and each table was written to it
         mock_zipfile.assert_called_once_with("tmp/exported_tables.zip", "w", compression=pyzipper.ZIP_DEFLATED)
         zipfile_instance = mock_zipfile.return_value.__enter__.return_value
-        for table_name in table_names:
-            zipfile_instance.write.assert_any_call(f"tmp/{table_name}_1.csv", f"{table_name}_1.csv")
+        mock_export_table.assert_has_calls([call(table_name, zipfile_instance) for table_name in table_names])
+
+    @less_console_noise_decorator
+    def test_export_table_streams_rows_into_numbered_files(self):
+        """Test that rows are written in primary key order, split across files of ROWS_PER_FILE rows"""
+        websites = [Website.objects.create(website=f"https://{name}.gov") for name in ["a", "b", "c"]]
 
-        # Verify logging for added files
-        for table_name in table_names:
-            self.logger_mock.info.assert_any_call(f"Added {table_name}_1.csv to tmp/exported_files.zip")
+        buffer = io.BytesIO()
+        with patch("registrar.management.commands.export_tables.ROWS_PER_FILE", 2):
+            with pyzipper.AESZipFile(buffer, "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
+                self.command.export_table("Website", zipf)
 
-        # Verify logging for removed files
-        for table_name in table_names:
-            self.logger_mock.info.assert_any_call(f"Removed {table_name}_1.csv")
+        with pyzipper.AESZipFile(buffer, "r") as zipf:
+            self.assertEqual(sorted(zipf.namelist()), ["Website_1.csv", "Website_2.csv"])
+            first_file = tablib.Dataset().load(zipf.read("Website_1.csv").decode(), format="csv")
+            second_file = tablib.Dataset().load(zipf.read("Website_2.csv").decode(), format="csv")
+
+        self.assertIn("website", first_file.headers)
+        self.assertEqual(first_file.headers, second_file.headers)
+        self.assertEqual(
+            [row["id"] for row in first_file.dict + second_file.dict], [str(website.id) for website in websites]
+        )
+        self.logger_mock.info.assert_any_call("Successfully exported Website into 2 files.")
+
+    @less_console_noise_decorator
+    def test_export_table_writes_headers_for_empty_table(self):
+        """Test that an empty table still exports a file with its headers"""
+        buffer = io.BytesIO()
+        with pyzipper.AESZipFile(buffer, "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
+            self.command.export_table("Website", zipf)
+
+        with pyzipper.AESZipFile(buffer, "r") as zipf:
+            self.assertEqual(zipf.namelist(), ["Website_1.csv"])
+            self.assertEqual(len(zipf.read("Website_1.csv").decode().splitlines()), 1)
 
     @patch("registrar.management.commands.export_tables.getattr")
     @less_console_noise_decorator
@@ -1039,7 +1338,7 @@ class TestExportTables(MockEppLib):
         # Import the command to avoid any locale or gettext issues
         command_class = import_string("registrar.management.commands.export_tables.Command")
         command_instance = command_class()
-        command_instance.export_table("NonExistentTable")
+        command_instance.export_table("NonExistentTable", MagicMock())
 
         self.logger_mock.error.assert_called_with(
             "Resource class NonExistentTableResource not found in registrar.admin"
@@ -1050,48 +1349,73 @@ class TestExportTables(MockEppLib):
     def test_export_table_handles_generic_exception(self, mock_getattr):
         """Test that general exceptions in the handle method are handled correctly"""
         mock_resource_class = MagicMock()
-        mock_resource_class().export.side_effect = Exception("Test Exception")
+        mock_resource_class().get_export_headers.side_effect = Exception("Test Exception")
         mock_getattr.return_value = mock_resource_class
 
         # Import the command to avoid any locale or gettext issues
         command_class = import_string("registrar.management.commands.export_tables.Command")
         command_instance = command_class()
-        command_instance.export_table("TestTable")
+        command_instance.export_table("TestTable", MagicMock())
 
         self.logger_mock.error.assert_called_with("Failed to export TestTable: Test Exception")
 
 
+def count_letters(table_name):
+    """Stands in for per-table work in the scheduler tests, returning a row count"""
+    return len(table_name)
+
+
+class TestTableScheduler(SimpleTestCase):
+    """Test the scheduler that export_tables and import_tables run tables with"""
+
+    def test_dependency_levels(self):
+        """Test that each table is in a later level than the tables it references"""
+        levels = get_dependency_levels(["PublicContact", "HostIp", "Host", "Domain", "Website", "DomainRequest"])
+
+        self.assertEqual(levels[0], ["Domain", "Website"])
+        level_by_table = {table_name: index for index, level in enumerate(levels) for table_name in level}
+        self.assertEqual(level_by_table["PublicContact"], level_by_table["Host"])
+        self.assertGreater(level_by_table["HostIp"], level_by_table["Host"])
+        self.assertGreater(level_by_table["DomainRequest"], level_by_table["Website"])
+
+    @less_console_noise_decorator
+    def test_run_tables_in_worker_processes(self):
+        """Test that tables run in a pool of processes, and their throughput is logged"""
+        with patch("registrar.management.commands.utility.table_scheduler.logger") as mock_logger:
+            results = run_tables(count_letters, ["User", "Contact", "Domain"], workers=2)
+            log_throughput(results, "imported", seconds=1)
+
+        self.assertEqual(
+            [(result.table_name, result.rows) for result in results], [("User", 4), ("Contact", 7), ("Domain", 6)]
+        )
+        self.assertTrue(all(result.error is None for result in results))
+        mock_logger.info.assert_any_call("Imported 17 rows from 3 tables in 1.0s (17 rows/s)")
+
+    @less_console_noise_decorator
+    def test_run_tables_records_failures(self):
+        """Test that a table that fails doesn't stop the others"""
+        results = run_tables(count_letters, ["User", None], workers=1)
+
+        self.assertEqual(results[0].rows, 4)
+        self.assertEqual(results[1].rows, 0)
+        self.assertIsNotNone(results[1].error)
+
+
 class TestImportTables(TestCase):
     """Test the import_tables script"""
 
+    def tearDown(self):
+        Website.objects.all().delete()
+        User.objects.all().delete()
+        Group.objects.filter(name="import test group").delete()
+
     @patch("registrar.management.commands.import_tables.os.makedirs")
     @patch("registrar.management.commands.import_tables.os.path.exists")
-    @patch("registrar.management.commands.import_tables.os.remove")
     @patch("registrar.management.commands.import_tables.pyzipper.AESZipFile")
-    @patch("registrar.management.commands.import_tables.tablib.Dataset")
-    @patch("registrar.management.commands.import_tables.open", create=True)
-    @patch("registrar.management.commands.import_tables.logger")
-    @patch("registrar.management.commands.import_tables.getattr")
-    @patch("django.apps.apps.get_model")
-    @patch("os.listdir")
+    @patch.object(ImportTablesCommand, "import_table")
     @less_console_noise_decorator
-    def test_handle(
-        self,
-        mock_listdir,
-        mock_get_model,
-        mock_getattr,
-        mock_logger,
-        mock_open,
-        mock_dataset,
-        mock_zipfile,
-        mock_remove,
-        mock_path_exists,
-        mock_makedirs,
-    ):
-        """Test that the handle method properly imports tables"""
-        # Mock os.makedirs to do nothing
-        mock_makedirs.return_value = None
-
+    def test_handle(self, mock_import_table, mock_zipfile, mock_path_exists, mock_makedirs):
+        """Test that the handle method extracts the zip file and imports tables after the tables they reference"""
         # Mock os.path.exists to always return True
         mock_path_exists.return_value = True
 
@@ -1099,77 +1423,78 @@ class TestImportTables(TestCase):
         mock_zipfile_instance = mock_zipfile.return_value.__enter__.return_value
         mock_zipfile_instance.extractall.return_value = None
 
-        # Check that the import_table function was called for each table
-        table_names = [
-            "User",
-            "Contact",
-            "Domain",
-            "DomainRequest",
-            "DomainInformation",
-            "UserDomainRole",
-            "DraftDomain",
-            "Website",
-            "HostIp",
-            "Host",
-            "PublicContact",
-        ]
-
-        # Mock directory listing
-        mock_listdir.side_effect = lambda path: [f"{table}_1.csv" for table in table_names]
-
-        # Mock the CSV file content
-        csv_content = b"mock_csv_data"
-
-        # Mock the open function to return a mock file
-        mock_open.return_value.__enter__.return_value.read.return_value = csv_content
-
-        # Mock the Dataset class and its load method to return a dataset
-        mock_dataset_instance = MagicMock(spec=tablib.Dataset)
-        with patch(
-            "registrar.management.commands.import_tables.tablib.Dataset.load", return_value=mock_dataset_instance
-        ):
-            # Mock the resource class and its import method
-            mock_resource_class = MagicMock()
-            mock_resource_instance = MagicMock()
-            mock_result = MagicMock()
-            mock_result.has_errors.return_value = False
-            mock_resource_instance.import_data.return_value = mock_result
-            mock_resource_class.return_value = mock_resource_instance
-            mock_getattr.return_value = mock_resource_class
+        call_command("import_tables", workers=1)
 
-            # Call the command
-            call_command("import_tables")
+        # Check that os.makedirs was called once to create the tmp directory
+        mock_makedirs.assert_called_once_with("tmp", exist_ok=True)
 
-            # Check that os.makedirs was called once to create the tmp directory
-            mock_makedirs.assert_called_once_with("tmp", exist_ok=True)
+        # Check that pyzipper.AESZipFile was called once to open the zip file
+        mock_zipfile.assert_called_once_with("tmp/exported_tables.zip", "r")
+
+        # Check that extractall was called once to extract the zip file contents
+        mock_zipfile_instance.extractall.assert_called_once_with("tmp")
+
+        # Check that every table was imported, each after the tables it references
+        imported = [import_call.args[0] for import_call in mock_import_table.call_args_list]
+        self.assertEqual(len(imported), 12)
+        for table_name, referenced_table_name in [
+            ("Host", "Domain"),
+            ("HostIp", "Host"),
+            ("DomainRequest", "Website"),
+            ("DomainRequest", "FederalAgency"),
+            ("DomainInformation", "DomainRequest"),
+            ("UserDomainRole", "User"),
+            ("PublicContact", "Domain"),
+        ]:
+            self.assertGreater(imported.index(table_name), imported.index(referenced_table_name))
+
+    @patch("registrar.management.commands.import_tables.os.listdir")
+    def test_get_table_files_in_export_order(self, mock_listdir):
+        """Test that a table's files are imported in the order they were exported, and only that table's"""
+        mock_listdir.return_value = ["Domain_10.csv", "DomainRequest_1.csv", "Domain_2.csv", "Domain_1.csv"]
 
-            # Check that os.path.exists was called once for the zip file
-            mock_path_exists.assert_any_call("tmp/exported_tables.zip")
+        self.assertEqual(
+            ImportTablesCommand().get_table_files("Domain"), ["Domain_1.csv", "Domain_2.csv", "Domain_10.csv"]
+        )
 
-            # Check that pyzipper.AESZipFile was called once to open the zip file
-            mock_zipfile.assert_called_once_with("tmp/exported_tables.zip", "r")
+    @less_console_noise_decorator
+    def test_import_table_round_trip(self):
+        """Test that exported rows, including many to many relations, are imported in bulk"""
+        group = Group.objects.create(name="import test group")
+        user = User.objects.create(username="import-test-user", email="import@igorville.gov", first_name="Import")
+        user.groups.add(group)
+        websites = [Website.objects.create(website=f"https://{name}.gov") for name in ["a", "b"]]
 
-            # Check that extractall was called once to extract the zip file contents
-            mock_zipfile_instance.extractall.assert_called_once_with("tmp")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            buffer = io.BytesIO()
+            with pyzipper.AESZipFile(buffer, "w") as zipf:
+                ExportTablesCommand().export_table("User", zipf)
+                ExportTablesCommand().export_table("Website", zipf)
+            with pyzipper.AESZipFile(buffer, "r") as zipf:
+                zipf.extractall(tmp_dir)
 
-            # Check that os.path.exists was called for each table
-            for table_name in table_names:
-                mock_path_exists.assert_any_call(f"{table_name}_1.csv")
+            User.objects.all().delete()
+            Website.objects.all().delete()
 
-            # Check that logger.info was called for each successful import
-            for table_name in table_names:
-                mock_logger.info.assert_any_call(f"Successfully imported {table_name}_1.csv into {table_name}")
+            command = ImportTablesCommand()
+            command.skip_epp_save = True
+            command.import_table("User", tmp_dir)
+            command.import_table("Website", tmp_dir)
 
-            # Check that logger.error was not called for resource class not found
-            mock_logger.error.assert_not_called()
+            # The csv files are removed once imported
+            self.assertEqual(os.listdir(tmp_dir), [])
 
-            # Check that os.remove was called for each CSV file
-            for table_name in table_names:
-                mock_remove.assert_any_call(f"{table_name}_1.csv")
+        imported_user = User.objects.get(id=user.id)
+        self.assertEqual(imported_user.email, "import@igorville.gov")
+        self.assertEqual(imported_user.first_name, "Import")
+        self.assertEqual(list(imported_user.groups.all()), [group])
+        self.assertEqual(
+            list(Website.objects.order_by("id").values_list("id", "website")),
+            [(website.id, website.website) for website in websites],
+        )
 
-            # Check that logger.info was called for each CSV file removal
-            for table_name in table_names:
-                mock_logger.info.assert_any_call(f"Removed temporary file {table_name}_1.csv")
+        # New rows are numbered after the imported ones
+        self.assertGreater(Website.objects.create(website="https://c.gov").id, websites[-1].id)
 
     @patch("registrar.management.commands.import_tables.logger")
     @patch("registrar.management.commands.import_tables.os.makedirs")
@@ -2473,6 +2798,8 @@ class TestRemovePortfolios(TestCase):
         # Ensure related objects exist before running the command
         self.assertEqual(DomainInformation.objects.count(), 2)
         self.assertEqual(DomainRequest.objects.count(), 1)
+        self.domain_information.refresh_from_db()
+        self.assertEqual(self.domain_information.effective_organization_name, "Test with orphaned objects")
 
         # Run the command
         call_command("remove_unused_portfolios", debug=False)
@@ -2485,6 +2812,12 @@ class TestRemovePortfolios(TestCase):
         self.assertEqual(DomainInformation.objects.filter(portfolio=None).count(), 2)
         self.assertEqual(DomainRequest.objects.filter(portfolio=None).count(), 1)
 
+        # Check that the orphaned objects no longer take their converted values from the portfolio
+        self.domain_information.refresh_from_db()
+        self.domain_request.refresh_from_db()
+        self.assertIsNone(self.domain_information.effective_organization_name)
+        self.assertIsNone(self.domain_request.effective_organization_name)
+
         # Check that the portfolio was deleted
         self.assertFalse(Portfolio.objects.filter(organization_name="Test with orphaned objects").exists())
 
@@ -2728,3 +3061,90 @@ class TestCleanPII(TestCase):
         super().tearDown()
         Contact.objects.all().delete()
         User.objects.all().delete()
+
+
+class TestGenerateLargeRegistry(TestCase):
+    """Tests for the generate_large_registry script"""
+
+    sizes = {"portfolios": 3, "users": 9, "domains": 12, "contacts": 20}
+
+    @less_console_noise_decorator
+    def test_generates_registry_of_given_size(self):
+        """Test that the registry has the requested rows, each portfolio has an admin, and every domain a manager"""
+        call_command("generate_large_registry", **self.sizes)
+
+        self.assertEqual(User.objects.filter(username__startswith="load-user-").count(), 9)
+        self.assertTrue(User.objects.get(username="load-analyst").is_superuser)
+        self.assertEqual(Portfolio.objects.count(), 3)
+        self.assertEqual(Domain.objects.count(), 12)
+        self.assertEqual(Contact.objects.count(), 20)
+        self.assertEqual(UserPortfolioPermission.objects.count(), 9)
+        self.assertEqual(DomainInformation.objects.filter(portfolio__isnull=False).count(), 12)
+        self.assertEqual(
+            DomainRequest.objects.filter(status=DomainRequest.DomainRequestStatus.APPROVED).count(),
+            12,
+        )
+        for portfolio in Portfolio.objects.all():
+            self.assertTrue(
+                UserPortfolioPermission.objects.filter(
+                    user=portfolio.requester,
+                    portfolio=portfolio,
+                    roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+                ).exists()
+            )
+        self.assertFalse(Domain.objects.filter(permissions__isnull=True).exists())
+        # The stored converted values are filled in, though the rows were bulk inserted
+        self.assertFalse(DomainRequest.objects.filter(effective_organization_name__isnull=True).exists())
+
+    @less_console_noise_decorator
+    def test_same_seed_builds_same_registry(self):
+        """Test that generating again with the same seed gives the same domains and managers"""
+
+        def snapshot():
+            return sorted(
+                UserDomainRole.objects.values_list("domain__name", "domain__state", "user__username"),
+            )
+
+        call_command("generate_large_registry", seed=4, **self.sizes)
+        first = snapshot()
+        # Clear the registry, since the command won't generate over one
+        for model in [UserDomainRole, DomainInvitation, PortfolioInvitation, DomainInformation, DomainRequest]:
+            model.objects.all().delete()
+        for model in [Domain, Contact, UserPortfolioPermission, Portfolio, User]:
+            model.objects.all().delete()
+        call_command("generate_large_registry", seed=4, **self.sizes)
+
+        self.assertEqual(snapshot(), first)
+
+    @less_console_noise_decorator
+    def test_refuses_to_generate_twice(self):
+        call_command("generate_large_registry", **self.sizes)
+        with self.assertRaises(CommandError):
+            call_command("generate_large_registry", **self.sizes)
+
+
+class TestBenchmarkRegressions(SimpleTestCase):
+    """Tests for comparing benchmark results with a baseline"""
+
+    baseline = {
+        "domains_json": {"median_ms": 100.0, "queries": 10},
+        "analytics": {"median_ms": 40.0, "queries": 5},
+    }
+
+    def test_find_regressions(self):
+        """Test that extra queries and large slowdowns regress, and small slowdowns don't"""
+        results = {
+            "domains_json": {"median_ms": 150.0, "queries": 10},
+            "analytics": {"median_ms": 55.0, "queries": 6},
+            "home": {"median_ms": 500.0, "queries": 50},
+        }
+
+        self.assertEqual(
+            find_regressions(results, self.baseline),
+            ["domains_json: 100.0ms -> 150.0ms", "analytics: 5 -> 6 queries"],
+        )
+
+    def test_errors_always_regress(self):
+        results = {"home": {"url": "/", "error": "/ returned 500"}}
+
+        self.assertEqual(find_regressions(results, {}), ["home: / returned 500"])
@@ -2,9 +2,13 @@ from django.test import TestCase, override_settings
 from django.urls import reverse
 import io
 import logging
+import re
+from unittest.mock import patch
 from registrar.config.settings import JsonFormatter
 from django.contrib.auth import get_user_model
 import registrar.registrar_middleware
+from registrar.utility import request_metrics
+from epplibwrapper.metrics import METRICS
 from ..logging_context import clear_user_log_context
 
 
@@ -56,3 +60,75 @@ class RegisterLoggingMiddlewareTest(TestCase):
         self.client.get(reverse("health"))
         log_output = self.stream.getvalue()
         self.assertNotIn("Router log", log_output)
+
+
+class RequestMetricsMiddlewareTest(TestCase):
+    """Test the per-request query counts and timings, which don't depend on DEBUG."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="metrics",
+            first_name="metrics",
+            last_name="user",
+            title="tester",
+            email="metrics_middleware@gmail.com",
+            phone="8002224444",
+        )
+        self.client.force_login(self.user)
+
+    @override_settings(DEBUG=False)
+    def test_server_timing_counts_queries(self):
+        """The Server-Timing header reports the queries the request ran"""
+        response = self.client.get(reverse("get_domains_json"))
+
+        server_timing = response["Server-Timing"]
+        self.assertRegex(server_timing, r'^db;dur=[\d.]+;desc="\d+ calls"')
+        self.assertRegex(server_timing, r"total;dur=[\d.]+$")
+        query_count = int(re.search(r'desc="(\d+) calls"', server_timing).group(1))
+        self.assertGreater(query_count, 0)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_sampled_requests_are_logged(self):
+        with self.assertLogs(request_metrics.__name__, level="INFO") as logs:
+            self.client.get(reverse("get_domains_json"))
+
+        self.assertEqual(len(logs.records), 1)
+        summary = logs.records[0].request_metrics
+        self.assertEqual(summary["endpoint"], "get_domains_json")
+        self.assertEqual(summary["status"], 200)
+        self.assertGreater(summary["db_calls"], 0)
+        self.assertEqual(summary["epp_calls"], 0)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0, REQUEST_METRICS_SLOW_MS=0)
+    def test_slow_requests_are_always_logged(self):
+        with self.assertLogs(request_metrics.__name__, level="INFO") as logs:
+            self.client.get(reverse("get_domains_json"))
+        self.assertIn("REQUEST_METRICS: ", logs.output[0])
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_logged(self):
+        with patch.object(request_metrics.logger, "info") as mock_info:
+            self.client.get(reverse("get_domains_json"))
+        mock_info.assert_not_called()
+
+    def test_timed_calls_count_against_the_request(self):
+        """External calls wrapped in timed() are recorded against the request being handled, if there is one"""
+        with request_metrics.timed(request_metrics.SES):
+            pass
+
+        with request_metrics.collect_request_metrics() as metrics:
+            with request_metrics.timed(request_metrics.EPP):
+                pass
+            get_user_model().objects.count()
+
+        self.assertEqual(metrics.counts, {"db": 1, "epp": 1, "ses": 0, "s3": 0})
+        self.assertIn("epp;dur=", metrics.server_timing())
+        self.assertIsNone(request_metrics.get_current_metrics())
+
+    def test_registry_commands_count_against_the_request(self):
+        """The registry client times its commands with request_metrics, as set up when the app is ready"""
+        with request_metrics.collect_request_metrics() as metrics:
+            with METRICS.time_send():
+                pass
+
+        self.assertEqual(metrics.counts["epp"], 1)
@@ -23,7 +23,9 @@ from registrar.models.portfolio import Portfolio
 from registrar.models.portfolio_invitation import PortfolioInvitation
 from registrar.models.transition_domain import TransitionDomain
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
+from registrar.models.utility.converted_fields import refresh_converted_fields
 from registrar.models.verified_by_staff import VerifiedByStaff  # type: ignore
+from registrar.utility.constants import BranchChoices
 
 from .common import (
     MockSESClient,
@@ -1985,6 +1987,106 @@ class TestDomainInformationCustomSave(TestCase):
         self.assertEqual(domain_information_election.generic_org_type, DomainRequest.OrganizationChoices.CITY)
 
 
+class TestConvertedFieldsSync(TestCase):
+    """Tests that the stored converted values of domain requests and domain information stay up to date"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = create_test_user()
+        self.agency = FederalAgency.objects.create(agency="Stored Agency", federal_type=BranchChoices.EXECUTIVE)
+        self.portfolio_agency = FederalAgency.objects.create(
+            agency="Stored Portfolio Agency", federal_type=BranchChoices.JUDICIAL
+        )
+        self.portfolio = Portfolio.objects.create(
+            requester=self.user,
+            organization_name="Stored Portfolio",
+            organization_type=DomainRequest.OrganizationChoices.FEDERAL,
+            federal_agency=self.portfolio_agency,
+            city="Portfolio City",
+            state_territory=DomainRequest.StateTerritoryChoices.ALASKA,
+        )
+
+    def tearDown(self):
+        DomainInformation.objects.all().delete()
+        DomainRequest.objects.all().delete()
+        Domain.objects.all().delete()
+        Portfolio.objects.all().delete()
+        FederalAgency.objects.filter(agency__startswith="Stored").delete()
+        User.objects.all().delete()
+        super().tearDown()
+
+    def assert_stored_values_match_properties(self, record):
+        record.refresh_from_db()
+        self.assertEqual(record.effective_generic_org_type, record.converted_generic_org_type)
+        self.assertEqual(record.effective_federal_agency, record.converted_federal_agency)
+        self.assertEqual(record.effective_federal_type, record.converted_federal_type)
+        self.assertEqual(record.effective_organization_name, record.converted_organization_name)
+        self.assertEqual(record.effective_city, record.converted_city)
+        self.assertEqual(record.effective_state_territory, record.converted_state_territory)
+
+    @less_console_noise_decorator
+    def test_save_stores_converted_values(self):
+        """Saving a record stores its own values, or its portfolio's once it has one"""
+        domain_request = completed_domain_request(
+            name="stored.gov",
+            generic_org_type=DomainRequest.OrganizationChoices.CITY,
+            federal_agency=self.agency,
+            organization_name="Own Name",
+            city="Own City",
+        )
+        self.assert_stored_values_match_properties(domain_request)
+        self.assertEqual(domain_request.effective_organization_name, "Own Name")
+        self.assertEqual(domain_request.effective_federal_type, BranchChoices.EXECUTIVE)
+
+        domain_request.portfolio = self.portfolio
+        domain_request.save()
+        self.assert_stored_values_match_properties(domain_request)
+        self.assertEqual(domain_request.effective_organization_name, "Stored Portfolio")
+        self.assertEqual(domain_request.effective_federal_type, BranchChoices.JUDICIAL)
+
+    @less_console_noise_decorator
+    def test_portfolio_without_agency_stores_no_agency(self):
+        """A record in a portfolio without a federal agency stores no agency, not its own"""
+        self.portfolio.federal_agency = None
+        self.portfolio.save()
+        domain_request = completed_domain_request(
+            name="stored.gov", federal_agency=self.agency, portfolio=self.portfolio, user=self.user
+        )
+        self.assert_stored_values_match_properties(domain_request)
+        self.assertIsNone(domain_request.effective_federal_agency)
+        self.assertIsNone(domain_request.effective_federal_type)
+
+    @less_console_noise_decorator
+    def test_portfolio_and_agency_changes_refresh_stored_values(self):
+        """Changing a portfolio or a federal agency updates the records that read from them"""
+        domain_request = completed_domain_request(
+            name="stored.gov", federal_agency=self.agency, portfolio=self.portfolio, user=self.user
+        )
+        domain_information = DomainInformation.create_from_dr(domain_request)
+
+        self.portfolio.organization_name = "Renamed Portfolio"
+        self.portfolio.organization_type = DomainRequest.OrganizationChoices.STATE_OR_TERRITORY
+        self.portfolio.save()
+        self.portfolio_agency.federal_type = BranchChoices.LEGISLATIVE
+        self.portfolio_agency.save()
+
+        for record in [domain_request, domain_information]:
+            self.assert_stored_values_match_properties(record)
+            self.assertEqual(record.effective_organization_name, "Renamed Portfolio")
+            self.assertEqual(record.effective_federal_type, BranchChoices.LEGISLATIVE)
+
+    @less_console_noise_decorator
+    def test_refresh_converted_fields_fixes_bulk_updates(self):
+        """refresh_converted_fields saves only the records whose stored values are out of date"""
+        domain_request = completed_domain_request(name="stored.gov", federal_agency=self.agency)
+        completed_domain_request(name="untouched.gov", federal_agency=self.agency)
+        DomainRequest.objects.filter(id=domain_request.id).update(portfolio=self.portfolio)
+
+        self.assertEqual(refresh_converted_fields(DomainRequest.objects.all()), 1)
+        self.assert_stored_values_match_properties(domain_request)
+        self.assertEqual(refresh_converted_fields(DomainRequest.objects.all()), 0)
+
+
 class TestDomainRequestIncomplete(TestCase):
 
     @classmethod
@@ -0,0 +1,205 @@
+"""
+Checks that the queries behind the busiest pages are served by indexes.
+
+Each test loads a page against a generated fixture, captures the queries it runs, and
+EXPLAINs each one with sequential scans turned off. The planner then only picks a
+sequential scan when no index can serve the query, so a filtered sequential scan on one
+of the large tables means a query shape that will read the whole table in production,
+however few rows the test tables hold.
+"""
+
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django_webtest import WebTest  # type: ignore
+
+from api.tests.common import less_console_noise_decorator
+from registrar.models import (
+    Domain,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    Portfolio,
+    PortfolioInvitation,
+    User,
+    UserDomainRole,
+    UserPortfolioPermission,
+)
+from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
+from registrar.tests.common import MockEppLib, create_test_user
+
+# The tables that grow with the registry. Scans of small lookup tables are expected.
+CHECKED_MODELS = [
+    Domain,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    PortfolioInvitation,
+    UserDomainRole,
+    UserPortfolioPermission,
+]
+CHECKED_TABLES = {model._meta.db_table for model in CHECKED_MODELS}
+
+
+def iter_plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def get_filtered_seq_scans(sql):
+    """Returns the checked tables that the plan for sql reads with a filtered sequential scan"""
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute("RESET enable_seqscan")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        node["Relation Name"]
+        for node in iter_plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in CHECKED_TABLES and "Filter" in node
+    ]
+
+
+class TestHotPathQueryPlans(MockEppLib, WebTest):
+    """The JSON tables, the middleware on every page, and the user export use indexes"""
+
+    # Rows of each kind generated for the test user's portfolio, and as many again elsewhere
+    FIXTURE_SIZE = 200
+
+    def setUp(self):
+        super().setUp()
+        self.user = create_test_user()
+        self.other_user = User.objects.create(username="plan_other_user", email="other@example.com")
+        self.portfolio = Portfolio.objects.create(requester=self.user, organization_name="Plan portfolio")
+        self.other_portfolio = Portfolio.objects.create(requester=self.other_user, organization_name="Other portfolio")
+        UserPortfolioPermission.objects.create(
+            user=self.user, portfolio=self.portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN]
+        )
+        self.member = User.objects.create(username="plan_member", email="member@example.com")
+        UserPortfolioPermission.objects.create(
+            user=self.member, portfolio=self.portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+        )
+        self.generate_fixture()
+        self.app.set_user(self.user.username)
+
+    def generate_fixture(self):
+        today = timezone.now().date()
+        size = self.FIXTURE_SIZE
+        domains = Domain.objects.bulk_create(
+            [
+                Domain(
+                    name=f"plan{i}.gov",
+                    state=Domain.State.READY,
+                    expiration_date=today + timedelta(days=i),
+                )
+                for i in range(size * 2)
+            ]
+        )
+        ours, theirs = domains[:size], domains[size:]
+        DomainInformation.objects.bulk_create(
+            [DomainInformation(requester=self.user, portfolio=self.portfolio, domain=domain) for domain in ours]
+            + [DomainInformation(requester=self.other_user, portfolio=self.other_portfolio, domain=d) for d in theirs]
+        )
+        UserDomainRole.objects.bulk_create(
+            [UserDomainRole(user=self.user, domain=domain, role=UserDomainRole.Roles.MANAGER) for domain in ours]
+            + [UserDomainRole(user=self.other_user, domain=d, role=UserDomainRole.Roles.MANAGER) for d in theirs]
+            + [UserDomainRole(user=self.member, domain=d, role=UserDomainRole.Roles.MANAGER) for d in ours[::10]]
+        )
+        invitation_statuses = DomainInvitation.DomainInvitationStatus.values
+        DomainInvitation.objects.bulk_create(
+            [
+                DomainInvitation(
+                    email=f"invitee{i % 20}@example.com",
+                    domain=domain,
+                    status=invitation_statuses[i % len(invitation_statuses)],
+                )
+                for i, domain in enumerate(domains)
+            ]
+        )
+        PortfolioInvitation.objects.bulk_create(
+            [
+                PortfolioInvitation(
+                    email=f"invitee{i}@example.com",
+                    portfolio=self.portfolio if i % 2 else self.other_portfolio,
+                    roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER],
+                    status=PortfolioInvitation.PortfolioInvitationStatus.values[i % 2],
+                )
+                for i in range(size)
+            ]
+        )
+        request_statuses = DomainRequest.DomainRequestStatus.values
+        DomainRequest.objects.bulk_create(
+            [
+                DomainRequest(
+                    requester=self.user if i % 2 else self.other_user,
+                    portfolio=self.portfolio if i % 2 else self.other_portfolio,
+                    status=request_statuses[i % len(request_statuses)],
+                )
+                for i in range(size * 2)
+            ]
+        )
+        with connection.cursor() as cursor:
+            for table in sorted(CHECKED_TABLES):
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+    def tearDown(self):
+        DomainRequest.objects.all().delete()
+        PortfolioInvitation.objects.all().delete()
+        DomainInvitation.objects.all().delete()
+        UserDomainRole.objects.all().delete()
+        DomainInformation.objects.all().delete()
+        Domain.objects.all().delete()
+        UserPortfolioPermission.objects.all().delete()
+        Portfolio.objects.all().delete()
+        User.objects.all().delete()
+        super().tearDown()
+
+    def assertIndexedQueries(self, url, params=None):
+        """Loads url, then checks the plan of every select it ran"""
+        with CaptureQueriesContext(connection) as context:
+            response = self.app.get(url, params=params or {})
+        self.assertLess(response.status_code, 400)
+
+        selects = [query["sql"] for query in context.captured_queries if query["sql"].lstrip().startswith("SELECT")]
+        self.assertTrue(selects)
+        for sql in selects:
+            with self.subTest(sql=sql):
+                self.assertEqual(get_filtered_seq_scans(sql), [])
+
+    @less_console_noise_decorator
+    def test_home_page(self):
+        """The middleware and home page queries use indexes"""
+        self.assertIndexedQueries(reverse("home"))
+
+    @less_console_noise_decorator
+    def test_domains_json(self):
+        self.assertIndexedQueries(reverse("get_domains_json"))
+        self.assertIndexedQueries(reverse("get_domains_json"), {"portfolio": self.portfolio.id})
+
+    @less_console_noise_decorator
+    def test_domain_requests_json(self):
+        self.assertIndexedQueries(reverse("get_domain_requests_json"))
+        self.assertIndexedQueries(reverse("get_domain_requests_json"), {"portfolio": self.portfolio.id})
+
+    @less_console_noise_decorator
+    def test_portfolio_members_json(self):
+        self.assertIndexedQueries(reverse("get_portfolio_members_json"), {"portfolio": self.portfolio.id})
+
+    @less_console_noise_decorator
+    def test_member_domains_json(self):
+        params = {"portfolio": self.portfolio.id, "member_only": "true"}
+        self.assertIndexedQueries(reverse("get_member_domains_json"), {**params, "member_id": self.member.id})
+        self.assertIndexedQueries(reverse("get_member_domains_json"), {**params, "email": "invitee1@example.com"})
+
+    @less_console_noise_decorator
+    def test_export_data_type_user(self):
+        self.assertIndexedQueries(reverse("export_data_type_user"))
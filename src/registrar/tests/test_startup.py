@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess  # nosec B404
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# Run in a fresh interpreter, so that nothing is already imported or connected.
+# Any outbound connection is refused and counted: startup should not need the network.
+STARTUP_SCRIPT = """
+import json
+import socket
+import time
+
+attempted_connections = []
+
+
+def refuse_connection(*args, **kwargs):
+    attempted_connections.append(repr(args[1:2]))
+    raise OSError("Network access is disabled during the startup benchmark")
+
+
+socket.socket.connect = refuse_connection
+socket.socket.connect_ex = refuse_connection
+
+start = time.perf_counter()
+import django
+
+django.setup()
+import epplibwrapper.client  # noqa
+import djangooidc.views  # noqa
+import registrar.config.urls  # noqa
+
+print(json.dumps({"seconds": time.perf_counter() - start, "connections": attempted_connections}))
+"""
+
+
+class TestStartupTime(SimpleTestCase):
+    """Guards the time it takes a worker to go from import to ready to serve"""
+
+    # Generous on purpose: this catches network round trips and timeouts creeping
+    # back into import time, not small slowdowns.
+    STARTUP_BUDGET_SECONDS = 10
+
+    def run_startup_script(self):
+        """Imports the app in a new interpreter and returns its timing and connection report"""
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "registrar.config.settings"},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_startup_does_not_contact_registry_or_oidc_provider(self):
+        """Importing the app should not connect to EPP or fetch OIDC discovery"""
+        report = self.run_startup_script()
+        self.assertEqual(report["connections"], [])
+
+    def test_startup_time_is_within_budget(self):
+        """Importing the app should stay within the startup budget"""
+        report = self.run_startup_script()
+        self.assertLess(report["seconds"], self.STARTUP_BUDGET_SECONDS)
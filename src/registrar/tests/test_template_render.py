@@ -0,0 +1,79 @@
+import logging
+import time
+from unittest.mock import patch
+
+from django.urls import resolve, reverse
+from django_webtest import WebTest  # type: ignore
+
+from api.tests.common import less_console_noise_decorator
+from registrar.models import Domain, DomainRequest, Portfolio, User, UserDomainRole, UserPortfolioPermission
+from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
+
+from .common import completed_domain_request, create_test_user, create_test_user_not_in_portfolio
+
+logger = logging.getLogger(__name__)
+
+
+class TestDashboardRenderTime(WebTest):
+    """Benchmarks rendering the main dashboard pages, and guards against per-render work creeping back in"""
+
+    # Generous on purpose: this catches a page becoming many times slower, not small slowdowns.
+    RENDER_BUDGET_SECONDS = 2
+    RENDERS_PER_PAGE = 5
+
+    def setUp(self):
+        super().setUp()
+        self.user = create_test_user()
+        self.user_not_in_portfolio = create_test_user_not_in_portfolio()
+        self.portfolio = Portfolio.objects.create(requester=self.user, organization_name="Hotel California")
+        UserPortfolioPermission.objects.create(
+            user=self.user, portfolio=self.portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN]
+        )
+        for user in [self.user, self.user_not_in_portfolio]:
+            for index in range(3):
+                domain = Domain.objects.create(name=f"{user.id}-{index}-render.gov")
+                UserDomainRole.objects.create(user=user, domain=domain, role=UserDomainRole.Roles.MANAGER)
+        completed_domain_request(name="render-request.gov", user=self.user_not_in_portfolio)
+
+    def tearDown(self):
+        UserPortfolioPermission.objects.all().delete()
+        Portfolio.objects.all().delete()
+        UserDomainRole.objects.all().delete()
+        DomainRequest.objects.all().delete()
+        Domain.objects.all().delete()
+        User.objects.all().delete()
+        super().tearDown()
+
+    def dashboard_pages(self):
+        """Yields (user, url) for each dashboard page"""
+        yield self.user_not_in_portfolio, reverse("home")
+        for url_name in ["domains", "domain-requests", "members", "organization"]:
+            yield self.user, reverse(url_name)
+
+    def render(self, user, url):
+        """Renders url as user, returning the seconds the request took"""
+        self.app.set_user(user.username)
+        start = time.perf_counter()
+        response = self.app.get(url)
+        seconds = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200, url)
+        return seconds
+
+    @less_console_noise_decorator
+    def test_nav_does_not_resolve_the_path_again(self):
+        """The nav uses the url name Django matched for the request, instead of resolving the path per filter"""
+        with patch("registrar.models.utility.generic_helper.resolve", wraps=resolve) as mock_resolve:
+            for user, url in self.dashboard_pages():
+                self.render(user, url)
+        mock_resolve.assert_not_called()
+
+    @less_console_noise_decorator
+    def test_dashboard_pages_render_within_budget(self):
+        """Each dashboard page should render within the budget, once caches are warm"""
+        for user, url in self.dashboard_pages():
+            # The first render warms the template and url caches
+            self.render(user, url)
+            timings = sorted(self.render(user, url) for _ in range(self.RENDERS_PER_PAGE))
+            median = timings[len(timings) // 2]
+            logger.info(f"Rendered {url} in {median * 1000:.1f}ms (median of {self.RENDERS_PER_PAGE})")
+            self.assertLess(median, self.RENDER_BUDGET_SECONDS, url)
@@ -1,5 +1,7 @@
 """Test template tags."""
 
+from unittest.mock import patch
+
 from django.conf import settings
 from django.test import TestCase
 from django.template import Context, Template
@@ -12,6 +14,7 @@ from registrar.templatetags.custom_filters import (
     is_domain_request_subpage,
     is_domain_subpage,
     is_portfolio_subpage,
+    is_members_subpage,
 )
 
 
@@ -108,3 +111,22 @@ class CustomFiltersTestCase(TestCase):
         """Tests if the path is recognized as a portfolio subpage."""
         self.assertTrue(is_portfolio_subpage("/organization/"))
         self.assertFalse(is_portfolio_subpage("/"))
+
+    def test_subpage_filters_use_url_name_from_context(self):
+        """Tests that the filters use the page's url name when it is given, instead of resolving the path."""
+        with patch("registrar.templatetags.custom_filters.get_url_name") as mock_get_url_name:
+            self.assertTrue(is_domain_subpage("/domain/1/dns", "domain-dns"))
+            self.assertTrue(is_domain_request_subpage("/requests/", "domain-requests"))
+            self.assertTrue(is_members_subpage("/members/", "members"))
+            self.assertFalse(is_portfolio_subpage("/domains/", "domains"))
+        mock_get_url_name.assert_not_called()
+
+    def test_subpage_filters_in_template(self):
+        """Tests the filters with the url name argument, as used by the nav."""
+        template = Template(
+            "{% load custom_filters %}{% if path|is_domain_subpage:current_url_name %}current{% endif %}"
+        )
+        self.assertEqual(template.render(Context({"path": "/x/", "current_url_name": "domains"})), "current")
+        # Without a url name, for example on pages that weren't routed to a view, the path is resolved
+        self.assertEqual(template.render(Context({"path": "/domains/", "current_url_name": None})), "current")
+        self.assertEqual(template.render(Context({"path": "/", "current_url_name": "home"})), "")
@@ -1,8 +1,12 @@
 import datetime
+import os
+import shutil
+import sqlite3
+import tempfile
 
 from io import StringIO
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from registrar.models import (
     User,
@@ -18,6 +22,12 @@ from django.core.management import call_command
 from unittest.mock import patch
 
 from registrar.models.contact import Contact
+from registrar.management.commands.utility.epp_data_containers import AgencyAdhoc, EnumFilenames
+from registrar.management.commands.utility.extra_transition_domain_helper import (
+    ExtraTransitionDomain,
+    SQLiteRowIndex,
+)
+from registrar.management.commands.utility.transition_domain_arguments import TransitionDomainArguments
 
 from .common import MockSESClient, less_console_noise
 import boto3_mocking  # type: ignore
@@ -178,6 +188,36 @@ class TestProcessedMigrations(TestCase):
             transition_domain_object = TransitionDomain.objects.get(domain_name="fakewebsite3.gov")
             self.assertTrue(transition_domain_object.processed)
 
+    def test_load_with_disk_index_closes_lookup_tables(self):
+        """
+        This test checks that the status and email lookup tables are closed once a load
+        with use_disk_index finishes.
+        """
+        with less_console_noise():
+            with patch(
+                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+                return_value=True,
+            ), patch.object(SQLiteRowIndex, "close", autospec=True, side_effect=SQLiteRowIndex.close) as mock_close:
+                call_command(
+                    "load_transition_domain",
+                    self.migration_json_filename,
+                    directory=self.test_data_file_location,
+                    use_disk_index=True,
+                )
+
+        self.assertTrue(TransitionDomain.objects.filter(domain_name="fakewebsite3.gov").exists())
+        # The lookup tables map to strings, unlike the tables of the additional data files
+        closed_lookup_tables = [call.args[0] for call in mock_close.call_args_list if call.args[0].record_type is str]
+        self.assertEqual(len(closed_lookup_tables), 2)
+
+    def test_disk_index_closes_as_context_manager(self):
+        """A SQLiteRowIndex used in a with block is closed at the end of it"""
+        with SQLiteRowIndex(str) as index:
+            index["fakewebsite1.gov"] = "ready"
+            self.assertEqual(index["fakewebsite1.gov"], "ready")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            len(index)
+
 
 class TestOrganizationMigration(TestCase):
     def setUp(self):
@@ -787,6 +827,66 @@ class TestMigrations(TestCase):
                 expected_missing_domain_invitations,
             )
 
+    def test_transfer_transition_domains_to_domains_in_chunks(self):
+        """Transferring in small chunks gives the same result as a single pass,
+        and a rerun after every chunk is committed does not add anything."""
+        with less_console_noise():
+            self.run_load_domains()
+            call_command("transfer_transition_domains_to_domains", batchSize=2)
+
+            # Every chunk marks its transition domains as processed
+            self.assertFalse(TransitionDomain.objects.filter(processed=False).exists())
+
+            # Rerunning the script should be a no-op
+            call_command("transfer_transition_domains_to_domains", batchSize=2)
+
+            self.compare_tables(
+                expected_total_transition_domains=9,
+                expected_total_domains=5,
+                expected_total_domain_informations=5,
+                expected_total_domain_invitations=8,
+                expected_missing_domains=0,
+                expected_duplicate_domains=0,
+                expected_missing_domain_informations=0,
+                expected_missing_domain_invitations=1,
+            )
+
+    def test_transfer_transition_domains_resumes_after_partial_run(self):
+        """Only unprocessed transition domains are picked up, so a run that was
+        interrupted after some chunks were committed resumes where it left off."""
+        with less_console_noise():
+            self.run_load_domains()
+            # Simulate a committed chunk by processing only the first few rows
+            call_command("transfer_transition_domains_to_domains", limitParse=3)
+            self.assertTrue(TransitionDomain.objects.filter(processed=False).exists())
+
+            self.run_transfer_domains()
+            self.assertFalse(TransitionDomain.objects.filter(processed=False).exists())
+            self.assertEqual(Domain.objects.count(), 5)
+            self.assertEqual(DomainInformation.objects.count(), 5)
+            self.assertEqual(DomainInvitation.objects.count(), 8)
+
+    def test_transfer_transition_domains_updates_existing_domain_state(self):
+        """The status of a transition domain is saved to the matching existing domain"""
+        with less_console_noise():
+            domain = Domain.objects.create(name="statechange.gov", state=Domain.State.READY)
+            transition_domain = TransitionDomain.objects.create(
+                username="statechange@mail.com",
+                domain_name="statechange.gov",
+                status=TransitionDomain.StatusChoices.ON_HOLD,
+            )
+            self.run_transfer_domains()
+            domain.refresh_from_db()
+            self.assertEqual(domain.state, Domain.State.ON_HOLD)
+
+            # And back again
+            transition_domain.status = TransitionDomain.StatusChoices.READY
+            transition_domain.processed = False
+            transition_domain.save()
+            self.run_transfer_domains()
+            domain.refresh_from_db()
+            self.assertEqual(domain.state, Domain.State.READY)
+
     def test_logins(self):
         with less_console_noise():
             # TODO: setup manually instead of calling other scripts
@@ -866,3 +966,51 @@ class TestMigrations(TestCase):
         self.assertIn("Found 2 transition domains", output)
         self.assertTrue("would send email to testuser@gmail.com", output)
         self.assertTrue("would send email to agustina.wyman7@test.com", output)
+
+
+class TestExtraTransitionDomainParsing(SimpleTestCase):
+    """Tests for the streaming parser used on the legacy data files"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = "agency.adhoc.dotgov.txt"
+        with open(os.path.join(self.directory, self.filename), "w") as agency_file:
+            agency_file.write(
+                "agencyid|agencyname|active|isfederal|unused\n"
+                "1|Agency | Subagency|Y|Y|not needed\n"
+                "2|Other agency|N|N|not needed\n"
+                "3|Corrupt|data|Y|Y|Y|Y\n"
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def parse_agency_file(self, use_disk_index=False):
+        options = TransitionDomainArguments(
+            directory=self.directory,
+            sep="|",
+            use_disk_index=use_disk_index,
+            pattern_map_params=[(EnumFilenames.AGENCY_ADHOC, self.filename, AgencyAdhoc, "agencyid")],
+        )
+        parsed_data = ExtraTransitionDomain(options)
+        with less_console_noise():
+            parsed_data.parse_all_files(infer_filenames=False)
+        return parsed_data.file_data[EnumFilenames.AGENCY_ADHOC].data
+
+    def test_bad_seperators_are_repaired_in_one_pass(self):
+        """Seperators inside of a value are repaired, unknown columns are dropped
+        and rows that are still corrupt are skipped"""
+        data = self.parse_agency_file()
+        self.assertEqual(data["1"], AgencyAdhoc("1", "Agency | Subagency", "Y", "Y"))
+        self.assertEqual(data["2"], AgencyAdhoc("2", "Other agency", "N", "N"))
+        self.assertNotIn("3", data)
+
+    def test_disk_index_matches_in_memory_parsing(self):
+        """Parsing into a SQLite index gives the same records as parsing into a dict"""
+        data = self.parse_agency_file(use_disk_index=True)
+        self.assertIsInstance(data, SQLiteRowIndex)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data.get("1"), AgencyAdhoc("1", "Agency | Subagency", "Y", "Y"))
+        self.assertEqual(data.get("2"), AgencyAdhoc("2", "Other agency", "N", "N"))
+        self.assertIsNone(data.get("3"))
+        data.close()
@@ -330,6 +330,17 @@ class GetDomainsJsonTest(TestWithUser, WebTest):
             domains[0],
         )
 
+    @less_console_noise_decorator
+    def test_get_domains_json_search_is_case_insensitive_and_literal(self):
+        """Search ignores case, and matches % and _ as themselves rather than as wildcards"""
+        response = self.app.get(reverse("get_domains_json"), params={"search_term": "EXAMPLE3"})
+        self.assertEqual([domain["name"] for domain in response.json["domains"]], [self.domain3.name])
+
+        for search_term in ["%", "example_.com"]:
+            with self.subTest(search_term=search_term):
+                response = self.app.get(reverse("get_domains_json"), params={"search_term": search_term})
+                self.assertEqual(response.json["total"], 0)
+
     @less_console_noise_decorator
     def test_pagination(self):
         """Test that pagination is correct in the response"""
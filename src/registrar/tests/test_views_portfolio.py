@@ -2717,18 +2717,19 @@ class TestPortfolioMemberDomainsEditView(TestWithUser, WebTest):
         expected_domains = [self.domain1, self.domain2, self.domain3]
         # assert that send_domain_manager_removal_emails_to_domain_managers is not called
         send_domain_manager_removal_emails.assert_not_called()
-        # Verify that the invitation email was sent
+        # Verify that the invitation email was sent, and the domain managers' emails left to be queued
         mock_send_domain_email.assert_called_once()
         call_args = mock_send_domain_email.call_args.kwargs
         self.assertEqual(call_args["email"], "info@example.com")
         self.assertEqual(call_args["requestor"], self.user)
         self.assertEqual(list(call_args["domains"]), list(expected_domains))
         self.assertIsNone(call_args.get("is_member_of_different_org"))
+        self.assertFalse(call_args["notify_domain_managers"])
 
     @less_console_noise_decorator
     @patch("registrar.views.portfolios.send_domain_invitation_email")
-    @patch("registrar.views.portfolios.send_domain_manager_removal_emails_to_domain_managers")
-    def test_post_with_valid_removed_domains(self, send_domain_manager_removal_emails, mock_send_domain_email):
+    @patch("registrar.views.portfolios.queue_domain_manager_removal_emails_to_domain_managers")
+    def test_post_with_valid_removed_domains(self, queue_domain_manager_removal_emails, mock_send_domain_email):
         """Test that domains can be successfully removed."""
         self.client.force_login(self.user)
 
@@ -2736,8 +2737,6 @@ class TestPortfolioMemberDomainsEditView(TestWithUser, WebTest):
         domains = [self.domain1, self.domain2, self.domain3]
         UserDomainRole.objects.bulk_create([UserDomainRole(domain=domain, user=self.user) for domain in domains])
 
-        send_domain_manager_removal_emails.return_value = True
-
         data = {
             "removed_domains": json.dumps([self.domain1.id, self.domain2.id]),
         }
@@ -2754,19 +2753,34 @@ class TestPortfolioMemberDomainsEditView(TestWithUser, WebTest):
         self.assertEqual(str(messages[0]), "The domain assignment changes have been saved.")
         # assert that send_domain_invitation_email is not called
         mock_send_domain_email.assert_not_called()
-        # assert that send_domain_manager_removal_emails_to_domain_managers is called twice
-        send_domain_manager_removal_emails.assert_any_call(
-            removed_by_user=self.user,
-            manager_removed=self.portfolio_permission.user,
-            manager_removed_email=self.portfolio_permission.user.email,
-            domain=self.domain1,
-        )
-        send_domain_manager_removal_emails.assert_any_call(
-            removed_by_user=self.user,
-            manager_removed=self.portfolio_permission.user,
-            manager_removed_email=self.portfolio_permission.user.email,
-            domain=self.domain2,
-        )
+        # assert that the domain managers' emails are queued once, for both domains
+        queue_domain_manager_removal_emails.assert_called_once()
+        call_args = queue_domain_manager_removal_emails.call_args.kwargs
+        self.assertEqual(call_args["removed_by_user"], self.user)
+        self.assertEqual(call_args["manager_removed"], self.portfolio_permission.user)
+        self.assertEqual(call_args["manager_removed_email"], self.portfolio_permission.user.email)
+        self.assertCountEqual(call_args["domains"], [self.domain1, self.domain2])
+        UserDomainRole.objects.all().delete()
+
+    @less_console_noise_decorator
+    @patch("registrar.views.portfolios.queue_domain_manager_removal_emails_to_domain_managers")
+    def test_post_with_removed_domains_when_emails_cannot_be_queued(self, queue_domain_manager_removal_emails):
+        """Test that domains are removed, and the user is warned, when the notifications can't be queued."""
+        self.client.force_login(self.user)
+        queue_domain_manager_removal_emails.side_effect = EmailSendingError("Failed to render email")
+
+        UserDomainRole.objects.create(domain=self.domain1, user=self.user)
+
+        data = {
+            "removed_domains": json.dumps([self.domain1.id]),
+        }
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(UserDomainRole.objects.filter(user=self.user).count(), 0)
+        self.assertRedirects(response, reverse("member-domains", kwargs={"member_pk": self.portfolio_permission.pk}))
+        messages = [str(message) for message in response.wsgi_request._messages]
+        self.assertIn("Could not send email notification to existing domain managers.", messages)
+        self.assertIn("The domain assignment changes have been saved.", messages)
         UserDomainRole.objects.all().delete()
 
     @less_console_noise_decorator
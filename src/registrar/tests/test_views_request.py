@@ -3,6 +3,10 @@ from unittest.mock import Mock, patch
 from datetime import datetime
 from django.utils import timezone
 from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from api.tests.common import less_console_noise_decorator
 from registrar.utility.constants import BranchChoices
@@ -23,6 +27,7 @@ from registrar.models import (
     UserPortfolioPermission,
 )
 from registrar.views.domain_request import DomainRequestWizard, Step
+from registrar.views.utility.wizard_storage import WIZARD_STATE_VERSION
 
 from .common import less_console_noise
 from .test_views import TestWithUser
@@ -3179,6 +3184,142 @@ class TestDomainRequestWizard(TestWithUser, WebTest):
         DomainRequest.objects.all().delete()
         DomainInformation.objects.all().delete()
 
+    def test_storage_is_only_written_when_it_changes(self):
+        """Wizard state is written back to the session only when it changed during the request"""
+        session = SessionStore()
+        self.wizard.request = Mock(user=self.user, session=session)
+        self.wizard.storage["step_history"] = [Step.ORGANIZATION_TYPE]
+        self.wizard.storage["current_step"] = Step.ORGANIZATION_TYPE
+        self.wizard.save_storage()
+
+        # Stored compactly: versioned, with plain strings, and without the current step (it comes from the url)
+        stored = session[self.wizard.prefix]
+        self.assertEqual(stored, {"version": WIZARD_STATE_VERSION, "data": {"step_history": ["generic_org_type"]}})
+
+        # The next request sees the same state, and so doesn't write the session
+        next_session = SessionStore()
+        next_session[self.wizard.prefix] = stored
+        next_session.modified = False
+        next_wizard = DomainRequestWizard()
+        next_wizard.request = Mock(user=self.user, session=next_session)
+        self.assertEqual(next_wizard.storage["step_history"], [Step.ORGANIZATION_TYPE])
+        next_wizard.storage["step_history"] = [Step.ORGANIZATION_TYPE]
+        next_wizard.storage["current_step"] = Step.PURPOSE
+        next_wizard.save_storage()
+        self.assertFalse(next_session.modified)
+
+        # Changes made in place are still saved
+        next_wizard.storage["step_history"].append(Step.TRIBAL_GOVERNMENT)
+        next_wizard.save_storage()
+        self.assertTrue(next_session.modified)
+        self.assertEqual(
+            next_session[self.wizard.prefix]["data"]["step_history"], ["generic_org_type", "tribal_government"]
+        )
+
+    def test_storage_from_an_older_version_is_discarded(self):
+        """Wizard state stored in an older format is ignored rather than misread"""
+        self.wizard.request = Mock(
+            user=self.user, session={self.wizard.prefix: {"current_step": "purpose", "step_history": ["purpose"]}}
+        )
+        self.assertEqual(dict(self.wizard.storage), {})
+
+    @override_settings(DOMAIN_REQUEST_WIZARD_STATE_STORE="registrar.views.utility.wizard_storage.CacheWizardStateStore")
+    def test_storage_in_cache(self):
+        """Wizard state can be kept in the cache instead of the session"""
+        session = SessionStore()
+        self.wizard.request = Mock(user=self.user, session=session)
+        self.wizard.storage["step_history"] = [Step.PURPOSE]
+        self.wizard.save_storage()
+        self.assertNotIn(self.wizard.prefix, session)
+
+        next_wizard = DomainRequestWizard()
+        next_wizard.request = Mock(user=self.user, session=session)
+        self.assertEqual(next_wizard.storage["step_history"], [Step.PURPOSE])
+
+        del next_wizard.storage
+        other_wizard = DomainRequestWizard()
+        other_wizard.request = Mock(user=self.user, session=session)
+        self.assertEqual(dict(other_wizard.storage), {})
+
+    @less_console_noise_decorator
+    def test_revisiting_a_step_does_not_write_the_session(self):
+        """Viewing the same wizard step again doesn't write the session row"""
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.STARTED, user=self.user)
+        self.client.force_login(self.user)
+        step_url = reverse("domain-request:purpose", kwargs={"domain_request_pk": domain_request.id})
+        self.client.get(reverse("edit-domain-request", kwargs={"domain_request_pk": domain_request.id}))
+        self.client.get(step_url)
+
+        with patch.object(SessionStore, "save", autospec=True, side_effect=SessionStore.save) as mock_save:
+            response = self.client.get(step_url)
+        self.assertEqual(response.status_code, 200)
+        mock_save.assert_not_called()
+
+    def test_step_data_is_worked_out_once_per_request(self):
+        """Unlocked steps are worked out once per request, and again after the domain request changes"""
+        is_unlocked = Mock(return_value=True)
+        self.wizard.unlocking_steps = {Step.PURPOSE: is_unlocked}
+
+        # Outside of a request, nothing is cached
+        self.wizard.db_check_for_unlocking_steps()
+        self.wizard.db_check_for_unlocking_steps()
+        self.assertEqual(is_unlocked.call_count, 2)
+
+        # As set up by dispatch
+        self.wizard._step_cache = {}
+        self.assertEqual(self.wizard.db_check_for_unlocking_steps(), [Step.PURPOSE])
+        self.wizard.form_is_complete()
+        self.assertEqual(is_unlocked.call_count, 3)
+
+        self.wizard.clear_step_cache()
+        self.wizard.db_check_for_unlocking_steps()
+        self.assertEqual(is_unlocked.call_count, 4)
+
+    @less_console_noise_decorator
+    def test_step_query_count_is_fixed(self):
+        """Each step runs the same number of queries, however many related rows the request has"""
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.STARTED, user=self.user)
+        steps = [
+            Step.ORGANIZATION_TYPE,
+            Step.ORGANIZATION_FEDERAL,
+            Step.ORGANIZATION_CONTACT,
+            Step.SENIOR_OFFICIAL,
+            Step.CURRENT_SITES,
+            Step.DOTGOV_DOMAIN,
+            Step.PURPOSE,
+            Step.OTHER_CONTACTS,
+            Step.ADDITIONAL_DETAILS,
+            Step.REQUIREMENTS,
+            Step.REVIEW,
+        ]
+
+        def count_queries(step):
+            url = reverse(f"domain-request:{step}", kwargs={"domain_request_pk": domain_request.id})
+            with CaptureQueriesContext(connection) as queries:
+                response = self.app.get(url)
+            self.assertEqual(response.status_code, 200, step)
+            return len(queries)
+
+        # The first visit to each step saves the visited steps, so is counted separately
+        self.app.get(reverse("edit-domain-request", kwargs={"domain_request_pk": domain_request.id}))
+        for step in steps:
+            count_queries(step)
+        counts = {step: count_queries(step) for step in steps}
+        self.assertEqual({step: count_queries(step) for step in steps}, counts)
+
+        for index in range(3):
+            domain_request.other_contacts.add(
+                Contact.objects.create(
+                    first_name="Other",
+                    last_name=f"Contact {index}",
+                    title="Tester",
+                    email=f"other{index}@igorville.gov",
+                    phone="(555) 555 5555",
+                )
+            )
+            domain_request.current_websites.add(Website.objects.create(website=f"igorville{index}.com"))
+        self.assertEqual({step: count_queries(step) for step in steps}, counts)
+
     @less_console_noise_decorator
     def test_breadcrumb_navigation(self):
         """
@@ -0,0 +1,128 @@
+"""
+Cached option lists for the admin changelist filters.
+
+A filter's lookups() used to run a DISTINCT query over its whole table on every changelist
+load, before the first row was shown. Each FilterValues here computes one filter's distinct
+values once, and keeps them in the shared cache for ADMIN_FILTER_VALUES_TIMEOUT seconds.
+
+The post_save receivers in registrar/signals.py drop the cached values of every filter
+that reads from the saved model. Deletes, queryset .update() and bulk_update() don't, so a
+filter can show a stale option until its values expire; this only affects which options
+are offered, not which rows a selected option matches.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Value
+from django.db.models.functions import Coalesce, Concat
+
+from registrar.models import DomainInformation, DomainRequest, FederalAgency, Portfolio, User
+
+DEFAULT_FILTER_VALUES_TIMEOUT = 300
+
+
+class FilterValues:
+    """The distinct values one admin list filter offers"""
+
+    # Every FilterValues, by name
+    registry: dict[str, "FilterValues"] = {}
+
+    def __init__(self, name, compute, models):
+        """
+        Args:
+            name: Unique name, used in the cache key
+            compute: Returns the values. They are stored in the cache, so must be picklable.
+            models: The models whose changes can change the values
+        """
+        self.name = name
+        self.compute = compute
+        self.models = set(models)
+        FilterValues.registry[name] = self
+
+    @property
+    def cache_key(self):
+        return f"admin_filter_values:{self.name}"
+
+    def get(self) -> list:
+        values = cache.get(self.cache_key)
+        if values is None:
+            values = list(self.compute())
+            timeout = getattr(settings, "ADMIN_FILTER_VALUES_TIMEOUT", DEFAULT_FILTER_VALUES_TIMEOUT)
+            cache.set(self.cache_key, values, timeout=timeout)
+        return values
+
+    def invalidate(self):
+        cache.delete(self.cache_key)
+
+
+def invalidate_filter_values(model):
+    """Drops the cached values of every filter that reads from model.
+
+    Inside a transaction, they are dropped again once it commits, in case another
+    process cached the values from before the change in the meantime.
+    """
+    cache_keys = [values.cache_key for values in FilterValues.registry.values() if model in values.models]
+    if not cache_keys:
+        return
+    cache.delete_many(cache_keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def distinct_values(queryset, field_name):
+    """Returns the distinct, non empty values of field_name in queryset"""
+    return [
+        value for value in queryset.order_by().values_list(field_name, flat=True).distinct() if value not in (None, "")
+    ]
+
+
+def get_investigators():
+    """Returns (user id, full name) for each staff user investigating a domain request, ordered by name"""
+    return (
+        DomainRequest.objects.filter(investigator__is_staff=True)
+        .order_by("investigator__first_name", "investigator__last_name", "investigator__email")
+        .annotate(
+            full_name=Coalesce(
+                Concat("investigator__first_name", Value(" "), "investigator__last_name", output_field=CharField()),
+                "investigator__email",
+                output_field=CharField(),
+            )
+        )
+        .values_list("investigator__id", "full_name")
+        .distinct()
+    )
+
+
+# The stored converted values are refreshed when a portfolio or federal agency
+# changes (see converted_fields.py), so those models invalidate them too.
+DOMAIN_REQUEST_ORG_TYPES = FilterValues(
+    "domain_request_org_types",
+    lambda: distinct_values(DomainRequest.objects.all(), "effective_generic_org_type"),
+    [DomainRequest, Portfolio],
+)
+DOMAIN_REQUEST_FEDERAL_TYPES = FilterValues(
+    "domain_request_federal_types",
+    lambda: distinct_values(DomainRequest.objects.all(), "effective_federal_type"),
+    [DomainRequest, Portfolio, FederalAgency],
+)
+DOMAIN_REQUEST_INVESTIGATORS = FilterValues(
+    "domain_request_investigators",
+    get_investigators,
+    [DomainRequest, User],
+)
+DOMAIN_INFORMATION_ORG_TYPES = FilterValues(
+    "domain_information_org_types",
+    lambda: distinct_values(DomainInformation.objects.all(), "effective_generic_org_type"),
+    [DomainInformation, Portfolio],
+)
+DOMAIN_ORG_TYPES = FilterValues(
+    "domain_org_types",
+    lambda: distinct_values(DomainInformation.objects.filter(domain__isnull=False), "effective_generic_org_type"),
+    [DomainInformation, Portfolio],
+)
+DOMAIN_FEDERAL_TYPES = FilterValues(
+    "domain_federal_types",
+    lambda: distinct_values(DomainInformation.objects.filter(domain__isnull=False), "effective_federal_type"),
+    [DomainInformation, Portfolio, FederalAgency],
+)
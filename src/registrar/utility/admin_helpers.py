@@ -1,4 +1,6 @@
 from registrar.models.domain_request import DomainRequest
+from registrar.utility.constants import BranchChoices
+from django.db.models import Q
 from django.conf import settings
 from django.template.loader import get_template
 from django.utils.html import format_html
@@ -8,6 +10,18 @@ from registrar.models.utility.generic_helper import value_of_attribute
 from django.contrib.admin.widgets import AutocompleteSelect
 
 
+def get_federal_executive_filter(prefix=""):
+    """Returns a filter for the records OMB analysts can see: those whose converted org type is
+    federal and whose converted federal type is executive. prefix is the path from the queried
+    model to the domain request or domain information, such as "domain_info__"."""
+    return Q(
+        **{
+            f"{prefix}effective_generic_org_type": DomainRequest.OrganizationChoices.FEDERAL,
+            f"{prefix}effective_federal_type": BranchChoices.EXECUTIVE,
+        }
+    )
+
+
 def get_action_needed_reason_default_email(domain_request, action_needed_reason):
     """Returns the default email associated with the given action needed reason"""
     return _get_default_email(
@@ -0,0 +1,252 @@
+"""
+Pagination for the admin changelists of large tables.
+
+Django's changelist counts the filtered rows exactly, counts the whole table again for
+show_full_result_count, and pages with OFFSET, so each page reads every row before it.
+LargeTableAdminMixin changes that for a ModelAdmin:
+
+- EstimatedCountPaginator reads the planner's row estimate from pg_class for unfiltered
+  lists, and only counts exactly when the filtered rows are few.
+- The changelist links between pages with a cursor, the primary key of the first or last
+  row shown, and seeks to the next page on the ordering columns instead of using OFFSET.
+  Numbered pages (?p=) still work, for old links.
+"""
+
+import functools
+import json
+import logging
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import OrderBy
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+# Query string parameters holding the cursor: the pk of the last row of the previous
+# page (after) or the first row of the next page (before)
+AFTER_VAR = "after"
+BEFORE_VAR = "before"
+
+# Filtered results up to this size are counted exactly
+EXACT_COUNT_LIMIT = 10000
+
+
+def estimate_table_rows(model, using="default"):
+    """Returns Postgres' estimate of the rows in model's table, or None if it has no estimate"""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 for tables that have never been analyzed
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def estimate_query_rows(queryset):
+    """Returns the planner's estimate of the rows queryset returns, or None if it has no estimate"""
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    try:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (DatabaseError, ValueError, LookupError, TypeError) as err:
+        logger.warning(f"Could not estimate the rows of a {queryset.model.__name__} query: {err}")
+        return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """A Paginator that doesn't count large result sets exactly.
+
+    Unfiltered lists use the table's row estimate. Filtered lists are counted up to
+    EXACT_COUNT_LIMIT rows, and past that use the query planner's estimate.
+    is_estimate tells whether count is an estimate.
+    """
+
+    is_estimate = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = queryset.query
+        if not query.where and not query.distinct and not query.combinator:
+            estimate = estimate_table_rows(queryset.model, using=queryset.db)
+            if estimate is not None and estimate > EXACT_COUNT_LIMIT:
+                self.is_estimate = True
+                return estimate
+
+        # Counts at most EXACT_COUNT_LIMIT + 1 rows, so this stays cheap however many match
+        count = queryset.order_by().values("pk")[: EXACT_COUNT_LIMIT + 1].count()
+        if count <= EXACT_COUNT_LIMIT:
+            return count
+        self.is_estimate = True
+        return max(estimate_query_rows(queryset) or 0, count)
+
+
+def get_keyset_ordering(queryset):
+    """Returns the queryset's ordering as (name, descending) pairs, or None if it can't be seeked on.
+
+    Each name must be a column or annotation that has one value per row, and the
+    primary key must be one of them, so that the ordering is unique.
+    """
+    opts = queryset.model._meta
+    keys = []
+    for order in queryset.query.order_by:
+        if isinstance(order, OrderBy) and isinstance(order.expression, F):
+            name, descending = order.expression.name, order.descending
+        elif isinstance(order, F):
+            name, descending = order.name, False
+        elif isinstance(order, str) and order != "?":
+            name, descending = order.lstrip("-"), order.startswith("-")
+        else:
+            return None
+        if name == "pk":
+            name = opts.pk.name
+        if name not in queryset.query.annotations and not is_single_valued_path(opts, name):
+            return None
+        keys.append((name, descending))
+
+    if opts.pk.name not in [name for name, _ in keys]:
+        return None
+    return keys
+
+
+def is_single_valued_path(opts, path):
+    """Returns True if path is a field path with one value per row, crossing no to-many relations"""
+    for part in path.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except Exception:
+            return False
+        if field.many_to_many or field.one_to_many:
+            return False
+        if field.is_relation:
+            opts = field.related_model._meta
+    return True
+
+
+def get_seek_filter(keys, row, reverse=False):
+    """Returns a Q matching the rows that come after row in the ordering keys,
+    or before it if reverse is True. Nulls sort as Postgres sorts them by default:
+    last in ascending order and first in descending order."""
+    seek = Q(pk__in=[])
+    equal = Q()
+    for name, descending in keys:
+        value = row[name]
+        descending = descending != reverse
+        # Postgres puts nulls last in ascending order, so reversing the ordering also moves them
+        nulls_after = not descending
+        if value is None:
+            # Only non null values come after a null, and only when nulls sort first
+            after = Q(**{f"{name}__isnull": False}) if not nulls_after else Q(pk__in=[])
+            same = Q(**{f"{name}__isnull": True})
+        else:
+            after = Q(**{f"{name}__lt" if descending else f"{name}__gt": value})
+            if nulls_after:
+                after |= Q(**{f"{name}__isnull": True})
+            same = Q(**{name: value})
+        seek |= equal & after
+        equal &= same
+    return seek
+
+
+class KeysetPaginationMixin:
+    """Changelist mixin that pages with a cursor, the pk of a row next to the page, when one is given"""
+
+    cursor = None
+    cursor_is_before = False
+    next_cursor = None
+    previous_cursor = None
+    result_count_is_estimate = False
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        for var in [AFTER_VAR, BEFORE_VAR]:
+            lookup_params.pop(var, None)
+        return lookup_params
+
+    def get_queryset(self, request):
+        # The cursor isn't carried over to the links for sorting, filtering and searching
+        for var in [AFTER_VAR, BEFORE_VAR]:
+            value = self.params.pop(var, None)
+            if value is not None and self.cursor is None:
+                try:
+                    self.cursor = self.lookup_opts.pk.to_python(value)
+                    self.cursor_is_before = var == BEFORE_VAR
+                except ValidationError:
+                    pass
+        return super().get_queryset(request)
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.result_count_is_estimate = getattr(self.paginator, "is_estimate", False)
+        keys = get_keyset_ordering(self.queryset)
+        if keys is None or self.show_all or (self.cursor is None and not self.multi_page):
+            return
+
+        queryset = self.queryset
+        if self.cursor is not None:
+            cursor_row = self.get_rows(keys, [self.cursor]).get(self.cursor)
+            if cursor_row is not None:
+                seek = get_seek_filter(keys, cursor_row, reverse=self.cursor_is_before)
+                if self.cursor_is_before:
+                    pks = queryset.filter(seek).reverse().values_list("pk", flat=True)[: self.list_per_page]
+                    self.result_list = queryset.filter(pk__in=list(pks))
+                else:
+                    self.result_list = queryset.filter(seek)[: self.list_per_page]
+
+        # The template shows the same rows, so this doesn't query them again
+        rows = list(self.result_list)
+        if not rows:
+            return
+        first_pk, last_pk = rows[0].pk, rows[-1].pk
+        row_values = self.get_rows(keys, [first_pk, last_pk])
+        if last_pk in row_values and queryset.filter(get_seek_filter(keys, row_values[last_pk])).exists():
+            self.next_cursor = last_pk
+        if first_pk in row_values and queryset.filter(get_seek_filter(keys, row_values[first_pk], True)).exists():
+            self.previous_cursor = first_pk
+
+    def get_rows(self, keys, pks) -> dict:
+        """Returns the ordering values of the rows with the given primary keys, by primary key.
+        Rows that aren't in the results are left out."""
+        pk_name = self.lookup_opts.pk.name
+        names = [name for name, _ in keys]
+        return {row[pk_name]: row for row in self.queryset.filter(pk__in=pks).values(*names)}
+
+    @property
+    def keyset_pagination(self):
+        return self.next_cursor is not None or self.previous_cursor is not None
+
+    def get_next_page_url(self):
+        return self.get_query_string({AFTER_VAR: self.next_cursor}, ["p", BEFORE_VAR])
+
+    def get_previous_page_url(self):
+        return self.get_query_string({BEFORE_VAR: self.previous_cursor}, ["p", AFTER_VAR])
+
+    def get_first_page_url(self):
+        return self.get_query_string(remove=["p", AFTER_VAR, BEFORE_VAR])
+
+
+@functools.cache
+def get_keyset_changelist(changelist_class):
+    """Returns changelist_class with keyset pagination"""
+    return type(f"Keyset{changelist_class.__name__}", (KeysetPaginationMixin, changelist_class), {})
+
+
+class LargeTableAdminMixin:
+    """ModelAdmin mixin for the changelists of large tables: estimated counts and keyset pagination"""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return get_keyset_changelist(super().get_changelist(request, **kwargs))
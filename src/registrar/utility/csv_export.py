@@ -37,6 +37,7 @@ from django.contrib.postgres.aggregates import ArrayAgg, StringAgg
 from django.contrib.admin.models import LogEntry, ADDITION
 from django.contrib.contenttypes.models import ContentType
 from registrar.models.utility.generic_helper import convert_queryset_to_dict
+from registrar.models.utility.converted_fields import converted_field_annotations
 from registrar.templatetags.custom_filters import get_region
 from registrar.utility.constants import BranchChoices
 from registrar.utility.enums import DefaultEmail, DefaultUserValues
@@ -544,6 +545,7 @@ class DomainExport(BaseExport):
         # This is for performance purposes. Since we are working with dictionary values and not
         # model objects as we export data, trying to reinstate model objects in order to grab @property
         # values negatively impacts performance.  Therefore, we will follow best practice and use annotations
+        converted_fields = converted_field_annotations()
         return {
             "converted_org_type": Case(
                 # When portfolio is present and is_election_board is True
@@ -564,34 +566,10 @@ class DomainExport(BaseExport):
                 default=F("organization_type"),
                 output_field=CharField(),
             ),
-            "converted_federal_agency": Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__agency"),
-                ),
-                # Otherwise, return the natively assigned value
-                default=F("federal_agency__agency"),
-                output_field=CharField(),
-            ),
-            "converted_federal_type": Case(
-                # When portfolio is present, use its value instead
-                # NOTE: this is an @Property funciton in portfolio.
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return the federal type from federal agency
-                default=F("federal_agency__federal_type"),
-                output_field=CharField(),
-            ),
-            "converted_organization_name": Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__organization_name")),
-                # Otherwise, return the natively assigned value
-                default=F("organization_name"),
-                output_field=CharField(),
-            ),
+            # These converted values are stored on each record, see converted_fields.py
+            "converted_federal_agency": converted_fields["converted_federal_agency"],
+            "converted_federal_type": converted_fields["converted_federal_type"],
+            "converted_organization_name": converted_fields["converted_organization_name"],
             "converted_so_email": Case(
                 # When portfolio is present, use its value instead
                 When(portfolio__isnull=False, then=F("portfolio__senior_official__email")),
@@ -794,16 +772,8 @@ class DomainExport(BaseExport):
     def get_filtered_domain_infos_by_org(domain_infos_to_filter, org_to_filter_by):
         """Returns a list of Domain Requests that has been filtered by the given organization value."""
 
-        annotated_queryset = domain_infos_to_filter.annotate(
-            converted_generic_org_type=Case(
-                # Recreate the logic of the converted_generic_org_type property
-                # here in annotations
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                default=F("generic_org_type"),
-                output_field=CharField(),
-            )
-        )
-        return annotated_queryset.filter(converted_generic_org_type=org_to_filter_by)
+        # The converted generic org type is stored on each record, see converted_fields.py
+        return domain_infos_to_filter.filter(effective_generic_org_type=org_to_filter_by)
 
     @classmethod
     def get_sliced_domains(cls, filter_condition):
@@ -1602,16 +1572,8 @@ class DomainRequestExport(BaseExport):
 
     def get_filtered_domain_requests_by_org(domain_requests_to_filter, org_to_filter_by):
         """Returns a list of Domain Requests that has been filtered by the given organization value"""
-        annotated_queryset = domain_requests_to_filter.annotate(
-            converted_generic_org_type=Case(
-                # Recreate the logic of the converted_generic_org_type property
-                # here in annotations
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                default=F("generic_org_type"),
-                output_field=CharField(),
-            )
-        )
-        return annotated_queryset.filter(converted_generic_org_type=org_to_filter_by)
+        # The converted generic org type is stored on each record, see converted_fields.py
+        return domain_requests_to_filter.filter(effective_generic_org_type=org_to_filter_by)
 
         # return domain_requests_to_filter.filter(
         #     # Filter based on the generic org value returned by converted_generic_org_type
@@ -1633,55 +1595,8 @@ class DomainRequestExport(BaseExport):
         # model objects as we export data, trying to reinstate model objects in order to grab @property
         # values negatively impacts performance.  Therefore, we will follow best practice and use annotations
         return {
-            "converted_generic_org_type": Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                # Otherwise, return the natively assigned value
-                default=F("generic_org_type"),
-                output_field=CharField(),
-            ),
-            "converted_federal_agency": Case(
-                # When portfolio is present, use its value instead
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__agency"),
-                ),
-                # Otherwise, return the natively assigned value
-                default=F("federal_agency__agency"),
-                output_field=CharField(),
-            ),
-            "converted_federal_type": Case(
-                # When portfolio is present, use its value instead
-                # NOTE: this is an @Property funciton in portfolio.
-                When(
-                    Q(portfolio__isnull=False) & Q(portfolio__federal_agency__isnull=False),
-                    then=F("portfolio__federal_agency__federal_type"),
-                ),
-                # Otherwise, return the federal type from federal agency
-                default=F("federal_agency__federal_type"),
-                output_field=CharField(),
-            ),
-            "converted_organization_name": Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__organization_name")),
-                # Otherwise, return the natively assigned value
-                default=F("organization_name"),
-                output_field=CharField(),
-            ),
-            "converted_city": Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__city")),
-                # Otherwise, return the natively assigned value
-                default=F("city"),
-                output_field=CharField(),
-            ),
-            "converted_state_territory": Case(
-                # When portfolio is present, use its value instead
-                When(portfolio__isnull=False, then=F("portfolio__state_territory")),
-                # Otherwise, return the natively assigned value
-                default=F("state_territory"),
-                output_field=CharField(),
-            ),
+            # The converted organization values are stored on each request, see converted_fields.py
+            **converted_field_annotations(),
             "converted_suborganization_name": Case(
                 # When sub_organization is present, use its name
                 When(sub_organization__isnull=False, then=F("sub_organization__name")),
@@ -3,16 +3,21 @@
 import boto3
 import logging
 import textwrap
+import threading
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from django.apps import apps
 from django.conf import settings
+from django.db import connections, transaction
 from django.template.loader import get_template
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from waffle import flag_is_active
 
+from registrar.utility.request_metrics import SES, timed
+
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,7 @@ def send_templated_email(  # noqa
     attachment_file=None,
     wrap_email=False,
     cc_addresses: list[str] = [],
+    ses_client=None,
 ):
     """Send an email built from a template.
 
@@ -64,6 +70,9 @@ def send_templated_email(  # noqa
     cc_addresses is a list and can contain many addresses. Emails not in the
     allow list (if applicable) will be filtered out before sending.
 
+    ses_client is an SES client to send with, to reuse one across emails. One is
+    made for the email if not given.
+
     template_name and subject_template_name are relative to the same template
     context as Django's HTML templates. context gives additional information
     that the template may use.
@@ -76,8 +85,23 @@ def send_templated_email(  # noqa
     if context is None:
         context = {}
 
-    to_addresses = _normalize_and_flatten_email_list(to_addresses)
+    _send_email(
+        lambda: render_templated_email(template_name, subject_template_name, context),
+        to_addresses,
+        bcc_address=bcc_address,
+        attachment_file=attachment_file,
+        wrap_email=wrap_email,
+        cc_addresses=cc_addresses,
+        ses_client=ses_client,
+    )
 
+
+def render_templated_email(template_name: str, subject_template_name: str, context: dict) -> tuple[str, str]:
+    """Returns the subject and body of an email built from a template.
+
+    Outside production, the subject is prefixed with the environment name, and
+    manage.get.gov links in context point to the current environment.
+    """
     env_base_url = settings.BASE_URL
     # The regular expression is to get both http (localhost) and https (everything else)
     env_name = re.sub(r"^https?://", "", env_base_url).split(".")[0]
@@ -90,6 +114,44 @@ def send_templated_email(  # noqa
 
     context["manage_url"] = manage_url
 
+    template = get_template(template_name)
+    email_body = template.render(context=context)
+
+    # Do cleanup on the email body. For emails with custom content.
+    if email_body:
+        email_body.strip().lstrip("\n")
+
+    # Update the subject to have prefix here versus every email
+    subject_template = get_template(subject_template_name)
+    subject = subject_template.render(context=context)
+    return f"{prefix}{subject}", email_body
+
+
+def send_email(subject: str, email_body: str, to_addresses: list[str], cc_addresses: list[str] = [], ses_client=None):
+    """Send an email whose subject and body are already rendered, such as by
+    render_templated_email. to_addresses, cc_addresses and ses_client are as for
+    send_templated_email.
+
+    Raises EmailSendingError if:
+        SES client could not be accessed
+        No valid recipient addresses are provided
+    """
+    _send_email(lambda: (subject, email_body), to_addresses, cc_addresses=cc_addresses, ses_client=ses_client)
+
+
+def _send_email(  # noqa
+    render,
+    to_addresses: list[str] | str,
+    bcc_address: str = "",
+    attachment_file=None,
+    wrap_email=False,
+    cc_addresses: list[str] = [],
+    ses_client=None,
+):
+    """Sends the email whose subject and body render() returns. It is only rendered
+    once the addresses are known to be allowed."""
+    to_addresses = _normalize_and_flatten_email_list(to_addresses)
+
     # by default assume we can send to all addresses (prod has no allowlist)
     sendable_cc_addresses = cc_addresses
     sendable_to_addresses = to_addresses
@@ -109,30 +171,11 @@ def send_templated_email(  # noqa
         if blocked_cc_addresses:
             logger.warning("Some CC'ed addresses were removed: %s.", blocked_cc_addresses)
 
-    template = get_template(template_name)
-    email_body = template.render(context=context)
-
-    # Do cleanup on the email body. For emails with custom content.
-    if email_body:
-        email_body.strip().lstrip("\n")
-
-    # Update the subject to have prefix here versus every email
-    subject_template = get_template(subject_template_name)
-    subject = subject_template.render(context=context)
-    subject = f"{prefix}{subject}"
+    subject, email_body = render()
 
-    try:
-        ses_client = boto3.client(
-            "sesv2",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=settings.BOTO_CONFIG,
-        )
-        logger.info(f"Connected to SES client! Template name: {template_name} to {sendable_to_addresses}")
-    except Exception as exc:
-        logger.debug("E-mail unable to send! Could not access the SES client.")
-        raise EmailSendingError("Could not access the SES client.") from exc
+    if ses_client is None:
+        ses_client = _get_ses_client()
+    logger.info(f"Connected to SES client! Subject: {subject} to {sendable_to_addresses}")
 
     destination = {}
     if to_addresses:
@@ -154,16 +197,17 @@ def send_templated_email(  # noqa
             if wrap_email:
                 email_body = wrap_text_and_preserve_paragraphs(email_body, width=80)
 
-            ses_client.send_email(
-                FromEmailAddress=settings.DEFAULT_FROM_EMAIL,
-                Destination=destination,
-                Content={
-                    "Simple": {
-                        "Subject": {"Data": subject},
-                        "Body": {"Text": {"Data": email_body}},
+            with timed(SES):
+                ses_client.send_email(
+                    FromEmailAddress=settings.DEFAULT_FROM_EMAIL,
+                    Destination=destination,
+                    Content={
+                        "Simple": {
+                            "Subject": {"Data": subject},
+                            "Body": {"Text": {"Data": email_body}},
+                        },
                     },
-                },
-            )
+                )
             logger.info(
                 "Email sent to [%s], bcc [%s], cc %s", sendable_to_addresses, bcc_address, sendable_cc_addresses
             )
@@ -189,6 +233,161 @@ def send_templated_email(  # noqa
         raise EmailSendingError("Could not send SES email.") from exc
 
 
+@dataclass
+class TemplatedEmail:
+    """An email built from a template, for send_templated_emails"""
+
+    template_name: str
+    subject_template_name: str
+    to_addresses: list[str]
+    context: dict = field(default_factory=dict)
+    cc_addresses: list[str] = field(default_factory=list)
+
+
+def send_templated_emails(emails: list[TemplatedEmail]) -> list[tuple[TemplatedEmail, EmailSendingError]]:
+    """Send many emails built from templates over one SES client.
+
+    An email that fails to send doesn't stop the others. Returns each email
+    that failed, with its error.
+
+    Raises EmailSendingError if the SES client could not be accessed.
+    """
+    if not emails:
+        return []
+    ses_client = _get_ses_client()
+    failures = []
+    for email in emails:
+        try:
+            send_templated_email(
+                email.template_name,
+                email.subject_template_name,
+                to_addresses=email.to_addresses,
+                cc_addresses=email.cc_addresses,
+                context=email.context,
+                ses_client=ses_client,
+            )
+        except EmailSendingError as err:
+            failures.append((email, err))
+    return failures
+
+
+def queue_templated_emails(emails: list[TemplatedEmail]) -> list:
+    """Renders emails built from templates and saves them as QueuedEmails, to be sent by
+    send_queued_emails. They are saved in the current transaction, so they are only
+    queued if the changes they are about are saved too.
+
+    Raises EmailSendingError if an email could not be rendered.
+    """
+    QueuedEmail = apps.get_model("registrar", "QueuedEmail")
+    queued_emails = []
+    for email in emails:
+        try:
+            subject, body = render_templated_email(email.template_name, email.subject_template_name, email.context)
+        except Exception as exc:
+            raise EmailSendingError(f"Could not render email {email.template_name}.") from exc
+        queued_emails.append(
+            QueuedEmail(subject=subject, body=body, to_addresses=email.to_addresses, cc_addresses=email.cc_addresses)
+        )
+    return QueuedEmail.objects.bulk_create(queued_emails)
+
+
+def send_queued_emails(ids=None) -> tuple[int, int]:
+    """Sends the pending QueuedEmails, or those of them in ids, over one SES client.
+
+    Each email is locked while it is sent, so that an email being sent by one process is
+    skipped by the others. Sent emails are deleted. An email that fails to send stays pending
+    for the next run, until it has been tried QueuedEmail.MAX_ATTEMPTS times.
+
+    Returns the number of emails sent, and the number that failed.
+    """
+    QueuedEmail = apps.get_model("registrar", "QueuedEmail")
+    pending = QueuedEmail.objects.filter(status=QueuedEmail.Status.PENDING)
+    if ids is not None:
+        pending = pending.filter(id__in=ids)
+
+    sent = 0
+    failed = 0
+    ses_client = None
+    for queued_email_id in pending.order_by("id").values_list("id", flat=True):
+        with transaction.atomic():
+            queued_email = (
+                QueuedEmail.objects.select_for_update(skip_locked=True)
+                .filter(id=queued_email_id, status=QueuedEmail.Status.PENDING)
+                .first()
+            )
+            if queued_email is None:
+                # Sent, or being sent, by another process
+                continue
+            try:
+                if ses_client is None:
+                    ses_client = _get_ses_client()
+                send_email(
+                    queued_email.subject,
+                    queued_email.body,
+                    to_addresses=queued_email.to_addresses,
+                    cc_addresses=queued_email.cc_addresses,
+                    ses_client=ses_client,
+                )
+            except EmailSendingError as err:
+                queued_email.record_failure(err)
+                failed += 1
+                logger.error(
+                    "Failed to send queued email:\n"
+                    f"  Subject: {queued_email.subject}\n"
+                    f"  To: {queued_email.to_addresses}\n"
+                    f"  Attempts: {queued_email.attempts}\n"
+                    f"  Error: {err}",
+                    exc_info=err,
+                )
+            else:
+                queued_email.delete()
+                sent += 1
+    return sent, failed
+
+
+def send_templated_emails_later(emails: list[TemplatedEmail]):
+    """Queue many emails built from templates, and send them on a background thread once
+    the current transaction commits, so that the request doesn't wait for them.
+
+    Under the gevent worker class the thread is a greenlet. Emails that the thread doesn't
+    send, because sending failed or the process stopped, are left queued for the
+    send_queued_emails command to retry.
+
+    Raises EmailSendingError if an email could not be rendered.
+    """
+    if not emails:
+        return
+    ids = [queued_email.id for queued_email in queue_templated_emails(emails)]
+    transaction.on_commit(
+        lambda: threading.Thread(target=_send_queued_emails_in_background, args=(ids,), name="email-batch").start()
+    )
+
+
+def _send_queued_emails_in_background(ids):
+    try:
+        send_queued_emails(ids)
+    except Exception:
+        logger.exception("Failed to send queued emails in the background, they are left for send_queued_emails")
+    finally:
+        # The thread has its own database connections
+        connections.close_all()
+
+
+def _get_ses_client():
+    """Returns an SES client. Raises EmailSendingError if it could not be accessed."""
+    try:
+        return boto3.client(
+            "sesv2",
+            region_name=settings.AWS_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=settings.BOTO_CONFIG,
+        )
+    except Exception as exc:
+        logger.debug("E-mail unable to send! Could not access the SES client.")
+        raise EmailSendingError("Could not access the SES client.") from exc
+
+
 def _can_send_email(to_addresses, bcc_address):
     """Raises an EmailSendingError if we cannot send an email. Does nothing otherwise."""
 
@@ -288,6 +487,9 @@ def send_email_with_attachment(sender, recipient, subject, body, attachment_file
     attachment_part.add_header("Content-Disposition", f'attachment; filename="{current_filename}"')
     msg.attach(attachment_part)
 
-    response = ses_client.send_raw_email(Source=sender, Destinations=recipient, RawMessage={"Data": msg.as_string()})
+    with timed(SES):
+        response = ses_client.send_raw_email(
+            Source=sender, Destinations=recipient, RawMessage={"Data": msg.as_string()}
+        )
 
     return response
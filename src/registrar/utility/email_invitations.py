@@ -13,7 +13,12 @@ from registrar.utility.errors import (
     OutsideOrgMemberError,
 )
 from registrar.utility.waffle import flag_is_active_for_user
-from registrar.utility.email import EmailSendingError, send_templated_email
+from registrar.utility.email import (
+    EmailSendingError,
+    TemplatedEmail,
+    send_templated_email,
+    send_templated_emails_later,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -107,7 +112,12 @@ def _send_domain_invitation_email(email, requestor_email, domains, requested_use
 
 
 def send_domain_invitation_email(
-    email: str, requestor, domains: Domain | list[Domain], is_member_of_different_org, requested_user=None
+    email: str,
+    requestor,
+    domains: Domain | list[Domain],
+    is_member_of_different_org,
+    requested_user=None,
+    notify_domain_managers=True,
 ):
     """
     Sends a domain invitation email to the specified address.
@@ -118,6 +128,8 @@ def send_domain_invitation_email(
         domains (Domain or list of Domain): The domain objects for which the invitation is being sent.
         is_member_of_different_org (bool): if an email belongs to a different org
         requested_user (User | None): The recipient if the email belongs to a user in the registrar
+        notify_domain_managers (bool): Whether to email the managers of the domains. Callers that
+            queue those emails with queue_domain_invitation_update_emails_to_domain_managers pass False.
 
     Returns:
         Boolean indicating if all messages were sent successfully.
@@ -136,6 +148,9 @@ def send_domain_invitation_email(
 
     _send_domain_invitation_email(email, requestor_email, domains, requested_user)
 
+    if not notify_domain_managers:
+        return True
+
     all_manager_emails_sent = True
     # send emails to domain managers
     for domain in domains:
@@ -250,6 +265,88 @@ def send_domain_manager_removal_emails_to_domain_managers(
     return all_emails_sent
 
 
+def queue_domain_invitation_update_emails_to_domain_managers(
+    email: str, requestor, domains: list[Domain], requested_user=None
+):
+    """
+    Notifies the managers of the domains that email was invited to them, with one email
+    per manager listing the domains they manage, sent once the current transaction commits.
+
+    Args:
+        email (str): The email address invited.
+        requestor (User): The user initiating the invitation.
+        domains (list of Domain): The domains email was invited to.
+        requested_user (User | None): The user invited, who isn't notified if already a manager.
+
+    Raises:
+        MissingEmailError: If the requestor has no email associated with their account.
+    """
+    requestor_email = _get_requestor_email(requestor, domains=domains)
+    _queue_emails_to_domain_managers(
+        domains,
+        "emails/domain_manager_notification.txt",
+        "emails/domain_manager_notification_subject.txt",
+        context={
+            "requestor_email": requestor_email,
+            "invited_email_address": email,
+            "date": date.today(),
+        },
+        excluded_user=requested_user,
+    )
+
+
+def queue_domain_manager_removal_emails_to_domain_managers(
+    removed_by_user: User,
+    manager_removed: User | None,
+    manager_removed_email: str,
+    domains: list[Domain],
+):
+    """
+    Notifies the managers of the domains that a domain manager was removed from them, with
+    one email per manager listing the domains they manage, sent once the current transaction commits.
+
+    Args:
+        removed_by_user(User): The user who initiated the removal.
+        manager_removed(User): The user being removed, who isn't notified.
+        manager_removed_email(str): The email of the user being removed (in case no User).
+        domains(list of Domain): The domains the user is being removed from.
+    """
+    _queue_emails_to_domain_managers(
+        domains,
+        "emails/domain_manager_deleted_notification.txt",
+        "emails/domain_manager_deleted_notification_subject.txt",
+        context={
+            "removed_by": removed_by_user,
+            "manager_removed_email": manager_removed_email,
+            "date": date.today(),
+        },
+        excluded_user=manager_removed,
+    )
+
+
+def _queue_emails_to_domain_managers(domains, template_name, subject_template_name, context, excluded_user=None):
+    """Queues one email to each manager of the domains, about those of the domains they manage.
+    The managers of all the domains are looked up in one query."""
+    user_domain_roles = UserDomainRole.objects.filter(domain__in=domains, user__isnull=False)
+    if excluded_user:
+        user_domain_roles = user_domain_roles.exclude(user=excluded_user)
+    domains_by_manager: dict[User, list[Domain]] = {}
+    for user_domain_role in user_domain_roles.select_related("user", "domain").order_by("domain__name"):
+        domains_by_manager.setdefault(user_domain_role.user, []).append(user_domain_role.domain)
+
+    emails = []
+    for manager, manager_domains in domains_by_manager.items():
+        manager_context = {**context, "domain_manager": manager}
+        if len(manager_domains) == 1:
+            manager_context["domain"] = manager_domains[0]
+        else:
+            manager_context["domains"] = manager_domains
+        emails.append(
+            TemplatedEmail(template_name, subject_template_name, to_addresses=[manager.email], context=manager_context)
+        )
+    send_templated_emails_later(emails)
+
+
 def send_domain_manager_on_hold_email_to_domain_managers(domain: Domain, requestor):
     """
     Notifies all domain managers that a domain they are a domain manager
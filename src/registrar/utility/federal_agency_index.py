@@ -0,0 +1,155 @@
+"""
+Process-wide matcher index over FederalAgency names.
+
+The index generates the name variants of every FederalAgency once, so exact and
+variant lookups are dict probes and fuzzy lookups only score against a prebuilt
+candidate list. Fuzzy results are memoized per search term.
+
+The index is rebuilt lazily after FederalAgency records change. The post_save and
+post_delete receivers in registrar/signals.py drop the local copy and bump a version
+stamp in the shared cache, which tells other processes to rebuild theirs.
+Queryset .update() and bulk_create() do not send signals, so scripts that use them
+should call invalidate_federal_agency_index() themselves.
+"""
+
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.core.cache import cache
+from django.db import transaction
+
+from registrar.management.commands.utility.fuzzy_string_matcher import (
+    MatchResult,
+    create_federal_agency_matcher,
+)
+from registrar.models.federal_agency import FederalAgency
+from registrar.models.utility.generic_helper import normalize_string
+
+logger = logging.getLogger(__name__)
+
+FEDERAL_AGENCY_INDEX_VERSION_KEY = "federal_agency_index_version"
+
+_federal_agency_index = None
+_federal_agency_index_lock = threading.Lock()
+
+
+class FederalAgencyIndex:
+    """Prebuilt lookup structures for matching free text against FederalAgency.agency."""
+
+    # Upper bound on memoized fuzzy lookups. Admin search terms are arbitrary input,
+    # so the memo is cleared once it reaches this size.
+    MAX_CACHED_LOOKUPS = 4096
+
+    def __init__(self, agencies: Iterable[tuple], threshold: int = 85, version: Optional[str] = None):
+        """
+        Args:
+            agencies: (id, agency name) pairs. When names repeat, the first id wins.
+            threshold: Fuzzy matching threshold passed to create_federal_agency_matcher
+            version: Cache version stamp the index was built against
+        """
+        self.version = version
+        self.matcher = create_federal_agency_matcher(threshold)
+        self.agency_ids_by_name: Dict[str, int] = {}
+        self.names_by_variant: Dict[str, Set[str]] = defaultdict(set)
+        for agency_id, agency_name in agencies:
+            if not agency_name or agency_name in self.agency_ids_by_name:
+                continue
+            self.agency_ids_by_name[agency_name] = agency_id
+            for variant in self.matcher.variant_generator.generate_variants(agency_name):
+                self.names_by_variant[variant].add(agency_name)
+        self.candidates: List[str] = sorted(self.agency_ids_by_name)
+        self._fuzzy_results: Dict[str, MatchResult] = {}
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def find_exact_matches(self, agency_name: str) -> Set[str]:
+        """Returns the agency names whose precomputed variants include agency_name."""
+        if not agency_name:
+            return set()
+        return set(self.names_by_variant.get(normalize_string(agency_name), ()))
+
+    def find_matches(self, agency_name: str) -> MatchResult:
+        """Returns the fuzzy MatchResult (with details) for agency_name against every agency."""
+        return self.batch_find_matches([agency_name])[agency_name]
+
+    def batch_find_matches(self, agency_names: List[str]) -> Dict[str, MatchResult]:
+        """Returns fuzzy MatchResults for many names, scoring only names not seen before."""
+        missing = sorted({name for name in agency_names if name and name not in self._fuzzy_results})
+        if missing:
+            if len(self._fuzzy_results) + len(missing) > self.MAX_CACHED_LOOKUPS:
+                self._fuzzy_results.clear()
+            self._fuzzy_results.update(self.matcher.batch_find_matches(missing, self.candidates))
+        return {name: self._fuzzy_results.get(name) or MatchResult(matched_strings=set()) for name in agency_names}
+
+    def find_exact_match(self, agency_name: str) -> Optional[str]:
+        """Returns the agency name with the same normalized name as agency_name, else the
+        only agency name that agency_name is a variant of, or None."""
+        exact_matches = self.find_exact_matches(agency_name)
+        normalized_name = normalize_string(agency_name) if agency_name else ""
+        same_name = sorted(name for name in exact_matches if normalize_string(name) == normalized_name)
+        if same_name:
+            return same_name[0]
+        if len(exact_matches) == 1:
+            return next(iter(exact_matches))
+        return None
+
+    def find_best_match(self, agency_name: str) -> Optional[str]:
+        """
+        Returns the single agency name that best matches agency_name, or None.
+
+        Preference order: same normalized name, a unique variant hit, then the highest
+        fuzzy score (ties broken alphabetically so results are stable).
+        """
+        exact_match = self.find_exact_match(agency_name)
+        if exact_match:
+            return exact_match
+
+        details = self.find_matches(agency_name).match_details
+        if not details:
+            return None
+        best_match, _, _ = min(details, key=lambda detail: (-detail[1], detail[0]))
+        return best_match
+
+    def get_agency_id(self, agency_name: str, fuzzy: bool = True) -> Optional[int]:
+        """Returns the id of the FederalAgency that best matches agency_name, or None.
+        With fuzzy=False, only exact and variant matches are returned."""
+        best_match = self.find_best_match(agency_name) if fuzzy else self.find_exact_match(agency_name)
+        return self.agency_ids_by_name.get(best_match) if best_match else None
+
+    def find_agency_ids(self, search_term: str) -> Set[int]:
+        """Returns the ids of every FederalAgency that matches search_term exactly, by variant or fuzzily."""
+        matched_names = self.find_exact_matches(search_term) | self.find_matches(search_term).matched_strings
+        return {self.agency_ids_by_name[name] for name in matched_names}
+
+
+def get_federal_agency_index() -> FederalAgencyIndex:
+    """Returns this process's FederalAgencyIndex, building it on first use or after FederalAgency changes."""
+    global _federal_agency_index
+    version = cache.get(FEDERAL_AGENCY_INDEX_VERSION_KEY)
+    index = _federal_agency_index
+    if index is not None and index.version == version:
+        return index
+
+    with _federal_agency_index_lock:
+        index = _federal_agency_index
+        if index is None or index.version != version:
+            agencies = FederalAgency.objects.filter(agency__isnull=False).order_by("id").values_list("id", "agency")
+            index = FederalAgencyIndex(agencies, version=version)
+            _federal_agency_index = index
+            logger.debug(f"Built federal agency index with {len(index)} agencies")
+    return index
+
+
+def invalidate_federal_agency_index():
+    """
+    Drops this process's index right away and, once the current transaction commits,
+    bumps the shared version stamp so that other processes rebuild theirs too.
+    """
+    global _federal_agency_index
+    with _federal_agency_index_lock:
+        _federal_agency_index = None
+    transaction.on_commit(lambda: cache.set(FEDERAL_AGENCY_INDEX_VERSION_KEY, uuid.uuid4().hex, timeout=None))
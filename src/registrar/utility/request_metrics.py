@@ -0,0 +1,128 @@
+"""
+Per-request performance metrics that work with DEBUG off.
+
+RequestMetricsMiddleware collects a RequestMetrics for each request, which counts and times:
+
+- database queries, through connection.execute_wrapper. Django only fills in
+  connection.queries when DEBUG is on, so it can't be used in production.
+- registry (EPP) commands, SES emails and S3 calls, wherever they are wrapped in timed()
+
+Outside production, each response gets a Server-Timing header with the totals, which browser
+developer tools show next to the request (REQUEST_METRICS_SERVER_TIMING). A one line summary
+is logged for a sample of requests (REQUEST_METRICS_SAMPLE_RATE), and for every request slower
+than REQUEST_METRICS_SLOW_MS.
+"""
+
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# What time is spent on, in the order they are reported
+DB = "db"
+EPP = "epp"
+SES = "ses"
+S3 = "s3"
+CATEGORIES = [DB, EPP, SES, S3]
+
+_current_metrics: ContextVar["RequestMetrics | None"] = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """The calls made while handling one request, and the time they took, by category"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.counts = dict.fromkeys(CATEGORIES, 0)
+        self.durations_ms = dict.fromkeys(CATEGORIES, 0.0)
+
+    def record(self, category, duration_ms):
+        self.counts[category] += 1
+        self.durations_ms[category] += duration_ms
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Times each query (see connection.execute_wrapper)"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(DB, (time.perf_counter() - start) * 1000)
+
+    def server_timing(self):
+        """Returns the value of a Server-Timing header with the time spent in each category"""
+        entries = [
+            f'{category};dur={self.durations_ms[category]:.1f};desc="{self.counts[category]} calls"'
+            for category in CATEGORIES
+            if self.counts[category]
+        ]
+        entries.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(entries)
+
+    def summary(self, request, response) -> dict:
+        """Returns the metrics of the request as a flat dict, for logging"""
+        match = getattr(request, "resolver_match", None)
+        summary = {
+            "req_id": request.META.get("HTTP_X_REQUEST_ID", "unknown"),
+            "method": request.method,
+            # The url pattern groups requests by endpoint, whatever the ids in the path
+            "endpoint": match.view_name if match else None,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(self.elapsed_ms(), 1),
+        }
+        for category in CATEGORIES:
+            summary[f"{category}_calls"] = self.counts[category]
+            summary[f"{category}_ms"] = round(self.durations_ms[category], 1)
+        return summary
+
+
+def get_current_metrics() -> RequestMetrics | None:
+    """Returns the metrics of the request being handled, or None outside of a request"""
+    return _current_metrics.get()
+
+
+@contextmanager
+def timed(category):
+    """Records the time the block takes against the request being handled, if there is one"""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record(category, (time.perf_counter() - start) * 1000)
+
+
+@contextmanager
+def collect_request_metrics():
+    """Collects the metrics of everything done in the block, on this thread"""
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def log_request_metrics(request, response, metrics):
+    """Logs a summary of the request if it is slow, or is in the sample"""
+    slow = metrics.elapsed_ms() >= settings.REQUEST_METRICS_SLOW_MS
+    if not slow and random.random() >= settings.REQUEST_METRICS_SAMPLE_RATE:  # nosec
+        return
+    summary = metrics.summary(request, response)
+    message = ", ".join(f"{key}={value}" for key, value in summary.items())
+    logger.info(f"REQUEST_METRICS: {message}", extra={"request_metrics": summary})
@@ -24,6 +24,7 @@ from registrar.models import DomainRequest
 from registrar.models.contact import Contact
 from registrar.models.user import User
 from registrar.views.utility import StepsHelper
+from registrar.views.utility.wizard_storage import WizardState, get_wizard_state_store
 from registrar.utility.enums import Step, PortfolioDomainRequestStep
 from registrar.views.utility.invitation_helper import get_org_membership
 from ..utility.email import send_templated_email, EmailSendingError
@@ -142,15 +143,29 @@ class DomainRequestWizard(TemplateView):
     }
     # endregion
 
+    # Related rows that the step conditions and forms read, loaded with the domain request
+    DOMAIN_REQUEST_RELATED = [
+        "requested_domain",
+        "senior_official",
+        "federal_agency",
+        "portfolio",
+        "sub_organization",
+    ]
+    DOMAIN_REQUEST_PREFETCHED = ["current_websites", "other_contacts"]
+
     def __init__(self):
         super().__init__()
         self.titles = {}
         self.wizard_conditions = {}
         self.unlocking_steps = {}
         self.steps = None
+        # Derived step data, such as the unlocked steps, is kept here
+        # for the length of a request. See dispatch and cached_step_data.
+        self._step_cache: dict | None = None
         # Configure titles, wizard_conditions, unlocking_steps, and steps
         self.configure_step_options()
         self._domain_request = None  # for caching
+        self._storage = None  # loaded on first access, see storage
         self.kwargs = {}
 
     def configure_step_options(self):
@@ -173,6 +188,7 @@ class DomainRequestWizard(TemplateView):
             self.wizard_conditions = self.REGULAR_WIZARD_CONDITIONS
             self.unlocking_steps = self.REGULAR_UNLOCKING_STEPS
         self.steps = StepsHelper(self)
+        self.clear_step_cache()
 
     def has_pk(self):
         """Does this wizard know about a DomainRequest database record?"""
@@ -215,9 +231,13 @@ class DomainRequestWizard(TemplateView):
 
         if self.has_pk():
             try:
-                self._domain_request = DomainRequest.objects.get(
-                    requester=requester,
-                    pk=self.kwargs.get("domain_request_pk"),
+                self._domain_request = (
+                    DomainRequest.objects.select_related(*self.DOMAIN_REQUEST_RELATED)
+                    .prefetch_related(*self.DOMAIN_REQUEST_PREFETCHED)
+                    .get(
+                        requester=requester,
+                        pk=self.kwargs.get("domain_request_pk"),
+                    )
                 )
                 return self._domain_request
             except DomainRequest.DoesNotExist:
@@ -238,26 +258,54 @@ class DomainRequestWizard(TemplateView):
         return self._domain_request
 
     @property
-    def storage(self):
-        # marking session as modified on every access
-        # so that updates to nested keys are always saved
-        # Also - check that self.request.session has the attr
-        # modified to account for test environments calling
-        # view methods
-        if hasattr(self.request.session, "modified"):
-            self.request.session.modified = True
-        return self.request.session.setdefault(self.prefix, {})
+    def storage(self) -> WizardState:
+        """The wizard's state, loaded once per request.
+        Changes, including to nested lists, are written back by save_storage."""
+        if self._storage is None:
+            self._storage = get_wizard_state_store().load(self.request, self.prefix)
+        return self._storage
 
     @storage.setter
     def storage(self, value):
-        self.request.session[self.prefix] = value
-        self.request.session.modified = True
+        del self.storage
+        self._storage.update(value)
 
     @storage.deleter
     def storage(self):
-        if self.prefix in self.request.session:
-            del self.request.session[self.prefix]
-            self.request.session.modified = True
+        get_wizard_state_store().delete(self.request, self.prefix)
+        self._storage = WizardState()
+
+    def save_storage(self):
+        """Writes the wizard's state back to its store, if it changed during this request"""
+        if self._storage is not None:
+            get_wizard_state_store().save(self.request, self.prefix, self._storage)
+
+    def dispatch(self, request, *args, **kwargs):
+        self._step_cache = {}
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            self.save_storage()
+            return response
+        finally:
+            self._step_cache = None
+
+    def cached_step_data(self, key, compute):
+        """Returns compute(), worked out once per request.
+
+        Step lists, unlocked steps and pending requests are read several times while
+        rendering a step. Outside of a request, such as when these methods are called
+        directly, nothing is cached.
+        """
+        if self._step_cache is None:
+            return compute()
+        if key not in self._step_cache:
+            self._step_cache[key] = compute()
+        return self._step_cache[key]
+
+    def clear_step_cache(self):
+        """Forgets the step data cached for this request, for when the steps or domain request change"""
+        if self._step_cache is not None:
+            self._step_cache = {}
 
     def done(self):
         """Called when the user clicks the submit button, if all forms are valid."""
@@ -404,31 +452,33 @@ class DomainRequestWizard(TemplateView):
     def pending_requests(self):
         """return an array of pending requests if user has pending requests
         and no approved requests"""
+        return self.cached_step_data("pending_requests", self._get_pending_requests)
+
+    def _get_pending_requests(self):
         if self.approved_domain_requests_exist() or self.approved_domains_exist():
             return []
         else:
-            return self.pending_domain_requests()
+            return list(self.pending_domain_requests().select_related("requested_domain"))
 
     def approved_domain_requests_exist(self):
         """Checks if user is requester of domain requests with DomainRequestStatus.APPROVED status"""
-        approved_domain_request_count = DomainRequest.objects.filter(
+        return DomainRequest.objects.filter(
             requester=self.request.user, status=DomainRequest.DomainRequestStatus.APPROVED
-        ).count()
-        return approved_domain_request_count > 0
+        ).exists()
 
     def approved_domains_exist(self):
         """Checks if user has permissions on approved domains
 
         This additional check is necessary to account for domains which were migrated
         and do not have a domain request"""
-        return self.request.user.permissions.count() > 0
+        return self.request.user.permissions.exists()
 
     def pending_domain_requests(self):
         """Returns a List of user's domain requests with one of the following states:
         DomainRequestStatus.SUBMITTED, DomainRequestStatus.IN_REVIEW, DomainRequestStatus.ACTION_NEEDED"""
         # if the current domain request has DomainRequestStatus.ACTION_NEEDED status, this check should not be performed
         if self.domain_request.status == DomainRequest.DomainRequestStatus.ACTION_NEEDED:
-            return []
+            return DomainRequest.objects.none()
         check_statuses = [
             DomainRequest.DomainRequestStatus.SUBMITTED,
             DomainRequest.DomainRequestStatus.IN_REVIEW,
@@ -439,6 +489,9 @@ class DomainRequestWizard(TemplateView):
     def db_check_for_unlocking_steps(self):
         """Helper for get_context_data.
         Queries the DB for a domain request and returns a list of unlocked steps."""
+        return list(self.cached_step_data("unlocked_steps", self._get_unlocked_steps))
+
+    def _get_unlocked_steps(self):
         return [key for key, is_unlocked_checker in self.unlocking_steps.items() if is_unlocked_checker(self)]
 
     def form_is_complete(self):
@@ -488,7 +541,7 @@ class DomainRequestWizard(TemplateView):
 
     def get_step_list(self) -> list:
         """Dynamically generated list of steps in the form wizard."""
-        return request_step_list(self, self.get_step_enum())
+        return self.cached_step_data("step_list", lambda: request_step_list(self, self.get_step_enum()))
 
     def goto(self, step):
         self.steps.current = step
@@ -598,6 +651,11 @@ class DomainRequestWizard(TemplateView):
                     form.to_database(self.domain_request)
         except ValidationError:
             raise
+        finally:
+            # The forms may have changed the domain request and its related rows, and so which
+            # steps are shown or unlocked. Prefetched rows are dropped so they are read again.
+            self.domain_request._prefetched_objects_cache = {}
+            self.clear_step_cache()
 
 
 # TODO - this is a WIP until the domain request experience for portfolios is complete
@@ -5,6 +5,7 @@ from registrar.models import DomainRequest
 from django.utils.dateformat import format
 from django.urls import reverse
 from django.db.models import Q
+from registrar.models.utility.search import get_search_filter
 
 
 @grant_access(ALL)
@@ -75,18 +76,23 @@ def _apply_search(queryset, request):
         # requested_domain (those display as New domain request in the UI)
         if search_term_lower in new_domain_request_text:
             queryset = queryset.filter(
-                Q(requested_domain__name__icontains=search_term) | Q(requested_domain__isnull=True)
+                get_search_filter(search_term, ["requested_domain__name"]) | Q(requested_domain__isnull=True)
             )
         elif is_portfolio:
             queryset = queryset.filter(
-                Q(requested_domain__name__icontains=search_term)
-                | Q(requester__first_name__icontains=search_term)
-                | Q(requester__last_name__icontains=search_term)
-                | Q(requester__email__icontains=search_term)
+                get_search_filter(
+                    search_term,
+                    [
+                        "requested_domain__name",
+                        "requester__first_name",
+                        "requester__last_name",
+                        "requester__email",
+                    ],
+                )
             )
         # For non org users
         else:
-            queryset = queryset.filter(Q(requested_domain__name__icontains=search_term))
+            queryset = queryset.filter(get_search_filter(search_term, ["requested_domain__name"]))
     return queryset
 
 
@@ -5,6 +5,7 @@ from registrar.decorators import grant_access, ALL
 from registrar.models import UserDomainRole, Domain, DomainInformation, User
 from django.urls import reverse
 from django.db.models import Q
+from registrar.models.utility.search import get_search_filter
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ def get_domain_ids_from_request(request):
 def apply_search(queryset, request):
     search_term = request.GET.get("search_term")
     if search_term:
-        queryset = queryset.filter(Q(name__icontains=search_term))
+        queryset = queryset.filter(get_search_filter(search_term, ["name"]))
     return queryset
 
 
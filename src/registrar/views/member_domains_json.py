@@ -7,7 +7,7 @@ from django.views import View
 from registrar.decorators import HAS_PORTFOLIO_MEMBERS_ANY_PERM, grant_access
 from registrar.models import UserDomainRole, Domain, DomainInformation, User
 from django.urls import reverse
-from django.db.models import Q
+from registrar.models.utility.search import get_search_filter
 
 from registrar.models.domain_invitation import DomainInvitation
 
@@ -104,7 +104,7 @@ class PortfolioMemberDomainsJson(View):
     def _apply_search(self, queryset, request):
         search_term = request.GET.get("search_term")
         if search_term:
-            queryset = queryset.filter(Q(name__icontains=search_term))
+            queryset = queryset.filter(get_search_filter(search_term, ["name"]))
         return queryset
 
     def _apply_sorting(self, queryset, request):
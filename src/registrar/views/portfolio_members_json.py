@@ -12,6 +12,7 @@ from registrar.models.portfolio_invitation import PortfolioInvitation
 from registrar.models.user_portfolio_permission import UserPortfolioPermission
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
 from registrar.models.utility.orm_helper import ArrayRemoveNull
+from registrar.models.utility.search import get_search_filter
 from django.contrib.postgres.aggregates import StringAgg
 
 
@@ -184,11 +185,7 @@ class PortfolioMembersJson(View):
         """Apply search term to the queryset."""
         search_term = request.GET.get("search_term", "").lower()
         if search_term:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search_term)
-                | Q(last_name__icontains=search_term)
-                | Q(email_display__icontains=search_term)
-            )
+            queryset = queryset.filter(get_search_filter(search_term, ["first_name", "last_name", "email_display"]))
         return queryset
 
     def apply_sorting(self, queryset, request):
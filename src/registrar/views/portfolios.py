@@ -37,6 +37,8 @@ from registrar.utility.email_invitations import (
     send_portfolio_member_permission_remove_email,
     send_portfolio_member_permission_update_email,
     send_portfolio_update_emails_to_portfolio_admins,
+    queue_domain_invitation_update_emails_to_domain_managers,
+    queue_domain_manager_removal_emails_to_domain_managers,
 )
 from registrar.utility.errors import MissingEmailError
 from registrar.utility.enums import DefaultUserValues
@@ -50,6 +52,16 @@ from registrar.views.utility.invitation_helper import get_org_membership
 logger = logging.getLogger(__name__)
 
 
+def queue_domain_manager_emails(request, queue_emails, **kwargs):
+    """Calls queue_emails(**kwargs) to queue the domain managers' emails, and warns the user
+    if they couldn't be. Emails that fail to send later are shown under Queued emails in the admin."""
+    try:
+        queue_emails(**kwargs)
+    except EmailSendingError as err:
+        logger.warning("Could not queue email notifications to existing domain managers", exc_info=err)
+        messages.warning(request, "Could not send email notification to existing domain managers.")
+
+
 @grant_access(HAS_PORTFOLIO_DOMAINS_ANY_PERM)
 class PortfolioDomainsView(View):
 
@@ -434,19 +446,22 @@ class PortfolioMemberDomainsEditView(DetailView, View):
     def _process_added_domains(self, added_domain_ids, member, requestor, portfolio):
         """
         Processes added domains by bulk creating UserDomainRole instances.
+
+        The member's invitation is sent before the roles are created, so that they aren't
+        if it fails. The existing domain managers are emailed once the changes are saved.
         """
         if added_domain_ids:
             # get added_domains from ids to pass to send email method and bulk create
-            added_domains = Domain.objects.filter(id__in=added_domain_ids)
+            added_domains = list(Domain.objects.filter(id__in=added_domain_ids))
             member_of_a_different_org, _ = get_org_membership(portfolio, member.email, member)
-            if not send_domain_invitation_email(
+            send_domain_invitation_email(
                 email=member.email,
                 requestor=requestor,
                 domains=added_domains,
                 is_member_of_different_org=member_of_a_different_org,
                 requested_user=member,
-            ):
-                messages.warning(self.request, "Could not send email notification to existing domain managers.")
+                notify_domain_managers=False,
+            )
             # Bulk create UserDomainRole instances for added domains
             UserDomainRole.objects.bulk_create(
                 [
@@ -455,28 +470,32 @@ class PortfolioMemberDomainsEditView(DetailView, View):
                 ],
                 ignore_conflicts=True,  # Avoid duplicate entries
             )
+            queue_domain_manager_emails(
+                self.request,
+                queue_domain_invitation_update_emails_to_domain_managers,
+                email=member.email,
+                requestor=requestor,
+                domains=added_domains,
+                requested_user=member,
+            )
 
     def _process_removed_domains(self, removed_domain_ids, member):
         """
         Processes removed domains by deleting corresponding UserDomainRole instances.
+        The remaining domain managers are emailed once the changes are saved.
         """
         if removed_domain_ids:
-            # Notify domain managers for domains which the member is being removed from
-            # Fetch Domain objects from removed_domain_ids
-            removed_domains = Domain.objects.filter(id__in=removed_domain_ids)
-            # need to get the domains from removed_domain_ids
-            for domain in removed_domains:
-                if not send_domain_manager_removal_emails_to_domain_managers(
-                    removed_by_user=self.request.user,
-                    manager_removed=member,
-                    manager_removed_email=member.email,
-                    domain=domain,
-                ):
-                    messages.warning(
-                        self.request, "Could not send email notification to existing domain managers for %s", domain
-                    )
             # Delete UserDomainRole instances for removed domains
             UserDomainRole.objects.filter(domain_id__in=removed_domain_ids, user=member).delete()
+            # Notify domain managers for domains which the member is being removed from
+            queue_domain_manager_emails(
+                self.request,
+                queue_domain_manager_removal_emails_to_domain_managers,
+                removed_by_user=self.request.user,
+                manager_removed=member,
+                manager_removed_email=member.email,
+                domains=list(Domain.objects.filter(id__in=removed_domain_ids)),
+            )
 
 
 @grant_access(HAS_PORTFOLIO_MEMBERS_ANY_PERM)
@@ -769,15 +788,23 @@ class PortfolioInvitedMemberDomainsEditView(DetailView, View):
         """
         if added_domain_ids:
             # get added_domains from ids to pass to send email method and bulk create
-            added_domains = Domain.objects.filter(id__in=added_domain_ids)
+            added_domains = list(Domain.objects.filter(id__in=added_domain_ids))
             member_of_a_different_org, _ = get_org_membership(portfolio, email, None)
-            if not send_domain_invitation_email(
+            send_domain_invitation_email(
                 email=email,
                 requestor=requestor,
                 domains=added_domains,
                 is_member_of_different_org=member_of_a_different_org,
-            ):
-                messages.warning(self.request, "Could not send email notification to existing domain managers.")
+                notify_domain_managers=False,
+            )
+            # The existing domain managers are emailed once the invitations are saved
+            queue_domain_manager_emails(
+                self.request,
+                queue_domain_invitation_update_emails_to_domain_managers,
+                email=email,
+                requestor=requestor,
+                domains=added_domains,
+            )
 
             # Update existing invitations from CANCELED to INVITED
             existing_invitations = DomainInvitation.objects.filter(domain__in=added_domains, email=email)
@@ -806,20 +833,16 @@ class PortfolioInvitedMemberDomainsEditView(DetailView, View):
         if not removed_domain_ids:
             return
 
-        # Notify domain managers for domains which the member is being removed from
-        # Fetch Domain objects from removed_domain_ids
-        removed_domains = Domain.objects.filter(id__in=removed_domain_ids)
-        # need to get the domains from removed_domain_ids
-        for domain in removed_domains:
-            if not send_domain_manager_removal_emails_to_domain_managers(
-                removed_by_user=self.request.user,
-                manager_removed=None,
-                manager_removed_email=email,
-                domain=domain,
-            ):
-                messages.warning(
-                    self.request, "Could not send email notification to existing domain managers for %s", domain
-                )
+        # Notify domain managers for domains which the member is being removed from,
+        # once the invitations are saved
+        queue_domain_manager_emails(
+            self.request,
+            queue_domain_manager_removal_emails_to_domain_managers,
+            removed_by_user=self.request.user,
+            manager_removed=None,
+            manager_removed_email=email,
+            domains=list(Domain.objects.filter(id__in=removed_domain_ids)),
+        )
 
         # Update invitations from INVITED to CANCELED
         DomainInvitation.objects.filter(
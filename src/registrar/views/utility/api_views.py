@@ -1,4 +1,5 @@
 import logging
+from epplibwrapper.metrics import METRICS
 from django.http import JsonResponse
 from django.forms.models import model_to_dict
 from registrar.decorators import IS_CISA_ANALYST, IS_FULL_ACCESS, IS_OMB_ANALYST, grant_access
@@ -157,3 +158,9 @@ def get_rejection_email_for_user_json(request):
     domain_request = DomainRequest.objects.filter(id=domain_request_id).first()
     email = get_rejection_reason_default_email(domain_request, reason)
     return JsonResponse({"email": email}, status=200)
+
+
+@grant_access(IS_FULL_ACCESS)
+def get_epp_metrics_json(request):
+    """Returns the latency, retries and slow commands of the registry client in this process"""
+    return JsonResponse(METRICS.snapshot(), status=200)
@@ -0,0 +1,128 @@
+"""
+Storage for the state the domain request wizard keeps between requests.
+
+The state is a small dict, such as the steps the user has visited. It is loaded once per
+request, and only written back if it changed, so moving between steps doesn't rewrite the
+session. Where it is kept is set by DOMAIN_REQUEST_WIZARD_STATE_STORE, the dotted path to a
+WizardStateStore subclass (by default, the user's session).
+"""
+
+import json
+from collections.abc import MutableMapping
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+# Stored state with a different version is discarded, so the format can change safely
+WIZARD_STATE_VERSION = 1
+
+DEFAULT_WIZARD_STATE_STORE = "registrar.views.utility.wizard_storage.SessionWizardStateStore"
+
+
+class WizardState(MutableMapping):
+    """The wizard's state for one request.
+
+    Remembers what it was loaded with, so it can tell if it has changed, including
+    changes made in place to the lists it holds.
+    """
+
+    # Keys that are worked out again on each request, and so are never stored.
+    # The current step always comes from the url (see StepsHelper.current).
+    TRANSIENT_KEYS = frozenset({"current_step"})
+
+    def __init__(self, data=None):
+        self._data = dict(data or {})
+        self._saved = self.to_stored()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def to_stored(self) -> dict:
+        """Returns the state as it is stored: versioned, with plain json values"""
+        data = {key: value for key, value in self._data.items() if key not in self.TRANSIENT_KEYS}
+        # Step enums are str subclasses, so this also stores them as plain strings
+        return {"version": WIZARD_STATE_VERSION, "data": json.loads(json.dumps(data))}
+
+    def has_changed(self) -> bool:
+        return self.to_stored() != self._saved
+
+    def mark_saved(self):
+        self._saved = self.to_stored()
+
+    @classmethod
+    def from_stored(cls, stored):
+        """Returns the state for a stored value, or an empty state if it is missing or out of date"""
+        if not isinstance(stored, dict) or stored.get("version") != WIZARD_STATE_VERSION:
+            return cls()
+        return cls(stored.get("data"))
+
+
+class WizardStateStore:
+    """Where wizard state is kept between requests"""
+
+    def load(self, request, key) -> WizardState:
+        return WizardState.from_stored(self.read(request, key))
+
+    def save(self, request, key, state: WizardState):
+        """Writes the state if it has changed since it was loaded or last saved"""
+        if state.has_changed():
+            self.write(request, key, state.to_stored())
+            state.mark_saved()
+
+    def read(self, request, key):
+        raise NotImplementedError
+
+    def write(self, request, key, stored):
+        raise NotImplementedError
+
+    def delete(self, request, key):
+        raise NotImplementedError
+
+
+class SessionWizardStateStore(WizardStateStore):
+    """Keeps wizard state in the user's session. The session is only marked as modified on writes."""
+
+    def read(self, request, key):
+        return request.session.get(key)
+
+    def write(self, request, key, stored):
+        request.session[key] = stored
+
+    def delete(self, request, key):
+        if key in request.session:
+            del request.session[key]
+
+
+class CacheWizardStateStore(WizardStateStore):
+    """Keeps wizard state in the django cache, keyed by session, so the session row isn't written at all"""
+
+    def cache_key(self, request, key):
+        return f"{key}:{request.session.session_key or request.user.pk}"
+
+    def read(self, request, key):
+        return cache.get(self.cache_key(request, key))
+
+    def write(self, request, key, stored):
+        cache.set(self.cache_key(request, key), stored, timeout=settings.SESSION_COOKIE_AGE)
+
+    def delete(self, request, key):
+        cache.delete(self.cache_key(request, key))
+
+
+def get_wizard_state_store() -> WizardStateStore:
+    """Returns the store set by DOMAIN_REQUEST_WIZARD_STATE_STORE"""
+    path = getattr(settings, "DOMAIN_REQUEST_WIZARD_STATE_STORE", DEFAULT_WIZARD_STATE_STORE)
+    return import_string(path)()